@@ -15,6 +15,7 @@ from graphrag.api.query import (
     local_search,
     local_search_streaming,
 )
+from graphrag.api.query_session import QuerySession
 
 __all__ = [  # noqa: RUF022
     # index API
@@ -24,6 +25,7 @@ __all__ = [  # noqa: RUF022
     "global_search_streaming",
     "local_search",
     "local_search_streaming",
+    "QuerySession",
     # prompt tuning API
     "DocSelectionType",
     "generate_indexing_prompts",
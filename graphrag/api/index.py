@@ -61,7 +61,10 @@ async def build_index(
     # TODO: must update filepath of lancedb (if used) until the new config engine has been implemented
     # TODO: remove the type ignore annotations below once the new config engine has been refactored
     vector_store_type = config.embeddings.vector_store["type"] if config.embeddings.vector_store is not None else None  # type: ignore
-    if vector_store_type == VectorStoreType.LanceDB:
+    if vector_store_type == VectorStoreType.LanceDB or (
+        vector_store_type == VectorStoreType.InMemory
+        and config.embeddings.vector_store.get("db_uri")  # type: ignore
+    ):
         db_uri = config.embeddings.vector_store["db_uri"]  # type: ignore
         lancedb_dir = Path(config.root_dir).resolve() / db_uri
         config.embeddings.vector_store["db_uri"] = str(lancedb_dir)  # type: ignore
@@ -182,18 +182,7 @@ async def local_search(
     ------
     TODO: Document any exceptions to expect.
     """
-    # TODO: must update filepath of lancedb (if used) until the new config engine has been implemented
-    # TODO: remove the type ignore annotations below once the new config engine has been refactored
-    vector_store_type = config.embeddings.vector_store.get("type")  # type: ignore
-    vector_store_args = config.embeddings.vector_store
-    if vector_store_type == "lancedb":
-        db_uri = config.embeddings.vector_store["db_uri"]  # type: ignore
-        lancedb_dir = Path(config.root_dir).resolve() / db_uri
-        vector_store_args["db_uri"] = str(lancedb_dir)  # type: ignore
-    reporter.info(f"Vector Store Args: {redact(vector_store_args)}")  # type: ignore
-    description_embedding_store = _get_embedding_description_store(
-        config_args=vector_store_args,  # type: ignore
-    )
+    description_embedding_store = _create_description_embedding_store(config)
 
     _entities = read_indexer_entities(nodes, entities, community_level)
     _covariates = read_indexer_covariates(covariates) if covariates is not None else []
@@ -251,18 +240,7 @@ async def local_search_streaming(
     ------
     TODO: Document any exceptions to expect.
     """
-    # TODO: must update filepath of lancedb (if used) until the new config engine has been implemented
-    # TODO: remove the type ignore annotations below once the new config engine has been refactored
-    vector_store_type = config.embeddings.vector_store["type"]  # type: ignore
-    vector_store_args = config.embeddings.vector_store
-    if vector_store_type == VectorStoreType.LanceDB:
-        db_uri = config.embeddings.vector_store["db_uri"]  # type: ignore
-        lancedb_dir = Path(config.root_dir).resolve() / db_uri
-        vector_store_args["db_uri"] = str(lancedb_dir)  # type: ignore
-    reporter.info(f"Vector Store Args: {redact(vector_store_args)}")  # type: ignore
-    description_embedding_store = _get_embedding_description_store(
-        config_args=vector_store_args,  # type: ignore
-    )
+    description_embedding_store = _create_description_embedding_store(config)
 
     _entities = read_indexer_entities(nodes, entities, community_level)
     _covariates = read_indexer_covariates(covariates) if covariates is not None else []
@@ -292,6 +270,25 @@ async def local_search_streaming(
             yield stream_chunk
 
 
+def _create_description_embedding_store(config: GraphRagConfig):
+    """Create and connect the entity description embedding store of a config."""
+    # TODO: must update filepath of lancedb (if used) until the new config engine has been implemented
+    # TODO: remove the type ignore annotations below once the new config engine has been refactored
+    vector_store_type = config.embeddings.vector_store.get("type")  # type: ignore
+    vector_store_args = config.embeddings.vector_store
+    if vector_store_type == VectorStoreType.LanceDB or (
+        vector_store_type == VectorStoreType.InMemory
+        and config.embeddings.vector_store.get("db_uri")  # type: ignore
+    ):
+        db_uri = config.embeddings.vector_store["db_uri"]  # type: ignore
+        lancedb_dir = Path(config.root_dir).resolve() / db_uri
+        vector_store_args["db_uri"] = str(lancedb_dir)  # type: ignore
+    reporter.info(f"Vector Store Args: {redact(vector_store_args)}")  # type: ignore
+    return _get_embedding_description_store(
+        config_args=vector_store_args,  # type: ignore
+    )
+
+
 def _get_embedding_description_store(
     config_args: dict,
 ):
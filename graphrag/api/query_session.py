@@ -0,0 +1,267 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""
+Long-lived Query Session API.
+
+A QuerySession loads the index outputs once, converts them into query model objects,
+and keeps warm search engines around so that many (concurrent) queries can be served
+without re-reading or re-converting the index. Call `reload` to pick up a new index.
+
+WARNING: This API is under development and may undergo changes in future releases.
+Backwards compatibility is not guaranteed at this time.
+"""
+
+import asyncio
+import copy
+import logging
+from collections.abc import AsyncGenerator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from graphrag.api.query import (
+    _create_description_embedding_store,
+    _reformat_context_data,
+)
+from graphrag.config import GraphRagConfig
+from graphrag.index.create_pipeline_config import create_pipeline_config
+from graphrag.index.storage import PipelineStorage
+from graphrag.model import CommunityReport
+from graphrag.query.factories import get_global_search_engine, get_local_search_engine
+from graphrag.query.indexer_adapters import (
+    read_indexer_covariates,
+    read_indexer_entities,
+    read_indexer_relationships,
+    read_indexer_reports,
+    read_indexer_text_units,
+)
+from graphrag.query.structured_search.base import BaseSearch, SearchResult
+from graphrag.utils.storage import _create_storage, _load_table_from_storage
+
+log = logging.getLogger(__name__)
+
+REQUIRED_TABLES = [
+    "create_final_nodes",
+    "create_final_entities",
+    "create_final_community_reports",
+    "create_final_text_units",
+    "create_final_relationships",
+]
+OPTIONAL_TABLES = ["create_final_covariates"]
+
+
+@dataclass
+class _SessionState:
+    """The search engines built from one version of the index."""
+
+    local_search: BaseSearch
+    global_search: BaseSearch
+    engines: dict[tuple[str, str], BaseSearch] = field(default_factory=dict)
+
+
+class QuerySession:
+    """Serve many queries over an index that is loaded once.
+
+    Searches only read the session state, so any number of them may run concurrently.
+    `reload` builds the new state before swapping it in, so searches that are already
+    running finish against the index they started on.
+    """
+
+    def __init__(
+        self,
+        config: GraphRagConfig,
+        community_level: int = 2,
+        response_type: str = "Multiple Paragraphs",
+        storage: PipelineStorage | None = None,
+    ):
+        """Create a query session, call `reload` (or use `create`) before searching.
+
+        Parameters
+        ----------
+        - config (GraphRagConfig): A graphrag configuration (from settings.yaml)
+        - community_level (int): The community level to search at.
+        - response_type (str): The default type of response to return.
+        - storage (PipelineStorage): The storage to read the index outputs from, defaults to the configured output storage.
+        """
+        self._config = config
+        self._community_level = community_level
+        self._response_type = response_type
+        self._storage = storage
+        self._state: _SessionState | None = None
+        self._reload_lock = asyncio.Lock()
+
+    @classmethod
+    async def create(
+        cls,
+        config: GraphRagConfig,
+        community_level: int = 2,
+        response_type: str = "Multiple Paragraphs",
+        storage: PipelineStorage | None = None,
+    ) -> "QuerySession":
+        """Create a query session and load the index into it."""
+        session = cls(
+            config,
+            community_level=community_level,
+            response_type=response_type,
+            storage=storage,
+        )
+        await session.reload()
+        return session
+
+    @property
+    def loaded(self) -> bool:
+        """Whether an index has been loaded into the session."""
+        return self._state is not None
+
+    async def reload(self) -> None:
+        """(Re)load the index outputs and rebuild the search engines."""
+        async with self._reload_lock:
+            tables = await self._load_tables()
+            # model conversion and context indexing are CPU bound, keep the loop responsive
+            self._state = await asyncio.to_thread(self._build_state, tables)
+            log.info(
+                "query session loaded index at community level %s",
+                self._community_level,
+            )
+
+    async def global_search(
+        self, query: str, response_type: str | None = None
+    ) -> tuple[
+        str | dict[str, Any] | list[dict[str, Any]],
+        str | list[pd.DataFrame] | dict[str, pd.DataFrame],
+    ]:
+        """Perform a global search and return the response and context data."""
+        search_engine = self._engine("global", response_type)
+        result: SearchResult = await search_engine.asearch(query=query)
+        return result.response, _reformat_context_data(result.context_data)  # type: ignore
+
+    async def global_search_streaming(
+        self, query: str, response_type: str | None = None
+    ) -> AsyncGenerator:
+        """Perform a global search, yielding the context data followed by the response tokens."""
+        search_engine = self._engine("global", response_type)
+        async for chunk in _stream(search_engine, query):
+            yield chunk
+
+    async def local_search(
+        self, query: str, response_type: str | None = None
+    ) -> tuple[
+        str | dict[str, Any] | list[dict[str, Any]],
+        str | list[pd.DataFrame] | dict[str, pd.DataFrame],
+    ]:
+        """Perform a local search and return the response and context data."""
+        search_engine = self._engine("local", response_type)
+        result: SearchResult = await search_engine.asearch(query=query)
+        return result.response, _reformat_context_data(result.context_data)  # type: ignore
+
+    async def local_search_streaming(
+        self, query: str, response_type: str | None = None
+    ) -> AsyncGenerator:
+        """Perform a local search, yielding the context data followed by the response tokens."""
+        search_engine = self._engine("local", response_type)
+        async for chunk in _stream(search_engine, query):
+            yield chunk
+
+    def _engine(self, search_type: str, response_type: str | None) -> BaseSearch:
+        """Get the warm engine of a search type for a response type."""
+        if self._state is None:
+            msg = "QuerySession has not been loaded, call reload() first"
+            raise ValueError(msg)
+        state = self._state
+        base_engine = (
+            state.local_search if search_type == "local" else state.global_search
+        )
+        response_type = response_type or self._response_type
+        if response_type == self._response_type:
+            return base_engine
+        key = (search_type, response_type)
+        engine = state.engines.get(key)
+        if engine is None:
+            # the context builder, llm and encoder are shared with the base engine
+            engine = copy.copy(base_engine)
+            engine.response_type = response_type  # type: ignore
+            state.engines[key] = engine
+        return engine
+
+    async def _load_tables(self) -> dict[str, pd.DataFrame | None]:
+        storage = self._storage or _create_storage(
+            root_dir=Path(self._config.root_dir),
+            config=create_pipeline_config(self._config).storage,
+        )
+        optional = await asyncio.gather(*[
+            storage.has(f"{name}.parquet") for name in OPTIONAL_TABLES
+        ])
+        names = REQUIRED_TABLES + [
+            name
+            for name, exists in zip(OPTIONAL_TABLES, optional, strict=True)
+            if exists
+        ]
+        loaded = await asyncio.gather(*[
+            _load_table_from_storage(name=f"{name}.parquet", storage=storage)
+            for name in names
+        ])
+        tables: dict[str, pd.DataFrame | None] = dict.fromkeys(OPTIONAL_TABLES)
+        tables.update(zip(names, loaded, strict=True))
+        return tables
+
+    def _build_state(self, tables: dict[str, pd.DataFrame | None]) -> _SessionState:
+        nodes: pd.DataFrame = tables["create_final_nodes"]  # type: ignore
+        entities = read_indexer_entities(
+            nodes,
+            tables["create_final_entities"],  # type: ignore
+            self._community_level,
+        )
+
+        def reports() -> Sequence[CommunityReport]:
+            # global search stores community weights on its reports, so the engines
+            # each get their own copy to keep local search context unchanged
+            return read_indexer_reports(
+                tables["create_final_community_reports"],  # type: ignore
+                nodes,
+                self._community_level,
+            )
+
+        covariates = tables["create_final_covariates"]
+        return _SessionState(
+            local_search=get_local_search_engine(
+                config=self._config,
+                reports=reports(),
+                text_units=read_indexer_text_units(
+                    tables["create_final_text_units"]  # type: ignore
+                ),
+                entities=entities,
+                relationships=read_indexer_relationships(
+                    tables["create_final_relationships"]  # type: ignore
+                ),
+                covariates={
+                    "claims": read_indexer_covariates(covariates)
+                    if covariates is not None
+                    else []
+                },
+                description_embedding_store=_create_description_embedding_store(
+                    self._config
+                ),
+                response_type=self._response_type,
+            ),
+            global_search=get_global_search_engine(
+                self._config,
+                reports=reports(),
+                entities=entities,
+                response_type=self._response_type,
+            ),
+        )
+
+
+async def _stream(search_engine: BaseSearch, query: str) -> AsyncGenerator:
+    # when streaming results, a context data object is returned as the first result
+    # and the query response in subsequent tokens
+    get_context_data = True
+    async for stream_chunk in search_engine.astream_search(query=query):  # type: ignore
+        if get_context_data:
+            yield _reformat_context_data(stream_chunk)  # type: ignore
+            get_context_data = False
+        else:
+            yield stream_chunk
@@ -0,0 +1,46 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""CLI implementation of migrate-cache subcommand."""
+
+from pathlib import Path
+
+from graphrag.config import load_config
+from graphrag.index.cache.sqlite_pipeline_cache import (
+    SQLITE_CACHE_FILENAME,
+    SqlitePipelineCache,
+)
+from graphrag.logging import PrintProgressReporter
+
+reporter = PrintProgressReporter("")
+
+
+def migrate_cache(
+    root_dir: Path,
+    config_filepath: Path | None = None,
+    source_dir: Path | None = None,
+    compact: bool = False,
+) -> int:
+    """Import a file (JSON) cache directory into the project's sqlite cache database.
+
+    The source defaults to the configured cache base_dir, the database is created at
+    `<cache.base_dir>/cache.sqlite`. Existing entries with the same keys are replaced.
+    """
+    root = root_dir.resolve()
+    config = load_config(root, config_filepath)
+    cache_dir = root / config.cache.base_dir
+    source = source_dir.resolve() if source_dir else cache_dir
+    if not source.is_dir():
+        msg = f"Cache directory not found: {source}"
+        raise FileNotFoundError(msg)
+
+    cache = SqlitePipelineCache(cache_dir / SQLITE_CACHE_FILENAME)
+    try:
+        count = cache.import_json_cache(source)
+        if compact:
+            cache.compact()
+    finally:
+        cache.close()
+    reporter.success(f"Imported {count} cache entries from {source} into {cache.path}")
+    reporter.info("Set cache.type to sqlite in the configuration to use it.")
+    return count
@@ -78,6 +78,7 @@ def index_cli(
     dry_run: bool,
     skip_validation: bool,
     output_dir: Path | None,
+    stream_batch_size: int | None = None,
 ):
     """Run the pipeline with the given config."""
     progress_reporter = create_progress_reporter(reporter)
@@ -94,6 +95,10 @@ def index_cli(
     if not cache:
         config.cache.type = CacheType.none
 
+    if stream_batch_size:
+        config.streaming.enabled = True
+        config.streaming.batch_size = stream_batch_size
+
     enabled_logging, log_path = enable_logging_with_config(config, verbose)
     if enabled_logging:
         info(f"Logging enabled at {log_path}", True)
@@ -16,6 +16,7 @@ from graphrag.logging import ReporterType
 from graphrag.prompt_tune.generator import MAX_TOKEN_COUNT
 from graphrag.prompt_tune.loader import MIN_CHUNK_SIZE
 
+from .cache import migrate_cache
 from .index import index_cli
 from .initialize import initialize_project_at
 from .prompt_tune import prompt_tune
@@ -117,6 +118,13 @@ def _index_cli(
             resolve_path=True,
         ),
     ] = None,
+    stream_batch_size: Annotated[
+        int | None,
+        typer.Option(
+            help="Chunk and extract the input in micro-batches of this many documents or text units, spilling each batch to the output storage. Overrides streaming in the configuration file.",
+            min=1,
+        ),
+    ] = None,
 ):
     """Build a knowledge graph index."""
     if resume and update_index:
@@ -136,6 +144,45 @@ def _index_cli(
         dry_run=dry_run,
         skip_validation=skip_validation,
         output_dir=output,
+        stream_batch_size=stream_batch_size,
+    )
+
+
+@app.command("migrate-cache")
+def _migrate_cache_cli(
+    root: Annotated[
+        Path,
+        typer.Option(
+            help="The project root directory.",
+            exists=True,
+            dir_okay=True,
+            writable=True,
+            resolve_path=True,
+        ),
+    ] = Path(),  # set default to current directory
+    config: Annotated[
+        Path | None,
+        typer.Option(
+            help="The configuration to use.", exists=True, file_okay=True, readable=True
+        ),
+    ] = None,
+    source: Annotated[
+        Path | None,
+        typer.Option(
+            help="The file cache directory to import. Defaults to the configured cache base_dir.",
+            exists=True,
+            dir_okay=True,
+            readable=True,
+            resolve_path=True,
+        ),
+    ] = None,
+    compact: Annotated[
+        bool, typer.Option(help="Compact the cache database after the import.")
+    ] = False,
+):
+    """Import a file cache into a single file sqlite cache."""
+    migrate_cache(
+        root_dir=root, config_filepath=config, source_dir=source, compact=compact
     )
 
 
@@ -39,6 +39,7 @@ from .input_models import (
     ReportingConfigInput,
     SnapshotsConfigInput,
     StorageConfigInput,
+    StreamingConfigInput,
     SummarizeDescriptionsConfigInput,
     TextEmbeddingConfigInput,
     UmapConfigInput,
@@ -57,12 +58,14 @@ from .models import (
     GraphRagConfig,
     InputConfig,
     LLMConfig,
+    LLMEndpointParameters,
     LLMParameters,
     LocalSearchConfig,
     ParallelizationParameters,
     ReportingConfig,
     SnapshotsConfig,
     StorageConfig,
+    StreamingConfig,
     SummarizeDescriptionsConfig,
     TextEmbeddingConfig,
     UmapConfig,
@@ -99,6 +102,7 @@ __all__ = [
     "InputType",
     "LLMConfig",
     "LLMConfigInput",
+    "LLMEndpointParameters",
     "LLMParameters",
     "LLMParametersInput",
     "LLMType",
@@ -115,6 +119,8 @@ __all__ = [
     "StorageConfigInput",
     "StorageType",
     "StorageType",
+    "StreamingConfig",
+    "StreamingConfigInput",
     "SummarizeDescriptionsConfig",
     "SummarizeDescriptionsConfigInput",
     "TextEmbeddingConfig",
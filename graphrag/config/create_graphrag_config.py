@@ -50,6 +50,7 @@ from .models import (
     ReportingConfig,
     SnapshotsConfig,
     StorageConfig,
+    StreamingConfig,
     SummarizeDescriptionsConfig,
     TextEmbeddingConfig,
     UmapConfig,
@@ -99,6 +100,9 @@ def create_graphrag_config(
             sleep_on_rate_limit = reader.bool(Fragment.sleep_recommendation)
             if sleep_on_rate_limit is None:
                 sleep_on_rate_limit = base.sleep_on_rate_limit_recommendation
+            adaptive_concurrency = reader.bool(Fragment.adaptive_concurrency)
+            if adaptive_concurrency is None:
+                adaptive_concurrency = base.adaptive_concurrency
 
             return LLMParameters(
                 api_key=api_key,
@@ -128,6 +132,16 @@ def create_graphrag_config(
                 sleep_on_rate_limit_recommendation=sleep_on_rate_limit,
                 concurrent_requests=reader.int(Fragment.concurrent_requests)
                 or base.concurrent_requests,
+                adaptive_concurrency=adaptive_concurrency,
+                min_concurrent_requests=reader.int(Fragment.min_concurrent_requests)
+                or base.min_concurrent_requests,
+                max_concurrent_requests=reader.int(Fragment.max_concurrent_requests)
+                or base.max_concurrent_requests,
+                endpoints=reader.section.get("endpoints") or base.endpoints,
+                endpoint_eject_after=reader.int(Fragment.endpoint_eject_after)
+                or base.endpoint_eject_after,
+                endpoint_eject_seconds=reader.float(Fragment.endpoint_eject_seconds)
+                or base.endpoint_eject_seconds,
             )
 
     def hydrate_embeddings_params(
@@ -169,6 +183,9 @@ def create_graphrag_config(
             sleep_on_rate_limit = reader.bool(Fragment.sleep_recommendation)
             if sleep_on_rate_limit is None:
                 sleep_on_rate_limit = base.sleep_on_rate_limit_recommendation
+            adaptive_concurrency = reader.bool(Fragment.adaptive_concurrency)
+            if adaptive_concurrency is None:
+                adaptive_concurrency = base.adaptive_concurrency
 
             return LLMParameters(
                 api_key=api_key,
@@ -192,6 +209,16 @@ def create_graphrag_config(
                 sleep_on_rate_limit_recommendation=sleep_on_rate_limit,
                 concurrent_requests=reader.int(Fragment.concurrent_requests)
                 or defs.LLM_CONCURRENT_REQUESTS,
+                adaptive_concurrency=adaptive_concurrency,
+                min_concurrent_requests=reader.int(Fragment.min_concurrent_requests)
+                or defs.LLM_MIN_CONCURRENT_REQUESTS,
+                max_concurrent_requests=reader.int(Fragment.max_concurrent_requests)
+                or defs.LLM_MAX_CONCURRENT_REQUESTS,
+                endpoints=reader.section.get("endpoints"),
+                endpoint_eject_after=reader.int(Fragment.endpoint_eject_after)
+                or defs.LLM_ENDPOINT_EJECT_AFTER,
+                endpoint_eject_seconds=reader.float(Fragment.endpoint_eject_seconds)
+                or defs.LLM_ENDPOINT_EJECT_SECONDS,
             )
 
     def hydrate_parallelization_params(
@@ -245,6 +272,9 @@ def create_graphrag_config(
                 sleep_on_rate_limit = reader.bool(Fragment.sleep_recommendation)
                 if sleep_on_rate_limit is None:
                     sleep_on_rate_limit = defs.LLM_SLEEP_ON_RATE_LIMIT_RECOMMENDATION
+                adaptive_concurrency = reader.bool(Fragment.adaptive_concurrency)
+                if adaptive_concurrency is None:
+                    adaptive_concurrency = defs.LLM_ADAPTIVE_CONCURRENCY
 
                 llm_model = LLMParameters(
                     api_key=api_key,
@@ -275,6 +305,16 @@ def create_graphrag_config(
                     sleep_on_rate_limit_recommendation=sleep_on_rate_limit,
                     concurrent_requests=reader.int(Fragment.concurrent_requests)
                     or defs.LLM_CONCURRENT_REQUESTS,
+                    adaptive_concurrency=adaptive_concurrency,
+                    min_concurrent_requests=reader.int(Fragment.min_concurrent_requests)
+                    or defs.LLM_MIN_CONCURRENT_REQUESTS,
+                    max_concurrent_requests=reader.int(Fragment.max_concurrent_requests)
+                    or defs.LLM_MAX_CONCURRENT_REQUESTS,
+                    endpoints=reader.section.get("endpoints"),
+                    endpoint_eject_after=reader.int(Fragment.endpoint_eject_after)
+                    or defs.LLM_ENDPOINT_EJECT_AFTER,
+                    endpoint_eject_seconds=reader.float(Fragment.endpoint_eject_seconds)
+                    or defs.LLM_ENDPOINT_EJECT_SECONDS,
                 )
             with reader.use(values.get("parallelization")):
                 llm_parallelization_model = ParallelizationParameters(
@@ -356,6 +396,7 @@ def create_graphrag_config(
                 database_name=reader.str(Fragment.storage_database_name),
                 account_name=reader.str(Fragment.storage_account_name),
                 account_key=reader.str(Fragment.storage_account_key),
+                write_behind=reader.bool("write_behind") or defs.CACHE_WRITE_BEHIND,
             )
         with (
             reader.envvar_prefix(Section.reporting),
@@ -380,6 +421,8 @@ def create_graphrag_config(
                 database_name=reader.str(Fragment.storage_database_name) or defs.STORAGE_DATABASE_NAME,
                 account_name=reader.str(Fragment.storage_account_name) or defs.STORAGE_ACCOUNT_NAME,
                 account_key=reader.str(Fragment.storage_account_key) or defs.STORAGE_ACCOUNT_KEY,
+                concurrent_requests=reader.int(Fragment.concurrent_requests)
+                or defs.STORAGE_CONCURRENT_REQUESTS,
             )
         with reader.envvar_prefix(Section.chunk), reader.use(values.get("chunks")):
             group_by_columns = reader.list("group_by_columns", "BY_COLUMNS")
@@ -402,6 +445,14 @@ def create_graphrag_config(
                 top_level_nodes=reader.bool("top_level_nodes")
                 or defs.SNAPSHOTS_TOP_LEVEL_NODES,
             )
+        with (
+            reader.envvar_prefix(Section.streaming),
+            reader.use(values.get("streaming")),
+        ):
+            streaming_model = StreamingConfig(
+                enabled=reader.bool(Fragment.enabled) or defs.STREAMING_ENABLED,
+                batch_size=reader.int("batch_size") or defs.STREAMING_BATCH_SIZE,
+            )
         with reader.envvar_prefix(Section.umap), reader.use(values.get("umap")):
             umap_model = UmapConfig(
                 enabled=reader.bool(Fragment.enabled) or defs.UMAP_ENABLED,
@@ -471,6 +522,8 @@ def create_graphrag_config(
                 or defs.COMMUNITY_REPORT_MAX_LENGTH,
                 max_input_length=reader.int("max_input_length")
                 or defs.COMMUNITY_REPORT_MAX_INPUT_LENGTH,
+                incremental=reader.bool("incremental")
+                or defs.COMMUNITY_REPORT_INCREMENTAL,
             )
 
         summarize_description_config = values.get("summarize_descriptions") or {}
@@ -487,6 +540,14 @@ def create_graphrag_config(
                 prompt=reader.str("prompt", Fragment.prompt_file),
                 max_length=reader.int(Fragment.max_length)
                 or defs.SUMMARIZE_DESCRIPTIONS_MAX_LENGTH,
+                tree_reduce=reader.bool("tree_reduce")
+                or defs.SUMMARIZE_DESCRIPTIONS_TREE_REDUCE,
+                fan_out=reader.int("fan_out") or defs.SUMMARIZE_DESCRIPTIONS_FAN_OUT,
+                batched=reader.bool("batched") or defs.SUMMARIZE_DESCRIPTIONS_BATCHED,
+                batch_max_tokens=reader.int("batch_max_tokens")
+                or defs.SUMMARIZE_DESCRIPTIONS_BATCH_MAX_TOKENS,
+                batch_size=reader.int("batch_size")
+                or defs.SUMMARIZE_DESCRIPTIONS_BATCH_SIZE,
             )
 
         with reader.use(values.get("cluster_graph")):
@@ -543,6 +604,9 @@ def create_graphrag_config(
 
         encoding_model = reader.str(Fragment.encoding_model) or defs.ENCODING_MODEL
         skip_workflows = reader.list("skip_workflows") or []
+        max_parallel_workflows = (
+            reader.int("max_parallel_workflows") or defs.MAX_PARALLEL_WORKFLOWS
+        )
 
     return GraphRagConfig(
         root_dir=root_dir,
@@ -557,6 +621,7 @@ def create_graphrag_config(
         input=input_model,
         chunks=chunks_model,
         snapshots=snapshots_model,
+        streaming=streaming_model,
         entity_extraction=entity_extraction_model,
         claim_extraction=claim_extraction_model,
         community_reports=community_reports_model,
@@ -565,6 +630,7 @@ def create_graphrag_config(
         cluster_graph=cluster_graph_model,
         encoding_model=encoding_model,
         skip_workflows=skip_workflows,
+        max_parallel_workflows=max_parallel_workflows,
         local_search=local_search_model,
         global_search=global_search_model,
     )
@@ -573,6 +639,7 @@ def create_graphrag_config(
 class Fragment(str, Enum):
     """Configuration Fragments."""
 
+    adaptive_concurrency = "ADAPTIVE_CONCURRENCY"
     api_base = "API_BASE"
     api_key = "API_KEY"
     api_version = "API_VERSION"
@@ -589,12 +656,16 @@ class Fragment(str, Enum):
     enabled = "ENABLED"
     encoding = "ENCODING"
     encoding_model = "ENCODING_MODEL"
+    endpoint_eject_after = "ENDPOINT_EJECT_AFTER"
+    endpoint_eject_seconds = "ENDPOINT_EJECT_SECONDS"
     file_type = "FILE_TYPE"
     max_gleanings = "MAX_GLEANINGS"
     max_length = "MAX_LENGTH"
     max_retries = "MAX_RETRIES"
     max_retry_wait = "MAX_RETRY_WAIT"
     max_tokens = "MAX_TOKENS"
+    max_concurrent_requests = "MAX_CONCURRENT_REQUESTS"
+    min_concurrent_requests = "MIN_CONCURRENT_REQUESTS"
     temperature = "TEMPERATURE"
     top_p = "TOP_P"
     n = "N"
@@ -631,6 +702,7 @@ class Section(str, Enum):
     reporting = "REPORTING"
     snapshot = "SNAPSHOT"
     storage = "STORAGE"
+    streaming = "STREAMING"
     summarize_descriptions = "SUMMARIZE_DESCRIPTIONS"
     umap = "UMAP"
     local_search = "LOCAL_SEARCH"
@@ -21,6 +21,7 @@ from .enums import (
 
 ASYNC_MODE = AsyncType.Threaded
 ENCODING_MODEL = "cl100k_base"
+MAX_PARALLEL_WORKFLOWS = 1
 #
 # LLM Parameters
 #
@@ -37,6 +38,12 @@ LLM_MAX_RETRIES = 10
 LLM_MAX_RETRY_WAIT = 10.0
 LLM_SLEEP_ON_RATE_LIMIT_RECOMMENDATION = True
 LLM_CONCURRENT_REQUESTS = 25
+LLM_ADAPTIVE_CONCURRENCY = False
+LLM_MIN_CONCURRENT_REQUESTS = 1
+LLM_MAX_CONCURRENT_REQUESTS = 100
+LLM_ENDPOINT_WEIGHT = 1.0
+LLM_ENDPOINT_EJECT_AFTER = 3
+LLM_ENDPOINT_EJECT_SECONDS = 30.0
 
 #
 # Text Embedding Parameters
@@ -49,6 +56,7 @@ EMBEDDING_TARGET = TextEmbeddingTarget.required
 
 CACHE_TYPE = CacheType.file
 CACHE_BASE_DIR = "cache"
+CACHE_WRITE_BEHIND = False
 CHUNK_SIZE = 1200
 CHUNK_OVERLAP = 100
 CHUNK_GROUP_BY_COLUMNS = ["id"]
@@ -60,6 +68,7 @@ CLAIM_EXTRACTION_ENABLED = False
 MAX_CLUSTER_SIZE = 10
 COMMUNITY_REPORT_MAX_LENGTH = 2000
 COMMUNITY_REPORT_MAX_INPUT_LENGTH = 8000
+COMMUNITY_REPORT_INCREMENTAL = False
 ENTITY_EXTRACTION_ENTITY_TYPES = ["organization", "person", "geo", "event"]
 ENTITY_EXTRACTION_MAX_GLEANINGS = 1
 INPUT_FILE_TYPE = InputFileType.text
@@ -87,7 +96,15 @@ STORAGE_TYPE = StorageType.file
 STORAGE_DATABASE_NAME = "graphrag"
 STORAGE_ACCOUNT_NAME = "graphrag"
 STORAGE_ACCOUNT_KEY = None
+STORAGE_CONCURRENT_REQUESTS = 25
+STREAMING_ENABLED = False
+STREAMING_BATCH_SIZE = 1000
 SUMMARIZE_DESCRIPTIONS_MAX_LENGTH = 500
+SUMMARIZE_DESCRIPTIONS_TREE_REDUCE = False
+SUMMARIZE_DESCRIPTIONS_FAN_OUT = 4
+SUMMARIZE_DESCRIPTIONS_BATCHED = False
+SUMMARIZE_DESCRIPTIONS_BATCH_MAX_TOKENS = 4000
+SUMMARIZE_DESCRIPTIONS_BATCH_SIZE = 8
 UMAP_ENABLED = False
 
 VECTOR_STORE = f"""
@@ -21,6 +21,8 @@ class CacheType(str, Enum):
     """The blob cache configuration type."""
     cosmos = "cosmos"
     """The cosmos cache configuration type."""
+    sqlite = "sqlite"
+    """The single file sqlite cache configuration type."""
 
     def __repr__(self):
         """Get a string representation."""
@@ -20,6 +20,7 @@ from .parallelization_parameters_input import ParallelizationParametersInput
 from .reporting_config_input import ReportingConfigInput
 from .snapshots_config_input import SnapshotsConfigInput
 from .storage_config_input import StorageConfigInput
+from .streaming_config_input import StreamingConfigInput
 from .summarize_descriptions_config_input import (
     SummarizeDescriptionsConfigInput,
 )
@@ -44,6 +45,7 @@ __all__ = [
     "ReportingConfigInput",
     "SnapshotsConfigInput",
     "StorageConfigInput",
+    "StreamingConfigInput",
     "SummarizeDescriptionsConfigInput",
     "TextEmbeddingConfigInput",
     "UmapConfigInput",
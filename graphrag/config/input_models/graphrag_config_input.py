@@ -19,6 +19,7 @@ from .local_search_config_input import LocalSearchConfigInput
 from .reporting_config_input import ReportingConfigInput
 from .snapshots_config_input import SnapshotsConfigInput
 from .storage_config_input import StorageConfigInput
+from .streaming_config_input import StreamingConfigInput
 from .summarize_descriptions_config_input import (
     SummarizeDescriptionsConfigInput,
 )
@@ -37,6 +38,7 @@ class GraphRagConfigInput(LLMConfigInput):
     embeddings: NotRequired[TextEmbeddingConfigInput | None]
     chunks: NotRequired[ChunkingConfigInput | None]
     snapshots: NotRequired[SnapshotsConfigInput | None]
+    streaming: NotRequired[StreamingConfigInput | None]
     entity_extraction: NotRequired[EntityExtractionConfigInput | None]
     summarize_descriptions: NotRequired[SummarizeDescriptionsConfigInput | None]
     community_reports: NotRequired[CommunityReportsConfigInput | None]
@@ -45,5 +47,6 @@ class GraphRagConfigInput(LLMConfigInput):
     umap: NotRequired[UmapConfigInput | None]
     encoding_model: NotRequired[str | None]
     skip_workflows: NotRequired[list[str] | str | None]
+    max_parallel_workflows: NotRequired[int | str | None]
     local_search: NotRequired[LocalSearchConfigInput | None]
     global_search: NotRequired[GlobalSearchConfigInput | None]
@@ -29,3 +29,9 @@ class LLMParametersInput(TypedDict):
     max_retry_wait: NotRequired[float | str | None]
     sleep_on_rate_limit_recommendation: NotRequired[bool | str | None]
     concurrent_requests: NotRequired[int | str | None]
+    adaptive_concurrency: NotRequired[bool | str | None]
+    min_concurrent_requests: NotRequired[int | str | None]
+    max_concurrent_requests: NotRequired[int | str | None]
+    endpoints: NotRequired[list[dict] | None]
+    endpoint_eject_after: NotRequired[int | str | None]
+    endpoint_eject_seconds: NotRequired[float | str | None]
@@ -19,4 +19,5 @@ class StorageConfigInput(TypedDict):
     database_name: NotRequired[str | None]
     account_key: NotRequired[str | None]
     account_name: NotRequired[str | None]
+    concurrent_requests: NotRequired[int | str | None]
     
@@ -0,0 +1,13 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Parameterization settings for the default configuration."""
+
+from typing_extensions import NotRequired, TypedDict
+
+
+class StreamingConfigInput(TypedDict):
+    """Configuration section for micro-batched streaming indexing."""
+
+    enabled: NotRequired[bool | str | None]
+    batch_size: NotRequired[int | str | None]
@@ -13,4 +13,9 @@ class SummarizeDescriptionsConfigInput(LLMConfigInput):
 
     prompt: NotRequired[str | None]
     max_length: NotRequired[int | str | None]
+    tree_reduce: NotRequired[bool | str | None]
+    fan_out: NotRequired[int | str | None]
+    batched: NotRequired[bool | str | None]
+    batch_max_tokens: NotRequired[int | str | None]
+    batch_size: NotRequired[int | str | None]
     strategy: NotRequired[dict | None]
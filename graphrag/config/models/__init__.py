@@ -15,12 +15,14 @@ from .global_search_config import GlobalSearchConfig
 from .graph_rag_config import GraphRagConfig
 from .input_config import InputConfig
 from .llm_config import LLMConfig
+from .llm_endpoint_parameters import LLMEndpointParameters
 from .llm_parameters import LLMParameters
 from .local_search_config import LocalSearchConfig
 from .parallelization_parameters import ParallelizationParameters
 from .reporting_config import ReportingConfig
 from .snapshots_config import SnapshotsConfig
 from .storage_config import StorageConfig
+from .streaming_config import StreamingConfig
 from .summarize_descriptions_config import SummarizeDescriptionsConfig
 from .text_embedding_config import TextEmbeddingConfig
 from .umap_config import UmapConfig
@@ -38,12 +40,14 @@ __all__ = [
     "GraphRagConfig",
     "InputConfig",
     "LLMConfig",
+    "LLMEndpointParameters",
     "LLMParameters",
     "LocalSearchConfig",
     "ParallelizationParameters",
     "ReportingConfig",
     "SnapshotsConfig",
     "StorageConfig",
+    "StreamingConfig",
     "SummarizeDescriptionsConfig",
     "TextEmbeddingConfig",
     "UmapConfig",
@@ -36,3 +36,7 @@ class CacheConfig(BaseModel):
     account_key: str | None = Field(
         description="The account key to use.", default=None
     )
+    write_behind: bool = Field(
+        description="Whether to queue cache writes and flush them in batches in the background (cosmos cache only).",
+        default=defs.CACHE_WRITE_BEHIND,
+    )
@@ -29,6 +29,10 @@ class CommunityReportsConfig(LLMConfig):
     strategy: dict | None = Field(
         description="The override strategy to use.", default=None
     )
+    incremental: bool = Field(
+        description="Whether to reuse the previous reports of the communities whose context did not change.",
+        default=defs.COMMUNITY_REPORT_INCREMENTAL,
+    )
 
     def resolved_strategy(self, root_dir) -> dict:
         """Get the resolved community report extraction strategy."""
@@ -22,6 +22,7 @@ from .local_search_config import LocalSearchConfig
 from .reporting_config import ReportingConfig
 from .snapshots_config import SnapshotsConfig
 from .storage_config import StorageConfig
+from .streaming_config import StreamingConfig
 from .summarize_descriptions_config import (
     SummarizeDescriptionsConfig,
 )
@@ -88,6 +89,12 @@ class GraphRagConfig(LLMConfig):
     )
     """The snapshots configuration to use."""
 
+    streaming: StreamingConfig = Field(
+        description="The streaming configuration to use.",
+        default=StreamingConfig(),
+    )
+    """The streaming configuration to use."""
+
     entity_extraction: EntityExtractionConfig = Field(
         description="The entity extraction configuration to use.",
         default=EntityExtractionConfig(),
@@ -144,3 +151,9 @@ class GraphRagConfig(LLMConfig):
         description="The workflows to skip, usually for testing reasons.", default=[]
     )
     """The workflows to skip, usually for testing reasons."""
+
+    max_parallel_workflows: int = Field(
+        description="The number of independent workflows to run at once.",
+        default=defs.MAX_PARALLEL_WORKFLOWS,
+    )
+    """The number of independent workflows to run at once."""
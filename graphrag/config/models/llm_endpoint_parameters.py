@@ -0,0 +1,42 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""LLM Endpoint Parameters model."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+import graphrag.config.defaults as defs
+
+
+class LLMEndpointParameters(BaseModel):
+    """LLM Endpoint Parameters model, overriding the LLM parameters for one of the endpoints requests are balanced over."""
+
+    model_config = ConfigDict(protected_namespaces=(), extra="allow")
+    api_base: str = Field(description="The base URL of the endpoint.")
+    api_key: str | None = Field(
+        description="The API key to use for the endpoint, if different.", default=None
+    )
+    api_version: str | None = Field(
+        description="The version of the API to use for the endpoint, if different.",
+        default=None,
+    )
+    deployment_name: str | None = Field(
+        description="The deployment name to use for the endpoint, if different.",
+        default=None,
+    )
+    weight: float = Field(
+        description="The share of the requests to route to the endpoint, relative to the other endpoints.",
+        default=defs.LLM_ENDPOINT_WEIGHT,
+    )
+    tokens_per_minute: int | None = Field(
+        description="The number of tokens per minute to use for the endpoint, if different.",
+        default=None,
+    )
+    requests_per_minute: int | None = Field(
+        description="The number of requests per minute to use for the endpoint, if different.",
+        default=None,
+    )
+    concurrent_requests: int | None = Field(
+        description="The number of concurrent requests to use for the endpoint, if different.",
+        default=None,
+    )
@@ -8,6 +8,8 @@ from pydantic import BaseModel, ConfigDict, Field
 import graphrag.config.defaults as defs
 from graphrag.config.enums import LLMType
 
+from .llm_endpoint_parameters import LLMEndpointParameters
+
 
 class LLMParameters(BaseModel):
     """LLM Parameters model."""
@@ -86,3 +88,27 @@ class LLMParameters(BaseModel):
         description="Whether to use concurrent requests for the LLM service.",
         default=defs.LLM_CONCURRENT_REQUESTS,
     )
+    adaptive_concurrency: bool = Field(
+        description="Whether to adapt the number of concurrent requests to the LLM service's throttling.",
+        default=defs.LLM_ADAPTIVE_CONCURRENCY,
+    )
+    min_concurrent_requests: int = Field(
+        description="The minimum number of concurrent requests when adapting the concurrency.",
+        default=defs.LLM_MIN_CONCURRENT_REQUESTS,
+    )
+    max_concurrent_requests: int = Field(
+        description="The maximum number of concurrent requests when adapting the concurrency.",
+        default=defs.LLM_MAX_CONCURRENT_REQUESTS,
+    )
+    endpoints: list[LLMEndpointParameters] | None = Field(
+        description="The endpoints to balance the requests over, instead of `api_base` alone.",
+        default=None,
+    )
+    endpoint_eject_after: int = Field(
+        description="The number of consecutive throttled or failed requests after which an endpoint is ejected.",
+        default=defs.LLM_ENDPOINT_EJECT_AFTER,
+    )
+    endpoint_eject_seconds: float = Field(
+        description="The number of seconds an ejected endpoint receives no requests.",
+        default=defs.LLM_ENDPOINT_EJECT_SECONDS,
+    )
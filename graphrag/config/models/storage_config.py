@@ -37,4 +37,8 @@ class StorageConfig(BaseModel, extra="allow"):
     account_name: str | None = Field(
         description="The storage account name to use.", default=None
     )
+    concurrent_requests: int = Field(
+        description="The number of concurrent requests allowed when writing to the storage.",
+        default=defs.STORAGE_CONCURRENT_REQUESTS,
+    )
 
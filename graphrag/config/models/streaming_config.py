@@ -0,0 +1,21 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Parameterization settings for the default configuration."""
+
+from pydantic import BaseModel, Field
+
+import graphrag.config.defaults as defs
+
+
+class StreamingConfig(BaseModel):
+    """Configuration section for micro-batched streaming indexing."""
+
+    enabled: bool = Field(
+        description="A flag indicating whether to chunk and extract the input in micro-batches.",
+        default=defs.STREAMING_ENABLED,
+    )
+    batch_size: int = Field(
+        description="The number of documents or text units in each micro-batch.",
+        default=defs.STREAMING_BATCH_SIZE,
+    )
@@ -22,6 +22,26 @@ class SummarizeDescriptionsConfig(LLMConfig):
         description="The description summarization maximum length.",
         default=defs.SUMMARIZE_DESCRIPTIONS_MAX_LENGTH,
     )
+    tree_reduce: bool = Field(
+        description="Whether to summarize long description lists with a tree of concurrent summarizations.",
+        default=defs.SUMMARIZE_DESCRIPTIONS_TREE_REDUCE,
+    )
+    fan_out: int = Field(
+        description="The maximum number of partial summaries reduced by a single summarization.",
+        default=defs.SUMMARIZE_DESCRIPTIONS_FAN_OUT,
+    )
+    batched: bool = Field(
+        description="Whether to summarize the descriptions of several items with a single request.",
+        default=defs.SUMMARIZE_DESCRIPTIONS_BATCHED,
+    )
+    batch_max_tokens: int = Field(
+        description="The maximum number of description tokens packed into a single batched request.",
+        default=defs.SUMMARIZE_DESCRIPTIONS_BATCH_MAX_TOKENS,
+    )
+    batch_size: int = Field(
+        description="The maximum number of items packed into a single batched request.",
+        default=defs.SUMMARIZE_DESCRIPTIONS_BATCH_SIZE,
+    )
     strategy: dict | None = Field(
         description="The override strategy to use.", default=None
     )
@@ -42,4 +62,9 @@ class SummarizeDescriptionsConfig(LLMConfig):
             if self.prompt
             else None,
             "max_summary_length": self.max_length,
+            "tree_reduce": self.tree_reduce,
+            "fan_out": self.fan_out,
+            "batched": self.batched,
+            "batch_max_tokens": self.batch_max_tokens,
+            "batch_size": self.batch_size,
         }
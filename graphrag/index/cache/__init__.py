@@ -8,11 +8,13 @@ from .load_cache import load_cache
 from .memory_pipeline_cache import InMemoryCache
 from .noop_pipeline_cache import NoopPipelineCache
 from .pipeline_cache import PipelineCache
+from .sqlite_pipeline_cache import SqlitePipelineCache
 
 __all__ = [
     "InMemoryCache",
     "JsonPipelineCache",
     "NoopPipelineCache",
     "PipelineCache",
+    "SqlitePipelineCache",
     "load_cache",
 ]
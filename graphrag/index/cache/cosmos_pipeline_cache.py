@@ -1,57 +1,184 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""A module containing 'FilePipelineCache' model."""
+"""A module containing 'CosmosPipelineCache' model."""
 
-import json
+import asyncio
+import logging
+from contextlib import suppress
+from itertools import islice
 from typing import Any, cast
 
-from graphrag.index.storage import PipelineStorage, CosmosDBStorage
+from azure.cosmos.exceptions import CosmosResourceNotFoundError
+
+from graphrag.index.storage import CosmosDBStorage, PipelineStorage
+from graphrag.utils.lru_cache import LRUCache
 
 from .pipeline_cache import PipelineCache
 
+log = logging.getLogger(__name__)
+
+MEMORY_CACHE_MAX_ENTRIES = 50_000
+WRITE_BEHIND_BATCH_SIZE = 100
+WRITE_BEHIND_FLUSH_INTERVAL = 1.0
+FLUSH_MAX_RETRIES = 3
+FLUSH_RETRY_DELAY = 1.0
+
 
 class CosmosPipelineCache(PipelineCache):
-    """File pipeline cache class definition."""
+    """Cosmos pipeline cache class definition.
+
+    In write-behind mode `set` only queues the value; a background task upserts
+    queued values in batches once `WRITE_BEHIND_BATCH_SIZE` are pending or every
+    `WRITE_BEHIND_FLUSH_INTERVAL` seconds, and `flush` drains whatever is left,
+    retrying failed upserts with backoff and raising if any value is still unwritten.
+    """
 
     _storage: CosmosDBStorage
     _encoding: str
-    _memory_cache: dict[str, Any]
+    _memory_cache: LRUCache
+    _write_behind: bool
+    _pending: dict[str, Any]
+    _flush_task: asyncio.Task | None
+    _flush_wakeup: asyncio.Event | None
 
-    def __init__(self, storage: PipelineStorage, encoding="utf-8"):
+    def __init__(self, storage: PipelineStorage, encoding="utf-8", write_behind=False):
         """Init method definition."""
         self._storage = cast(CosmosDBStorage, storage)
         self._encoding = encoding
-        self._cache_client = self._storage.get_client('_cache')
-        self._memory_cache = {}
+        self._cache_client = self._storage.get_client("_cache")
+        self._memory_cache = LRUCache(MEMORY_CACHE_MAX_ENTRIES)
+        self._write_behind = write_behind
+        self._pending = {}
+        self._flush_task = None
+        self._flush_wakeup = None
 
     async def get(self, key: str) -> Any:
+        """Get method definition."""
+        if key in self._pending:
+            return self._pending[key]
         if key in self._memory_cache:
             return self._memory_cache[key]
-        
-        items = self._cache_client.query_items(f"SELECT * FROM c where c.id = '{key}'", partition_key=key, enable_cross_partition_query=False)
-        if items is not None:
-            item = next(iter(items), None)
-            if item is None:
-                return None
-        
-            value = item['value']
-            self._memory_cache[key] = value
-            return value
-        return None
+
+        try:
+            item = await self._storage.run_in_executor(
+                self._cache_client.read_item, item=key, partition_key=key
+            )
+        except CosmosResourceNotFoundError:
+            return None
+        value = item["value"]
+        self._memory_cache[key] = value
+        return value
 
     async def set(self, key: str, value: Any, debug_data: dict | None = None) -> None:
-        self._cache_client.upsert_item({'id': key, 'value': value})
+        """Set method definition."""
+        if not self._write_behind:
+            await self._upsert(key, value)
+            self._memory_cache[key] = value
+            return
+
+        self._pending[key] = value
+        self._ensure_flush_task()
+        if len(self._pending) >= WRITE_BEHIND_BATCH_SIZE:
+            cast(asyncio.Event, self._flush_wakeup).set()
 
     async def has(self, key: str) -> bool:
-        return self.get(key) != None
+        """Has method definition."""
+        return await self.get(key) is not None
 
     async def delete(self, key: str) -> None:
-        self._cache_client.delete_item(key, key)
+        """Delete method definition."""
+        self._pending.pop(key, None)
+        self._memory_cache.pop(key)
+        with suppress(CosmosResourceNotFoundError):
+            await self._storage.run_in_executor(
+                self._cache_client.delete_item, key, key
+            )
 
     async def clear(self) -> None:
-        if self._storage._db is not None:
-            self._storage._db.delete_container('_cache')
+        """Clear method definition."""
+        self._pending.clear()
+        self._memory_cache.clear()
+        if self._storage._db is not None:  # noqa: SLF001
+            self._storage._db.delete_container("_cache")  # noqa: SLF001
+
+    async def flush(self) -> None:
+        """Stop the background writer and upsert every pending value.
+
+        Failed upserts are retried up to `FLUSH_MAX_RETRIES` times with exponential backoff;
+        a `RuntimeError` is raised if values are still pending after that, as they would be lost.
+        """
+        if self._flush_task is not None:
+            task = self._flush_task
+            self._flush_task = None
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            except RuntimeError:
+                # the task belongs to a loop that is no longer running
+                log.warning("cosmos cache writer was bound to a closed event loop")
+
+        delay = FLUSH_RETRY_DELAY
+        for attempt in range(FLUSH_MAX_RETRIES + 1):
+            await self._flush_pending()
+            if not self._pending:
+                return
+            if attempt < FLUSH_MAX_RETRIES:
+                log.warning(
+                    "retrying %d pending cache writes in %.1fs",
+                    len(self._pending),
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                delay *= 2
+        msg = f"Failed to write {len(self._pending)} cache entries to cosmos"
+        raise RuntimeError(msg)
 
     def child(self, name: str) -> PipelineCache:
-        return self
\ No newline at end of file
+        """Child method definition."""
+        return self
+
+    def _ensure_flush_task(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_wakeup = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        wakeup = cast(asyncio.Event, self._flush_wakeup)
+        while True:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(wakeup.wait(), WRITE_BEHIND_FLUSH_INTERVAL)
+            wakeup.clear()
+            await self._flush_pending()
+
+    async def _flush_pending(self) -> None:
+        while self._pending:
+            batch = list(islice(self._pending.items(), WRITE_BEHIND_BATCH_SIZE))
+            results = await asyncio.gather(
+                *[self._upsert(key, value) for key, value in batch],
+                return_exceptions=True,
+            )
+            failed = 0
+            for (key, value), result in zip(batch, results, strict=True):
+                if isinstance(result, BaseException):
+                    failed += 1
+                    continue
+                # only retire the entry if it was not overwritten while in flight
+                if self._pending.get(key) is value:
+                    del self._pending[key]
+                self._memory_cache[key] = value
+            if failed > 0:
+                log.warning(
+                    "failed to write %d cache entries to cosmos, %d remain pending",
+                    failed,
+                    len(self._pending),
+                )
+                # leave the failures queued for the next flush
+                return
+
+    async def _upsert(self, key: str, value: Any) -> None:
+        await self._storage.run_in_executor(
+            self._cache_client.upsert_item, {"id": key, "value": value}
+        )
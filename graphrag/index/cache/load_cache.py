@@ -5,25 +5,32 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 from graphrag.config.enums import CacheType
 from graphrag.index.config.cache import (
     PipelineBlobCacheConfig,
-    PipelineFileCacheConfig,
     PipelineCosmosCacheConfig,
+    PipelineFileCacheConfig,
+    PipelineSqliteCacheConfig,
+)
+from graphrag.index.storage import (
+    BlobPipelineStorage,
+    CosmosDBStorage,
+    FilePipelineStorage,
 )
-from graphrag.index.storage import BlobPipelineStorage, FilePipelineStorage, CosmosDBStorage
 
 if TYPE_CHECKING:
     from graphrag.index.config import (
         PipelineCacheConfig,
     )
 
+from .cosmos_pipeline_cache import CosmosPipelineCache
 from .json_pipeline_cache import JsonPipelineCache
 from .memory_pipeline_cache import create_memory_cache
 from .noop_pipeline_cache import NoopPipelineCache
-from .cosmos_pipeline_cache import CosmosPipelineCache
+from .sqlite_pipeline_cache import SQLITE_CACHE_FILENAME, SqlitePipelineCache
 
 
 def load_cache(config: PipelineCacheConfig | None, root_dir: str | None):
@@ -56,7 +63,12 @@ def load_cache(config: PipelineCacheConfig | None, root_dir: str | None):
                 config.account_name,
                 config.account_key,
             )
-            return CosmosPipelineCache(storage)
+            return CosmosPipelineCache(storage, write_behind=config.write_behind)
+        case CacheType.sqlite:
+            config = cast(PipelineSqliteCacheConfig, config)
+            return SqlitePipelineCache(
+                Path(root_dir or "") / (config.base_dir or "") / SQLITE_CACHE_FILENAME
+            )
         case _:
             msg = f"Unknown cache type: {config.type}"
             raise ValueError(msg)
@@ -5,9 +5,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABCMeta, abstractmethod
 from typing import Any
 
+# the number of keys get_many and set_many read or write at once by default
+MANY_CONCURRENCY = 16
+
 
 class PipelineCache(metaclass=ABCMeta):
     """Provide a cache interface for the pipeline."""
@@ -58,6 +62,39 @@ class PipelineCache(metaclass=ABCMeta):
     async def clear(self) -> None:
         """Clear the cache."""
 
+    async def get_many(self, keys: list[str]) -> list[Any]:
+        """Get the values of several keys, None for missing keys.
+
+        Args:
+            - keys - The keys to get the values for.
+        """
+        result = []
+        for start in range(0, len(keys), MANY_CONCURRENCY):
+            result.extend(
+                await asyncio.gather(*[
+                    self.get(key) for key in keys[start : start + MANY_CONCURRENCY]
+                ])
+            )
+        return result
+
+    async def set_many(
+        self, values: dict[str, Any], debug_data: dict | None = None
+    ) -> None:
+        """Set several values.
+
+        Args:
+            - values - The values to set, by key.
+        """
+        items = list(values.items())
+        for start in range(0, len(items), MANY_CONCURRENCY):
+            await asyncio.gather(*[
+                self.set(key, value, debug_data)
+                for key, value in items[start : start + MANY_CONCURRENCY]
+            ])
+
+    async def flush(self) -> None:  # noqa: B027
+        """Write any pending (buffered) values through to the backing store."""
+
     @abstractmethod
     def child(self, name: str) -> PipelineCache:
         """Create a child cache with the given name.
@@ -0,0 +1,234 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the 'SqlitePipelineCache' model."""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from .pipeline_cache import PipelineCache
+
+log = logging.getLogger(__name__)
+
+SQLITE_CACHE_FILENAME = "cache.sqlite"
+_BATCH_SIZE = 500
+
+
+class _CacheDatabase:
+    """A SQLite database in WAL mode, shared by a cache and all of its children."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID"
+        )
+
+    def fetch(self, keys: list[str]) -> dict[str, str]:
+        values = {}
+        with self.lock:
+            for batch in _batched(keys):
+                rows = self.connection.execute(
+                    f"SELECT key, value FROM cache WHERE key IN ({_placeholders(batch)})",  # noqa: S608
+                    batch,
+                ).fetchall()
+                values.update(rows)
+        return values
+
+    def store(self, items: Iterable[tuple[str, str]]) -> int:
+        count = 0
+        with self.lock:
+            self.connection.execute("BEGIN")
+            try:
+                for batch in _batched(items):
+                    self.connection.executemany(
+                        "INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)", batch
+                    )
+                    count += len(batch)
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.connection.execute("COMMIT")
+        return count
+
+    def delete(self, keys: list[str]) -> None:
+        with self.lock:
+            self.connection.executemany(
+                "DELETE FROM cache WHERE key = ?", [(key,) for key in keys]
+            )
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self.lock:
+            if prefix:
+                self.connection.execute(
+                    "DELETE FROM cache WHERE key >= ? AND key < ?",
+                    (prefix, _prefix_end(prefix)),
+                )
+            else:
+                self.connection.execute("DELETE FROM cache")
+
+    def compact(self) -> None:
+        with self.lock:
+            self.connection.execute("VACUUM")
+            self.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+
+class SqlitePipelineCache(PipelineCache):
+    """Pipeline cache that keeps all entries in one SQLite database file.
+
+    Entries are stored in the same JSON format as `JsonPipelineCache`, and child caches
+    share the database, prefixing their keys with `<name>/` as the file cache nests
+    its directories.
+    """
+
+    _database: _CacheDatabase
+    _prefix: str
+
+    def __init__(
+        self,
+        path: str | Path,
+        prefix: str = "",
+        *,
+        _database: _CacheDatabase | None = None,
+    ):
+        """Open (or create) the cache database at the given path."""
+        self._database = _database or _CacheDatabase(path)
+        self._prefix = prefix
+
+    @property
+    def path(self) -> Path:
+        """The path of the database file."""
+        return self._database.path
+
+    async def get(self, key: str) -> Any:
+        """Get the value for the given key."""
+        return (await self.get_many([key]))[0]
+
+    async def get_many(self, keys: list[str]) -> list[Any]:
+        """Get the values of several keys in one query, None for missing keys."""
+        full_keys = [self._key(key) for key in keys]
+        rows = self._database.fetch(full_keys)
+        values = []
+        invalid = []
+        for key in full_keys:
+            value = rows.get(key)
+            if value is not None:
+                try:
+                    value = json.loads(value).get("result")
+                except json.decoder.JSONDecodeError:
+                    invalid.append(key)
+                    value = None
+            values.append(value)
+        if invalid:
+            self._database.delete(invalid)
+        return values
+
+    async def set(self, key: str, value: Any, debug_data: dict | None = None) -> None:
+        """Set the value for the given key."""
+        await self.set_many({key: value}, debug_data)
+
+    async def set_many(
+        self, values: dict[str, Any], debug_data: dict | None = None
+    ) -> None:
+        """Set several values in one transaction, None values are skipped."""
+        self._database.store(
+            (
+                self._key(key),
+                json.dumps({"result": value, **(debug_data or {})}, ensure_ascii=False),
+            )
+            for key, value in values.items()
+            if value is not None
+        )
+
+    async def has(self, key: str) -> bool:
+        """Return True if the given key exists in the cache."""
+        return self._key(key) in self._database.fetch([self._key(key)])
+
+    async def delete(self, key: str) -> None:
+        """Delete the given key from the cache."""
+        self._database.delete([self._key(key)])
+
+    async def clear(self) -> None:
+        """Delete all entries of this cache and its children."""
+        self._database.delete_prefix(self._prefix)
+
+    def child(self, name: str) -> "SqlitePipelineCache":
+        """Create a child cache whose keys are prefixed with the given name."""
+        return SqlitePipelineCache(
+            self.path, f"{self._prefix}{name}/", _database=self._database
+        )
+
+    def compact(self) -> None:
+        """Reclaim the space of deleted and overwritten entries, and truncate the write-ahead log."""
+        self._database.compact()
+
+    def close(self) -> None:
+        """Close the database connection, shared with all child caches."""
+        self._database.close()
+
+    def import_json_cache(self, directory: str | Path) -> int:
+        """Import the entries of a `JsonPipelineCache` directory, returning how many were imported.
+
+        Each file becomes an entry keyed by its path relative to the directory. Files
+        that do not hold a JSON object are skipped, as are this cache's own database files.
+        """
+        directory = Path(directory)
+        return self._database.store(
+            (self._key(key), value)
+            for key, value in _read_json_cache(directory, self.path)
+        )
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}{key}"
+
+
+def _read_json_cache(directory: Path, database_path: Path) -> Iterator[tuple[str, str]]:
+    database_files = {
+        database_path.resolve(),
+        *(Path(f"{database_path.resolve()}{suffix}") for suffix in ("-wal", "-shm")),
+    }
+    for root, _, files in os.walk(directory):
+        for file in sorted(files):
+            path = Path(root) / file
+            if path.resolve() in database_files:
+                continue
+            try:
+                value = path.read_text(encoding="utf-8")
+                if not isinstance(json.loads(value), dict):
+                    continue
+            except (UnicodeDecodeError, json.decoder.JSONDecodeError):
+                log.warning("skipping invalid cache entry %s", path)
+                continue
+            yield path.relative_to(directory).as_posix(), value
+
+
+def _batched(items: Iterable, size: int = _BATCH_SIZE) -> Iterator[list]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _placeholders(batch: list) -> str:
+    return ", ".join("?" * len(batch))
+
+
+def _prefix_end(prefix: str) -> str:
+    """Get the smallest string that is greater than all strings starting with the prefix."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
@@ -11,6 +11,7 @@ from .cache import (
     PipelineMemoryCacheConfig,
     PipelineCosmosCacheConfig,
     PipelineNoneCacheConfig,
+    PipelineSqliteCacheConfig,
 )
 from .input import (
     PipelineCSVInputConfig,
@@ -61,6 +62,7 @@ __all__ = [
     "PipelineMemoryCacheConfig",
     "PipelineMemoryStorageConfig",
     "PipelineCosmosCacheConfig",
+    "PipelineSqliteCacheConfig",
     "PipelineNoneCacheConfig",
     "PipelineReportingConfig",
     "PipelineReportingConfigTypes",
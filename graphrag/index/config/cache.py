@@ -73,6 +73,7 @@ class PipelineBlobCacheConfig(PipelineCacheConfig[Literal[CacheType.blob]]):
     )
     """The storage account blob url for cache"""
 
+
 class PipelineCosmosCacheConfig(PipelineCacheConfig[Literal[CacheType.cosmos]]):
     """Represents the cosmos cache configuration for the pipeline."""
 
@@ -99,10 +100,30 @@ class PipelineCosmosCacheConfig(PipelineCacheConfig[Literal[CacheType.cosmos]]):
     )
     """The account key for the cache."""
 
+    write_behind: bool = pydantic_Field(
+        description="Whether to queue cache writes and flush them in batches in the background.",
+        default=False,
+    )
+    """Whether to queue cache writes and flush them in batches in the background."""
+
+
+class PipelineSqliteCacheConfig(PipelineCacheConfig[Literal[CacheType.sqlite]]):
+    """Represents the sqlite cache configuration for the pipeline."""
+
+    type: Literal[CacheType.sqlite] = CacheType.sqlite
+    """The type of cache."""
+
+    base_dir: str | None = pydantic_Field(
+        description="The base directory for the cache database.", default=None
+    )
+    """The base directory for the cache database."""
+
+
 PipelineCacheConfigTypes = (
     PipelineFileCacheConfig
     | PipelineMemoryCacheConfig
     | PipelineBlobCacheConfig
     | PipelineCosmosCacheConfig
+    | PipelineSqliteCacheConfig
     | PipelineNoneCacheConfig
 )
@@ -62,3 +62,9 @@ class PipelineConfig(BaseModel):
         description="The workflows for the pipeline.", default_factory=list
     )
     """The workflows for the pipeline."""
+
+    max_parallel_workflows: int | None = pydantic_Field(
+        description="The number of independent workflows to run at once.",
+        default=None,
+    )
+    """The number of independent workflows to run at once."""
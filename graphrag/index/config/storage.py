@@ -91,6 +91,12 @@ class PipelineCosmosStorageConfig(PipelineStorageConfig[Literal[StorageType.cosm
         description="The cosmos account name.", default=None
     )
     """The cosmos account name."""
+
+    concurrent_requests: int | None = pydantic_Field(
+        description="The number of concurrent requests allowed when writing to cosmos.",
+        default=None,
+    )
+    """The number of concurrent requests allowed when writing to cosmos."""
     
 
 
@@ -27,6 +27,12 @@ class PipelineRunStats:
     workflows: dict[str, dict[str, float]] = field(default_factory=dict)
     """A dictionary of workflows."""
 
+    llm_concurrency: dict[str, dict[str, float]] = field(default_factory=dict)
+    """The adaptive concurrency window and throttle events of each model."""
+
+    llm_endpoints: dict[str, dict[str, float]] = field(default_factory=dict)
+    """The requests, tokens and latency of each load balanced endpoint."""
+
 
 @dc_dataclass
 class PipelineRunContext:
@@ -25,6 +25,7 @@ from graphrag.index.config.cache import (
     PipelineMemoryCacheConfig,
     PipelineCosmosCacheConfig,
     PipelineNoneCacheConfig,
+    PipelineSqliteCacheConfig,
 )
 from graphrag.index.config.input import (
     PipelineCSVInputConfig,
@@ -122,6 +123,7 @@ def create_pipeline_config(settings: GraphRagConfig, verbose=False) -> PipelineC
         reporting=_get_reporting_config(settings),
         storage=_get_storage_config(settings),
         cache=_get_cache_config(settings),
+        max_parallel_workflows=settings.max_parallel_workflows,
         workflows=[
             *_document_workflows(settings, embedded_fields),
             *_text_unit_workflows(settings, covariates_enabled, embedded_fields),
@@ -203,6 +205,7 @@ def _text_unit_workflows(
             name=create_base_text_units,
             config={
                 "chunk_by": settings.chunks.group_by_columns,
+                "streaming_batch_size": _get_streaming_batch_size(settings),
                 "text_chunk": {
                     "strategy": settings.chunks.resolved_strategy(
                         settings.encoding_model
@@ -264,6 +267,7 @@ def _graph_workflows(
             name=create_base_entity_graph,
             config={
                 "graphml_snapshot": settings.snapshots.graphml,
+                "streaming_batch_size": _get_streaming_batch_size(settings),
                 "entity_extract": {
                     **settings.entity_extraction.parallelization.model_dump(),
                     "async_mode": settings.entity_extraction.async_mode,
@@ -355,6 +359,7 @@ def _community_workflows(
                 "create_community_reports": {
                     **settings.community_reports.parallelization.model_dump(),
                     "async_mode": settings.community_reports.async_mode,
+                    "incremental": settings.community_reports.incremental,
                     "strategy": settings.community_reports.resolved_strategy(
                         settings.root_dir
                     ),
@@ -398,11 +403,16 @@ def _covariate_workflows(
                         settings.root_dir, settings.encoding_model
                     ),
                 },
+                "streaming_batch_size": _get_streaming_batch_size(settings),
             },
         )
     ]
 
 
+def _get_streaming_batch_size(settings: GraphRagConfig) -> int | None:
+    return settings.streaming.batch_size if settings.streaming.enabled else None
+
+
 def _get_pipeline_input_config(
     settings: GraphRagConfig,
 ) -> PipelineInputConfigTypes:
@@ -516,6 +526,7 @@ def _get_storage_config(
                 connection_string=connection_string,
                 account_name=account_name,
                 account_key=account_key,
+                concurrent_requests=settings.storage.concurrent_requests,
             )
         case _:
             # relative to the root_dir
@@ -570,7 +581,11 @@ def _get_cache_config(
                 connection_string=connection_string,
                 account_name=account_name,
                 account_key=account_key,
+                write_behind=settings.cache.write_behind,
             )
+        case CacheType.sqlite:
+            # relative to root dir
+            return PipelineSqliteCacheConfig(base_dir=settings.cache.base_dir)
         case _:
             # relative to root dir
             return PipelineFileCacheConfig(base_dir="./cache")
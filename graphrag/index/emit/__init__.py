@@ -3,6 +3,7 @@
 
 """Definitions for emitting pipeline artifacts to storage."""
 
+from .cosmos_emitter import CosmosEmitter
 from .csv_table_emitter import CSVTableEmitter
 from .factories import create_table_emitter, create_table_emitters
 from .json_table_emitter import JsonTableEmitter
@@ -12,6 +13,7 @@ from .types import TableEmitterType
 
 __all__ = [
     "CSVTableEmitter",
+    "CosmosEmitter",
     "JsonTableEmitter",
     "ParquetTableEmitter",
     "TableEmitter",
@@ -1,39 +1,185 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
 
-from typing import cast
-import pandas as pd
-import json
-import numpy
-from graphrag.index.storage import PipelineStorage, CosmosDBStorage
-from graphrag.index.typing import ErrorHandlerFn
+"""CosmosEmitter module."""
 
+import asyncio
+import logging
+import time
+import traceback
+from collections.abc import Iterator
+from typing import Any, cast
+
+import numpy as np
+import pandas as pd
 from azure.cosmos import ContainerProxy
+from azure.cosmos.exceptions import CosmosHttpResponseError
+from datashaper import WorkflowCallbacks
+
+from graphrag.index.storage import CosmosDBStorage, PipelineStorage
+from graphrag.index.typing import ErrorHandlerFn
 
 from .table_emitter import TableEmitter
 
+log = logging.getLogger(__name__)
+
+_THROTTLED_STATUS_CODE = 429
+_MAX_THROTTLE_RETRIES = 10
+_MAX_BACKOFF_SECONDS = 30.0
+
+
 class CosmosEmitter(TableEmitter):
-    """CosmosEmitter protocol for emitting tables to a destination."""
+    """CosmosEmitter class, bulk upserts each table row as a document in a `_<table>` container."""
 
-    def __init__(self, storage: PipelineStorage, on_error: ErrorHandlerFn) -> None:
-        self.storage = storage
-        self.on_error = on_error
+    _storage: CosmosDBStorage
+    _on_error: ErrorHandlerFn
+    _callbacks: WorkflowCallbacks | None
+
+    def __init__(
+        self,
+        storage: PipelineStorage,
+        on_error: ErrorHandlerFn,
+        callbacks: WorkflowCallbacks | None = None,
+    ) -> None:
+        """Create a new Cosmos Table Emitter."""
         self._storage = cast(CosmosDBStorage, storage)
+        self._on_error = on_error
+        self._callbacks = callbacks
 
-        
     async def emit(self, name: str, data: pd.DataFrame) -> None:
         """Emit a dataframe to CosmosDB."""
-        client:ContainerProxy = self._storage.get_client('_' + name, True)  # type: ignore
-        ## Emit the data
-        for i, row in data.iterrows():
-            if 'id' not in row:
-                row['id'] = str(i)
-            row_data = row.to_dict()
-            for key, value in row_data.items():
-                if isinstance(value, pd.Timestamp):
-                    row_data[key] = value.to_pydatetime()
-                elif isinstance(value, pd.Series):
-                    row_data[key] = value.to_list()
-                elif isinstance(value, numpy.ndarray):
-                    row_data[key] = value.tolist()
-                
-            print(f"[{name}] Emitting Row: {row_data['id']}: {len(json.dumps(row_data))} bytes")
-            client.upsert_item(row_data)
+        client = cast(ContainerProxy, self._storage.get_client("_" + name, True))
+        documents = _to_documents(data)
+        stats = _EmitStats()
+        log.info("emitting %d rows to cosmos container _%s", len(data), name)
+
+        async def upsert_worker() -> None:
+            # all workers share the same document iterator, so at most
+            # `concurrent_requests` upserts are in flight at any time
+            for document in documents:
+                try:
+                    await self._upsert(client, document, stats)
+                except Exception as e:
+                    log.exception("Error while emitting cosmos document")
+                    stats.failed += 1
+                    self._on_error(e, traceback.format_exc(), {"id": document["id"]})
+
+        start_time = time.time()
+        await asyncio.gather(*[
+            upsert_worker() for _ in range(max(self._storage.concurrent_requests, 1))
+        ])
+        elapsed = max(time.time() - start_time, 1e-9)
+        rows_per_second = stats.emitted / elapsed
+
+        log.info(
+            "emitted %d rows to _%s in %.2fs (%.1f rows/s, %.1f RU, %d throttled, %d failed)",
+            stats.emitted,
+            name,
+            elapsed,
+            rows_per_second,
+            stats.request_charge,
+            stats.throttled,
+            stats.failed,
+        )
+        if self._callbacks is not None:
+            details = {
+                "table": name,
+                "rows": stats.emitted,
+                "failed": stats.failed,
+                "throttled": stats.throttled,
+                "seconds": elapsed,
+            }
+            self._callbacks.on_measure("emit_rows_per_second", rows_per_second, details)
+            self._callbacks.on_measure(
+                "emit_request_charge", stats.request_charge, details
+            )
+
+    async def _upsert(
+        self, client: ContainerProxy, document: dict[str, Any], stats: "_EmitStats"
+    ) -> None:
+        """Upsert a single document, backing off on its partition while it is throttled.
+
+        Containers are partitioned on `/id`, so a throttled document only delays
+        retries against its own partition while the other workers keep writing.
+        """
+        attempt = 0
+        while True:
+            try:
+                await self._storage.run_in_executor(
+                    client.upsert_item, document, raw_response_hook=stats.on_response
+                )
+            except CosmosHttpResponseError as e:
+                if (
+                    e.status_code != _THROTTLED_STATUS_CODE
+                    or attempt >= _MAX_THROTTLE_RETRIES
+                ):
+                    raise
+                attempt += 1
+                stats.throttled += 1
+                await asyncio.sleep(_retry_after(e, attempt))
+            else:
+                stats.emitted += 1
+                return
+
+
+class _EmitStats:
+    """Running totals for a single table emit."""
+
+    def __init__(self) -> None:
+        self.emitted = 0
+        self.failed = 0
+        self.throttled = 0
+        self.request_charge = 0.0
+
+    def on_response(self, response: Any) -> None:
+        """Collect the request charge from a raw Cosmos response."""
+        charge = response.http_response.headers.get("x-ms-request-charge")
+        if charge is not None:
+            self.request_charge += float(charge)
+
+
+def _retry_after(error: CosmosHttpResponseError, attempt: int) -> float:
+    """Seconds to wait before retrying a throttled request."""
+    headers = error.response.headers if error.response is not None else {}
+    retry_after_ms = headers.get("x-ms-retry-after-ms")
+    if retry_after_ms is not None:
+        return float(retry_after_ms) / 1000
+    return min(0.1 * 2**attempt, _MAX_BACKOFF_SECONDS)
+
+
+def _to_documents(data: pd.DataFrame) -> Iterator[dict[str, Any]]:
+    """Convert a dataframe into JSON-safe Cosmos documents, converting each column once."""
+    columns = {str(name): _to_json_values(data[name]) for name in data.columns}
+    ids = columns["id"] if "id" in columns else list(data.index)
+    columns["id"] = [str(id) for id in ids]
+    names = list(columns.keys())
+    for values in zip(*columns.values(), strict=True):
+        yield dict(zip(names, values, strict=True))
+
+
+def _to_json_values(column: pd.Series) -> list[Any]:
+    """Convert a column into a list of JSON-safe python values."""
+    if pd.api.types.is_datetime64_any_dtype(column):
+        return [None if pd.isna(value) else value.isoformat() for value in column]
+    if pd.api.types.is_bool_dtype(column) or pd.api.types.is_numeric_dtype(column):
+        return column.astype(object).where(column.notna(), None).tolist()
+    return [_to_json_value(value) for value in column]
+
+
+def _to_json_value(value: Any) -> Any:
+    """Convert a single object cell into a JSON-safe python value."""
+    if isinstance(value, np.ndarray) and value.dtype.kind in "biuf":
+        return value.tolist()
+    if isinstance(value, np.ndarray | pd.Series | list | tuple):
+        return [_to_json_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_json_value(item) for key, item in value.items()}
+    if value is pd.NaT:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
@@ -3,19 +3,24 @@
 
 """Table Emitter Factories."""
 
+from datashaper import WorkflowCallbacks
+
 from graphrag.index.storage import PipelineStorage
 from graphrag.index.typing import ErrorHandlerFn
 
+from .cosmos_emitter import CosmosEmitter
 from .csv_table_emitter import CSVTableEmitter
 from .json_table_emitter import JsonTableEmitter
 from .parquet_table_emitter import ParquetTableEmitter
 from .table_emitter import TableEmitter
-from .cosmos_emitter import CosmosEmitter
 from .types import TableEmitterType
 
 
 def create_table_emitter(
-    emitter_type: TableEmitterType, storage: PipelineStorage, on_error: ErrorHandlerFn
+    emitter_type: TableEmitterType,
+    storage: PipelineStorage,
+    on_error: ErrorHandlerFn,
+    callbacks: WorkflowCallbacks | None = None,
 ) -> TableEmitter:
     """Create a table emitter based on the specified type."""
     match emitter_type:
@@ -26,7 +31,7 @@ def create_table_emitter(
         case TableEmitterType.CSV:
             return CSVTableEmitter(storage)
         case TableEmitterType.Cosmos:
-            return CosmosEmitter(storage, on_error)
+            return CosmosEmitter(storage, on_error, callbacks)
         case _:
             msg = f"Unsupported table emitter type: {emitter_type}"
             raise ValueError(msg)
@@ -36,9 +41,10 @@ def create_table_emitters(
     emitter_types: list[TableEmitterType],
     storage: PipelineStorage,
     on_error: ErrorHandlerFn,
+    callbacks: WorkflowCallbacks | None = None,
 ) -> list[TableEmitter]:
     """Create a list of table emitters based on the specified types."""
     return [
-        create_table_emitter(emitter_type, storage, on_error)
+        create_table_emitter(emitter_type, storage, on_error, callbacks)
         for emitter_type in emitter_types
     ]
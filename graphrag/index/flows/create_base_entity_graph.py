@@ -3,8 +3,12 @@
 
 """All the steps to create the base entity graph."""
 
-from typing import Any, cast
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any
 
+import networkx as nx
 import pandas as pd
 from datashaper import (
     AsyncType,
@@ -18,7 +22,7 @@ from graphrag.index.operations.extract_entities import extract_entities
 from graphrag.index.operations.merge_graphs import merge_graphs
 from graphrag.index.operations.snapshot import snapshot
 from graphrag.index.operations.snapshot_graphml import snapshot_graphml
-from graphrag.index.operations.snapshot_rows import snapshot_rows
+from graphrag.index.operations.spill_batches import delete_partitions, spill_batches
 from graphrag.index.operations.summarize_descriptions import (
     summarize_descriptions,
 )
@@ -44,28 +48,66 @@ async def create_base_entity_graph(
     embedding_strategy: dict[str, Any] | None = None,
     graphml_snapshot_enabled: bool = False,
     raw_entity_snapshot_enabled: bool = False,
-) -> pd.DataFrame:
-    """All the steps to create the base entity graph."""
-    # this returns a graph for each text unit, to be merged later
-    entities, entity_graphs = await extract_entities(
-        text_units,
-        callbacks,
-        cache,
-        text_column=text_column,
-        id_column=id_column,
-        strategy=extraction_strategy,
-        async_mode=extraction_async_mode,
-        entity_types=entity_types,
-        to="entities",
-        num_threads=extraction_num_threads,
-    )
+    batch_size: int | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """All the steps to create the base entity graph.
 
-    merged_graph = merge_graphs(
-        entity_graphs,
-        callbacks,
-        node_operations=node_merge_config,
-        edge_operations=edge_merge_config,
-    )
+    Returns the clustered graph as a node table and an edge table keyed by community level.
+    With a `batch_size`, the text units are extracted that many at a time: the graphs of each
+    batch are spilled to the storage and merged into the graph before the next batch is extracted,
+    so the raw extraction results in memory are bounded by the batch size. The merged graph and
+    the returned tables are not.
+    """
+
+    async def extract(batch: pd.DataFrame) -> tuple[pd.DataFrame, list[nx.Graph]]:
+        # this returns a graph for each text unit, to be merged later
+        return await extract_entities(
+            batch,
+            callbacks,
+            cache,
+            text_column=text_column,
+            id_column=id_column,
+            strategy=extraction_strategy,
+            async_mode=extraction_async_mode,
+            entity_types=entity_types,
+            to="entities",
+            num_threads=extraction_num_threads,
+        )
+
+    if batch_size:
+        merged_graph = await _extract_graph_in_batches(
+            text_units,
+            extract,
+            callbacks,
+            storage,
+            id_column,
+            batch_size,
+            node_merge_config,
+            edge_merge_config,
+            raw_entity_snapshot_enabled,
+            extraction_config={
+                "text_column": text_column,
+                "strategy": extraction_strategy,
+                "entity_types": entity_types,
+            },
+        )
+    else:
+        entities, entity_graphs = await extract(text_units)
+
+        merged_graph = merge_graphs(
+            entity_graphs,
+            callbacks,
+            node_operations=node_merge_config,
+            edge_operations=edge_merge_config,
+        )
+
+        if raw_entity_snapshot_enabled:
+            await snapshot(
+                entities,
+                name="raw_extracted_entities",
+                storage=storage,
+                formats=["json"],
+            )
 
     summarized = await summarize_descriptions(
         merged_graph,
@@ -75,30 +117,20 @@ async def create_base_entity_graph(
         num_threads=summarization_num_threads,
     )
 
-    clustered = cluster_graph(
+    # the clustering runs in a thread, off the event loop the other workflows share
+    nodes, edges = await asyncio.to_thread(
+        cluster_graph,
         summarized,
         callbacks,
-        column="entity_graph",
         strategy=clustering_strategy,
-        to="clustered_graph",
-        level_to="level",
     )
 
-    if embedding_strategy:
-        clustered["embeddings"] = await embed_graph(
-            clustered,
-            callbacks,
-            column="clustered_graph",
-            strategy=embedding_strategy,
-        )
-
-    if raw_entity_snapshot_enabled:
-        await snapshot(
-            entities,
-            name="raw_extracted_entities",
-            storage=storage,
-            formats=["json"],
-        )
+    embeddings = (
+        embed_graph(summarized, strategy=embedding_strategy)
+        if embedding_strategy
+        else {}
+    )
+    nodes["graph_embedding"] = [embeddings.get(label) for label in nodes["label"]]
 
     if graphml_snapshot_enabled:
         await snapshot_graphml(
@@ -111,24 +143,101 @@ async def create_base_entity_graph(
             name="summarized_graph",
             storage=storage,
         )
-        await snapshot_rows(
-            clustered,
-            column="clustered_graph",
-            base_name="clustered_graph",
-            storage=storage,
-            formats=[{"format": "text", "extension": "graphml"}],
-        )
+        levels = nodes["level"].unique()
+        for level in levels:
+            await snapshot_graphml(
+                _to_graph(
+                    nodes[nodes["level"] == level], edges[edges["level"] == level]
+                ),
+                name="clustered_graph"
+                if len(levels) == 1
+                else f"clustered_graph.{level}",
+                storage=storage,
+            )
         if embedding_strategy:
-            await snapshot_rows(
-                clustered,
-                column="entity_graph",
-                base_name="embedded_graph",
+            await snapshot_graphml(
+                summarized,
+                name="embedded_graph",
+                storage=storage,
+            )
+
+    return nodes, edges
+
+
+async def _extract_graph_in_batches(
+    text_units: pd.DataFrame,
+    extract: Callable[[pd.DataFrame], Awaitable[tuple[pd.DataFrame, list[nx.Graph]]]],
+    callbacks: VerbCallbacks,
+    storage: PipelineStorage,
+    id_column: str,
+    batch_size: int,
+    node_merge_config: dict[str, Any] | None,
+    edge_merge_config: dict[str, Any] | None,
+    raw_entity_snapshot_enabled: bool,
+    extraction_config: dict[str, Any] | None = None,
+) -> nx.Graph:
+    """Extract and merge the graph one batch of text units at a time.
+
+    The batches are merged in order, so the graph is the same as when merging every text unit's graph at once.
+    Only one batch of raw extraction results is held in memory; the merged graph still grows with the input.
+    The `extraction_config` is part of the spilled partition keys, so partitions extracted with other settings
+    are not reused.
+    """
+
+    async def extract_batch(batch: pd.DataFrame) -> pd.DataFrame:
+        entities, entity_graphs = await extract(batch)
+        # the node-link form keeps the attribute types and the order of nodes and edges
+        entities["entities"] = [json.dumps(e) for e in entities["entities"]]
+        entities["graph"] = [
+            json.dumps(nx.node_link_data(g)) if g is not None else None
+            for g in entity_graphs
+        ]
+        return entities
+
+    merged_graph = nx.Graph()
+    partitions = []
+    async for key, partition in spill_batches(
+        text_units,
+        batch_size,
+        "extracted_entities",
+        id_column,
+        storage,
+        extract_batch,
+        extraction_config,
+    ):
+        merge_graphs(
+            [
+                nx.node_link_graph(json.loads(g)) if g is not None else None
+                for g in partition["graph"]
+            ],
+            callbacks,
+            node_operations=node_merge_config,
+            edge_operations=edge_merge_config,
+            target=merged_graph,
+        )
+        if raw_entity_snapshot_enabled:
+            entities = partition.drop(columns=["graph"])
+            entities["entities"] = [json.loads(e) for e in entities["entities"]]
+            await snapshot(
+                entities,
+                name=f"raw_extracted_entities.part-{len(partitions):05d}",
                 storage=storage,
-                formats=[{"format": "text", "extension": "graphml"}],
+                formats=["json"],
             )
+        partitions.append(key)
+
+    await delete_partitions(partitions, storage)
+    return merged_graph
 
-    final_columns = ["level", "clustered_graph"]
-    if embedding_strategy:
-        final_columns.append("embeddings")
 
-    return cast(pd.DataFrame, clustered[final_columns])
+def _to_graph(nodes: pd.DataFrame, edges: pd.DataFrame) -> nx.Graph:
+    """Rebuild a single level of the clustered graph from its node and edge tables."""
+    graph = nx.Graph()
+    for node in nodes.drop(columns=["graph_embedding"]).to_dict("records"):
+        label = node.pop("label")
+        graph.add_node(label, **{k: v for k, v in node.items() if pd.notna(v)})
+    for edge in edges.to_dict("records"):
+        source = edge.pop("source")
+        target = edge.pop("target")
+        graph.add_edge(source, target, **{k: v for k, v in edge.items() if pd.notna(v)})
+    return graph
@@ -25,8 +25,14 @@ def create_base_text_units(
     n_tokens_column_name: str,
     chunk_by_columns: list[str],
     chunk_strategy: dict[str, Any] | None = None,
+    batch_size: int | None = None,
 ) -> pd.DataFrame:
-    """All the steps to transform base text_units."""
+    """All the steps to transform base text_units.
+
+    With a `batch_size`, the document groups are chunked that many at a time, which bounds the
+    intermediate chunking columns to one batch. It does not bound the output: the text units of
+    every batch are concatenated into the returned table, so peak memory still grows with the corpus.
+    """
     sort = documents.sort_values(by=["id"], ascending=[True])
 
     sort["text_with_ids"] = list(
@@ -49,6 +55,32 @@ def create_base_text_units(
 
     callbacks.progress(Progress(percent=1))
 
+    # chunks never span document groups, so the groups can be chunked in batches
+    batch_size = batch_size or max(len(aggregated), 1)
+    text_units = [
+        _chunk_documents(
+            aggregated.iloc[start : start + batch_size],
+            callbacks,
+            chunk_column_name,
+            n_tokens_column_name,
+            chunk_by_columns,
+            chunk_strategy,
+        )
+        for start in range(0, max(len(aggregated), 1), batch_size)
+    ]
+    if len(text_units) == 1:
+        return text_units[0]
+    return pd.concat(text_units, ignore_index=True)
+
+
+def _chunk_documents(
+    aggregated: pd.DataFrame,
+    callbacks: VerbCallbacks,
+    chunk_column_name: str,
+    n_tokens_column_name: str,
+    chunk_by_columns: list[str],
+    chunk_strategy: dict[str, Any] | None,
+) -> pd.DataFrame:
     chunked = chunk_text(
         aggregated,
         column="texts",
@@ -4,21 +4,13 @@
 """All the steps to transform final communities."""
 
 import pandas as pd
-from datashaper import (
-    VerbCallbacks,
-)
-
-from graphrag.index.operations.unpack_graph import unpack_graph
 
 
 def create_final_communities(
-    entity_graph: pd.DataFrame,
-    callbacks: VerbCallbacks,
+    graph_nodes: pd.DataFrame,
+    graph_edges: pd.DataFrame,
 ) -> pd.DataFrame:
     """All the steps to transform final communities."""
-    graph_nodes = unpack_graph(entity_graph, callbacks, "clustered_graph", "nodes")
-    graph_edges = unpack_graph(entity_graph, callbacks, "clustered_graph", "edges")
-
     # Merge graph_nodes with graph_edges for both source and target matches
     source_clusters = graph_nodes.merge(
         graph_edges, left_on="label", right_on="source", how="inner"
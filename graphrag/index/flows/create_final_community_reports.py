@@ -3,6 +3,7 @@
 
 """All the steps to transform community reports."""
 
+from collections.abc import Collection
 from uuid import uuid4
 
 import pandas as pd
@@ -51,8 +52,16 @@ async def create_final_community_reports(
     full_content_text_embed: dict | None = None,
     summary_text_embed: dict | None = None,
     title_text_embed: dict | None = None,
+    previous_reports: pd.DataFrame | None = None,
+    changed_communities: Collection[str] | None = None,
 ) -> pd.DataFrame:
-    """All the steps to transform community reports."""
+    """All the steps to transform community reports.
+
+    With `previous_reports`, the reports whose fingerprint did not change are reused along with
+    their id and embeddings, and only the new and changed reports are generated and embedded.
+    With `changed_communities` as well, the reports of the communities outside of it are reused
+    instead, whatever their fingerprint.
+    """
     nodes = _prep_nodes(nodes_input)
     edges = _prep_edges(edges_input)
 
@@ -79,18 +88,25 @@ async def create_final_community_reports(
         summarization_strategy,
         async_mode=async_mode,
         num_threads=num_threads,
+        previous_reports=previous_reports,
+        changed_communities=changed_communities,
     )
 
-    community_reports["id"] = community_reports["community"].apply(
-        lambda _x: str(uuid4())
-    )
+    community_reports["id"] = [
+        id or str(uuid4())
+        for id in _previous_values(
+            community_reports, previous_reports, "id", changed_communities
+        )
+    ]
 
     # Embed full content if not skipped
     if full_content_text_embed:
-        community_reports["full_content_embedding"] = await embed_text(
+        community_reports["full_content_embedding"] = await _embed_changed(
             community_reports,
+            previous_reports,
             callbacks,
             cache,
+            changed_communities,
             column="full_content",
             strategy=full_content_text_embed["strategy"],
             embedding_name="community_report_full_content",
@@ -98,10 +114,12 @@ async def create_final_community_reports(
 
     # Embed summary if not skipped
     if summary_text_embed:
-        community_reports["summary_embedding"] = await embed_text(
+        community_reports["summary_embedding"] = await _embed_changed(
             community_reports,
+            previous_reports,
             callbacks,
             cache,
+            changed_communities,
             column="summary",
             strategy=summary_text_embed["strategy"],
             embedding_name="community_report_summary",
@@ -109,10 +127,12 @@ async def create_final_community_reports(
 
     # Embed title if not skipped
     if title_text_embed:
-        community_reports["title_embedding"] = await embed_text(
+        community_reports["title_embedding"] = await _embed_changed(
             community_reports,
+            previous_reports,
             callbacks,
             cache,
+            changed_communities,
             column="title",
             strategy=title_text_embed["strategy"],
             embedding_name="community_report_title",
@@ -121,6 +141,94 @@ async def create_final_community_reports(
     return community_reports
 
 
+def _previous_values(
+    reports: pd.DataFrame,
+    previous_reports: pd.DataFrame | None,
+    column: str,
+    changed_communities: Collection[str] | None = None,
+) -> list:
+    """Get the previous value of a column for each reused report, or None for the generated ones."""
+    if (
+        previous_reports is None
+        or len(reports) == 0
+        or column not in previous_reports.columns
+    ):
+        return [None] * len(reports)
+    if changed_communities is not None:
+        changed = set(map(str, changed_communities))
+        values = dict(
+            zip(
+                previous_reports["community"].astype(str),
+                previous_reports[column],
+                strict=True,
+            )
+        )
+        return [
+            None if community in changed else values.get(community)
+            for community in reports["community"].astype(str)
+        ]
+    if "fingerprint" not in previous_reports.columns:
+        return [None] * len(reports)
+    values = {
+        (str(community), fingerprint): value
+        for community, fingerprint, value in zip(
+            previous_reports["community"],
+            previous_reports["fingerprint"],
+            previous_reports[column],
+            strict=True,
+        )
+    }
+    return [
+        values.get((str(community), fingerprint))
+        for community, fingerprint in zip(
+            reports["community"], reports["fingerprint"], strict=True
+        )
+    ]
+
+
+async def _embed_changed(
+    reports: pd.DataFrame,
+    previous_reports: pd.DataFrame | None,
+    callbacks: VerbCallbacks,
+    cache: PipelineCache,
+    changed_communities: Collection[str] | None,
+    column: str,
+    strategy: dict,
+    embedding_name: str,
+):
+    """Embed the new and changed reports, the reused reports keeping their previous embedding.
+
+    A vector store collection is overwritten on each run, so all the reports are embedded
+    into it, the unchanged ones being served from the embedding cache.
+    """
+    if strategy.get("vector_store"):
+        return await embed_text(
+            reports,
+            callbacks,
+            cache,
+            column=column,
+            strategy=strategy,
+            embedding_name=embedding_name,
+        )
+
+    embeddings = _previous_values(
+        reports, previous_reports, f"{column}_embedding", changed_communities
+    )
+    changed = [i for i, embedding in enumerate(embeddings) if embedding is None]
+    if len(changed) > 0:
+        changed_embeddings = await embed_text(
+            reports.iloc[changed],
+            callbacks,
+            cache,
+            column=column,
+            strategy=strategy,
+            embedding_name=embedding_name,
+        )
+        for i, embedding in zip(changed, changed_embeddings, strict=True):
+            embeddings[i] = embedding
+    return embeddings
+
+
 def _prep_nodes(input: pd.DataFrame) -> pd.DataFrame:
     input = input.fillna(value={NODE_DESCRIPTION: "No Description"})
     # merge values of four columns into a map column
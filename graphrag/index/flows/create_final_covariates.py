@@ -16,6 +16,12 @@ from graphrag.index.cache import PipelineCache
 from graphrag.index.operations.extract_covariates import (
     extract_covariates,
 )
+from graphrag.index.operations.spill_batches import (
+    delete_partitions,
+    load_partitions,
+    spill_batches,
+)
+from graphrag.index.storage import PipelineStorage
 
 
 async def create_final_covariates(
@@ -28,19 +34,55 @@ async def create_final_covariates(
     async_mode: AsyncType = AsyncType.AsyncIO,
     entity_types: list[str] | None = None,
     num_threads: int = 4,
+    storage: PipelineStorage | None = None,
+    batch_size: int | None = None,
 ) -> pd.DataFrame:
-    """All the steps to extract and format covariates."""
-    covariates = await extract_covariates(
-        text_units,
-        callbacks,
-        cache,
-        column,
-        covariate_type,
-        extraction_strategy,
-        async_mode,
-        entity_types,
-        num_threads,
-    )
+    """All the steps to extract and format covariates.
+
+    With a `batch_size` and a `storage`, the text units are extracted that many at a time and
+    the covariates of each batch are spilled to the storage, so a resumed run reuses the batches
+    that were already extracted. This does not bound memory: the spilled covariates are read back
+    into one table once every batch is extracted, so the whole covariate table is held at the end.
+    """
+
+    async def extract(batch: pd.DataFrame) -> pd.DataFrame:
+        return await extract_covariates(
+            batch,
+            callbacks,
+            cache,
+            column,
+            covariate_type,
+            extraction_strategy,
+            async_mode,
+            entity_types,
+            num_threads,
+        )
+
+    if batch_size and storage is not None:
+        partitions = [
+            key
+            async for key, _ in spill_batches(
+                text_units,
+                batch_size,
+                "extracted_covariates",
+                column,
+                storage,
+                extract,
+                {
+                    "column": column,
+                    "covariate_type": covariate_type,
+                    "strategy": extraction_strategy,
+                    "entity_types": entity_types,
+                },
+            )
+        ]
+        covariates = pd.concat(
+            [partition async for partition in load_partitions(partitions, storage)],
+            ignore_index=True,
+        )
+        await delete_partitions(partitions, storage)
+    else:
+        covariates = await extract(text_units)
 
     covariates["id"] = covariates["covariate_type"].apply(lambda _x: str(uuid4()))
     covariates["human_readable_id"] = (covariates.index + 1).astype(str)
@@ -11,11 +11,10 @@ from datashaper import (
 from graphrag.index.cache import PipelineCache
 from graphrag.index.operations.embed_text import embed_text
 from graphrag.index.operations.split_text import split_text
-from graphrag.index.operations.unpack_graph import unpack_graph
 
 
 async def create_final_entities(
-    entity_graph: pd.DataFrame,
+    entity_nodes: pd.DataFrame,
     callbacks: VerbCallbacks,
     cache: PipelineCache,
     name_text_embed: dict | None = None,
@@ -24,8 +23,7 @@ async def create_final_entities(
     """All the steps to transform final entities."""
     # Process nodes
     nodes = (
-        unpack_graph(entity_graph, callbacks, "clustered_graph", "nodes")
-        .rename(columns={"label": "name"})
+        entity_nodes.rename(columns={"label": "name"})
         .loc[
             :,
             [
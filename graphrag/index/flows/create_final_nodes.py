@@ -5,6 +5,7 @@
 
 from typing import Any, cast
 
+import networkx as nx
 import pandas as pd
 from datashaper import (
     VerbCallbacks,
@@ -12,12 +13,11 @@ from datashaper import (
 
 from graphrag.index.operations.layout_graph import layout_graph
 from graphrag.index.operations.snapshot import snapshot
-from graphrag.index.operations.unpack_graph import unpack_graph
 from graphrag.index.storage import PipelineStorage
 
 
 async def create_final_nodes(
-    entity_graph: pd.DataFrame,
+    entity_nodes: pd.DataFrame,
     callbacks: VerbCallbacks,
     storage: PipelineStorage,
     layout_strategy: dict[str, Any],
@@ -25,27 +25,31 @@ async def create_final_nodes(
     snapshot_top_level_nodes: bool = False,
 ) -> pd.DataFrame:
     """All the steps to transform final nodes."""
-    laid_out_entity_graph = cast(
-        pd.DataFrame,
-        layout_graph(
-            entity_graph,
-            callbacks,
-            layout_strategy,
-            embeddings_column="embeddings",
-            graph_column="clustered_graph",
-            to="node_positions",
-            graph_to="positioned_graph",
-        ),
+    # the graph structure and embeddings are the same at every level, so a single layout
+    # of the positioned level serves all of them
+    level_nodes = entity_nodes[entity_nodes["level"] == level_for_node_positions]
+    layout = layout_graph(
+        _to_layout_graph(level_nodes),
+        callbacks,
+        layout_strategy,
+        embeddings={
+            label: embedding
+            for label, embedding in zip(
+                level_nodes["label"], level_nodes["graph_embedding"], strict=True
+            )
+            if embedding is not None
+        },
     )
 
-    nodes = cast(
-        pd.DataFrame,
-        unpack_graph(
-            laid_out_entity_graph, callbacks, column="positioned_graph", type="nodes"
-        ),
-    )
-
-    nodes_without_positions = nodes.drop(columns=["x", "y"], errors="ignore")
+    nodes = entity_nodes.merge(layout, on="label", how="left")
+    nodes_without_positions = nodes.loc[
+        :,
+        [
+            *entity_nodes.columns.drop("graph_embedding"),
+            "size",
+            "graph_embedding",
+        ],
+    ]
 
     nodes = nodes[nodes["level"] == level_for_node_positions].reset_index(drop=True)
     nodes = cast(pd.DataFrame, nodes[["id", "x", "y"]])
@@ -70,3 +74,15 @@ async def create_final_nodes(
     joined.rename(columns={"label": "title", "cluster": "community"}, inplace=True)
 
     return joined
+
+
+def _to_layout_graph(nodes: pd.DataFrame) -> nx.Graph:
+    """Build the node-only graph the layout strategies read cluster and degree from."""
+    graph = nx.Graph()
+    for label, cluster, degree in zip(
+        nodes["label"], nodes["cluster"], nodes["degree"], strict=True
+    ):
+        graph.add_node(label, degree=degree)
+        if pd.notna(cluster):
+            graph.nodes[label]["cluster"] = cluster
+    return graph
@@ -15,20 +15,17 @@ from graphrag.index.operations.compute_edge_combined_degree import (
     compute_edge_combined_degree,
 )
 from graphrag.index.operations.embed_text import embed_text
-from graphrag.index.operations.unpack_graph import unpack_graph
 
 
 async def create_final_relationships(
-    entity_graph: pd.DataFrame,
+    relationship_edges: pd.DataFrame,
     nodes: pd.DataFrame,
     callbacks: VerbCallbacks,
     cache: PipelineCache,
     description_text_embed: dict | None = None,
 ) -> pd.DataFrame:
     """All the steps to transform final relationships."""
-    graph_edges = unpack_graph(entity_graph, callbacks, "clustered_graph", "edges")
-
-    graph_edges.rename(columns={"source_id": "text_unit_ids"}, inplace=True)
+    graph_edges = relationship_edges.rename(columns={"source_id": "text_unit_ids"})
 
     filtered = cast(
         pd.DataFrame, graph_edges[graph_edges["level"] == 0].reset_index(drop=True)
@@ -2,6 +2,10 @@
 # Licensed under the MIT License
 """Sort context by degree in descending order."""
 
+import math
+from collections.abc import Callable
+from typing import Any
+
 import pandas as pd
 
 import graphrag.index.graph.extractors.community_reports.schemas as schemas
@@ -107,6 +111,9 @@ def sort_context(
 
         return "\n\n".join(contexts)
 
+    def _is_valid(row: dict, id_column: str) -> bool:
+        return id_column in row and row[id_column] and str(row[id_column]).strip() != ""
+
     # sort node details by degree in descending order
     edges = []
     node_details = {}
@@ -127,30 +134,170 @@ def sort_context(
     edges = [edge for edge in edges if isinstance(edge, dict)]
     edges = sorted(edges, key=lambda x: x[edge_degree_column], reverse=True)
 
-    sorted_edges = []
-    sorted_nodes = []
-    sorted_claims = []
-    context_string = ""
-    for edge in edges:
-        source_details = node_details.get(edge[edge_source_column], {})
-        target_details = node_details.get(edge[edge_target_column], {})
-        sorted_nodes.extend([source_details, target_details])
-        sorted_edges.append(edge)
-        source_claims = claim_details.get(edge[edge_source_column], [])
-        target_claims = claim_details.get(edge[edge_target_column], [])
-        sorted_claims.extend(source_claims if source_claims else [])
-        sorted_claims.extend(target_claims if source_claims else [])
-        if max_tokens:
-            new_context_string = _get_context_string(
-                sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
+    # Adding an edge only ever appends rows to the context, so instead of rebuilding the
+    # context after every edge we collect the rows as edges are added, remember how many
+    # of them each prefix of the sorted edges contributes, and only render the prefixes
+    # we need. Rows that are exact repeats of an earlier row are skipped up front;
+    # `drop_duplicates` still runs when rendering, so the rendered context is unchanged.
+    sorted_nodes = _ContextRows(lambda row: _is_valid(row, node_id_column))
+    sorted_edges = _ContextRows(lambda row: _is_valid(row, edge_id_column))
+    sorted_claims = _ContextRows(lambda row: _is_valid(row, claim_id_column))
+    prefixes: list[tuple[int, int, int]] = []
+
+    def _add_edges(num_edges: int) -> None:
+        """Add sorted edges until the first `num_edges` of them are in the context."""
+        for edge in edges[len(prefixes) : num_edges]:
+            source_claims = claim_details.get(edge[edge_source_column], [])
+            target_claims = claim_details.get(edge[edge_target_column], [])
+            sorted_nodes.extend([
+                node_details.get(edge[edge_source_column], {}),
+                node_details.get(edge[edge_target_column], {}),
+            ])
+            sorted_edges.extend([edge])
+            sorted_claims.extend(source_claims if source_claims else [])
+            sorted_claims.extend(target_claims if source_claims else [])
+            prefixes.append((
+                len(sorted_nodes.rows),
+                len(sorted_edges.rows),
+                len(sorted_claims.rows),
+            ))
+
+    renders: dict[int, str] = {}
+
+    def _render(num_edges: int) -> str:
+        """Render the context holding the first `num_edges` sorted edges."""
+        if num_edges not in renders:
+            _add_edges(num_edges)
+            num_nodes, num_rels, num_claims = (
+                prefixes[num_edges - 1] if num_edges > 0 else (0, 0, 0)
+            )
+            renders[num_edges] = _get_context_string(
+                sorted_nodes.rows[:num_nodes],
+                sorted_edges.rows[:num_rels],
+                sorted_claims.rows[:num_claims],
+                sub_community_reports,
             )
-            if num_tokens(new_context_string) > max_tokens:
-                break
-            context_string = new_context_string
+        return renders[num_edges]
+
+    if not max_tokens:
+        return _render(len(edges))
 
+    # estimate the size of each prefix from the token cost of its new rows, which
+    # avoids tokenising the whole context for every edge
+    estimate = num_tokens(_render(0))
+    guess = len(edges) + 1
+    for num_edges in range(1, len(edges) + 1):
+        _add_edges(num_edges)
+        num_nodes, num_rels, num_claims = prefixes[-1]
+        estimate += sorted_nodes.tokens(num_nodes)
+        estimate += sorted_edges.tokens(num_rels)
+        estimate += sorted_claims.tokens(num_claims)
+        if estimate > max_tokens:
+            guess = num_edges
+            break
+
+    # the estimate is only a starting point, the cut-off itself is always decided on the
+    # token count of the rendered context, exactly as if we had added one edge at a time
+    cutoff = _first_exceeding(
+        len(edges), guess, lambda n: num_tokens(_render(n)) > max_tokens
+    )
+    if cutoff is None:
+        return _render(len(edges))
+
+    context_string = _render(cutoff - 1) if cutoff > 1 else ""
     if context_string == "":
-        return _get_context_string(
-            sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
-        )
+        return _render(cutoff)
 
     return context_string
+
+
+class _ContextRows:
+    """The distinct rows of one context section, in the order they were added."""
+
+    def __init__(self, is_valid: Callable[[dict], bool]):
+        self._is_valid = is_valid
+        self._seen: set[tuple] = set()
+        self._seen_ids: set[int] = set()
+        self._costs: list[int] = []
+        self.rows: list[dict] = []
+
+    def extend(self, rows: list[dict]) -> None:
+        """Add rows to the section, skipping invalid rows and repeats."""
+        for row in rows:
+            # the same details dict is shared by every edge of a node, so most
+            # repeats are caught without building a key
+            if id(row) in self._seen_ids or not self._is_valid(row):
+                continue
+            self._seen_ids.add(id(row))
+            key = _row_key(row)
+            if key not in self._seen:
+                self._seen.add(key)
+                self.rows.append(row)
+
+    def tokens(self, num_rows: int) -> int:
+        """Return the estimated token cost of the rows up to `num_rows` not yet counted."""
+        start = len(self._costs)
+        for row in self.rows[start:num_rows]:
+            line = ",".join(
+                "" if _is_null(value) else str(value) for value in row.values()
+            )
+            self._costs.append(num_tokens(line + "\n"))
+        if start == 0 and num_rows > 0:
+            # the section title, the csv header and the separator
+            return sum(self._costs) + num_tokens(",".join(self.rows[0])) + 8
+        return sum(self._costs[start:])
+
+
+def _row_key(row: dict) -> tuple:
+    """Build a hashable key that only matches rows rendering identically."""
+    return tuple(
+        sorted(
+            (key, None if _is_null(value) else (type(value).__name__, value))
+            for key, value in row.items()
+        )
+    )
+
+
+def _is_null(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _first_exceeding(
+    num_items: int, guess: int, exceeds: Callable[[int], bool]
+) -> int | None:
+    """Find the first prefix length in [1, num_items] for which `exceeds` holds.
+
+    `exceeds` must be monotonic. The search gallops out from `guess`, so it only
+    evaluates a handful of prefixes when the guess is close.
+    """
+    if num_items == 0:
+        return None
+    guess = min(max(guess, 1), num_items)
+    if exceeds(guess):
+        # gallop down to a prefix that fits
+        high, step = guess, 1
+        low = guess - step
+        while low >= 1 and exceeds(low):
+            high, step = low, step * 2
+            low = high - step
+        low = max(low, 0)
+    else:
+        # gallop up to a prefix that does not fit
+        low, step = guess, 1
+        high = guess + step
+        while high <= num_items and not exceeds(high):
+            low, step = high, step * 2
+            high = low + step
+        if high > num_items:
+            if exceeds(num_items):
+                high = num_items
+            else:
+                return None
+    # bisect between the last prefix known to fit (low) and the first known not to (high)
+    while high - low > 1:
+        mid = (low + high) // 2
+        if exceeds(mid):
+            high = mid
+        else:
+            low = mid
+    return high
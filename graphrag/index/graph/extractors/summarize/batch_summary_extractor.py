@@ -0,0 +1,112 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the 'BatchSummarizeExtractor' model."""
+
+import asyncio
+import json
+import logging
+import traceback
+
+from graphrag.index.typing import ErrorHandlerFn
+from graphrag.llm import CompletionLLM
+
+from .description_summary_extractor import (
+    DEFAULT_MAX_SUMMARY_LENGTH,
+    SummarizationResult,
+    SummarizeExtractor,
+)
+from .prompts import BATCH_SUMMARIZE_PROMPT
+
+log = logging.getLogger(__name__)
+
+
+class BatchSummarizeExtractor:
+    """Summarize the descriptions of several graph items with a single LLM call."""
+
+    _llm: CompletionLLM
+    _items_key: str
+    _summarization_prompt: str
+    _on_error: ErrorHandlerFn
+    _max_summary_length: int
+    _extractor: SummarizeExtractor
+
+    def __init__(
+        self,
+        llm_invoker: CompletionLLM,
+        extractor: SummarizeExtractor,
+        items_key: str | None = None,
+        summarization_prompt: str | None = None,
+        on_error: ErrorHandlerFn | None = None,
+        max_summary_length: int | None = None,
+    ):
+        """Init method definition.
+
+        The items the batch response does not summarize are summarized one by one with the
+        given extractor.
+        """
+        self._llm = llm_invoker
+        self._extractor = extractor
+        self._items_key = items_key or "items"
+        self._summarization_prompt = summarization_prompt or BATCH_SUMMARIZE_PROMPT
+        self._on_error = on_error or (lambda _e, _s, _d: None)
+        self._max_summary_length = max_summary_length or DEFAULT_MAX_SUMMARY_LENGTH
+
+    async def __call__(
+        self, batch: list[tuple[str | tuple[str, str], list[str]]]
+    ) -> list[SummarizationResult]:
+        """Call method definition."""
+        summaries: dict[str, str] = {}
+        if len(batch) > 1:
+            summaries = await self._summarize_batch_with_llm(batch)
+
+        async def summarize(
+            key: str, items: str | tuple[str, str], descriptions: list[str]
+        ) -> SummarizationResult:
+            if key in summaries:
+                return SummarizationResult(items=items, description=summaries[key])
+            return await self._extractor(items=items, descriptions=descriptions)
+
+        return list(
+            await asyncio.gather(*[
+                summarize(str(i), items, descriptions)
+                for i, (items, descriptions) in enumerate(batch, 1)
+            ])
+        )
+
+    async def _summarize_batch_with_llm(
+        self, batch: list[tuple[str | tuple[str, str], list[str]]]
+    ) -> dict[str, str]:
+        """Summarize the items with a single LLM call, returning the summaries by item key."""
+        payload = {
+            str(i): {"entities": items, "descriptions": sorted(descriptions)}
+            for i, (items, descriptions) in enumerate(batch, 1)
+        }
+        try:
+            response = await self._llm(
+                self._summarization_prompt,
+                json=True,
+                name="summarize_batch",
+                variables={
+                    self._items_key: json.dumps(payload, ensure_ascii=False),
+                },
+                model_parameters={"max_tokens": self._max_summary_length * len(batch)},
+            )
+        except Exception as e:
+            log.exception("error summarizing a batch of descriptions")
+            self._on_error(e, traceback.format_exc(), None)
+            return {}
+
+        output = response.json or {}
+        summaries = {
+            key: summary
+            for key, summary in output.items()
+            if key in payload and isinstance(summary, str) and summary
+        }
+        if len(summaries) < len(payload):
+            log.warning(
+                "batch summarization returned %d of %d summaries, summarizing the others one by one",
+                len(summaries),
+                len(payload),
+            )
+        return summaries
@@ -3,6 +3,7 @@
 
 """A module containing 'GraphExtractionResult' and 'GraphExtractor' models."""
 
+import asyncio
 import json
 from dataclasses import dataclass
 
@@ -16,6 +17,8 @@ from .prompts import SUMMARIZE_PROMPT
 DEFAULT_MAX_INPUT_TOKENS = 4_000
 # Max token count for LLM answers
 DEFAULT_MAX_SUMMARY_LENGTH = 500
+# Max number of partial summaries reduced by a single call in the tree-reduce mode
+DEFAULT_FAN_OUT = 4
 
 
 @dataclass
@@ -36,6 +39,8 @@ class SummarizeExtractor:
     _on_error: ErrorHandlerFn
     _max_summary_length: int
     _max_input_tokens: int
+    _tree_reduce: bool
+    _fan_out: int
 
     def __init__(
         self,
@@ -46,6 +51,8 @@ class SummarizeExtractor:
         on_error: ErrorHandlerFn | None = None,
         max_summary_length: int | None = None,
         max_input_tokens: int | None = None,
+        tree_reduce: bool = False,
+        fan_out: int | None = None,
     ):
         """Init method definition."""
         # TODO: streamline construction
@@ -57,6 +64,8 @@ class SummarizeExtractor:
         self._on_error = on_error or (lambda _e, _s, _d: None)
         self._max_summary_length = max_summary_length or DEFAULT_MAX_SUMMARY_LENGTH
         self._max_input_tokens = max_input_tokens or DEFAULT_MAX_INPUT_TOKENS
+        self._tree_reduce = tree_reduce
+        self._fan_out = max(fan_out or DEFAULT_FAN_OUT, 2)
 
     async def __call__(
         self,
@@ -91,6 +100,9 @@ class SummarizeExtractor:
         if len(descriptions) > 1:
             descriptions = sorted(descriptions)
 
+        if self._tree_reduce:
+            return await self._reduce_descriptions(sorted_items, descriptions)
+
         # Iterate over descriptions, adding all until the max input tokens is reached
         usable_tokens = self._max_input_tokens - num_tokens_from_string(
             self._summarization_prompt
@@ -122,6 +134,31 @@ class SummarizeExtractor:
 
         return result
 
+    async def _reduce_descriptions(
+        self, items: str | tuple[str, str] | list[str], descriptions: list[str]
+    ) -> str:
+        """Summarize descriptions with a tree of concurrent LLM calls.
+
+        The descriptions are split into groups that fit the input budget, which are summarized
+        concurrently. The partial summaries are then summarized in groups of at most `fan_out`,
+        round after round, until a single summary is left.
+        """
+        usable_tokens = self._max_input_tokens - num_tokens_from_string(
+            self._summarization_prompt
+        )
+
+        async def summarize(group: list[str]) -> str:
+            if len(group) == 1:
+                return group[0]
+            return await self._summarize_descriptions_with_llm(items, group)
+
+        groups = _group_descriptions(descriptions, usable_tokens)
+        while True:
+            summaries = await asyncio.gather(*[summarize(group) for group in groups])
+            if len(summaries) == 1:
+                return summaries[0]
+            groups = _group_descriptions(summaries, usable_tokens, self._fan_out)
+
     async def _summarize_descriptions_with_llm(
         self, items: str | tuple[str, str] | list[str], descriptions: list[str]
     ):
@@ -139,3 +176,29 @@ class SummarizeExtractor:
         )
         # Calculate result
         return str(response.output)
+
+
+def _group_descriptions(
+    descriptions: list[str], usable_tokens: int, max_group_size: int | None = None
+) -> list[list[str]]:
+    """Split descriptions into consecutive groups that fit the token budget.
+
+    A group is only closed once it holds two descriptions, so that every round of summarization
+    reduces the number of descriptions, even if they exceed the budget.
+    """
+    groups: list[list[str]] = []
+    group: list[str] = []
+    group_tokens = 0
+    for description in descriptions:
+        tokens = num_tokens_from_string(description)
+        if len(group) > 1 and (
+            group_tokens + tokens > usable_tokens
+            or (max_group_size is not None and len(group) >= max_group_size)
+        ):
+            groups.append(group)
+            group, group_tokens = [], 0
+        group.append(description)
+        group_tokens += tokens
+    if group:
+        groups.append(group)
+    return groups
@@ -3,12 +3,19 @@
 
 """The Indexing Engine LLM package root."""
 
-from .load_llm import load_llm, load_llm_embeddings
+from .load_llm import (
+    concurrency_limiter_stats,
+    endpoint_stats,
+    load_llm,
+    load_llm_embeddings,
+)
 from .types import TextListSplitter, TextSplitter
 
 __all__ = [
     "TextListSplitter",
     "TextSplitter",
+    "concurrency_limiter_stats",
+    "endpoint_stats",
     "load_llm",
     "load_llm_embeddings",
 ]
@@ -11,12 +11,15 @@ from typing import TYPE_CHECKING, Any
 
 from graphrag.config.enums import LLMType
 from graphrag.llm import (
+    AdaptiveConcurrencyLimiter,
     CompletionLLM,
     EmbeddingLLM,
     LLMCache,
+    LLMEndpointMetrics,
     LLMLimiter,
     MockCompletionLLM,
     OpenAIConfiguration,
+    OpenAIEndpoint,
     create_openai_chat_llm,
     create_openai_client,
     create_openai_completion_llm,
@@ -34,6 +37,8 @@ log = logging.getLogger(__name__)
 
 _semaphores: dict[str, asyncio.Semaphore] = {}
 _rate_limiters: dict[str, LLMLimiter] = {}
+_concurrency_limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+_endpoint_metrics: dict[str, LLMEndpointMetrics] = {}
 
 
 def load_llm(
@@ -83,6 +88,20 @@ def load_llm_embeddings(
     raise ValueError(msg)
 
 
+def concurrency_limiter_stats() -> dict[str, dict[str, float]]:
+    """Get the window and throttle events of the adaptive concurrency limiters, by model."""
+    return {
+        name: limiter.stats for name, limiter in sorted(_concurrency_limiters.items())
+    }
+
+
+def endpoint_stats() -> dict[str, dict[str, float]]:
+    """Get the requests, tokens and latency of the load balanced endpoints, by endpoint."""
+    return {
+        name: metrics.to_dict() for name, metrics in sorted(_endpoint_metrics.items())
+    }
+
+
 def _create_error_handler(callbacks: VerbCallbacks) -> ErrorHandlerFn:
     def on_error(
         error: BaseException | None = None,
@@ -115,6 +134,7 @@ def _load_openai_completion_llm(
         on_error,
         cache,
         azure,
+        config.get("endpoints"),
     )
 
 
@@ -140,6 +160,7 @@ def _load_openai_chat_llm(
         on_error,
         cache,
         azure,
+        config.get("endpoints"),
     )
 
 
@@ -161,6 +182,7 @@ def _load_openai_embeddings_llm(
         on_error,
         cache,
         azure,
+        config.get("endpoints"),
     )
 
 
@@ -186,8 +208,8 @@ def _get_base_config(config: dict[str, Any]) -> dict[str, Any]:
     api_key = config.get("api_key")
 
     return {
-        # Pass in all parameterized values
-        **config,
+        # Pass in all parameterized values, the endpoints are configured separately
+        **{key: value for key, value in config.items() if key != "endpoints"},
         # Set default values
         "api_key": api_key,
         "api_base": config.get("api_base"),
@@ -246,13 +268,29 @@ def _create_openai_chat_llm(
     on_error: ErrorHandlerFn,
     cache: LLMCache,
     azure=False,
+    endpoints: list[dict[str, Any]] | None = None,
 ) -> CompletionLLM:
     """Create an openAI chat llm."""
+    openai_endpoints = _create_endpoints(configuration, endpoints, azure)
+    if openai_endpoints:
+        # the endpoints bring their own clients and limits
+        return create_openai_chat_llm(
+            None, configuration, cache, on_error=on_error, endpoints=openai_endpoints
+        )
     client = create_openai_client(configuration=configuration, azure=azure)
     limiter = _create_limiter(configuration)
-    semaphore = _create_semaphore(configuration)
+    concurrency_limiter = _create_concurrency_limiter(configuration)
+    semaphore = (
+        _create_semaphore(configuration) if concurrency_limiter is None else None
+    )
     return create_openai_chat_llm(
-        client, configuration, cache, limiter, semaphore, on_error=on_error
+        client,
+        configuration,
+        cache,
+        limiter,
+        semaphore,
+        on_error=on_error,
+        concurrency_limiter=concurrency_limiter,
     )
 
 
@@ -261,13 +299,29 @@ def _create_openai_completion_llm(
     on_error: ErrorHandlerFn,
     cache: LLMCache,
     azure=False,
+    endpoints: list[dict[str, Any]] | None = None,
 ) -> CompletionLLM:
     """Create an openAI completion llm."""
+    openai_endpoints = _create_endpoints(configuration, endpoints, azure)
+    if openai_endpoints:
+        # the endpoints bring their own clients and limits
+        return create_openai_completion_llm(
+            None, configuration, cache, on_error=on_error, endpoints=openai_endpoints
+        )
     client = create_openai_client(configuration=configuration, azure=azure)
     limiter = _create_limiter(configuration)
-    semaphore = _create_semaphore(configuration)
+    concurrency_limiter = _create_concurrency_limiter(configuration)
+    semaphore = (
+        _create_semaphore(configuration) if concurrency_limiter is None else None
+    )
     return create_openai_completion_llm(
-        client, configuration, cache, limiter, semaphore, on_error=on_error
+        client,
+        configuration,
+        cache,
+        limiter,
+        semaphore,
+        on_error=on_error,
+        concurrency_limiter=concurrency_limiter,
     )
 
 
@@ -276,18 +330,84 @@ def _create_openai_embeddings_llm(
     on_error: ErrorHandlerFn,
     cache: LLMCache,
     azure=False,
+    endpoints: list[dict[str, Any]] | None = None,
 ) -> EmbeddingLLM:
     """Create an openAI embeddings llm."""
+    openai_endpoints = _create_endpoints(configuration, endpoints, azure)
+    if openai_endpoints:
+        # the endpoints bring their own clients and limits
+        return create_openai_embedding_llm(
+            None, configuration, cache, on_error=on_error, endpoints=openai_endpoints
+        )
     client = create_openai_client(configuration=configuration, azure=azure)
     limiter = _create_limiter(configuration)
-    semaphore = _create_semaphore(configuration)
+    concurrency_limiter = _create_concurrency_limiter(configuration)
+    semaphore = (
+        _create_semaphore(configuration) if concurrency_limiter is None else None
+    )
     return create_openai_embedding_llm(
-        client, configuration, cache, limiter, semaphore, on_error=on_error
+        client,
+        configuration,
+        cache,
+        limiter,
+        semaphore,
+        on_error=on_error,
+        concurrency_limiter=concurrency_limiter,
     )
 
 
+def _create_endpoints(
+    configuration: OpenAIConfiguration,
+    endpoints: list[dict[str, Any]] | None,
+    azure: bool,
+) -> list[OpenAIEndpoint] | None:
+    if not endpoints:
+        return None
+
+    result = []
+    for endpoint in endpoints:
+        endpoint_config = OpenAIConfiguration({
+            **configuration.raw_config,
+            **{
+                key: value
+                for key, value in endpoint.items()
+                if value is not None and key != "weight"
+            },
+            # the load balancer retries the failed requests on the other endpoints
+            "max_retries": 1,
+            "sleep_on_rate_limit_recommendation": False,
+        })
+        limit_name = _limit_name(endpoint_config)
+        metrics = _endpoint_metrics.setdefault(limit_name, LLMEndpointMetrics())
+        concurrency_limiter = _create_concurrency_limiter(endpoint_config)
+        semaphore = (
+            _create_semaphore(endpoint_config) if concurrency_limiter is None else None
+        )
+        result.append(
+            OpenAIEndpoint(
+                limit_name,
+                create_openai_client(configuration=endpoint_config, azure=azure),
+                endpoint_config,
+                endpoint.get("weight") or 1.0,
+                _create_limiter(endpoint_config),
+                semaphore,
+                metrics,
+                concurrency_limiter,
+            )
+        )
+    return result
+
+
+def _limit_name(configuration: OpenAIConfiguration) -> str:
+    # the LLMs calling the same deployment share its limits, e.g. chat and embeddings
+    name = configuration.deployment_name or configuration.model or "default"
+    if configuration.api_base:
+        return f"{configuration.api_base.rstrip('/')}/{name}"
+    return name
+
+
 def _create_limiter(configuration: OpenAIConfiguration) -> LLMLimiter:
-    limit_name = configuration.model or configuration.deployment_name or "default"
+    limit_name = _limit_name(configuration)
     if limit_name not in _rate_limiters:
         tpm = configuration.tokens_per_minute
         rpm = configuration.requests_per_minute
@@ -297,7 +417,7 @@ def _create_limiter(configuration: OpenAIConfiguration) -> LLMLimiter:
 
 
 def _create_semaphore(configuration: OpenAIConfiguration) -> asyncio.Semaphore | None:
-    limit_name = configuration.model or configuration.deployment_name or "default"
+    limit_name = _limit_name(configuration)
     concurrency = configuration.concurrent_requests
 
     # bypass the semaphore if concurrency is zero
@@ -310,3 +430,27 @@ def _create_semaphore(configuration: OpenAIConfiguration) -> asyncio.Semaphore |
         _semaphores[limit_name] = asyncio.Semaphore(concurrency)
 
     return _semaphores[limit_name]
+
+
+def _create_concurrency_limiter(
+    configuration: OpenAIConfiguration,
+) -> AdaptiveConcurrencyLimiter | None:
+    if not configuration.adaptive_concurrency:
+        return None
+
+    limit_name = _limit_name(configuration)
+    if limit_name not in _concurrency_limiters:
+        min_limit = configuration.min_concurrent_requests or 1
+        max_limit = max(configuration.max_concurrent_requests or 0, min_limit)
+        initial_limit = configuration.concurrent_requests or min_limit
+        log.info(
+            "create adaptive concurrency limiter for %s: %s (min=%s, max=%s)",
+            limit_name,
+            initial_limit,
+            min_limit,
+            max_limit,
+        )
+        _concurrency_limiters[limit_name] = AdaptiveConcurrencyLimiter(
+            initial_limit, min_limit, max_limit
+        )
+    return _concurrency_limiters[limit_name]
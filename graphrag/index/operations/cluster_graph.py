@@ -1,9 +1,13 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""A module containing cluster_graph, apply_clustering and run_layout methods definition."""
+"""A module containing cluster_graph and run_layout methods definition."""
 
 import logging
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from random import Random
 from typing import Any, cast
@@ -14,15 +18,25 @@ from datashaper import VerbCallbacks, progress_iterable
 from graspologic.partition import hierarchical_leiden
 
 from graphrag.index.graph.utils import stable_largest_connected_component
-from graphrag.index.utils import gen_uuid
+from graphrag.index.utils import gen_md5_hash, gen_uuid
 
 Communities = list[tuple[int, str, list[str]]]
+# a connected component as its sorted nodes and (source, target, weight) edges
+Component = tuple[list[str], list[tuple[str, str, float]]]
+# the (level, node, cluster) assignments of a component, with clusters unique across its levels
+ComponentClusters = list[tuple[int, str, int]]
+# clusters a component, starting from the level 0 communities of its nodes when they are given
+ClusterComponent = Callable[
+    [Component, int, int, dict[str, int] | None], ComponentClusters
+]
 
 
 class GraphCommunityStrategyType(str, Enum):
     """GraphCommunityStrategyType class definition."""
 
     leiden = "leiden"
+    parallel_leiden = "parallel_leiden"
+    leidenalg = "leidenalg"
 
     def __repr__(self):
         """Get a string representation."""
@@ -33,93 +47,80 @@ log = logging.getLogger(__name__)
 
 
 def cluster_graph(
-    input: nx.Graph,
+    graph: nx.Graph,
     callbacks: VerbCallbacks,
     strategy: dict[str, Any],
-    column: str,
-    to: str,
-    level_to: str | None = None,
-) -> pd.DataFrame:
-    """Apply a hierarchical clustering algorithm to a graph."""
-    output = pd.DataFrame()
-    # TODO: for back-compat, downstream expects a graphml string
-    output[column] = ["\n".join(nx.generate_graphml(input))]
-    communities = run_layout(strategy, input)
-
-    community_map_to = "communities"
-    output[community_map_to] = [communities]
-
-    level_to = level_to or f"{to}_level"
-    output[level_to] = output.apply(
-        lambda x: list({level for level, _, _ in x[community_map_to]}), axis=1
-    )
-    output[to] = None
-
-    num_total = len(output)
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Apply a hierarchical clustering algorithm to a graph.
+
+    Returns a node table and an edge table with one row per node (or edge) for each
+    community level. Node rows carry the `cluster` the node belongs to at that level
+    (or NaN if it was not clustered) along with its `degree`, and nodes and edges get
+    an `id` and `human_readable_id` that are stable across levels.
+    """
+    communities = run_layout(strategy, graph)
+    levels = sorted({level for level, _, _ in communities})
 
     # Create a seed for this run (if not provided)
     seed = strategy.get("seed", Random().randint(0, 0xFFFFFFFF))  # noqa S311
+    random = Random(seed)  # noqa S311
 
-    # Go through each of the rows
-    graph_level_pairs_column: list[list[tuple[int, str]]] = []
-    for _, row in progress_iterable(output.iterrows(), callbacks.progress, num_total):
-        levels = row[level_to]
-        graph_level_pairs: list[tuple[int, str]] = []
-
-        # For each of the levels, get the graph and add it to the list
-        for level in levels:
-            graphml = "\n".join(
-                nx.generate_graphml(
-                    apply_clustering(
-                        input,
-                        cast(Communities, row[community_map_to]),
-                        level,
-                        seed=seed,
-                    )
-                )
-            )
-            graph_level_pairs.append((level, graphml))
-        graph_level_pairs_column.append(graph_level_pairs)
-    output[to] = graph_level_pairs_column
-
-    # explode the list of (level, graph) pairs into separate rows
-    output = output.explode(to, ignore_index=True)
-
-    # split the (level, graph) pairs into separate columns
-    # TODO: There is probably a better way to do this
-    output[[level_to, to]] = pd.DataFrame(output[to].tolist(), index=output.index)
+    # add node uuid and incremental record id (a human readable id used as reference in the final report)
+    nodes = _to_table(
+        [{"label": label, **data} for label, data in graph.nodes(data=True)],
+        ["label"],
+    )
+    nodes["degree"] = [int(degree) for _, degree in graph.degree]
+    nodes["human_readable_id"] = range(len(nodes))
+    nodes["id"] = [str(gen_uuid(random)) for _ in range(len(nodes))]
 
-    # clean up the community map
-    output.drop(columns=[community_map_to], inplace=True)
-    return output
+    # add ids to edges
+    edges = _to_table(
+        [
+            {"source": source, "target": target, **data}
+            for source, target, data in graph.edges(data=True)
+        ],
+        ["source", "target"],
+    )
+    edges["id"] = [str(gen_uuid(random)) for _ in range(len(edges))]
+    edges["human_readable_id"] = range(len(edges))
+
+    node_columns = ["level", *nodes.columns[:-3], "cluster", *nodes.columns[-3:]]
+    edge_columns = ["level", *edges.columns]
+
+    level_nodes: list[pd.DataFrame] = []
+    level_edges: list[pd.DataFrame] = []
+    for level in progress_iterable(levels, callbacks.progress, len(levels)):
+        clusters = {
+            node: community_id
+            for community_level, community_id, members in communities
+            if community_level == level
+            for node in members
+        }
+        level_nodes.append(
+            nodes.assign(level=level, cluster=nodes["label"].map(clusters))
+        )
+        level_edges.append(edges.assign(level=level))
 
+    return (
+        _concat_levels(level_nodes, node_columns),
+        _concat_levels(level_edges, edge_columns),
+    )
 
-def apply_clustering(
-    graph: nx.Graph, communities: Communities, level: int = 0, seed: int | None = None
-) -> nx.Graph:
-    """Apply clustering to a graph."""
-    random = Random(seed)  # noqa S311
-    for community_level, community_id, nodes in communities:
-        if level == community_level:
-            for node in nodes:
-                graph.nodes[node]["cluster"] = community_id
-                graph.nodes[node]["level"] = level
 
-    # add node degree
-    for node_degree in graph.degree:
-        graph.nodes[str(node_degree[0])]["degree"] = int(node_degree[1])
+def _to_table(records: list[dict[str, Any]], columns: list[str]) -> pd.DataFrame:
+    """Build a table from graph records, keeping the key columns if there are none."""
+    if len(records) == 0:
+        return pd.DataFrame(columns=columns)
+    return pd.DataFrame(records)
 
-    # add node uuid and incremental record id (a human readable id used as reference in the final report)
-    for index, node in enumerate(graph.nodes()):
-        graph.nodes[node]["human_readable_id"] = index
-        graph.nodes[node]["id"] = str(gen_uuid(random))
 
-    # add ids to edges
-    for index, edge in enumerate(graph.edges()):
-        graph.edges[edge]["id"] = str(gen_uuid(random))
-        graph.edges[edge]["human_readable_id"] = index
-        graph.edges[edge]["level"] = level
-    return graph
+def _concat_levels(tables: list[pd.DataFrame], columns: list[str]) -> pd.DataFrame:
+    """Stack the per-level tables into a single table keyed by level."""
+    if len(tables) == 0:
+        return pd.DataFrame(columns=columns)
+    return cast(pd.DataFrame, pd.concat(tables, ignore_index=True).loc[:, columns])
 
 
 def run_layout(strategy: dict[str, Any], graph: nx.Graph) -> Communities:
@@ -133,6 +134,10 @@ def run_layout(strategy: dict[str, Any], graph: nx.Graph) -> Communities:
     match strategy_type:
         case GraphCommunityStrategyType.leiden:
             clusters = run_leiden(graph, strategy)
+        case GraphCommunityStrategyType.parallel_leiden:
+            clusters = run_parallel_leiden(graph, strategy, _cluster_with_graspologic)
+        case GraphCommunityStrategyType.leidenalg:
+            clusters = run_parallel_leiden(graph, strategy, _cluster_with_leidenalg)
         case _:
             msg = f"Unknown clustering strategy {strategy_type}"
             raise ValueError(msg)
@@ -161,8 +166,291 @@ def run_leiden(
         use_lcc=use_lcc,
         seed=args.get("seed", 0xDEADBEEF),
     )
-    levels = args.get("levels")
+    return _group_by_level(node_id_to_community_map, args.get("levels"))
+
+
+def run_parallel_leiden(
+    graph: nx.Graph,
+    args: dict[str, Any],
+    cluster_component: ClusterComponent,
+) -> dict[int, dict[str, list[str]]]:
+    """Cluster each connected component on its own, in a pool of `num_processes` processes.
+
+    Each component is sorted and seeded from its own nodes, so its clusters do not depend on
+    the rest of the graph or on the number of processes. The cluster ids are then numbered
+    level by level, following the components from the largest to the smallest.
+    """
+    max_cluster_size = args.get("max_cluster_size", 10)
+    use_lcc = args.get("use_lcc", True)
+    seed = args.get("seed", 0xDEADBEEF)
+    num_processes = args.get("num_processes") or os.cpu_count() or 1
+    if args.get("verbose", False):
+        log.info(
+            "Running leiden per component with max_cluster_size=%s, lcc=%s, processes=%s",
+            max_cluster_size,
+            use_lcc,
+            num_processes,
+        )
+
+    components = _stable_components(
+        stable_largest_connected_component(graph) if use_lcc else graph
+    )
+    component_clusters = _cluster_in_pool(
+        components, max_cluster_size, seed, num_processes, cluster_component
+    )
+
+    return _group_by_level(
+        _merge_component_clusters(component_clusters), args.get("levels")
+    )
+
+
+def recluster_components(
+    graph: nx.Graph,
+    strategy: dict[str, Any],
+    nodes: set[str],
+    starting_communities: dict[str, int],
+) -> Communities:
+    """Cluster the connected components of the graph holding any of `nodes`, starting from previous level 0 communities.
+
+    This is the incremental counterpart of the parallel strategies: the other components are
+    left out, and leiden only moves the nodes of a reclustered component away from their
+    `starting_communities` where that improves the partition. The graph is used as is, without
+    the largest connected component restriction, and the `leiden` strategy is run per component
+    as `parallel_leiden` is. The cluster ids are numbered from 0 as by `run_layout`.
+    """
+    strategy_type = strategy.get("type", GraphCommunityStrategyType.leiden)
+    match strategy_type:
+        case (
+            GraphCommunityStrategyType.leiden
+            | GraphCommunityStrategyType.parallel_leiden
+        ):
+            cluster_component = _cluster_with_graspologic
+        case GraphCommunityStrategyType.leidenalg:
+            cluster_component = _cluster_with_leidenalg
+        case _:
+            msg = f"Unknown clustering strategy {strategy_type}"
+            raise ValueError(msg)
+
+    components = [
+        component
+        for component in _stable_components(graph)
+        if any(node in nodes for node in component[0])
+    ]
+    component_clusters = _cluster_in_pool(
+        components,
+        strategy.get("max_cluster_size", 10),
+        strategy.get("seed", 0xDEADBEEF),
+        strategy.get("num_processes") or os.cpu_count() or 1,
+        cluster_component,
+        starting_communities,
+    )
+    clusters = _group_by_level(_merge_component_clusters(component_clusters), None)
+    return [
+        (level, cluster_id, members)
+        for level in clusters
+        for cluster_id, members in clusters[level].items()
+    ]
+
+
+def _cluster_in_pool(
+    components: list[Component],
+    max_cluster_size: int,
+    seed: int,
+    num_processes: int,
+    cluster_component: ClusterComponent,
+    starting_communities: dict[str, int] | None = None,
+) -> list[ComponentClusters]:
+    """Cluster the components in balanced tasks, in a pool of processes if there are several of both."""
+    tasks = [
+        [
+            (
+                component,
+                max_cluster_size,
+                _component_seed(seed, component),
+                _component_starting_communities(component, starting_communities),
+            )
+            for component in task
+        ]
+        for task in _balance(components, num_processes)
+    ]
+    if num_processes > 1 and len(tasks) > 1:
+        # spawned rather than forked, as the indexing process runs other threads
+        with ProcessPoolExecutor(
+            max_workers=min(num_processes, len(tasks)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            task_results = list(
+                pool.map(_cluster_components, [cluster_component] * len(tasks), tasks)
+            )
+    else:
+        task_results = [_cluster_components(cluster_component, task) for task in tasks]
+    return [clusters for result in task_results for clusters in result]
+
+
+def _stable_components(graph: nx.Graph) -> list[Component]:
+    """Split the graph into its connected components, sorted from the largest, with sorted nodes and edges.
+
+    Single nodes are left out, as they are by the leiden implementation.
+    """
+    component_nodes = [
+        nodes for nodes in nx.connected_components(graph) if len(nodes) > 1
+    ]
+    component_of = {
+        node: index for index, nodes in enumerate(component_nodes) for node in nodes
+    }
+    component_edges: list[list[tuple[str, str, float]]] = [[] for _ in component_nodes]
+    for source, target, weight in graph.edges(data="weight", default=1.0):
+        component_edges[component_of[source]].append((
+            min(source, target),
+            max(source, target),
+            float(weight),
+        ))
+    components = [
+        (sorted(nodes), sorted(edges))
+        for nodes, edges in zip(component_nodes, component_edges, strict=True)
+    ]
+    return sorted(components, key=lambda c: (-len(c[0]), -len(c[1]), c[0][0]))
+
+
+def _component_seed(seed: int, component: Component) -> int:
+    """Derive the seed of a component from the run seed and the component's first node."""
+    item = {"seed": seed, "node": component[0][0]}
+    return int(gen_md5_hash(item, ["seed", "node"])[:8], 16)
+
+
+def _component_starting_communities(
+    component: Component, starting_communities: dict[str, int] | None
+) -> dict[str, int] | None:
+    """Renumber the starting communities of a component densely, in node order, giving its new nodes a community of their own."""
+    if starting_communities is None:
+        return None
+    # a new node is keyed by its own name, which cannot collide with a community id
+    ids: dict[int | str, int] = {}
+    return {
+        node: ids.setdefault(starting_communities.get(node, node), len(ids))
+        for node in component[0]
+    }
+
+
+def _balance(components: list[Component], num_processes: int) -> list[list[Component]]:
+    """Group the components into tasks of similar size, a few per process, keeping the large ones alone."""
+    total = sum(len(edges) for _, edges in components)
+    target = max(total // (num_processes * 4), 1)
+    tasks: list[list[Component]] = []
+    size = target
+    for component in components:
+        if size >= target:
+            tasks.append([])
+            size = 0
+        tasks[-1].append(component)
+        size += len(component[1])
+    return tasks
+
+
+def _cluster_components(
+    cluster_component: ClusterComponent,
+    task: list[tuple[Component, int, int, dict[str, int] | None]],
+) -> list[ComponentClusters]:
+    return [
+        cluster_component(component, max_cluster_size, seed, starting_communities)
+        for component, max_cluster_size, seed, starting_communities in task
+    ]
+
+
+def _merge_component_clusters(
+    component_clusters: list[ComponentClusters],
+) -> dict[int, dict[str, int]]:
+    """Merge the clusters of the components, numbering the clusters level by level and component by component."""
+    results: dict[int, dict[str, int]] = {}
+    levels = sorted({
+        level for clusters in component_clusters for level, _, _ in clusters
+    })
+    next_id = 0
+    for level in levels:
+        for clusters in component_clusters:
+            ids: dict[int, int] = {}
+            for cluster_level, node, cluster in sorted(
+                (c for c in clusters if c[0] == level), key=lambda c: (c[2], c[1])
+            ):
+                if cluster not in ids:
+                    ids[cluster] = next_id
+                    next_id += 1
+                results.setdefault(cluster_level, {})[node] = ids[cluster]
+    return results
+
+
+def _cluster_with_graspologic(
+    component: Component,
+    max_cluster_size: int,
+    seed: int,
+    starting_communities: dict[str, int] | None = None,
+) -> ComponentClusters:
+    _, edges = component
+    return [
+        (partition.level, partition.node, partition.cluster)
+        for partition in hierarchical_leiden(
+            edges,
+            max_cluster_size=max_cluster_size,
+            starting_communities=starting_communities,
+            random_seed=seed,
+        )
+    ]
+
+
+def _cluster_with_leidenalg(
+    component: Component,
+    max_cluster_size: int,
+    seed: int,
+    starting_communities: dict[str, int] | None = None,
+) -> ComponentClusters:
+    """Cluster a component with igraph and leidenalg, splitting the clusters larger than `max_cluster_size` into another level."""
+    try:
+        import igraph as ig
+        import leidenalg
+    except ImportError as e:
+        msg = "The leidenalg clustering strategy requires the igraph and leidenalg packages: pip install leidenalg"
+        raise ValueError(msg) from e
+
+    nodes, edges = component
+    index = {node: i for i, node in enumerate(nodes)}
+    graph = ig.Graph(
+        n=len(nodes),
+        edges=[(index[source], index[target]) for source, target, _ in edges],
+    )
+    graph.es["weight"] = [weight for _, _, weight in edges]
+
+    results: ComponentClusters = []
+    next_id = 0
+    # (level, members) of the clusters to partition, in the order they were found
+    pending = [(0, list(range(len(nodes))))]
+    while pending:
+        level, members = pending.pop(0)
+        subgraph = graph.induced_subgraph(members) if level > 0 else graph
+        partition = leidenalg.find_partition(
+            subgraph,
+            leidenalg.ModularityVertexPartition,
+            initial_membership=[starting_communities[node] for node in nodes]
+            if level == 0 and starting_communities is not None
+            else None,
+            weights="weight",
+            seed=seed % 2**31,
+        )
+        # a cluster that cannot be split is final
+        if level > 0 and len(partition) < 2:
+            continue
+        for cluster in partition:
+            # the subgraph keeps the order of the members, which are sorted
+            cluster_members = sorted(members[i] for i in cluster)
+            results.extend((level, nodes[i], next_id) for i in cluster_members)
+            next_id += 1
+            if len(cluster_members) > max_cluster_size:
+                pending.append((level + 1, cluster_members))
+    return results
+
 
+def _group_by_level(
+    node_id_to_community_map: dict[int, dict[str, int]], levels: list[int] | None
+) -> dict[int, dict[str, list[str]]]:
     # If they don't pass in levels, use them all
     if levels is None:
         levels = sorted(node_id_to_community_map.keys())
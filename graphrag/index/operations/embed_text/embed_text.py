@@ -3,6 +3,7 @@
 
 """A module containing embed_text, load_strategy and create_row_from_embedding_data methods definition."""
 
+import asyncio
 import logging
 from enum import Enum
 from typing import Any
@@ -72,6 +73,7 @@ async def embed_text(
             model: !ENV ${GRAPHRAG_OPENAI_MODEL:gpt-4-turbo-preview} # The model to use for openai
             max_tokens: !ENV ${GRAPHRAG_MAX_TOKENS:6000} # The max tokens to use for openai
             organization: !ENV ${GRAPHRAG_OPENAI_ORGANIZATION} # The organization to use for openai
+        dimensions: # Optional, the number of dimensions of the embeddings, for the models that support it
         vector_store: # The optional configuration for the vector store
             type: lancedb # The type of vector store to use, available options are: azure_ai_search, lancedb
             <...>
@@ -158,20 +160,24 @@ async def _text_embed_with_vector_store(
         msg = f"Column {id_column} not found in input dataframe with columns {input.columns}"
         raise ValueError(msg)
 
-    total_rows = 0
-    for row in input[column]:
-        if isinstance(row, list):
-            total_rows += len(row)
-        else:
-            total_rows += 1
-
-    i = 0
-    starting_index = 0
-
+    # Up to num_threads slices are embedded concurrently, while a writer loads the
+    # embedded slices into the vector store in their input order. A slice counts
+    # against the limit until it is written, which bounds the embeddings held in memory.
+    # The slices share one request semaphore, so no more than num_threads embedding
+    # requests are in flight across all of them.
+    slices = [
+        input.iloc[start : start + insert_batch_size]
+        for start in range(0, input.shape[0], insert_batch_size)
+    ]
+    num_threads = strategy_args.get("num_threads") or 4
+    pending_slices = asyncio.Semaphore(num_threads)
+    strategy_args["semaphore"] = asyncio.Semaphore(num_threads)
+    embedded: asyncio.Queue[asyncio.Task] = asyncio.Queue()
     all_results = []
 
-    while insert_batch_size * i < input.shape[0]:
-        batch = input.iloc[insert_batch_size * i : insert_batch_size * (i + 1)]
+    async def embed_slice(
+        batch: pd.DataFrame,
+    ) -> tuple[list[VectorStoreDocument], list]:
         texts: list[str] = batch[column].to_numpy().tolist()
         titles: list[str] = batch[title_column].to_numpy().tolist()
         ids: list[str] = batch[id_column].to_numpy().tolist()
@@ -181,11 +187,6 @@ async def _text_embed_with_vector_store(
             cache,
             strategy_args,
         )
-        if store_in_table and result.embeddings:
-            embeddings = [
-                embedding for embedding in result.embeddings if embedding is not None
-            ]
-            all_results.extend(embeddings)
 
         vectors = result.embeddings or []
         documents: list[VectorStoreDocument] = []
@@ -199,10 +200,35 @@ async def _text_embed_with_vector_store(
                 attributes={"title": title},
             )
             documents.append(document)
-
-        vector_store.load_documents(documents, overwrite and i == 0)
-        starting_index += len(documents)
-        i += 1
+        return documents, result.embeddings or []
+
+    async def produce() -> None:
+        for batch in slices:
+            await pending_slices.acquire()
+            await embedded.put(asyncio.create_task(embed_slice(batch)))
+
+    async def write() -> None:
+        for i in range(len(slices)):
+            task = await embedded.get()
+            documents, embeddings = await task
+            if store_in_table:
+                all_results.extend(
+                    embedding for embedding in embeddings if embedding is not None
+                )
+            await asyncio.to_thread(
+                vector_store.load_documents, documents, overwrite and i == 0
+            )
+            pending_slices.release()
+
+    producer = asyncio.create_task(produce())
+    try:
+        await write()
+    finally:
+        producer.cancel()
+        tasks = [producer, *(embedded.get_nowait() for _ in range(embedded.qsize()))]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     if store_in_table:
         return all_results
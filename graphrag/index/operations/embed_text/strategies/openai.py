@@ -4,7 +4,10 @@
 """A module containing run method definition."""
 
 import asyncio
+import hashlib
+import json
 import logging
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import numpy as np
@@ -35,23 +38,46 @@ async def run(
     llm_config = args.get("llm", {})
     batch_size = args.get("batch_size", 16)
     batch_max_tokens = args.get("batch_max_tokens", 8191)
+    dimensions = args.get("dimensions")
     oai_config = OpenAIConfiguration(llm_config)
     splitter = _get_splitter(oai_config, batch_max_tokens)
-    llm = _get_llm(oai_config, callbacks, cache)
-    semaphore: asyncio.Semaphore = asyncio.Semaphore(args.get("num_threads", 4))
+    # snippets are cached one by one below, so the batched calls are not cached
+    llm = _get_llm(oai_config, callbacks, None)
+    # a caller embedding several inputs at once shares one limit across them
+    semaphore: asyncio.Semaphore = args.get("semaphore") or asyncio.Semaphore(
+        args.get("num_threads", 4)
+    )
 
     # Break up the input texts. The sizes here indicate how many snippets are in each input text
     texts, input_sizes = _prepare_embed_texts(input, splitter)
+
+    # Look up each distinct snippet in the cache, and only embed the misses
+    snippet_cache = cache.child("text_embedding_snippets")
+    unique_texts = list(dict.fromkeys(texts))
+    keys = {
+        text: _snippet_cache_key(text, oai_config.model, dimensions)
+        for text in unique_texts
+    }
+    cached = await snippet_cache.get_many([keys[text] for text in unique_texts])
+    snippet_embeddings = {
+        text: np.array(embedding)
+        for text, embedding in zip(unique_texts, cached, strict=True)
+        if embedding is not None
+    }
+    misses = [text for text in unique_texts if text not in snippet_embeddings]
+
     text_batches = _create_text_batches(
-        texts,
+        misses,
         batch_size,
         batch_max_tokens,
         splitter,
     )
     log.info(
-        "embedding %d inputs via %d snippets using %d batches. max_batch_size=%d, max_tokens=%d",
+        "embedding %d inputs via %d snippets (%d distinct, %d cached) using %d batches. max_batch_size=%d, max_tokens=%d",
         len(input),
         len(texts),
+        len(unique_texts),
+        len(snippet_embeddings),
         len(text_batches),
         batch_size,
         batch_max_tokens,
@@ -59,8 +85,22 @@ async def run(
     ticker = progress_ticker(callbacks.progress, len(text_batches))
 
     # Embed each chunk of snippets
-    embeddings = await _execute(llm, text_batches, ticker, semaphore)
-    embeddings = _reconstitute_embeddings(embeddings, input_sizes)
+    model_parameters = {"dimensions": dimensions} if dimensions else None
+    embeddings = await _execute(
+        llm,
+        text_batches,
+        ticker,
+        semaphore,
+        lambda batch, batch_embeddings: snippet_cache.set_many({
+            keys[text]: embedding.tolist()
+            for text, embedding in zip(batch, batch_embeddings, strict=True)
+        }),
+        model_parameters,
+    )
+    snippet_embeddings.update(zip(misses, embeddings, strict=True))
+    embeddings = _reconstitute_embeddings(
+        [snippet_embeddings[text] for text in texts], input_sizes
+    )
 
     return TextEmbeddingResult(embeddings=embeddings)
 
@@ -77,7 +117,7 @@ def _get_splitter(
 def _get_llm(
     config: OpenAIConfiguration,
     callbacks: VerbCallbacks,
-    cache: PipelineCache,
+    cache: PipelineCache | None,
 ) -> EmbeddingLLM:
     llm_type = config.lookup("type", "Unknown")
     return load_llm_embeddings(
@@ -94,12 +134,16 @@ async def _execute(
     chunks: list[list[str]],
     tick: ProgressTicker,
     semaphore: asyncio.Semaphore,
-) -> list[list[float]]:
+    on_embedded: Callable[[list[str], np.ndarray], Awaitable[None]],
+    model_parameters: dict[str, Any] | None = None,
+) -> list[np.ndarray]:
     async def embed(chunk: list[str]):
         async with semaphore:
-            chunk_embeddings = await llm(chunk)
-            result = np.array(chunk_embeddings.output)
-            tick(1)
+            chunk_embeddings = await llm(chunk, model_parameters=model_parameters)
+        result = np.array(chunk_embeddings.output)
+        # cached outside of the semaphore, which only bounds the embedding requests
+        await on_embedded(chunk, result)
+        tick(1)
         return result
 
     futures = [embed(chunk) for chunk in chunks]
@@ -108,6 +152,13 @@ async def _execute(
     return [item for sublist in results for item in sublist]
 
 
+def _snippet_cache_key(text: str, model: str, dimensions: int | None) -> str:
+    """Key a snippet's embedding by its text and the model settings that shape the embedding."""
+    item = {"model": model, "dimensions": dimensions, "text": text}
+    # serialized whole, so the settings and the text cannot run into each other
+    return hashlib.md5(json.dumps(item, sort_keys=True).encode()).hexdigest()  # noqa: S324
+
+
 def _create_text_batches(
     texts: list[str],
     max_batch_size: int,
@@ -160,7 +211,7 @@ def _prepare_embed_texts(
 
 
 def _reconstitute_embeddings(
-    raw_embeddings: list[list[float]], sizes: list[int]
+    raw_embeddings: list[np.ndarray], sizes: list[int]
 ) -> list[list[float] | None]:
     """Reconstitute the embeddings into the original input texts."""
     embeddings: list[list[float] | None] = []
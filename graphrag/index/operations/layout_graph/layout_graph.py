@@ -1,14 +1,14 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""A module containing layout_graph, _run_layout and _apply_layout_to_graph methods definition."""
+"""A module containing layout_graph and _run_layout methods definition."""
 
 from enum import Enum
-from typing import Any, cast
+from typing import Any
 
 import networkx as nx
 import pandas as pd
-from datashaper import VerbCallbacks, progress_callback
+from datashaper import VerbCallbacks
 
 from graphrag.index.graph.visualization import GraphLayout
 from graphrag.index.operations.embed_graph import NodeEmbeddings
@@ -27,24 +27,17 @@ class LayoutGraphStrategyType(str, Enum):
 
 
 def layout_graph(
-    input_df: pd.DataFrame,
+    graph: nx.Graph,
     callbacks: VerbCallbacks,
     strategy: dict[str, Any],
-    embeddings_column: str,
-    graph_column: str,
-    to: str,
-    graph_to: str | None = None,
-):
+    embeddings: NodeEmbeddings | None = None,
+) -> pd.DataFrame:
     """
-    Apply a layout algorithm to a graph. The graph is expected to be in graphml format. The verb outputs a new column containing the laid out graph.
+    Apply a layout algorithm to a graph. The operation outputs a table of node positions with `label`, `x`, `y` and `size` columns.
 
     ## Usage
     ```yaml
     args:
-        graph_column: clustered_graph # The name of the column containing the graph, should be a graphml graph
-        embeddings_column: embeddings # The name of the column containing the embeddings
-        to: node_positions # The name of the column to output the node positions to
-        graph_to: positioned_graph # The name of the column to output the positioned graph to
         strategy: <strategy config> # See strategies section below
     ```
 
@@ -60,36 +53,23 @@ def layout_graph(
         min_dist: 0.75 # Optional, The min distance to use for the umap algorithm, default: 0.75
     ```
     """
-    output_df = input_df
-    num_items = len(output_df)
     strategy_type = strategy.get("type", LayoutGraphStrategyType.umap)
     strategy_args = {**strategy}
 
-    has_embeddings = embeddings_column in output_df.columns
-
-    layouts = output_df.apply(
-        progress_callback(
-            lambda row: _run_layout(
-                strategy_type,
-                row[graph_column],
-                row[embeddings_column] if has_embeddings else {},
-                strategy_args,
-                callbacks,
-            ),
-            callbacks.progress,
-            num_items,
-        ),
-        axis=1,
+    layout = _run_layout(
+        strategy_type,
+        graph,
+        embeddings or {},
+        strategy_args,
+        callbacks,
+    )
+    return pd.DataFrame(
+        [
+            (position.label, position.x, position.y, position.size)
+            for position in layout
+        ],
+        columns=["label", "x", "y", "size"],
     )
-    output_df[to] = layouts.apply(lambda layout: [pos.to_pandas() for pos in layout])
-    if graph_to is not None:
-        output_df[graph_to] = output_df.apply(
-            lambda row: _apply_layout_to_graph(
-                row[graph_column], cast(GraphLayout, layouts[row.name])
-            ),
-            axis=1,
-        )
-    return output_df
 
 
 def _run_layout(
@@ -121,15 +101,3 @@ def _run_layout(
         case _:
             msg = f"Unknown strategy {strategy}"
             raise ValueError(msg)
-
-
-def _apply_layout_to_graph(
-    graphml_or_graph: str | nx.Graph, layout: GraphLayout
-) -> str:
-    graph = load_graph(graphml_or_graph)
-    for node_position in layout:
-        if node_position.label in graph.nodes:
-            graph.nodes[node_position.label]["x"] = node_position.x
-            graph.nodes[node_position.label]["y"] = node_position.y
-            graph.nodes[node_position.label]["size"] = node_position.size
-    return "\n".join(nx.generate_graphml(graph))
@@ -36,11 +36,12 @@ def merge_graphs(
     callbacks: VerbCallbacks,
     node_operations: dict[str, Any] | None,
     edge_operations: dict[str, Any] | None,
+    target: nx.Graph | None = None,
 ) -> nx.Graph:
     """
     Merge multiple graphs together. The graphs are expected to be in nx.Graph format. The verb outputs a new column containing the merged graph.
 
-    > Note: This will merge all rows into a single graph.
+    > Note: This will merge all rows into a single graph. If a target graph is given, the graphs are merged into it in place, so a graph can be built up incrementally.
 
     ## Usage
     ```yaml
@@ -94,7 +95,7 @@ def merge_graphs(
         for attrib, value in edges.items()
     }
 
-    mega_graph = nx.Graph()
+    mega_graph = target if target is not None else nx.Graph()
     num_total = len(graphs)
     for graph in progress_iterable(graphs, callbacks.progress, num_total):
         merge_nodes(mega_graph, graph, node_ops)
@@ -0,0 +1,82 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the spill_batches, load_partitions and delete_partitions methods definitions."""
+
+import json
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+import pandas as pd
+
+from graphrag.index.storage import PipelineStorage
+from graphrag.index.utils import gen_md5_hash
+
+log = logging.getLogger(__name__)
+
+
+async def spill_batches(
+    input: pd.DataFrame,
+    batch_size: int,
+    name: str,
+    key_column: str,
+    storage: PipelineStorage,
+    process: Callable[[pd.DataFrame], Awaitable[pd.DataFrame]],
+    config: dict[str, Any] | None = None,
+) -> AsyncIterator[tuple[str, pd.DataFrame]]:
+    """
+    Process the input in batches of `batch_size` rows, spilling the result of each batch to the storage as a parquet partition.
+
+    The partitions are yielded in input order, as `(key, result)` pairs, so the caller can merge each
+    result and release it before the next batch is processed. A partition is keyed by its position and
+    a fingerprint of the batch's `key_column` and of the `config` that `process` runs with, so a
+    resumed run reuses the partitions spilled for unchanged batches instead of processing them again,
+    while a changed configuration processes every batch again.
+    """
+    if batch_size <= 0:
+        msg = f"Invalid batch size: {batch_size}"
+        raise ValueError(msg)
+    num_batches = (len(input) + batch_size - 1) // batch_size
+    for index in range(num_batches):
+        batch = input.iloc[index * batch_size : (index + 1) * batch_size]
+        key = _partition_key(name, index, batch, key_column, config)
+        if await storage.has(key):
+            log.info("reusing spilled partition %s", key)
+            result = await storage.load_table(key)
+        else:
+            log.info("processing batch %s of %s for %s", index + 1, num_batches, name)
+            result = await process(batch)
+            await storage.set(key, result.to_parquet())
+        yield key, result
+
+
+async def load_partitions(
+    keys: list[str], storage: PipelineStorage
+) -> AsyncIterator[pd.DataFrame]:
+    """Load spilled partitions one at a time, in order."""
+    for key in keys:
+        yield await storage.load_table(key)
+
+
+async def delete_partitions(keys: list[str], storage: PipelineStorage) -> None:
+    """Delete spilled partitions once their results have been merged."""
+    for key in keys:
+        await storage.delete(key)
+
+
+def _partition_key(
+    name: str,
+    index: int,
+    batch: pd.DataFrame,
+    key_column: str,
+    config: dict[str, Any] | None,
+) -> str:
+    fingerprint = gen_md5_hash(
+        {
+            "keys": "\n".join(map(str, batch[key_column])),
+            "config": json.dumps(config or {}, sort_keys=True, default=str),
+        },
+        ["keys", "config"],
+    )
+    return f"{name}.part-{index:05d}-{fingerprint[:12]}.parquet"
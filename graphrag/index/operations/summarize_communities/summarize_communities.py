@@ -3,16 +3,19 @@
 
 """A module containing create_community_reports and load_strategy methods definition."""
 
+import asyncio
 import logging
+import traceback
+from collections.abc import Collection
+from typing import cast
 
 import pandas as pd
 from datashaper import (
     AsyncType,
-    NoopVerbCallbacks,
     VerbCallbacks,
-    derive_from_rows,
     progress_ticker,
 )
+from datashaper.errors import VerbParallelizationError
 
 import graphrag.config.defaults as defaults
 import graphrag.index.graph.extractors.community_reports.schemas as schemas
@@ -21,6 +24,7 @@ from graphrag.index.graph.extractors.community_reports import (
     get_levels,
     prep_community_report_context,
 )
+from graphrag.index.utils import gen_md5_hash
 
 from .typing import (
     CommunityReport,
@@ -40,25 +44,89 @@ async def summarize_communities(
     strategy: dict,
     async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
+    previous_reports: pd.DataFrame | None = None,
+    changed_communities: Collection[str] | None = None,
 ):
-    """Generate community summaries."""
+    """Generate community summaries.
+
+    The reports are scheduled by their dependencies rather than level by level. A community whose
+    local context fits within the limit, or that has no sub-communities to substitute it with,
+    starts right away. A community whose context is replaced with sub-community reports starts as
+    soon as all of its own sub-communities have a report, its context being built from those
+    reports only. At most `num_threads` reports are generated at once. The reports are always
+    awaited on the event loop: `AsyncType.Threaded` is accepted for compatibility but is
+    scheduled the same way as `AsyncType.AsyncIO`.
+
+    When `previous_reports` are given, each report is fingerprinted from its rendered context,
+    and the previous report of a community whose fingerprint did not change is reused as is
+    instead of being generated again. The reports then carry a `fingerprint` column. With
+    `changed_communities` as well, as an update run knows from its change set, the previous
+    report of every community outside of it is reused without comparing fingerprints.
+    """
+    if async_mode not in (AsyncType.AsyncIO, AsyncType.Threaded):
+        msg = f"Unsupported scheduling type {async_mode}"
+        raise ValueError(msg)
+    if async_mode == AsyncType.Threaded:
+        log.info(
+            "community reports are scheduled on the event loop, ignoring the threaded async mode"
+        )
+
     levels = get_levels(nodes)
-    reports: list[CommunityReport | None] = []
     tick = progress_ticker(callbacks.progress, len(local_contexts))
     runner = load_strategy(strategy["type"])
+    previous = (
+        None
+        if previous_reports is None
+        else _index_previous_reports(
+            previous_reports, require_fingerprint=changed_communities is None
+        )
+    )
+    changed = (
+        None if changed_communities is None else set(map(str, changed_communities))
+    )
+    reused = 0
+    max_tokens = strategy.get(
+        "max_input_tokens", defaults.COMMUNITY_REPORT_MAX_INPUT_LENGTH
+    )
 
-    for level in levels:
-        level_contexts = prep_community_report_context(
-            pd.DataFrame(reports),
+    # the contexts that do not depend on sub-community reports, the exceeding ones trimmed
+    contexts = [
+        record
+        for level in levels
+        for record in prep_community_report_context(
+            None,
             local_context_df=local_contexts,
             community_hierarchy_df=community_hierarchy,
             level=level,
-            max_tokens=strategy.get(
-                "max_input_tokens", defaults.COMMUNITY_REPORT_MAX_INPUT_LENGTH
-            ),
-        )
+            max_tokens=max_tokens,
+        ).to_dict("records")
+    ]
+    sub_communities = _get_sub_communities(local_contexts, community_hierarchy)
+    local_context_rows = {
+        community: index
+        for index, community in enumerate(local_contexts[schemas.NODE_COMMUNITY])
+    }
 
-        async def run_generate(record):
+    reports: dict[str, CommunityReport | None] = {}
+    done = {record[schemas.NODE_COMMUNITY]: asyncio.Event() for record in contexts}
+    semaphore = asyncio.Semaphore(num_threads or 4)
+    errors: list[tuple[BaseException, str]] = []
+
+    async def generate(record) -> CommunityReport | None:
+        nonlocal reused
+        fingerprint = None
+        if previous is not None:
+            fingerprint = _fingerprint(record[schemas.CONTEXT_STRING], strategy)
+            community = str(record[schemas.NODE_COMMUNITY])
+            report = previous.get(community)
+            if report is not None and (
+                community not in changed
+                if changed is not None
+                else report["fingerprint"] == fingerprint
+            ):
+                reused += 1
+                return cast(CommunityReport, {**report, "fingerprint": fingerprint})
+        async with semaphore:
             result = await _generate_report(
                 runner,
                 community_id=record[schemas.NODE_COMMUNITY],
@@ -68,19 +136,134 @@ async def summarize_communities(
                 cache=cache,
                 strategy=strategy,
             )
+        if result is not None and fingerprint is not None:
+            return cast(CommunityReport, {**result, "fingerprint": fingerprint})
+        return result
+
+    async def run(record) -> None:
+        community = record[schemas.NODE_COMMUNITY]
+        subs = sub_communities.get(community, [])
+        try:
+            for sub in subs:
+                if sub in done:
+                    await done[sub].wait()
+            if subs:
+                record = _context_with_sub_reports(
+                    record,
+                    subs,
+                    reports,
+                    local_contexts.iloc[
+                        [
+                            local_context_rows[c]
+                            for c in [community, *subs]
+                            if c in local_context_rows
+                        ]
+                    ],
+                    community_hierarchy,
+                    max_tokens,
+                )
+            reports[community] = await generate(record)
+        except Exception as e:
+            log.exception("error generating community report")
+            errors.append((e, traceback.format_exc()))
+        finally:
             tick()
-            return result
-
-        local_reports = await derive_from_rows(
-            level_contexts,
-            run_generate,
-            callbacks=NoopVerbCallbacks(),
-            num_threads=num_threads,
-            scheduling_type=async_mode,
-        )
-        reports.extend([lr for lr in local_reports if lr is not None])
+            done[community].set()
+
+    await asyncio.gather(*[run(record) for record in contexts])
+    tick.done()
+
+    for error, stack in errors:
+        callbacks.error("parallel transformation error", error, stack)
+    if len(errors) > 0:
+        raise VerbParallelizationError(len(errors))
+
+    if previous is not None:
+        log.info("reused %s of %s community reports", reused, len(reports))
+    return pd.DataFrame([
+        report
+        for record in contexts
+        if (report := reports.get(record[schemas.NODE_COMMUNITY])) is not None
+    ])
+
+
+def _get_sub_communities(
+    local_contexts: pd.DataFrame, community_hierarchy: pd.DataFrame
+) -> dict[str, list[str]]:
+    """Get the sub-communities of the communities whose local context exceeds the limit, which wait for their reports."""
+    exceeding = set(
+        local_contexts.loc[
+            local_contexts[schemas.CONTEXT_EXCEED_FLAG] == 1, schemas.NODE_COMMUNITY
+        ]
+    )
+    sub_communities: dict[str, list[str]] = {}
+    if community_hierarchy.empty:
+        return sub_communities
+    for community, sub_community in zip(
+        community_hierarchy[schemas.NODE_COMMUNITY],
+        community_hierarchy[schemas.SUB_COMMUNITY],
+        strict=True,
+    ):
+        if community in exceeding:
+            sub_communities.setdefault(community, []).append(sub_community)
+    return sub_communities
+
+
+def _context_with_sub_reports(
+    record: dict,
+    sub_communities: list[str],
+    reports: dict[str, CommunityReport | None],
+    local_contexts: pd.DataFrame,
+    community_hierarchy: pd.DataFrame,
+    max_tokens: int,
+) -> dict:
+    """Rebuild the context of a community from its own sub-community reports, as soon as they are all done."""
+    sub_reports = [
+        report for sub in sub_communities if (report := reports.get(sub)) is not None
+    ]
+    if len(sub_reports) == 0:
+        return record
+    community = record[schemas.NODE_COMMUNITY]
+    contexts = prep_community_report_context(
+        pd.DataFrame(sub_reports),
+        local_context_df=local_contexts,
+        community_hierarchy_df=community_hierarchy[
+            community_hierarchy[schemas.NODE_COMMUNITY] == community
+        ],
+        level=record[schemas.COMMUNITY_LEVEL],
+        max_tokens=max_tokens,
+    )
+    return contexts[contexts[schemas.NODE_COMMUNITY] == community].to_dict("records")[0]
+
+
+def _index_previous_reports(
+    previous_reports: pd.DataFrame, require_fingerprint: bool = True
+) -> dict[str, dict]:
+    """Index the previous reports by community, keeping the columns of a generated report."""
+    if require_fingerprint and "fingerprint" not in previous_reports.columns:
+        return {}
+    columns = [
+        column
+        for column in previous_reports.columns
+        if column in CommunityReport.__annotations__ or column == "fingerprint"
+    ]
+    return {
+        str(report["community"]): {column: report[column] for column in columns}
+        for report in previous_reports.to_dict("records")
+        if not require_fingerprint or isinstance(report["fingerprint"], str)
+    }
+
 
-    return pd.DataFrame(reports)
+def _fingerprint(context: str, strategy: dict) -> str:
+    """Fingerprint a community's rendered context (its members, edges, claims and sub-reports) along with the strategy settings that shape its report."""
+    llm = strategy.get("llm") or {}
+    item = {
+        "context": context,
+        "prompt": strategy.get("extraction_prompt"),
+        "max_report_length": strategy.get("max_report_length"),
+        "model": llm.get("model"),
+    }
+    return gen_md5_hash(item, item.keys())
 
 
 async def _generate_report(
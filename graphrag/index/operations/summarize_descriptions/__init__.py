@@ -4,9 +4,14 @@
 """Root package for description summarization."""
 
 from .summarize_descriptions import summarize_descriptions
-from .typing import SummarizationStrategy, SummarizeStrategyType
+from .typing import (
+    BatchSummarizationStrategy,
+    SummarizationStrategy,
+    SummarizeStrategyType,
+)
 
 __all__ = [
+    "BatchSummarizationStrategy",
     "SummarizationStrategy",
     "SummarizeStrategyType",
     "summarize_descriptions",
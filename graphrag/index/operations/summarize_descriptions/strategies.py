@@ -3,11 +3,17 @@
 
 """A module containing run_graph_intelligence,  run_resolve_entities and _create_text_list_splitter methods to run graph intelligence."""
 
+import json
+
 from datashaper import VerbCallbacks
 
 from graphrag.index.cache import PipelineCache
-from graphrag.index.graph.extractors.summarize import SummarizeExtractor
+from graphrag.index.graph.extractors.summarize import (
+    BatchSummarizeExtractor,
+    SummarizeExtractor,
+)
 from graphrag.index.llm import load_llm
+from graphrag.index.utils import gen_md5_hash
 from graphrag.llm import CompletionLLM
 
 from .typing import (
@@ -40,13 +46,68 @@ async def run_summarize_descriptions(
     args: StrategyConfig,
 ) -> SummarizedDescriptionResult:
     """Run the entity extraction chain."""
+    extractor = _create_extractor(llm, callbacks, args)
+    result = await extractor(items=items, descriptions=descriptions)
+    return SummarizedDescriptionResult(
+        items=result.items, description=result.description
+    )
+
+
+async def run_graph_intelligence_batch(
+    batch: list[tuple[str | tuple[str, str], list[str]]],
+    callbacks: VerbCallbacks,
+    cache: PipelineCache,
+    args: StrategyConfig,
+) -> list[SummarizedDescriptionResult]:
+    """Run the graph intelligence strategy on a batch of items with a single LLM call.
+
+    The summaries are also cached by item, so an item is not summarized again when it lands in
+    another batch.
+    """
+    llm_config = args.get("llm", {})
+    llm_type = llm_config.get("type")
+    llm = load_llm("summarize_descriptions", llm_type, callbacks, cache, llm_config)
+
+    item_cache = cache.child("summarize_descriptions_items")
+    keys = [_item_cache_key(items, descriptions, args) for items, descriptions in batch]
+    cached = await item_cache.get_many(keys)
+    missing = [i for i, summary in enumerate(cached) if summary is None]
+    summaries: list[str | None] = list(cached)
+    if missing:
+        extractor = BatchSummarizeExtractor(
+            llm_invoker=llm,
+            extractor=_create_extractor(llm, callbacks, args),
+            summarization_prompt=args.get("batch_summarize_prompt", None),
+            on_error=lambda e, stack, details: (
+                callbacks.error("Batch Summarization Error", e, stack, details)
+                if callbacks
+                else None
+            ),
+            max_summary_length=args.get("max_summary_length", None),
+        )
+        results = await extractor([batch[i] for i in missing])
+        for i, result in zip(missing, results, strict=True):
+            summaries[i] = result.description
+        await item_cache.set_many({
+            keys[i]: summaries[i] for i in missing if summaries[i]
+        })
+
+    return [
+        SummarizedDescriptionResult(items=items, description=summary or "")
+        for (items, _), summary in zip(batch, summaries, strict=True)
+    ]
+
+
+def _create_extractor(
+    llm: CompletionLLM, callbacks: VerbCallbacks, args: StrategyConfig
+) -> SummarizeExtractor:
     # Extraction Arguments
     summarize_prompt = args.get("summarize_prompt", None)
     entity_name_key = args.get("entity_name_key", "entity_name")
     input_descriptions_key = args.get("input_descriptions_key", "description_list")
     max_tokens = args.get("max_tokens", None)
 
-    extractor = SummarizeExtractor(
+    return SummarizeExtractor(
         llm_invoker=llm,
         summarization_prompt=summarize_prompt,
         entity_name_key=entity_name_key,
@@ -58,9 +119,22 @@ async def run_summarize_descriptions(
         ),
         max_summary_length=args.get("max_summary_length", None),
         max_input_tokens=max_tokens,
+        tree_reduce=args.get("tree_reduce", False),
+        fan_out=args.get("fan_out", None),
     )
 
-    result = await extractor(items=items, descriptions=descriptions)
-    return SummarizedDescriptionResult(
-        items=result.items, description=result.description
-    )
+
+def _item_cache_key(
+    items: str | tuple[str, str], descriptions: list[str], args: StrategyConfig
+) -> str:
+    """Key an item's summary by its descriptions and the settings that shape the summary."""
+    llm = args.get("llm") or {}
+    item = {
+        "items": json.dumps(items),
+        "descriptions": json.dumps(sorted(descriptions), ensure_ascii=False),
+        "prompt": args.get("summarize_prompt"),
+        "batch_prompt": args.get("batch_summarize_prompt"),
+        "max_summary_length": args.get("max_summary_length"),
+        "model": llm.get("model"),
+    }
+    return gen_md5_hash(item, item.keys())
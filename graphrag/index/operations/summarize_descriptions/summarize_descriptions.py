@@ -15,14 +15,22 @@ from datashaper import (
 )
 
 from graphrag.index.cache import PipelineCache
+from graphrag.index.utils.tokens import num_tokens_from_string
 
 from .typing import (
+    BatchSummarizationStrategy,
     SummarizationStrategy,
+    SummarizedDescriptionResult,
     SummarizeStrategyType,
 )
 
 log = logging.getLogger(__name__)
 
+# Max number of description tokens packed into a single batched summarization
+DEFAULT_BATCH_MAX_TOKENS = 4_000
+# Max number of items packed into a single batched summarization
+DEFAULT_BATCH_SIZE = 8
+
 
 async def summarize_descriptions(
     input: nx.Graph,
@@ -57,6 +65,11 @@ async def summarize_descriptions(
     strategy:
         type: graph_intelligence
         summarize_prompt: # Optional, the prompt to use for extraction
+        tree_reduce: # Optional, summarize long description lists with a tree of concurrent calls instead of sequentially, default: false
+        fan_out: # Optional, the max number of partial summaries reduced by a single call when tree_reduce is on, default: 4
+        batched: # Optional, summarize the descriptions of several items with a single call, default: false
+        batch_max_tokens: # Optional, the max number of description tokens packed into a single batched call, default: 4000
+        batch_size: # Optional, the max number of items packed into a single batched call, default: 8
 
 
         llm: # The configuration for the LLM
@@ -84,6 +97,10 @@ async def summarize_descriptions(
 
         ticker = progress_ticker(callbacks.progress, ticker_length)
 
+        if strategy_config.get("batched", False):
+            results = await get_batched_results(graph, ticker, semaphore)
+            return set_descriptions(graph, results)
+
         futures = [
             do_summarize_descriptions(
                 node,
@@ -104,7 +121,9 @@ async def summarize_descriptions(
         ]
 
         results = await asyncio.gather(*futures)
+        return set_descriptions(graph, results)
 
+    def set_descriptions(graph: nx.Graph, results: list[SummarizedDescriptionResult]):
         for result in results:
             graph_item = result.items
             if isinstance(graph_item, str) and graph_item in graph.nodes():
@@ -114,6 +133,49 @@ async def summarize_descriptions(
 
         return graph
 
+    async def get_batched_results(
+        graph: nx.Graph, ticker: ProgressTicker, semaphore: asyncio.Semaphore
+    ) -> list[SummarizedDescriptionResult]:
+        graph_items = [
+            (node, sorted(set(graph.nodes[node].get("description", "").split("\n"))))
+            for node in graph.nodes()
+        ] + [
+            (edge, sorted(set(graph.edges[edge].get("description", "").split("\n"))))
+            for edge in graph.edges()
+        ]
+        # the items with a single description need no summarization
+        results = [
+            SummarizedDescriptionResult(items=item, description=descriptions[0])
+            for item, descriptions in graph_items
+            if len(descriptions) == 1
+        ]
+        ticker(len(results))
+
+        batches = _pack_batches(
+            [item for item in graph_items if len(item[1]) > 1],
+            strategy_config.get("batch_max_tokens", DEFAULT_BATCH_MAX_TOKENS),
+            strategy_config.get("batch_size", DEFAULT_BATCH_SIZE),
+        )
+        batch_exec = load_batch_strategy(
+            strategy.get("type", SummarizeStrategyType.graph_intelligence)
+        )
+        batch_results = await asyncio.gather(*[
+            do_summarize_batch(batch_exec, batch, ticker, semaphore)
+            for batch in batches
+        ])
+        return results + [result for batch in batch_results for result in batch]
+
+    async def do_summarize_batch(
+        batch_exec: BatchSummarizationStrategy,
+        batch: list[tuple[str | tuple[str, str], list[str]]],
+        ticker: ProgressTicker,
+        semaphore: asyncio.Semaphore,
+    ):
+        async with semaphore:
+            results = await batch_exec(batch, callbacks, cache, strategy_config)
+            ticker(len(batch))
+        return results
+
     async def do_summarize_descriptions(
         graph_item: str | tuple[str, str],
         descriptions: list[str],
@@ -146,3 +208,41 @@ def load_strategy(strategy_type: SummarizeStrategyType) -> SummarizationStrategy
         case _:
             msg = f"Unknown strategy: {strategy_type}"
             raise ValueError(msg)
+
+
+def load_batch_strategy(
+    strategy_type: SummarizeStrategyType,
+) -> BatchSummarizationStrategy:
+    """Load the batched variant of a strategy."""
+    match strategy_type:
+        case SummarizeStrategyType.graph_intelligence:
+            from .strategies import run_graph_intelligence_batch
+
+            return run_graph_intelligence_batch
+        case _:
+            msg = f"Unknown batch strategy: {strategy_type}"
+            raise ValueError(msg)
+
+
+def _pack_batches(
+    graph_items: list[tuple[str | tuple[str, str], list[str]]],
+    max_tokens: int,
+    max_items: int,
+) -> list[list[tuple[str | tuple[str, str], list[str]]]]:
+    """Pack consecutive items into batches of at most `max_items` items and `max_tokens` description tokens.
+
+    An item whose descriptions exceed the budget on their own gets a batch of its own.
+    """
+    batches: list[list[tuple[str | tuple[str, str], list[str]]]] = []
+    batch: list[tuple[str | tuple[str, str], list[str]]] = []
+    batch_tokens = 0
+    for graph_item in graph_items:
+        tokens = sum(num_tokens_from_string(d) for d in graph_item[1])
+        if batch and (batch_tokens + tokens > max_tokens or len(batch) >= max_items):
+            batches.append(batch)
+            batch, batch_tokens = [], 0
+        batch.append(graph_item)
+        batch_tokens += tokens
+    if batch:
+        batches.append(batch)
+    return batches
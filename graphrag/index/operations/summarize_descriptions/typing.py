@@ -35,6 +35,17 @@ SummarizationStrategy = Callable[
 ]
 
 
+BatchSummarizationStrategy = Callable[
+    [
+        list[tuple[str | tuple[str, str], list[str]]],
+        VerbCallbacks,
+        PipelineCache,
+        StrategyConfig,
+    ],
+    Awaitable[list[SummarizedDescriptionResult]],
+]
+
+
 class DescriptionSummarizeRow(NamedTuple):
     """DescriptionSummarizeRow class definition."""
 
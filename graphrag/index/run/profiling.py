@@ -11,6 +11,7 @@ from dataclasses import asdict
 from datashaper import MemoryProfile, Workflow, WorkflowRunResult
 
 from graphrag.index.context import PipelineRunStats
+from graphrag.index.llm import concurrency_limiter_stats, endpoint_stats
 from graphrag.index.storage.pipeline_storage import PipelineStorage
 
 log = logging.getLogger(__name__)
@@ -43,6 +44,8 @@ async def _save_profiler_stats(
 
 async def _dump_stats(stats: PipelineRunStats, storage: PipelineStorage) -> None:
     """Dump the stats to the storage."""
+    stats.llm_concurrency = concurrency_limiter_stats()
+    stats.llm_endpoints = endpoint_stats()
     await storage.set(
         "stats.json", json.dumps(asdict(stats), indent=4, ensure_ascii=False)
     )
@@ -3,6 +3,7 @@
 
 """Different methods to run the pipeline."""
 
+import asyncio
 import gc
 import logging
 import time
@@ -31,8 +32,11 @@ from graphrag.index.run.postprocess import (
 from graphrag.index.run.profiling import _dump_stats
 from graphrag.index.run.utils import (
     _apply_substitutions,
+    _create_community_reports_callbacks,
     _create_input,
     _create_reporter,
+    _get_clustering_strategy,
+    _get_community_reports_args,
     _validate_dataset,
     create_run_context,
 )
@@ -48,6 +52,7 @@ from graphrag.index.update.dataframes import get_delta_docs, update_dataframe_ou
 from graphrag.index.workflows import (
     VerbDefinitions,
     WorkflowDefinitions,
+    WorkflowToRun,
     load_workflows,
 )
 from graphrag.logging import (
@@ -75,6 +80,7 @@ async def run_pipeline_with_config(
     run_id: str | None = None,
     is_resume_run: bool = False,
     is_update_run: bool = False,
+    max_parallel_workflows: int | None = None,
     **_kwargs: dict,
 ) -> AsyncIterable[PipelineRunResult]:
     """Run a pipeline with the given config.
@@ -92,6 +98,7 @@ async def run_pipeline_with_config(
         - emit - The table emitters to use for the pipeline.
         - memory_profile - Whether or not to profile the memory.
         - run_id - The run id to start or resume from.
+        - max_parallel_workflows - The number of independent workflows to run at once (this overrides the config).
     """
     if isinstance(config_or_path, str):
         log.info("Running pipeline with config %s", config_or_path)
@@ -117,6 +124,9 @@ async def run_pipeline_with_config(
         config.input
     )
     workflows = workflows or config.workflows
+    max_parallel_workflows = (
+        max_parallel_workflows or config.max_parallel_workflows or 1
+    )
 
     if dataset is None:
         msg = "No dataset provided!"
@@ -142,10 +152,20 @@ async def run_pipeline_with_config(
             progress_reporter=progress_reporter,
             emit=emit,
             is_resume_run=False,
+            max_parallel_workflows=max_parallel_workflows,
         ):
             tables_dict[table.workflow] = table.result
 
-        await update_dataframe_outputs(tables_dict, storage)
+        await update_dataframe_outputs(
+            tables_dict,
+            storage,
+            _get_clustering_strategy(workflows),
+            cache=cache,
+            callbacks=_create_community_reports_callbacks(
+                _create_callback_chain(callbacks, progress_reporter)
+            ),
+            community_reports_args=_get_community_reports_args(workflows),
+        )
 
     else:
         async for table in run_pipeline(
@@ -161,6 +181,7 @@ async def run_pipeline_with_config(
             progress_reporter=progress_reporter,
             emit=emit,
             is_resume_run=is_resume_run,
+            max_parallel_workflows=max_parallel_workflows,
         ):
             yield table
 
@@ -178,6 +199,7 @@ async def run_pipeline(
     emit: list[TableEmitterType] | None = None,
     memory_profile: bool = False,
     is_resume_run: bool = False,
+    max_parallel_workflows: int = 1,
     **_kwargs: dict,
 ) -> AsyncIterable[PipelineRunResult]:
     """Run the pipeline.
@@ -196,6 +218,7 @@ async def run_pipeline(
         - additional_verbs - The custom verbs to use for the pipeline
         - additional_workflows - The custom workflows to use for the pipeline
         - debug - Whether or not to run in debug mode
+        - max_parallel_workflows - The number of workflows to run at once, each starting as soon as the workflows it depends on are done
     Returns:
         - output - An iterable of workflow results as they complete running, as well as any errors that occur
     """
@@ -204,8 +227,8 @@ async def run_pipeline(
     context = create_run_context(storage=storage, cache=cache, stats=None)
 
     progress_reporter = progress_reporter or NullProgressReporter()
-    callbacks = callbacks or ConsoleWorkflowCallbacks()
-    callbacks = _create_callback_chain(callbacks, progress_reporter)
+    workflow_callbacks = callbacks or ConsoleWorkflowCallbacks()
+    callbacks = _create_callback_chain(workflow_callbacks, progress_reporter)
     # TODO: This default behavior is already defined at the API level. Update tests
     # of this function to pass in an emit type before removing this default setting.
     emit = emit or [TableEmitterType.Parquet]
@@ -215,6 +238,7 @@ async def run_pipeline(
         lambda e, s, d: cast(WorkflowCallbacks, callbacks).on_error(
             "Error emitting table", e, s, d
         ),
+        callbacks,
     )
     loaded_workflows = load_workflows(
         workflows,
@@ -241,27 +265,54 @@ async def run_pipeline(
     context.stats.num_documents = len(dataset)
     last_workflow = "input"
 
+    if memory_profile and max_parallel_workflows > 1:
+        log.warning("running the workflows one at a time to profile their memory")
+        max_parallel_workflows = 1
+
+    async def run_workflow(workflow_to_run: WorkflowToRun) -> PipelineRunResult | None:
+        # Try to flush out any intermediate dataframes
+        gc.collect()
+
+        return await _process_workflow(
+            workflow_to_run.workflow,
+            context,
+            # the progress of each workflow is reported separately, as they may overlap
+            _create_callback_chain(workflow_callbacks, progress_reporter),
+            emitters,
+            workflow_dependencies,
+            dataset,
+            start_time,
+            is_resume_run,
+        )
+
+    running: dict[asyncio.Task, str] = {}
     try:
         await _dump_stats(context.stats, context.storage)
 
-        for workflow_to_run in workflows_to_run:
-            # Try to flush out any intermediate dataframes
-            gc.collect()
-
-            last_workflow = workflow_to_run.workflow.name
-            result = await _process_workflow(
-                workflow_to_run.workflow,
-                context,
-                callbacks,
-                emitters,
-                workflow_dependencies,
-                dataset,
-                start_time,
-                is_resume_run,
+        waiting = list(workflows_to_run)
+        order = {w.workflow.name: i for i, w in enumerate(workflows_to_run)}
+        done: set[str] = set()
+        while waiting or running:
+            # start the workflows whose dependencies are done, in dependency order
+            for workflow_to_run in list(waiting):
+                if len(running) >= max_parallel_workflows:
+                    break
+                name = workflow_to_run.workflow.name
+                if all(dep in done for dep in workflow_dependencies[name]):
+                    waiting.remove(workflow_to_run)
+                    running[asyncio.create_task(run_workflow(workflow_to_run))] = name
+
+            finished, _ = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
             )
-            if result:
-                yield result
+            for task in sorted(finished, key=lambda t: order[running[t]]):
+                last_workflow = running.pop(task)
+                result = task.result()
+                done.add(last_workflow)
+                if result:
+                    yield result
 
+        await context.cache.flush()
         context.stats.total_runtime = time.time() - start_time
         await _dump_stats(context.stats, context.storage)
     except Exception as e:
@@ -269,4 +320,16 @@ async def run_pipeline(
         cast(WorkflowCallbacks, callbacks).on_error(
             "Error running pipeline!", e, traceback.format_exc()
         )
+        try:
+            await context.cache.flush()
+        except Exception as flush_error:
+            log.exception("error flushing the cache")
+            cast(WorkflowCallbacks, callbacks).on_error(
+                "Error flushing the cache", flush_error, traceback.format_exc()
+            )
         yield PipelineRunResult(last_workflow, None, [e])
+    finally:
+        # stop the workflows still running alongside a failed one
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
@@ -9,6 +9,10 @@ from typing import Any
 
 import pandas as pd
 from datashaper import (
+    DelegatingVerbCallbacks,
+    ExecutionNode,
+    VerbCallbacks,
+    VerbDetails,
     WorkflowCallbacks,
 )
 
@@ -30,10 +34,23 @@ from graphrag.index.config.storage import (
     PipelineBlobStorageConfig,
     PipelineFileStorageConfig,
 )
+from graphrag.index.config.workflow import PipelineWorkflowReference
 from graphrag.index.context import PipelineRunContext, PipelineRunStats
 from graphrag.index.input import load_input
 from graphrag.index.storage.memory_pipeline_storage import MemoryPipelineStorage
 from graphrag.index.storage.pipeline_storage import PipelineStorage
+from graphrag.index.workflows.v1.create_base_entity_graph import (
+    workflow_name as create_base_entity_graph_name,
+)
+from graphrag.index.workflows.v1.create_final_community_reports import (
+    build_steps as build_community_reports_steps,
+)
+from graphrag.index.workflows.v1.create_final_community_reports import (
+    workflow_name as create_final_community_reports_name,
+)
+from graphrag.index.workflows.v1.subflows.create_final_community_reports import (
+    create_final_community_reports,
+)
 from graphrag.logging import ProgressReporter
 
 log = logging.getLogger(__name__)
@@ -103,6 +120,43 @@ def _apply_substitutions(config: PipelineConfig, run_id: str) -> PipelineConfig:
     return config
 
 
+def _get_clustering_strategy(
+    workflows: list[PipelineWorkflowReference],
+) -> dict[str, Any]:
+    """Get the clustering strategy of the entity graph workflow, for an update run to recluster with."""
+    for workflow in workflows:
+        if workflow.name == create_base_entity_graph_name:
+            config = workflow.config or {}
+            return config.get("cluster_graph", {}).get("strategy") or {"type": "leiden"}
+    return {"type": "leiden"}
+
+
+def _get_community_reports_args(
+    workflows: list[PipelineWorkflowReference],
+) -> dict[str, Any] | None:
+    """Get the arguments of the community reports workflow, for an update run to regenerate the changed reports with."""
+    for workflow in workflows:
+        if workflow.name == create_final_community_reports_name:
+            return build_community_reports_steps(workflow.config or {})[0].get("args")
+    return None
+
+
+def _create_community_reports_callbacks(
+    callbacks: WorkflowCallbacks,
+) -> VerbCallbacks:
+    """Create the verb callbacks of the community reports an update run regenerates outside of a workflow."""
+    node = ExecutionNode(
+        node_id=create_final_community_reports_name,
+        has_explicit_id=True,
+        verb=VerbDetails(
+            name=create_final_community_reports_name,
+            func=create_final_community_reports,
+        ),
+        node_input={},
+    )
+    return DelegatingVerbCallbacks(node, callbacks)
+
+
 def create_run_context(
     storage: PipelineStorage | None,
     cache: PipelineCache | None,
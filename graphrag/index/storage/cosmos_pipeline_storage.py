@@ -1,63 +1,85 @@
 
 
+import asyncio
+import contextlib
+import logging
 import os
-from time import time
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from base64 import b64encode, b64decode
 from re import Pattern
-from collections.abc import Iterator
-from typing import Any, Coroutine
+from collections.abc import Callable, Coroutine, Iterator
+from typing import Any, TypeVar
 
 
 from azure.cosmos import DatabaseProxy, PartitionKey, ContainerProxy
 from azure.cosmos.cosmos_client import CosmosClient
+from azure.cosmos.exceptions import CosmosResourceNotFoundError
 from azure.identity import DefaultAzureCredential
 import pandas as pd
 
+import graphrag.config.defaults as defs
 from graphrag.logging.types import ProgressReporter
+from graphrag.utils.lru_cache import LRUCache
 
 from .pipeline_storage import PipelineStorage
 
 MAX_ITEM_LENGTH = 1024 * 1024 * 1.8
+QUERY_PAGE_SIZE = 1000
+MEMORY_CACHE_MAX_ENTRIES = 10_000
+MEMORY_CACHE_MAX_BYTES = 256 * 1024 * 1024
+MEMORY_CACHE_TTL = 60
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
 
 class CosmosDBStorage(PipelineStorage):
     _db: DatabaseProxy|None
     _container_clients: dict[str, ContainerProxy|None]
     _raw_client: ContainerProxy
-    _memory_cache: dict[str, Any]    
+    _memory_cache: LRUCache
+    _concurrent_requests: int
+    _executor: ThreadPoolExecutor
 
 
-    def __init__(self, database_name:str|None = None, connection_string:str|None = None, account_name:str|None = None, account_Key:str|None = None) -> None:
+    def __init__(self, database_name:str|None = None, connection_string:str|None = None, account_name:str|None = None, account_Key:str|None = None, concurrent_requests:int = defs.STORAGE_CONCURRENT_REQUESTS) -> None:
         self._db = None
         self._container_clients = dict[str, ContainerProxy|None]()
         self._connect(database_name, connection_string, account_name, account_Key)
         self._raw_client = self.get_client('_raw', True) # type: ignore
-        self._memory_cache = dict[str, Any]()
+        self._memory_cache = LRUCache(MEMORY_CACHE_MAX_ENTRIES, max_bytes=MEMORY_CACHE_MAX_BYTES, ttl=MEMORY_CACHE_TTL, size_of=_cached_size)
+        self._concurrent_requests = concurrent_requests
+        self._executor = ThreadPoolExecutor(max_workers=concurrent_requests, thread_name_prefix="cosmos")
+
+    @property
+    def concurrent_requests(self) -> int:
+        """The maximum number of requests this storage keeps in flight."""
+        return self._concurrent_requests
+
+    async def run_in_executor(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking Cosmos SDK call on the storage's request pool without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
     
 
-    async def get(self, key: str, as_bytes: bool | None = None, encoding: str | None = None) -> dict[str, str | bytes | None] | None:
-        if key in self._memory_cache:
-            cache_item = self._memory_cache[key]
-            if cache_item['expiry'] < time():
-                del self._memory_cache[key]
-            else:
-                return cache_item['value']
-        
-        items = self._raw_client.query_items(f"SELECT * FROM c where c.id = '{key}'", partition_key=key, enable_cross_partition_query=False)
-        if items is not None:
-            item = next(iter(items), None)
-            if item is None:
+    async def get(self, key: str, as_bytes: bool | None = None, encoding: str | None = None) -> Any:
+        cached = self._memory_cache.get(key)
+        if cached is None:
+            try:
+                item = await self.run_in_executor(self._raw_client.read_item, item=key, partition_key=key)
+            except CosmosResourceNotFoundError:
                 return None
-            
-            value = item['value']
-            if item['encoded']:
-                if as_bytes:
-                    value = b64decode(value)
-                else:
-                    value = b64decode(value).decode(encoding) if encoding is not None else b64decode(value).decode()
-
-            cache_item = {'value': value, 'expiry': time() + 60}
-            self._memory_cache[key] = cache_item
-            return value # type: ignore
+            cached = (item['value'], item['encoded'])
+            self._memory_cache[key] = cached
+
+        value, is_encoded = cached
+        if is_encoded and value is not None:
+            value = b64decode(value)
+            if not as_bytes:
+                value = value.decode(encoding) if encoding is not None else value.decode()
+        return value
 
     async def set(self, key: str, value: str | bytes | None, encoding: str | None = None) -> None:
         is_encoded = False
@@ -66,35 +88,67 @@ class CosmosDBStorage(PipelineStorage):
                 value = b64encode(value).decode(encoding) if encoding is not None else b64encode(value).decode()
                 is_encoded = True
 
-        self._raw_client.upsert_item({'id': key, 'value': value, 'encoded': is_encoded})
-        cache_item = {'value': value, 'expiry': time() + 60}
-        self._memory_cache[key] = cache_item
+        await self.run_in_executor(self._raw_client.upsert_item, {'id': key, 'value': value, 'encoded': is_encoded})
+        self._memory_cache[key] = (value, is_encoded)
 
     async def has(self, key: str) -> bool:
-        item = await self.get(key)
-        return item is not None
+        if self._memory_cache.get(key) is not None:
+            return True
+        ## Project only the id so that large values are not downloaded just to check for existence
+        items = await self.run_in_executor(
+            lambda: list(self._raw_client.query_items(
+                "SELECT VALUE c.id FROM c WHERE c.id = @id",
+                parameters=[{'name': '@id', 'value': key}],
+                partition_key=key,
+            ))
+        )
+        return len(items) > 0
 
     async def delete(self, key: str) -> None:
-        self._raw_client.delete_item(key, key)
-        if key in self._memory_cache:
-            del self._memory_cache[key]
+        with contextlib.suppress(CosmosResourceNotFoundError):
+            await self.run_in_executor(self._raw_client.delete_item, key, key)
+        self._memory_cache.pop(key)
 
     async def clear(self) -> None:
         if self._db is not None:
             self._db.delete_container('_raw')
-        self._memory_cache = dict[str, Any]()
+        self._memory_cache.clear()
+
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        """The hit/miss counters and current size of the in-memory read cache."""
+        return self._memory_cache.stats
 
     def keys(self) -> list[str]:
-        keys = []
-        items = self._raw_client.query_items("SELECT * FROM c", enable_cross_partition_query=True)
-        for item in items:
-            keys.append(item['id'])
-        return keys
+        return list(self._query_ids())
 
     def find(self, file_pattern: Pattern[str], base_dir: str | None = None, progress: ProgressReporter | None = None, file_filter: dict[str, Any] | None = None, max_count=-1) -> Iterator[tuple[str, dict[str, Any]]]:
-        ## Iterate each key returning the key and the value if it matches the pattern
-        items = self._raw_client.query_items(f"SELECT * FROM c where id like '{file_pattern}'", enable_cross_partition_query=True)
-        return iter([(item['id'], item) for item in items])
+        """Find keys in the storage using a file pattern, as well as a custom filter function."""
+        def item_filter(item: dict[str, Any]) -> bool:
+            if file_filter is None:
+                return True
+            return all(re.match(value, item[key]) for key, value in file_filter.items())
+
+        log.info("search cosmos for keys matching %s", file_pattern.pattern)
+        num_loaded = 0
+        for key in self._query_ids(base_dir):
+            match = file_pattern.match(key)
+            if match:
+                group = match.groupdict()
+                if item_filter(group):
+                    yield (key, group)
+                    num_loaded += 1
+                    if max_count > 0 and num_loaded >= max_count:
+                        break
+
+    def _query_ids(self, prefix: str | None = None) -> Iterator[str]:
+        """Page through the ids of the raw container, optionally only those starting with a prefix."""
+        query = "SELECT VALUE c.id FROM c"
+        parameters: list[dict[str, Any]] = []
+        if prefix:
+            query += " WHERE STARTSWITH(c.id, @prefix)"
+            parameters.append({'name': '@prefix', 'value': prefix})
+        yield from self._raw_client.query_items(query, parameters=parameters, enable_cross_partition_query=True, max_item_count=QUERY_PAGE_SIZE)
 
     def child(self, name: str | None) -> "PipelineStorage":
         return self
@@ -163,5 +217,9 @@ class CosmosDBStorage(PipelineStorage):
                 container_map[container_props['id']] = None
         self._container_clients = container_map
 
-def create_cosmos_storage(database_name:str|None = None, connection_string:str|None = None, account_name:str|None = None, account_Key:str|None = None) -> CosmosDBStorage:
-    return CosmosDBStorage(database_name, connection_string, account_name, account_Key)
\ No newline at end of file
+def _cached_size(cached: tuple[str | None, bool]) -> int:
+    value, _ = cached
+    return len(value) if value is not None else 0
+
+def create_cosmos_storage(database_name:str|None = None, connection_string:str|None = None, account_name:str|None = None, account_Key:str|None = None, concurrent_requests:int = defs.STORAGE_CONCURRENT_REQUESTS) -> CosmosDBStorage:
+    return CosmosDBStorage(database_name, connection_string, account_name, account_Key, concurrent_requests)
\ No newline at end of file
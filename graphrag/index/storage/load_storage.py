@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from typing import cast
 
+import graphrag.config.defaults as defs
 from graphrag.config import StorageType
 from graphrag.index.config.storage import (
     PipelineBlobStorageConfig,
@@ -44,6 +45,7 @@ def load_storage(config: PipelineStorageConfig):
                 config.connection_string,
                 config.account_name,
                 config.account_key,
+                config.concurrent_requests or defs.STORAGE_CONCURRENT_REQUESTS,
             )
         case _:
             msg = f"Unknown storage type: {config.type}"
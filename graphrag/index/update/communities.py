@@ -0,0 +1,355 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Incremental community maintenance for update runs."""
+
+import asyncio
+import json
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import networkx as nx
+import pandas as pd
+from datashaper import AsyncType, VerbCallbacks
+
+from graphrag.index.cache import PipelineCache
+from graphrag.index.flows.create_final_communities import create_final_communities
+from graphrag.index.flows.create_final_community_reports import (
+    create_final_community_reports,
+)
+from graphrag.index.graph.utils import stable_largest_connected_component
+from graphrag.index.operations.cluster_graph import Communities, recluster_components
+from graphrag.index.storage.pipeline_storage import PipelineStorage
+from graphrag.utils.storage import _load_table_from_storage
+
+
+@dataclass
+class CommunityChanges:
+    """Dataclass to hold the communities changed by an update.
+
+    Attributes
+    ----------
+    created : list[str]
+        The ids of the communities that did not exist before the update.
+    modified : list[str]
+        The ids of the communities whose members, or the members' entities and relationships, changed.
+    dissolved : list[str]
+        The ids of the communities that no longer exist.
+    """
+
+    created: list[str]
+    modified: list[str]
+    dissolved: list[str]
+
+
+async def update_community_outputs(
+    dataframe_dict: dict[str, pd.DataFrame],
+    storage: PipelineStorage,
+    clustering_strategy: dict[str, Any],
+) -> CommunityChanges:
+    """Recluster the communities touched by the delta and write the updated nodes, communities and change set.
+
+    Parameters
+    ----------
+    dataframe_dict : dict[str, pd.DataFrame]
+        The dictionary of dataframes from the delta pipeline run.
+    storage : PipelineStorage
+        The storage holding the previous outputs, where the updated ones are stored.
+    clustering_strategy : dict[str, Any]
+        The clustering strategy of the previous run.
+
+    Returns
+    -------
+    CommunityChanges
+        The communities created, modified and dissolved by the update.
+    """
+    old_nodes = await _load_table_from_storage("create_final_nodes.parquet", storage)
+    old_relationships = await _load_table_from_storage(
+        "create_final_relationships.parquet", storage
+    )
+    delta_nodes = dataframe_dict["create_final_nodes"]
+    delta_relationships = dataframe_dict["create_final_relationships"]
+
+    relationships = _merge_relationships(old_relationships, delta_relationships)
+    graph = nx.Graph()
+    graph.add_nodes_from(old_nodes["title"])
+    graph.add_nodes_from(delta_nodes["title"])
+    for source, target, weight in zip(
+        relationships["source"],
+        relationships["target"],
+        relationships["weight"],
+        strict=True,
+    ):
+        graph.add_edge(source, target, weight=weight)
+    # new and re-extracted entities, and the ends of new relationships
+    touched = {
+        *delta_nodes["title"],
+        *delta_relationships["source"],
+        *delta_relationships["target"],
+    }
+
+    communities, changes = await asyncio.to_thread(
+        update_communities,
+        graph,
+        _to_communities(old_nodes),
+        touched,
+        clustering_strategy,
+    )
+
+    nodes = _update_nodes(old_nodes, delta_nodes, graph, communities)
+    # the graph tables the communities are built from, with the edges at every level
+    edges = relationships.loc[:, ["source", "target", "id"]].assign(
+        source_id=[",".join(ids) for ids in relationships["text_unit_ids"]]
+    )
+    levels = sorted(nodes["level"].unique()) or [0]
+    final_communities = create_final_communities(
+        nodes.rename(columns={"title": "label", "community": "cluster"}),
+        pd.concat([edges.assign(level=level) for level in levels], ignore_index=True),
+    )
+
+    # TODO: Using _new in the mean time, to compare outputs without overwriting the original
+    await storage.set("create_final_nodes_new.parquet", nodes.to_parquet())
+    await storage.set(
+        "create_final_communities_new.parquet", final_communities.to_parquet()
+    )
+    await storage.set("community_changes.json", json.dumps(asdict(changes)))
+    return changes
+
+
+async def update_community_reports(
+    dataframe_dict: dict[str, pd.DataFrame],
+    storage: PipelineStorage,
+    cache: PipelineCache,
+    callbacks: VerbCallbacks,
+    changes: CommunityChanges,
+    report_args: dict[str, Any],
+) -> pd.DataFrame:
+    """Regenerate the reports of the communities the update created or modified, and reuse the previous reports of the others.
+
+    Parameters
+    ----------
+    dataframe_dict : dict[str, pd.DataFrame]
+        The dictionary of dataframes from the delta pipeline run.
+    storage : PipelineStorage
+        The storage holding the previous outputs and the updated nodes, where the updated reports are stored.
+    cache : PipelineCache
+        The cache of the pipeline.
+    callbacks : VerbCallbacks
+        The callbacks to report the report generation to.
+    changes : CommunityChanges
+        The change set of the update, deciding which reports are regenerated.
+    report_args : dict[str, Any]
+        The arguments of the community reports workflow.
+
+    Returns
+    -------
+    pd.DataFrame
+        The community reports of the updated communities.
+    """
+    nodes = await _load_table_from_storage("create_final_nodes_new.parquet", storage)
+    relationships = _merge_relationships(
+        await _load_table_from_storage("create_final_relationships.parquet", storage),
+        dataframe_dict["create_final_relationships"],
+    )
+    claims = [
+        table
+        for table in [
+            await _load_table_from_storage("create_final_covariates.parquet", storage)
+            if await storage.has("create_final_covariates.parquet")
+            else None,
+            dataframe_dict.get("create_final_covariates"),
+        ]
+        if table is not None
+    ]
+    previous_reports = (
+        await _load_table_from_storage(
+            "create_final_community_reports.parquet", storage
+        )
+        if await storage.has("create_final_community_reports.parquet")
+        else None
+    )
+
+    reports = await create_final_community_reports(
+        nodes,
+        relationships,
+        pd.concat(claims, ignore_index=True) if len(claims) > 0 else None,
+        callbacks,
+        cache,
+        report_args["summarization_strategy"],
+        async_mode=report_args.get("async_mode") or AsyncType.AsyncIO,
+        num_threads=report_args.get("num_threads") or 4,
+        full_content_text_embed=report_args.get("full_content_text_embed"),
+        summary_text_embed=report_args.get("summary_text_embed"),
+        title_text_embed=report_args.get("title_text_embed"),
+        previous_reports=previous_reports,
+        changed_communities=[*changes.created, *changes.modified],
+    )
+
+    # TODO: Using _new in the mean time, to compare outputs without overwriting the original
+    await storage.set(
+        "create_final_community_reports_new.parquet", reports.to_parquet()
+    )
+    return reports
+
+
+def update_communities(
+    graph: nx.Graph,
+    previous: Communities,
+    touched: set[str],
+    strategy: dict[str, Any],
+) -> tuple[Communities, CommunityChanges]:
+    """Recluster the connected components of the graph that hold a touched node, keeping the other communities.
+
+    The reclustered components start from their previous level 0 communities, and each new
+    community takes the id of the previous community of the same level it shares the most
+    members with, so a community that only gained or lost a few members keeps its id. The
+    components that hold no touched node, and whose nodes were all clustered before, keep their
+    communities as they were.
+
+    Parameters
+    ----------
+    graph : nx.Graph
+        The graph with both the previous and the new nodes and relationships.
+    previous : Communities
+        The previous (level, id, members) communities, with numeric ids.
+    touched : set[str]
+        The nodes that are new, changed, or at either end of a new relationship.
+    strategy : dict[str, Any]
+        The clustering strategy.
+
+    Returns
+    -------
+    Communities
+        The updated communities, sorted by level and id.
+    CommunityChanges
+        The communities created, modified and dissolved by the update.
+    """
+    if strategy.get("use_lcc", True) and len(graph.nodes) > 0:
+        graph = stable_largest_connected_component(graph)
+    previous_level_0 = {
+        node: int(community_id)
+        for level, community_id, members in previous
+        if level == 0
+        for node in members
+    }
+    recluster: set[str] = set()
+    for nodes in nx.connected_components(graph):
+        if len(nodes) > 1 and any(
+            node in touched or node not in previous_level_0 for node in nodes
+        ):
+            recluster.update(nodes)
+    kept_nodes = set(graph.nodes) - recluster
+
+    # communities outside of the reclustered components are kept as they are
+    kept = [c for c in previous if kept_nodes.issuperset(c[2])]
+    candidates = [c for c in previous if not kept_nodes.issuperset(c[2])]
+    reclustered = recluster_components(graph, strategy, recluster, previous_level_0)
+
+    communities = list(kept)
+    changes = CommunityChanges(created=[], modified=[], dissolved=[])
+    matches = _match_communities(candidates, reclustered)
+    next_id = max((int(c[1]) + 1 for c in previous), default=0)
+    for level, cluster_id, members in sorted(
+        reclustered, key=lambda c: (c[0], int(c[1]))
+    ):
+        match = matches.get((level, cluster_id))
+        if match is None:
+            community_id = str(next_id)
+            next_id += 1
+            changes.created.append(community_id)
+        else:
+            community_id, previous_members = match
+            if set(members) != set(previous_members) or touched.intersection(members):
+                changes.modified.append(community_id)
+        communities.append((level, community_id, members))
+
+    matched = {community_id for community_id, _ in matches.values()}
+    changes.dissolved.extend(
+        community_id for _, community_id, _ in candidates if community_id not in matched
+    )
+    communities.sort(key=lambda c: (c[0], int(c[1])))
+    return communities, changes
+
+
+def _match_communities(
+    previous: Communities, reclustered: Communities
+) -> dict[tuple[int, str], tuple[str, list[str]]]:
+    """Match each reclustered community to the previous community of its level it overlaps the most, each previous community being matched once."""
+    previous_by_level: dict[int, list[tuple[str, set[str]]]] = {}
+    for level, community_id, members in previous:
+        previous_by_level.setdefault(level, []).append((community_id, set(members)))
+
+    pairs = []
+    for level, cluster_id, members in reclustered:
+        for community_id, previous_members in previous_by_level.get(level, []):
+            overlap = len(previous_members.intersection(members))
+            if overlap > 0:
+                pairs.append((-overlap, int(community_id), int(cluster_id), level))
+
+    previous_members_of = {
+        (level, community_id): members for level, community_id, members in previous
+    }
+    matches: dict[tuple[int, str], tuple[str, list[str]]] = {}
+    matched: set[int] = set()
+    for _, community_id, cluster_id, level in sorted(pairs):
+        if community_id in matched or (level, str(cluster_id)) in matches:
+            continue
+        matched.add(community_id)
+        matches[level, str(cluster_id)] = (
+            str(community_id),
+            previous_members_of[level, str(community_id)],
+        )
+    return matches
+
+
+def _to_communities(nodes: pd.DataFrame) -> Communities:
+    """Read the (level, id, members) communities of a final nodes table."""
+    clustered = nodes[nodes["community"].notna()]
+    return [
+        (int(level), str(community_id), list(members))
+        for (level, community_id), members in clustered.groupby(
+            ["level", "community"], sort=False
+        )["title"]
+    ]
+
+
+def _merge_relationships(old: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+    """Add the delta relationships between pairs of nodes that were not related before."""
+    old_pairs = {
+        frozenset(pair) for pair in zip(old["source"], old["target"], strict=True)
+    }
+    new = [
+        frozenset(pair) not in old_pairs
+        for pair in zip(delta["source"], delta["target"], strict=True)
+    ]
+    return pd.concat([old, delta[new]], ignore_index=True)
+
+
+def _update_nodes(
+    old_nodes: pd.DataFrame,
+    delta_nodes: pd.DataFrame,
+    graph: nx.Graph,
+    communities: Communities,
+) -> pd.DataFrame:
+    """Build the final nodes table of the updated graph, with one row per node for each community level."""
+    start = int(old_nodes["human_readable_id"].max()) + 1 if len(old_nodes) > 0 else 0
+    new_nodes = delta_nodes[
+        ~delta_nodes["title"].isin(old_nodes["title"])
+    ].drop_duplicates("title")
+    new_nodes = new_nodes.assign(human_readable_id=range(start, start + len(new_nodes)))
+    base = pd.concat([old_nodes.drop_duplicates("title"), new_nodes], ignore_index=True)
+    base["degree"] = [int(graph.degree(title)) for title in base["title"]]
+
+    levels = sorted({level for level, _, _ in communities})
+    tables = []
+    for level in levels:
+        clusters = {
+            node: community_id
+            for community_level, community_id, members in communities
+            if community_level == level
+            for node in members
+        }
+        tables.append(base.assign(level=level, community=base["title"].map(clusters)))
+    if len(tables) == 0:
+        return pd.DataFrame(columns=old_nodes.columns)
+    return pd.concat(tables, ignore_index=True).loc[:, old_nodes.columns]
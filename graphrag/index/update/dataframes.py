@@ -5,11 +5,18 @@
 
 import os
 from dataclasses import dataclass
+from typing import Any
 
 import numpy as np
 import pandas as pd
+from datashaper import NoopVerbCallbacks, VerbCallbacks
 
+from graphrag.index.cache import InMemoryCache, PipelineCache
 from graphrag.index.storage.pipeline_storage import PipelineStorage
+from graphrag.index.update.communities import (
+    update_community_outputs,
+    update_community_reports,
+)
 from graphrag.utils.storage import _load_table_from_storage
 
 mergeable_outputs = [
@@ -72,6 +79,10 @@ async def get_delta_docs(
 async def update_dataframe_outputs(
     dataframe_dict: dict[str, pd.DataFrame],
     storage: PipelineStorage,
+    clustering_strategy: dict[str, Any] | None = None,
+    cache: PipelineCache | None = None,
+    callbacks: VerbCallbacks | None = None,
+    community_reports_args: dict[str, Any] | None = None,
 ) -> None:
     """Update the mergeable outputs.
 
@@ -81,6 +92,15 @@ async def update_dataframe_outputs(
         The dictionary of dataframes.
     storage : PipelineStorage
         The storage used to store the dataframes.
+    clustering_strategy : dict[str, Any] | None
+        The clustering strategy used to recluster the communities touched by the delta.
+    cache : PipelineCache | None
+        The cache of the pipeline, for the community reports to regenerate.
+    callbacks : VerbCallbacks | None
+        The callbacks to report the community report generation to.
+    community_reports_args : dict[str, Any] | None
+        The arguments of the community reports workflow. With its incremental mode on, the
+        reports of the communities changed by the update are regenerated and the others reused.
     """
     await _concat_dataframes("create_base_text_units", dataframe_dict, storage)
     await _concat_dataframes("create_final_documents", dataframe_dict, storage)
@@ -97,6 +117,20 @@ async def update_dataframe_outputs(
         "create_final_entities_new.parquet", merged_entities_df.to_parquet()
     )
 
+    changes = await update_community_outputs(
+        dataframe_dict, storage, clustering_strategy or {"type": "leiden"}
+    )
+
+    if community_reports_args and community_reports_args.get("incremental"):
+        await update_community_reports(
+            dataframe_dict,
+            storage,
+            cache or InMemoryCache(),
+            callbacks or NoopVerbCallbacks(),
+            changes,
+            community_reports_args,
+        )
+
 
 async def _concat_dataframes(name, dataframe_dict, storage):
     """Concatenate the dataframes.
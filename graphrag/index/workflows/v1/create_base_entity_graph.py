@@ -90,6 +90,7 @@ def build_steps(
 
     graphml_snapshot_enabled = config.get("graphml_snapshot", False) or False
     raw_entity_snapshot_enabled = config.get("raw_entity_snapshot", False) or False
+    batch_size = config.get("streaming_batch_size")
 
     return [
         {
@@ -111,6 +112,7 @@ def build_steps(
                 else None,
                 "raw_entity_snapshot_enabled": raw_entity_snapshot_enabled,
                 "graphml_snapshot_enabled": graphml_snapshot_enabled,
+                "batch_size": batch_size,
             },
             "input": ({"source": "workflow:create_base_text_units"}),
         },
@@ -24,6 +24,7 @@ def build_steps(
     n_tokens_column_name = config.get("n_tokens_column", "n_tokens")
     text_chunk_config = config.get("text_chunk", {})
     chunk_strategy = text_chunk_config.get("strategy")
+    batch_size = config.get("streaming_batch_size")
     return [
         {
             "verb": "create_base_text_units",
@@ -32,6 +33,7 @@ def build_steps(
                 "n_tokens_column_name": n_tokens_column_name,
                 "chunk_by_columns": chunk_by_columns,
                 "chunk_strategy": chunk_strategy,
+                "batch_size": batch_size,
             },
             "input": {"source": DEFAULT_INPUT_NAME},
         },
@@ -22,6 +22,7 @@ def build_steps(
     summarization_strategy = create_community_reports_config.get("strategy")
     async_mode = create_community_reports_config.get("async_mode")
     num_threads = create_community_reports_config.get("num_threads")
+    incremental = create_community_reports_config.get("incremental", False)
 
     base_text_embed = config.get("text_embed", {})
     community_report_full_content_embed_config = config.get(
@@ -59,6 +60,7 @@ def build_steps(
                 "summarization_strategy": summarization_strategy,
                 "async_mode": async_mode,
                 "num_threads": num_threads,
+                "incremental": incremental,
             },
             "input": input,
         },
@@ -28,6 +28,7 @@ def build_steps(
 
     chunk_column = config.get("chunk_column", "chunk")
     chunk_id_column = config.get("chunk_id_column", "chunk_id")
+    batch_size = config.get("streaming_batch_size")
 
     return [
         {
@@ -39,6 +40,7 @@ def build_steps(
                 "extraction_strategy": extraction_strategy,
                 "async_mode": async_mode,
                 "num_threads": num_threads,
+                "batch_size": batch_size,
             },
             "input": {"source": "workflow:create_base_text_units"},
         },
@@ -5,6 +5,7 @@
 
 from typing import Any, cast
 
+import pandas as pd
 from datashaper import (
     AsyncType,
     Table,
@@ -43,12 +44,13 @@ async def create_base_entity_graph(
     embedding_strategy: dict[str, Any] | None = None,
     graphml_snapshot_enabled: bool = False,
     raw_entity_snapshot_enabled: bool = False,
+    batch_size: int | None = None,
     **_kwargs: dict,
 ) -> VerbResult:
     """All the steps to create the base entity graph."""
     text_units = await runtime_storage.get("base_text_units")
 
-    output = await create_base_entity_graph_flow(
+    nodes, edges = await create_base_entity_graph_flow(
         text_units,
         callbacks,
         cache,
@@ -67,6 +69,10 @@ async def create_base_entity_graph(
         embedding_strategy=embedding_strategy,
         graphml_snapshot_enabled=graphml_snapshot_enabled,
         raw_entity_snapshot_enabled=raw_entity_snapshot_enabled,
+        batch_size=batch_size,
     )
 
-    return create_verb_result(cast(Table, output))
+    await runtime_storage.set("base_entity_nodes", nodes)
+    await runtime_storage.set("base_relationship_edges", edges)
+
+    return create_verb_result(cast(Table, pd.DataFrame()))
@@ -29,6 +29,7 @@ async def create_base_text_units(
     n_tokens_column_name: str,
     chunk_by_columns: list[str],
     chunk_strategy: dict[str, Any] | None = None,
+    batch_size: int | None = None,
     **_kwargs: dict,
 ) -> VerbResult:
     """All the steps to transform base text_units."""
@@ -41,6 +42,7 @@ async def create_base_text_units(
         n_tokens_column_name,
         chunk_by_columns,
         chunk_strategy=chunk_strategy,
+        batch_size=batch_size,
     )
 
     await runtime_storage.set("base_text_units", output)
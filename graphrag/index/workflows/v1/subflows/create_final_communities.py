@@ -5,11 +5,8 @@
 
 from typing import cast
 
-import pandas as pd
 from datashaper import (
     Table,
-    VerbCallbacks,
-    VerbInput,
     verb,
 )
 from datashaper.table_store.types import VerbResult, create_verb_result
@@ -17,20 +14,21 @@ from datashaper.table_store.types import VerbResult, create_verb_result
 from graphrag.index.flows.create_final_communities import (
     create_final_communities as create_final_communities_flow,
 )
+from graphrag.index.storage import PipelineStorage
 
 
 @verb(name="create_final_communities", treats_input_tables_as_immutable=True)
-def create_final_communities(
-    input: VerbInput,
-    callbacks: VerbCallbacks,
+async def create_final_communities(
+    runtime_storage: PipelineStorage,
     **_kwargs: dict,
 ) -> VerbResult:
     """All the steps to transform final communities."""
-    source = cast(pd.DataFrame, input.get_input())
+    entity_nodes = await runtime_storage.get("base_entity_nodes")
+    relationship_edges = await runtime_storage.get("base_relationship_edges")
 
     output = create_final_communities_flow(
-        source,
-        callbacks,
+        entity_nodes,
+        relationship_edges,
     )
 
     return create_verb_result(
@@ -19,6 +19,7 @@ from graphrag.index.cache import PipelineCache
 from graphrag.index.flows.create_final_community_reports import (
     create_final_community_reports as create_final_community_reports_flow,
 )
+from graphrag.index.storage import PipelineStorage
 from graphrag.index.utils.ds_util import get_named_input_table, get_required_input_table
 
 
@@ -27,12 +28,14 @@ async def create_final_community_reports(
     input: VerbInput,
     callbacks: VerbCallbacks,
     cache: PipelineCache,
+    storage: PipelineStorage,
     summarization_strategy: dict,
     async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
     full_content_text_embed: dict | None = None,
     summary_text_embed: dict | None = None,
     title_text_embed: dict | None = None,
+    incremental: bool = False,
     **_kwargs: dict,
 ) -> VerbResult:
     """All the steps to transform community reports."""
@@ -43,6 +46,15 @@ async def create_final_community_reports(
     if claims:
         claims = cast(pd.DataFrame, claims.table)
 
+    # the reports of the previous run, which is about to be overwritten
+    previous_reports = None
+    if incremental:
+        previous_reports = (
+            await storage.load_table("create_final_community_reports.parquet")
+            if await storage.has("create_final_community_reports.parquet")
+            else pd.DataFrame()
+        )
+
     output = await create_final_community_reports_flow(
         nodes,
         edges,
@@ -55,6 +67,7 @@ async def create_final_community_reports(
         full_content_text_embed=full_content_text_embed,
         summary_text_embed=summary_text_embed,
         title_text_embed=title_text_embed,
+        previous_reports=previous_reports,
     )
 
     return create_verb_result(
@@ -24,6 +24,7 @@ from graphrag.index.storage import PipelineStorage
 async def create_final_covariates(
     callbacks: VerbCallbacks,
     cache: PipelineCache,
+    storage: PipelineStorage,
     runtime_storage: PipelineStorage,
     column: str,
     covariate_type: str,
@@ -31,6 +32,7 @@ async def create_final_covariates(
     async_mode: AsyncType = AsyncType.AsyncIO,
     entity_types: list[str] | None = None,
     num_threads: int = 4,
+    batch_size: int | None = None,
     **_kwargs: dict,
 ) -> VerbResult:
     """All the steps to extract and format covariates."""
@@ -46,6 +48,8 @@ async def create_final_covariates(
         async_mode=async_mode,
         entity_types=entity_types,
         num_threads=num_threads,
+        storage=storage,
+        batch_size=batch_size,
     )
 
     return create_verb_result(cast(Table, output))
@@ -5,11 +5,9 @@
 
 from typing import cast
 
-import pandas as pd
 from datashaper import (
     Table,
     VerbCallbacks,
-    VerbInput,
     verb,
 )
 from datashaper.table_store.types import VerbResult, create_verb_result
@@ -18,6 +16,7 @@ from graphrag.index.cache import PipelineCache
 from graphrag.index.flows.create_final_entities import (
     create_final_entities as create_final_entities_flow,
 )
+from graphrag.index.storage import PipelineStorage
 
 
 @verb(
@@ -25,18 +24,18 @@ from graphrag.index.flows.create_final_entities import (
     treats_input_tables_as_immutable=True,
 )
 async def create_final_entities(
-    input: VerbInput,
     callbacks: VerbCallbacks,
     cache: PipelineCache,
+    runtime_storage: PipelineStorage,
     name_text_embed: dict | None = None,
     description_text_embed: dict | None = None,
     **_kwargs: dict,
 ) -> VerbResult:
     """All the steps to transform final entities."""
-    source = cast(pd.DataFrame, input.get_input())
+    entity_nodes = await runtime_storage.get("base_entity_nodes")
 
     output = await create_final_entities_flow(
-        source,
+        entity_nodes,
         callbacks,
         cache,
         name_text_embed=name_text_embed,
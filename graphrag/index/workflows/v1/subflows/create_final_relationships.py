@@ -18,6 +18,7 @@ from graphrag.index.cache import PipelineCache
 from graphrag.index.flows.create_final_relationships import (
     create_final_relationships as create_final_relationships_flow,
 )
+from graphrag.index.storage import PipelineStorage
 from graphrag.index.utils.ds_util import get_required_input_table
 
 
@@ -29,15 +30,16 @@ async def create_final_relationships(
     input: VerbInput,
     callbacks: VerbCallbacks,
     cache: PipelineCache,
+    runtime_storage: PipelineStorage,
     description_text_embed: dict | None = None,
     **_kwargs: dict,
 ) -> VerbResult:
     """All the steps to transform final relationships."""
-    source = cast(pd.DataFrame, input.get_input())
+    relationship_edges = await runtime_storage.get("base_relationship_edges")
     nodes = cast(pd.DataFrame, get_required_input_table(input, "nodes").table)
 
     output = await create_final_relationships_flow(
-        source,
+        relationship_edges,
         nodes,
         callbacks,
         cache,
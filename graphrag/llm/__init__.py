@@ -3,12 +3,21 @@
 
 """The Datashaper OpenAI Utilities package."""
 
-from .base import BaseLLM, CachingLLM, RateLimitingLLM
+from .base import (
+    BaseLLM,
+    CachingLLM,
+    LLMEndpoint,
+    LLMEndpointMetrics,
+    LoadBalancingLLM,
+    RateLimitingLLM,
+)
 from .errors import RetriesExhaustedError
 from .limiting import (
+    AdaptiveConcurrencyLimiter,
     CompositeLLMLimiter,
     LLMLimiter,
     NoopLLMLimiter,
+    TokenBudget,
     TpmRpmLLMLimiter,
     create_tpm_rpm_limiters,
 )
@@ -19,6 +28,7 @@ from .openai import (
     OpenAICompletionLLM,
     OpenAIConfiguration,
     OpenAIEmbeddingsLLM,
+    OpenAIEndpoint,
     create_openai_chat_llm,
     create_openai_client,
     create_openai_completion_llm,
@@ -46,6 +56,7 @@ from .types import (
 __all__ = [
     # LLM Types
     "LLM",
+    "AdaptiveConcurrencyLimiter",
     "BaseLLM",
     "CachingLLM",
     "CompletionInput",
@@ -61,12 +72,15 @@ __all__ = [
     # Cache
     "LLMCache",
     "LLMConfig",
+    "LLMEndpoint",
+    "LLMEndpointMetrics",
     # LLM I/O Types
     "LLMInput",
     "LLMInvocationFn",
     "LLMInvocationResult",
     "LLMLimiter",
     "LLMOutput",
+    "LoadBalancingLLM",
     "MockChatLLM",
     # Mock
     "MockCompletionLLM",
@@ -78,9 +92,11 @@ __all__ = [
     # OpenAI
     "OpenAIConfiguration",
     "OpenAIEmbeddingsLLM",
+    "OpenAIEndpoint",
     "RateLimitingLLM",
     # Errors
     "RetriesExhaustedError",
+    "TokenBudget",
     "TpmRpmLLMLimiter",
     "create_openai_chat_llm",
     "create_openai_client",
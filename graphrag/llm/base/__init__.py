@@ -5,6 +5,14 @@
 
 from .base_llm import BaseLLM
 from .caching_llm import CachingLLM
+from .load_balancing_llm import LLMEndpoint, LLMEndpointMetrics, LoadBalancingLLM
 from .rate_limiting_llm import RateLimitingLLM
 
-__all__ = ["BaseLLM", "CachingLLM", "RateLimitingLLM"]
+__all__ = [
+    "BaseLLM",
+    "CachingLLM",
+    "LLMEndpoint",
+    "LLMEndpointMetrics",
+    "LoadBalancingLLM",
+    "RateLimitingLLM",
+]
@@ -38,6 +38,14 @@ class BaseLLM(ABC, LLM[TIn, TOut], Generic[TIn, TOut]):
     ) -> TOut | None:
         pass
 
+    async def _execute_llm_with_usage(
+        self,
+        input: TIn,
+        **kwargs: Unpack[LLMInput],
+    ) -> tuple[TOut | None, dict[str, int] | None]:
+        """Execute the LLM, returning the token usage reported by the service if it is available."""
+        return await self._execute_llm(input, **kwargs), None
+
     async def __call__(
         self,
         input: TIn,
@@ -51,8 +59,8 @@ class BaseLLM(ABC, LLM[TIn, TOut], Generic[TIn, TOut]):
 
     async def _invoke(self, input: TIn, **kwargs: Unpack[LLMInput]) -> LLMOutput[TOut]:
         try:
-            output = await self._execute_llm(input, **kwargs)
-            return LLMOutput(output=output)
+            output, usage = await self._execute_llm_with_usage(input, **kwargs)
+            return LLMOutput(output=output, usage=usage)
         except RateLimitError:
             # for improved readability, do not log rate limit exceptions,
             # they are logged/handled elsewhere
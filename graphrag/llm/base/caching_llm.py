@@ -3,6 +3,7 @@
 
 """A class to interact with the cache."""
 
+import asyncio
 import json
 from typing import Generic, TypeVar
 
@@ -32,6 +33,8 @@ class CachingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
     _llm_parameters: dict
     _on_cache_hit: OnCacheActionFn
     _on_cache_miss: OnCacheActionFn
+    _pending: dict[str, "asyncio.Future[TOut | None]"]
+    _coalesced_hits: int
 
     def __init__(
         self,
@@ -46,6 +49,13 @@ class CachingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
         self._operation = operation
         self._on_cache_hit = _noop_cache_fn
         self._on_cache_miss = _noop_cache_fn
+        self._pending = {}
+        self._coalesced_hits = 0
+
+    @property
+    def coalesced_hits(self) -> int:
+        """The number of calls that were served by an identical call already in flight."""
+        return self._coalesced_hits
 
     def set_delegate(self, delegate: LLM[TIn, TOut]) -> None:
         """Set the delegate LLM. (for testing)."""
@@ -75,12 +85,51 @@ class CachingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
         input: TIn,
         **kwargs: Unpack[LLMInput],
     ) -> LLMOutput[TOut]:
-        """Execute the LLM."""
-        # Check for an Existing cache item
+        """Execute the LLM.
+
+        Concurrent calls with the same cache key are coalesced: the first one calls the
+        delegate, and the others wait for its output and are reported as cache hits. If
+        the first call fails, the waiting calls are retried as if they had been made alone.
+        """
         name = kwargs.get("name")
         history_in = kwargs.get("history") or None
         llm_args = {**self._llm_parameters, **(kwargs.get("model_parameters") or {})}
         cache_key = self._cache_key(input, name, llm_args, history_in)
+
+        while (pending := self._pending.get(cache_key)) is not None:
+            try:
+                output = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                continue
+            self._coalesced_hits += 1
+            self._on_cache_hit(cache_key, name)
+            return LLMOutput(output=output)
+
+        future: asyncio.Future[TOut | None] = asyncio.get_running_loop().create_future()
+        self._pending[cache_key] = future
+        try:
+            result = await self._call(input, cache_key, llm_args, history_in, **kwargs)
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result.output)
+        finally:
+            del self._pending[cache_key]
+        return result
+
+    async def _call(
+        self,
+        input: TIn,
+        cache_key: str,
+        llm_args: dict,
+        history_in: list[dict] | None,
+        **kwargs: Unpack[LLMInput],
+    ) -> LLMOutput[TOut]:
+        # Check for an Existing cache item
+        name = kwargs.get("name")
         cached_result = await self._cache.get(cache_key)
 
         if cached_result:
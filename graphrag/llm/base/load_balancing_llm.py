@@ -0,0 +1,219 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Load balancing LLM implementation."""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from typing_extensions import Unpack
+
+from graphrag.llm.limiting import LLMLimiter
+from graphrag.llm.types import LLM, LLMInput, LLMInvocationResult, LLMOutput
+
+TIn = TypeVar("TIn")
+TOut = TypeVar("TOut")
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class LLMEndpointMetrics:
+    """The requests, tokens and latency of an endpoint."""
+
+    requests: int = 0
+    failures: int = 0
+    ejections: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    total_latency: float = 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        """Get the metrics as a dictionary, with the mean latency of the requests."""
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "ejections": self.ejections,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "mean_latency": self.total_latency / self.requests if self.requests else 0,
+        }
+
+
+class LLMEndpoint(Generic[TIn, TOut]):
+    """One of the endpoints a `LoadBalancingLLM` routes requests to."""
+
+    name: str
+    llm: LLM[TIn, TOut]
+    weight: float
+    limiter: LLMLimiter | None
+    metrics: LLMEndpointMetrics
+    in_flight: int
+    consecutive_failures: int
+    ejected_until: float
+
+    def __init__(
+        self,
+        name: str,
+        llm: LLM[TIn, TOut],
+        weight: float = 1.0,
+        limiter: LLMLimiter | None = None,
+        metrics: LLMEndpointMetrics | None = None,
+    ):
+        if weight <= 0:
+            msg = f"Invalid weight for endpoint {name}: {weight}"
+            raise ValueError(msg)
+        self.name = name
+        self.llm = llm
+        self.weight = weight
+        self.limiter = limiter
+        # the metrics may be shared by the LLMs calling the same endpoint
+        self.metrics = metrics or LLMEndpointMetrics()
+        self.in_flight = 0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+
+    @property
+    def free_capacity(self) -> float:
+        """The weighted share of the endpoint's capacity that is free for another request."""
+        headroom = self.limiter.headroom if self.limiter is not None else 1.0
+        return self.weight * headroom / (1 + self.in_flight)
+
+    def on_invoke(self, result: LLMInvocationResult) -> None:
+        """Record the tokens and latency of a completed request."""
+        self.metrics.requests += 1
+        self.metrics.input_tokens += max(result.input_tokens, 0)
+        self.metrics.output_tokens += result.output_tokens
+        self.metrics.total_latency += result.total_time
+
+
+class LoadBalancingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
+    """Route each request to the endpoint with the most free capacity.
+
+    A request failing with a retryable error (a 429, a 5xx or a connection error) is
+    retried on the endpoint with the most free capacity at the time, and an endpoint
+    failing `eject_after` times in a row receives no requests for `eject_seconds` (or for
+    as long as the service recommends, if longer).
+    """
+
+    _endpoints: list[LLMEndpoint[TIn, TOut]]
+    _retryable_errors: tuple[type[BaseException], ...]
+    _max_retries: int
+    _max_retry_wait: float
+    _eject_after: int
+    _eject_seconds: float
+    _get_sleep_time: Callable[[BaseException], float]
+
+    def __init__(
+        self,
+        endpoints: list[LLMEndpoint[TIn, TOut]],
+        retryable_errors: list[type[Exception]],
+        max_retries: int = 10,
+        max_retry_wait: float = 10.0,
+        eject_after: int = 3,
+        eject_seconds: float = 30.0,
+        get_sleep_time: Callable[[BaseException], float] | None = None,
+    ):
+        if not endpoints:
+            msg = "At least one endpoint is required"
+            raise ValueError(msg)
+        self._endpoints = endpoints
+        self._retryable_errors = tuple(retryable_errors)
+        self._max_retries = max(max_retries, 1)
+        self._max_retry_wait = max_retry_wait
+        self._eject_after = max(eject_after, 1)
+        self._eject_seconds = eject_seconds
+        self._get_sleep_time = get_sleep_time or (lambda _e: 0.0)
+
+    @property
+    def endpoints(self) -> list[LLMEndpoint[TIn, TOut]]:
+        """The endpoints requests are routed to."""
+        return self._endpoints
+
+    @property
+    def metrics(self) -> dict[str, dict[str, float]]:
+        """The metrics of each endpoint, by name."""
+        return {
+            endpoint.name: endpoint.metrics.to_dict() for endpoint in self._endpoints
+        }
+
+    def select_endpoint(
+        self, tried: list[LLMEndpoint[TIn, TOut]] | None = None
+    ) -> LLMEndpoint[TIn, TOut]:
+        """Select the endpoint with the most free capacity, among those not ejected.
+
+        Endpoints a request was already tried on are only selected if no other endpoint
+        is available, and if every endpoint is ejected, the one returning first is selected.
+        """
+        now = time.monotonic()
+        available = [
+            endpoint for endpoint in self._endpoints if endpoint.ejected_until <= now
+        ]
+        if not available:
+            return min(self._endpoints, key=lambda endpoint: endpoint.ejected_until)
+        untried = [endpoint for endpoint in available if endpoint not in (tried or [])]
+        return max(untried or available, key=lambda endpoint: endpoint.free_capacity)
+
+    async def __call__(
+        self,
+        input: TIn,
+        **kwargs: Unpack[LLMInput],
+    ) -> LLMOutput[TOut]:
+        """Execute the LLM on one of the endpoints."""
+        attempt = 0
+        tried: list[LLMEndpoint[TIn, TOut]] = []
+        while True:
+            attempt += 1
+            endpoint = self.select_endpoint(tried)
+            wait = endpoint.ejected_until - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            endpoint.in_flight += 1
+            try:
+                result = await endpoint.llm(input, **kwargs)
+            except self._retryable_errors as e:
+                self._record_failure(endpoint, e)
+                if attempt >= self._max_retries:
+                    raise
+                log.warning(
+                    "%s failed on endpoint %s (%s/%s attempts), will retry: %s",
+                    kwargs.get("name", "Process"),
+                    endpoint.name,
+                    attempt,
+                    self._max_retries,
+                    type(e).__name__,
+                )
+                tried.append(endpoint)
+                # back off once the request was tried on every endpoint
+                if len(tried) == len(self._endpoints):
+                    tried.clear()
+                    await asyncio.sleep(self._backoff(attempt))
+                continue
+            finally:
+                endpoint.in_flight -= 1
+            endpoint.consecutive_failures = 0
+            return result
+
+    def _record_failure(self, endpoint: LLMEndpoint, error: BaseException) -> None:
+        endpoint.metrics.failures += 1
+        endpoint.consecutive_failures += 1
+        if endpoint.consecutive_failures >= self._eject_after:
+            eject_seconds = max(self._eject_seconds, self._get_sleep_time(error))
+            log.warning(
+                "ejecting endpoint %s for %s seconds after %s consecutive failures",
+                endpoint.name,
+                eject_seconds,
+                endpoint.consecutive_failures,
+            )
+            endpoint.ejected_until = time.monotonic() + eject_seconds
+            endpoint.consecutive_failures = 0
+            endpoint.metrics.ejections += 1
+
+    def _backoff(self, attempt: int) -> float:
+        rounds = attempt // len(self._endpoints)
+        return random.uniform(0, min(self._max_retry_wait, 2.0 ** (rounds - 1)))  # noqa: S311
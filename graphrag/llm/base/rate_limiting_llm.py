@@ -17,7 +17,7 @@ from tenacity import (
 from typing_extensions import Unpack
 
 from graphrag.llm.errors import RetriesExhaustedError
-from graphrag.llm.limiting import LLMLimiter
+from graphrag.llm.limiting import AdaptiveConcurrencyLimiter, LLMLimiter
 from graphrag.llm.types import (
     LLM,
     LLMConfig,
@@ -43,11 +43,13 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
     _delegate: LLM[TIn, TOut]
     _rate_limiter: LLMLimiter | None
     _semaphore: asyncio.Semaphore | None
+    _concurrency_limiter: AdaptiveConcurrencyLimiter | None
     _count_tokens: Callable[[str], int]
     _config: LLMConfig
     _operation: str
     _retryable_errors: list[type[Exception]]
     _rate_limit_errors: list[type[Exception]]
+    _timeout_errors: list[type[Exception]]
     _on_invoke: LLMInvocationFn
     _extract_sleep_recommendation: Callable[[Any], float]
 
@@ -62,14 +64,18 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
         semaphore: asyncio.Semaphore | None = None,
         count_tokens: Callable[[str], int] | None = None,
         get_sleep_time: Callable[[BaseException], float] | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        timeout_errors: list[type[Exception]] | None = None,
     ):
         self._delegate = delegate
         self._rate_limiter = rate_limiter
         self._semaphore = semaphore
+        self._concurrency_limiter = concurrency_limiter
         self._config = config
         self._operation = operation
         self._retryable_errors = retryable_errors
         self._rate_limit_errors = rate_limit_errors
+        self._timeout_errors = timeout_errors or []
         self._count_tokens = count_tokens or (lambda _s: -1)
         self._extract_sleep_recommendation = get_sleep_time or (lambda _e: 0.0)
         self._on_invoke = lambda _v: None
@@ -94,6 +100,16 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
             return result
         raise TypeError(_CANNOT_MEASURE_INPUT_TOKENS_MSG)
 
+    def expected_response_tokens(
+        self, input: TIn, model_parameters: dict | None = None
+    ) -> int:
+        """Estimate the response tokens of a request, as the most the LLM may generate."""
+        if not isinstance(input, str):
+            # embedding requests do not generate tokens
+            return 0
+        max_tokens = (model_parameters or {}).get("max_tokens")
+        return max_tokens or self._config.max_tokens or 0
+
     def count_response_tokens(self, output: TOut | None) -> int:
         """Count the request tokens on an output response."""
         if output is None:
@@ -117,6 +133,13 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
         attempt_number = 0
         call_times: list[float] = []
         input_tokens = self.count_request_tokens(input)
+        # reserve the most the call may use, and settle the reservation once it is done
+        reserved_tokens = (
+            input_tokens
+            + self.expected_response_tokens(input, kwargs.get("model_parameters"))
+            if self._rate_limiter and input_tokens > 0
+            else 0
+        )
         max_retries = self._config.max_retries or 10
         max_retry_wait = self._config.max_retry_wait or 10
         follow_recommendation = self._config.sleep_on_rate_limit_recommendation
@@ -142,27 +165,48 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
 
         async def do_attempt() -> LLMOutput[TOut]:
             nonlocal call_times
+            limiter = self._concurrency_limiter
+            started = await limiter.acquire() if limiter is not None else 0.0
             call_start = asyncio.get_event_loop().time()
             try:
-                return await self._delegate(input, **kwargs)
+                result = await self._delegate(input, **kwargs)
             except BaseException as e:
+                call_times.append(asyncio.get_event_loop().time() - call_start)
+                if limiter is not None:
+                    # release the slot before sleeping on a rate limit recommendation
+                    limiter.release(
+                        started,
+                        succeeded=False,
+                        throttled=isinstance(
+                            e, (*self._rate_limit_errors, *self._timeout_errors)
+                        ),
+                    )
                 if isinstance(e, tuple(self._rate_limit_errors)):
                     sleep_time = self._extract_sleep_recommendation(e)
                     await sleep_for(sleep_time)
                 raise
-            finally:
-                call_end = asyncio.get_event_loop().time()
-                call_times.append(call_end - call_start)
+            call_times.append(asyncio.get_event_loop().time() - call_start)
+            if limiter is not None:
+                limiter.release(started, succeeded=True, throttled=False)
+            return result
 
         async def execute_with_retry() -> tuple[LLMOutput[TOut], float]:
             nonlocal attempt_number
             async for attempt in retryer:
                 with attempt:
-                    if self._rate_limiter and input_tokens > 0:
-                        await self._rate_limiter.acquire(input_tokens)
+                    if self._rate_limiter and reserved_tokens > 0:
+                        await self._rate_limiter.acquire(reserved_tokens)
                     start = asyncio.get_event_loop().time()
                     attempt_number += 1
-                    return await do_attempt(), start
+                    try:
+                        return await do_attempt(), start
+                    except BaseException:
+                        # the prompt was sent, but no response tokens were generated
+                        if self._rate_limiter and reserved_tokens > 0:
+                            await self._rate_limiter.reconcile(
+                                reserved_tokens, input_tokens
+                            )
+                        raise
 
             log.error("Retries exhausted for %s", name)
             raise RetriesExhaustedError(name, max_retries)
@@ -177,9 +221,15 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
                 result, start = await execute_with_retry()
 
         end = asyncio.get_event_loop().time()
-        output_tokens = self.count_response_tokens(result.output)
-        if self._rate_limiter and output_tokens > 0:
-            await self._rate_limiter.acquire(output_tokens)
+        usage = result.usage or {}
+        output_tokens = usage.get("completion_tokens")
+        if output_tokens is None:
+            output_tokens = self.count_response_tokens(result.output)
+        if self._rate_limiter:
+            used_tokens = usage.get("total_tokens")
+            if used_tokens is None:
+                used_tokens = max(input_tokens, 0) + output_tokens
+            await self._rate_limiter.reconcile(reserved_tokens, used_tokens)
 
         invocation_result = LLMInvocationResult(
             result=result,
@@ -3,16 +3,20 @@
 
 """LLM limiters module."""
 
+from .adaptive_concurrency_limiter import AdaptiveConcurrencyLimiter
 from .composite_limiter import CompositeLLMLimiter
 from .create_limiters import create_tpm_rpm_limiters
 from .llm_limiter import LLMLimiter
 from .noop_llm_limiter import NoopLLMLimiter
+from .token_budget import TokenBudget
 from .tpm_rpm_limiter import TpmRpmLLMLimiter
 
 __all__ = [
+    "AdaptiveConcurrencyLimiter",
     "CompositeLLMLimiter",
     "LLMLimiter",
     "NoopLLMLimiter",
+    "TokenBudget",
     "TpmRpmLLMLimiter",
     "create_tpm_rpm_limiters",
 ]
@@ -0,0 +1,125 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Adaptive (AIMD) concurrency limiter module."""
+
+import asyncio
+import math
+import time
+from collections import deque
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limit the number of requests in flight with a window that adapts to the endpoint.
+
+    The window grows additively (by one request per window of healthy requests) while
+    requests succeed with a stable latency, and shrinks multiplicatively when the
+    endpoint throttles or times out. Throttles of requests started before the last
+    decrease do not shrink the window again, so a burst of 429s halves it only once.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        latency_smoothing: float = 0.1,
+    ):
+        """Create a limiter whose window starts at `initial_limit`, bounded by `min_limit` and `max_limit`."""
+        if min_limit < 1 or max_limit < min_limit:
+            msg = f"Invalid concurrency bounds: min={min_limit}, max={max_limit}"
+            raise ValueError(msg)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._window = float(min(max(initial_limit, min_limit), max_limit))
+        self._decrease_factor = decrease_factor
+        self._latency_tolerance = latency_tolerance
+        self._latency_smoothing = latency_smoothing
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._last_decrease = -math.inf
+        self._latency: float | None = None
+        self._base_latency: float | None = None
+        self._peak_window = self._window
+        self._successes = 0
+        self._throttle_events = 0
+        self._decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """The number of requests currently allowed in flight."""
+        return max(self._min_limit, int(self._window))
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests currently in flight."""
+        return self._in_flight
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """The current window and the throttle events seen so far."""
+        return {
+            "window": self.limit,
+            "min_window": self._min_limit,
+            "max_window": self._max_limit,
+            "peak_window": int(self._peak_window),
+            "successes": self._successes,
+            "throttle_events": self._throttle_events,
+            "window_decreases": self._decreases,
+        }
+
+    async def acquire(self) -> float:
+        """Wait for a slot in the window, returning the time the request started."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return time.monotonic()
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was handed over just before the cancellation
+                self._release_slot()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+        return time.monotonic()
+
+    def release(self, started: float, *, succeeded: bool, throttled: bool) -> None:
+        """Release a slot, adapting the window to the outcome of the request."""
+        now = time.monotonic()
+        if throttled:
+            self._throttle_events += 1
+            if started >= self._last_decrease:
+                self._window = max(
+                    self._min_limit, self._window * self._decrease_factor
+                )
+                self._last_decrease = now
+                self._decreases += 1
+        elif succeeded:
+            self._successes += 1
+            if self._latency_is_healthy(now - started):
+                self._window = min(self._max_limit, self._window + 1 / self._window)
+                self._peak_window = max(self._peak_window, self._window)
+        self._release_slot()
+
+    def _latency_is_healthy(self, latency: float) -> bool:
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency += self._latency_smoothing * (latency - self._latency)
+        if self._base_latency is None or self._latency < self._base_latency:
+            self._base_latency = self._latency
+        return self._latency <= self._latency_tolerance * self._base_latency
+
+    def _release_slot(self) -> None:
+        self._in_flight -= 1
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
@@ -20,7 +20,17 @@ class CompositeLLMLimiter(LLMLimiter):
         """Whether this limiter needs the token count to be passed in."""
         return any(limiter.needs_token_count for limiter in self._limiters)
 
+    @property
+    def headroom(self) -> float:
+        """The smallest headroom of the limiters."""
+        return min((limiter.headroom for limiter in self._limiters), default=1.0)
+
     async def acquire(self, num_tokens: int = 1) -> None:
         """Call method definition."""
         for limiter in self._limiters:
             await limiter.acquire(num_tokens)
+
+    async def reconcile(self, reserved_tokens: int, used_tokens: int) -> None:
+        """Settle a reservation with each limiter."""
+        for limiter in self._limiters:
+            await limiter.reconcile(reserved_tokens, used_tokens)
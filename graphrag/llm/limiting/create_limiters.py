@@ -5,11 +5,10 @@
 
 import logging
 
-from aiolimiter import AsyncLimiter
-
 from graphrag.llm.types import LLMConfig
 
 from .llm_limiter import LLMLimiter
+from .token_budget import TokenBudget
 from .tpm_rpm_limiter import TpmRpmLLMLimiter
 
 log = logging.getLogger(__name__)
@@ -24,6 +23,6 @@ def create_tpm_rpm_limiters(
     tpm = configuration.tokens_per_minute
     rpm = configuration.requests_per_minute
     return TpmRpmLLMLimiter(
-        None if tpm == 0 else AsyncLimiter(tpm or 50_000),
-        None if rpm == 0 else AsyncLimiter(rpm or 10_000),
+        None if tpm == 0 else TokenBudget(tpm or 50_000),
+        None if rpm == 0 else TokenBudget(rpm or 10_000),
     )
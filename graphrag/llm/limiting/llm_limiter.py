@@ -14,6 +14,20 @@ class LLMLimiter(ABC):
     def needs_token_count(self) -> bool:
         """Whether this limiter needs the token count to be passed in."""
 
+    @property
+    def headroom(self) -> float:
+        """The fraction of the limiter's capacity that is currently free, 1 if it is not measured."""
+        return 1.0
+
     @abstractmethod
     async def acquire(self, num_tokens: int = 1) -> None:
         """Acquire a pass through the limiter."""
+
+    async def reconcile(self, reserved_tokens: int, used_tokens: int) -> None:
+        """Settle a reservation once the tokens a call used are known.
+
+        By default, the tokens used beyond the reservation are acquired, and unused
+        reserved tokens are not returned.
+        """
+        if used_tokens > reserved_tokens:
+            await self.acquire(used_tokens - reserved_tokens)
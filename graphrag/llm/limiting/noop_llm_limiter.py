@@ -17,3 +17,7 @@ class NoopLLMLimiter(LLMLimiter):
     async def acquire(self, num_tokens: int = 1) -> None:
         """Call method definition."""
         # do nothing
+
+    async def reconcile(self, reserved_tokens: int, used_tokens: int) -> None:
+        """Reconcile method definition."""
+        # do nothing
@@ -0,0 +1,68 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Token budget module."""
+
+import asyncio
+
+
+class TokenBudget:
+    """A leaky-bucket budget of tokens per period, which can be charged or refunded after the fact.
+
+    Like `aiolimiter.AsyncLimiter`, the bucket holds at most `capacity` tokens and drains at
+    `capacity` tokens per period. Reservations wait, in order, until they fit in the bucket.
+    Adjustments apply immediately: a charge may overfill the bucket, making the next
+    reservations wait until it has drained.
+    """
+
+    def __init__(self, capacity: int, time_period: float = 60):
+        """Create a budget of `capacity` tokens per `time_period` seconds."""
+        if capacity <= 0:
+            msg = f"Invalid token budget: {capacity}"
+            raise ValueError(msg)
+        self._capacity = capacity
+        self._rate = capacity / time_period
+        self._level = 0.0
+        self._last_leak: float | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def capacity(self) -> int:
+        """The number of tokens per period."""
+        return self._capacity
+
+    @property
+    def level(self) -> float:
+        """The number of tokens currently in the bucket."""
+        self._leak()
+        return self._level
+
+    @property
+    def headroom(self) -> float:
+        """The fraction of the bucket that is currently free."""
+        return max(0.0, 1 - self.level / self._capacity)
+
+    async def acquire(self, num_tokens: int) -> None:
+        """Wait until the tokens fit in the bucket, then add them."""
+        # a reservation larger than the bucket could never fit, so it waits for an empty bucket
+        num_tokens = min(num_tokens, self._capacity)
+        async with self._lock:
+            while True:
+                self._leak()
+                excess = self._level + num_tokens - self._capacity
+                # ignore fractions of a token, which the clock may not be able to wait for
+                if excess < 1:
+                    self._level += num_tokens
+                    return
+                await asyncio.sleep(excess / self._rate)
+
+    def adjust(self, num_tokens: float) -> None:
+        """Charge (positive) or refund (negative) tokens without waiting."""
+        self._leak()
+        self._level = max(0.0, self._level + num_tokens)
+
+    def _leak(self) -> None:
+        now = asyncio.get_running_loop().time()
+        if self._last_leak is not None:
+            self._level = max(0.0, self._level - (now - self._last_leak) * self._rate)
+        self._last_leak = now
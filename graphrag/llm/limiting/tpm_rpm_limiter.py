@@ -6,16 +6,19 @@
 from aiolimiter import AsyncLimiter
 
 from .llm_limiter import LLMLimiter
+from .token_budget import TokenBudget
 
 
 class TpmRpmLLMLimiter(LLMLimiter):
     """TPM RPM Limiter class definition."""
 
-    _tpm_limiter: AsyncLimiter | None
-    _rpm_limiter: AsyncLimiter | None
+    _tpm_limiter: TokenBudget | AsyncLimiter | None
+    _rpm_limiter: TokenBudget | AsyncLimiter | None
 
     def __init__(
-        self, tpm_limiter: AsyncLimiter | None, rpm_limiter: AsyncLimiter | None
+        self,
+        tpm_limiter: TokenBudget | AsyncLimiter | None,
+        rpm_limiter: TokenBudget | AsyncLimiter | None,
     ):
         """Init method definition."""
         self._tpm_limiter = tpm_limiter
@@ -26,9 +29,28 @@ class TpmRpmLLMLimiter(LLMLimiter):
         """Whether this limiter needs the token count to be passed in."""
         return self._tpm_limiter is not None
 
+    @property
+    def headroom(self) -> float:
+        """The smallest free fraction of the token and request budgets."""
+        return min(
+            (
+                limiter.headroom
+                for limiter in (self._tpm_limiter, self._rpm_limiter)
+                if isinstance(limiter, TokenBudget)
+            ),
+            default=1.0,
+        )
+
     async def acquire(self, num_tokens: int = 1) -> None:
         """Call method definition."""
         if self._tpm_limiter is not None:
             await self._tpm_limiter.acquire(num_tokens)
         if self._rpm_limiter is not None:
-            await self._rpm_limiter.acquire()
+            await self._rpm_limiter.acquire(1)
+
+    async def reconcile(self, reserved_tokens: int, used_tokens: int) -> None:
+        """Refund the unused reserved tokens, or charge the tokens used beyond the reservation."""
+        if isinstance(self._tpm_limiter, TokenBudget):
+            self._tpm_limiter.adjust(used_tokens - reserved_tokens)
+        elif self._tpm_limiter is not None and used_tokens > reserved_tokens:
+            await self._tpm_limiter.acquire(used_tokens - reserved_tokens)
@@ -5,6 +5,7 @@
 
 from .create_openai_client import create_openai_client
 from .factories import (
+    OpenAIEndpoint,
     create_openai_chat_llm,
     create_openai_completion_llm,
     create_openai_embedding_llm,
@@ -21,6 +22,7 @@ __all__ = [
     "OpenAICompletionLLM",
     "OpenAIConfiguration",
     "OpenAIEmbeddingsLLM",
+    "OpenAIEndpoint",
     "create_openai_chat_llm",
     "create_openai_client",
     "create_openai_completion_llm",
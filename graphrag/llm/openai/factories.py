@@ -4,9 +4,18 @@
 """Factory functions for creating OpenAI LLMs."""
 
 import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
 
-from graphrag.llm.base import CachingLLM, RateLimitingLLM
-from graphrag.llm.limiting import LLMLimiter
+from graphrag.llm.base import (
+    BaseLLM,
+    CachingLLM,
+    LLMEndpoint,
+    LLMEndpointMetrics,
+    LoadBalancingLLM,
+    RateLimitingLLM,
+)
+from graphrag.llm.limiting import AdaptiveConcurrencyLimiter, LLMLimiter
 from graphrag.llm.types import (
     LLM,
     CompletionLLM,
@@ -14,6 +23,7 @@ from graphrag.llm.types import (
     ErrorHandlerFn,
     LLMCache,
     LLMInvocationFn,
+    LLMInvocationResult,
     OnCacheActionFn,
 )
 
@@ -28,14 +38,29 @@ from .types import OpenAIClientTypes
 from .utils import (
     RATE_LIMIT_ERRORS,
     RETRYABLE_ERRORS,
+    TIMEOUT_ERRORS,
     get_completion_cache_args,
     get_sleep_time_from_error,
     get_token_counter,
 )
 
 
+@dataclass
+class OpenAIEndpoint:
+    """One of several endpoints serving a model, with its own client and limits."""
+
+    name: str
+    client: OpenAIClientTypes
+    config: OpenAIConfiguration
+    weight: float = 1.0
+    limiter: LLMLimiter | None = None
+    semaphore: asyncio.Semaphore | None = None
+    metrics: LLMEndpointMetrics | None = None
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None = None
+
+
 def create_openai_chat_llm(
-    client: OpenAIClientTypes,
+    client: OpenAIClientTypes | None,
     config: OpenAIConfiguration,
     cache: LLMCache | None = None,
     limiter: LLMLimiter | None = None,
@@ -44,13 +69,23 @@ def create_openai_chat_llm(
     on_error: ErrorHandlerFn | None = None,
     on_cache_hit: OnCacheActionFn | None = None,
     on_cache_miss: OnCacheActionFn | None = None,
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+    endpoints: list[OpenAIEndpoint] | None = None,
 ) -> CompletionLLM:
-    """Create an OpenAI chat LLM."""
+    """Create an OpenAI chat LLM, balancing its requests between the endpoints if any are given."""
     operation = "chat"
-    result = OpenAIChatLLM(client, config)
-    result.on_error(on_error)
-    if limiter is not None or semaphore is not None:
-        result = _rate_limited(result, config, operation, limiter, semaphore, on_invoke)
+    result = _create_llm(
+        OpenAIChatLLM,
+        client,
+        config,
+        operation,
+        limiter,
+        semaphore,
+        on_invoke,
+        on_error,
+        concurrency_limiter,
+        endpoints,
+    )
     if cache is not None:
         result = _cached(result, config, operation, cache, on_cache_hit, on_cache_miss)
     result = OpenAIHistoryTrackingLLM(result)
@@ -59,7 +94,7 @@ def create_openai_chat_llm(
 
 
 def create_openai_completion_llm(
-    client: OpenAIClientTypes,
+    client: OpenAIClientTypes | None,
     config: OpenAIConfiguration,
     cache: LLMCache | None = None,
     limiter: LLMLimiter | None = None,
@@ -68,20 +103,30 @@ def create_openai_completion_llm(
     on_error: ErrorHandlerFn | None = None,
     on_cache_hit: OnCacheActionFn | None = None,
     on_cache_miss: OnCacheActionFn | None = None,
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+    endpoints: list[OpenAIEndpoint] | None = None,
 ) -> CompletionLLM:
-    """Create an OpenAI completion LLM."""
+    """Create an OpenAI completion LLM, balancing its requests between the endpoints if any are given."""
     operation = "completion"
-    result = OpenAICompletionLLM(client, config)
-    result.on_error(on_error)
-    if limiter is not None or semaphore is not None:
-        result = _rate_limited(result, config, operation, limiter, semaphore, on_invoke)
+    result = _create_llm(
+        OpenAICompletionLLM,
+        client,
+        config,
+        operation,
+        limiter,
+        semaphore,
+        on_invoke,
+        on_error,
+        concurrency_limiter,
+        endpoints,
+    )
     if cache is not None:
         result = _cached(result, config, operation, cache, on_cache_hit, on_cache_miss)
     return OpenAITokenReplacingLLM(result)
 
 
 def create_openai_embedding_llm(
-    client: OpenAIClientTypes,
+    client: OpenAIClientTypes | None,
     config: OpenAIConfiguration,
     cache: LLMCache | None = None,
     limiter: LLMLimiter | None = None,
@@ -90,18 +135,111 @@ def create_openai_embedding_llm(
     on_error: ErrorHandlerFn | None = None,
     on_cache_hit: OnCacheActionFn | None = None,
     on_cache_miss: OnCacheActionFn | None = None,
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+    endpoints: list[OpenAIEndpoint] | None = None,
 ) -> EmbeddingLLM:
-    """Create an OpenAI embeddings LLM."""
+    """Create an OpenAI embeddings LLM, balancing its requests between the endpoints if any are given."""
     operation = "embedding"
-    result = OpenAIEmbeddingsLLM(client, config)
-    result.on_error(on_error)
-    if limiter is not None or semaphore is not None:
-        result = _rate_limited(result, config, operation, limiter, semaphore, on_invoke)
+    result = _create_llm(
+        OpenAIEmbeddingsLLM,
+        client,
+        config,
+        operation,
+        limiter,
+        semaphore,
+        on_invoke,
+        on_error,
+        concurrency_limiter,
+        endpoints,
+    )
     if cache is not None:
         result = _cached(result, config, operation, cache, on_cache_hit, on_cache_miss)
     return result
 
 
+def _create_llm(
+    llm_type: Callable[[OpenAIClientTypes, OpenAIConfiguration], BaseLLM],
+    client: OpenAIClientTypes | None,
+    config: OpenAIConfiguration,
+    operation: str,
+    limiter: LLMLimiter | None,
+    semaphore: asyncio.Semaphore | None,
+    on_invoke: LLMInvocationFn | None,
+    on_error: ErrorHandlerFn | None,
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None,
+    endpoints: list[OpenAIEndpoint] | None,
+) -> LLM:
+    if endpoints:
+        return _load_balanced(
+            llm_type, config, operation, on_invoke, on_error, endpoints
+        )
+    if client is None:
+        msg = "An OpenAI client is required when no endpoints are given"
+        raise ValueError(msg)
+    result: LLM = llm_type(client, config)
+    result.on_error(on_error)
+    if limiter is not None or semaphore is not None or concurrency_limiter is not None:
+        result = _rate_limited(
+            result,
+            config,
+            operation,
+            limiter,
+            semaphore,
+            on_invoke,
+            concurrency_limiter,
+        )
+    return result
+
+
+def _load_balanced(
+    llm_type: Callable[[OpenAIClientTypes, OpenAIConfiguration], BaseLLM],
+    config: OpenAIConfiguration,
+    operation: str,
+    on_invoke: LLMInvocationFn | None,
+    on_error: ErrorHandlerFn | None,
+    endpoints: list[OpenAIEndpoint],
+) -> LoadBalancingLLM:
+    balanced_endpoints = []
+    for endpoint in endpoints:
+        delegate = llm_type(endpoint.client, endpoint.config)
+        delegate.on_error(on_error)
+        # each endpoint makes a single attempt, the balancer retries on another endpoint
+        llm = _rate_limited(
+            delegate,
+            endpoint.config,
+            operation,
+            endpoint.limiter,
+            endpoint.semaphore,
+            None,
+            endpoint.concurrency_limiter,
+        )
+        balanced_endpoint = LLMEndpoint(
+            endpoint.name, llm, endpoint.weight, endpoint.limiter, endpoint.metrics
+        )
+        llm.on_invoke(_record_invocation(balanced_endpoint, on_invoke))
+        balanced_endpoints.append(balanced_endpoint)
+    return LoadBalancingLLM(
+        balanced_endpoints,
+        RETRYABLE_ERRORS,
+        max_retries=config.max_retries or 10,
+        max_retry_wait=config.max_retry_wait or 10,
+        eject_after=config.endpoint_eject_after or 3,
+        eject_seconds=config.endpoint_eject_seconds or 30.0,
+        get_sleep_time=get_sleep_time_from_error,
+    )
+
+
+def _record_invocation(
+    endpoint: LLMEndpoint, on_invoke: LLMInvocationFn | None
+) -> LLMInvocationFn:
+    def record(result: LLMInvocationResult) -> None:
+        endpoint.on_invoke(result)
+        if on_invoke is not None:
+            on_invoke(result)
+
+    return record
+
+
 def _rate_limited(
     delegate: LLM,
     config: OpenAIConfiguration,
@@ -109,6 +247,7 @@ def _rate_limited(
     limiter: LLMLimiter | None,
     semaphore: asyncio.Semaphore | None,
     on_invoke: LLMInvocationFn | None,
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None,
 ):
     result = RateLimitingLLM(
         delegate,
@@ -120,6 +259,8 @@ def _rate_limited(
         semaphore,
         get_token_counter(config),
         get_sleep_time_from_error,
+        concurrency_limiter,
+        TIMEOUT_ERRORS,
     )
     result.on_invoke(on_invoke)
     return result
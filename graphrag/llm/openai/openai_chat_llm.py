@@ -19,7 +19,9 @@ from ._prompts import JSON_CHECK_PROMPT
 from .openai_configuration import OpenAIConfiguration
 from .types import OpenAIClientTypes
 from .utils import (
+    add_usage,
     get_completion_llm_args,
+    get_usage,
     try_parse_json_object,
 )
 
@@ -42,6 +44,12 @@ class OpenAIChatLLM(BaseLLM[CompletionInput, CompletionOutput]):
     async def _execute_llm(
         self, input: CompletionInput, **kwargs: Unpack[LLMInput]
     ) -> CompletionOutput | None:
+        output, _usage = await self._execute_llm_with_usage(input, **kwargs)
+        return output
+
+    async def _execute_llm_with_usage(
+        self, input: CompletionInput, **kwargs: Unpack[LLMInput]
+    ) -> tuple[CompletionOutput | None, dict[str, int] | None]:
         args = get_completion_llm_args(
             kwargs.get("model_parameters"), self.configuration
         )
@@ -53,7 +61,7 @@ class OpenAIChatLLM(BaseLLM[CompletionInput, CompletionOutput]):
         completion = await self.client.chat.completions.create(
             messages=messages, **args
         )
-        return completion.choices[0].message.content
+        return completion.choices[0].message.content, get_usage(completion)
 
     async def _invoke_json(
         self,
@@ -110,6 +118,7 @@ class OpenAIChatLLM(BaseLLM[CompletionInput, CompletionOutput]):
             output=output,
             json=json_output,
             history=result.history,
+            usage=result.usage,
         )
 
     async def _manual_json(
@@ -121,12 +130,16 @@ class OpenAIChatLLM(BaseLLM[CompletionInput, CompletionOutput]):
         output, json_output = try_parse_json_object(result.output or "")
         if json_output:
             return LLMOutput[CompletionOutput](
-                output=result.output, json=json_output, history=history
+                output=result.output,
+                json=json_output,
+                history=history,
+                usage=result.usage,
             )
         # if not return correct formatted json, retry
         log.warning("error parsing llm json, retrying")
 
         # If cleaned up json is unparsable, use the LLM to reformat it (may throw)
+        usage = result.usage
         result = await self._try_clean_json_with_llm(output, **kwargs)
         output, json_output = try_parse_json_object(result.output or "")
 
@@ -134,6 +147,7 @@ class OpenAIChatLLM(BaseLLM[CompletionInput, CompletionOutput]):
             output=output,
             json=json_output,
             history=history,
+            usage=add_usage(usage, result.usage),
         )
 
     async def _try_clean_json_with_llm(
@@ -16,7 +16,7 @@ from graphrag.llm.types import (
 
 from .openai_configuration import OpenAIConfiguration
 from .types import OpenAIClientTypes
-from .utils import get_completion_llm_args
+from .utils import get_completion_llm_args, get_usage
 
 log = logging.getLogger(__name__)
 
@@ -36,8 +36,16 @@ class OpenAICompletionLLM(BaseLLM[CompletionInput, CompletionOutput]):
         input: CompletionInput,
         **kwargs: Unpack[LLMInput],
     ) -> CompletionOutput | None:
+        output, _usage = await self._execute_llm_with_usage(input, **kwargs)
+        return output
+
+    async def _execute_llm_with_usage(
+        self,
+        input: CompletionInput,
+        **kwargs: Unpack[LLMInput],
+    ) -> tuple[CompletionOutput | None, dict[str, int] | None]:
         args = get_completion_llm_args(
             kwargs.get("model_parameters"), self.configuration
         )
         completion = await self.client.completions.create(prompt=input, **args)
-        return completion.choices[0].text
+        return completion.choices[0].text, get_usage(completion)
@@ -57,6 +57,11 @@ class OpenAIConfiguration(Hashable, LLMConfig):
     _tokens_per_minute: int | None
     _requests_per_minute: int | None
     _concurrent_requests: int | None
+    _adaptive_concurrency: bool | None
+    _min_concurrent_requests: int | None
+    _max_concurrent_requests: int | None
+    _endpoint_eject_after: int | None
+    _endpoint_eject_seconds: float | None
     _encoding_model: str | None
     _sleep_on_rate_limit_recommendation: bool | None
 
@@ -121,6 +126,11 @@ class OpenAIConfiguration(Hashable, LLMConfig):
         self._tokens_per_minute = lookup_int("tokens_per_minute")
         self._requests_per_minute = lookup_int("requests_per_minute")
         self._concurrent_requests = lookup_int("concurrent_requests")
+        self._adaptive_concurrency = lookup_bool("adaptive_concurrency")
+        self._min_concurrent_requests = lookup_int("min_concurrent_requests")
+        self._max_concurrent_requests = lookup_int("max_concurrent_requests")
+        self._endpoint_eject_after = lookup_int("endpoint_eject_after")
+        self._endpoint_eject_seconds = lookup_float("endpoint_eject_seconds")
         self._encoding_model = lookup_str("encoding_model")
         self._max_retry_wait = lookup_float("max_retry_wait")
         self._sleep_on_rate_limit_recommendation = lookup_bool(
@@ -250,6 +260,31 @@ class OpenAIConfiguration(Hashable, LLMConfig):
         """Concurrent requests property definition."""
         return self._concurrent_requests
 
+    @property
+    def adaptive_concurrency(self) -> bool | None:
+        """Adaptive concurrency property definition."""
+        return self._adaptive_concurrency
+
+    @property
+    def min_concurrent_requests(self) -> int | None:
+        """Minimum concurrent requests property definition."""
+        return self._min_concurrent_requests
+
+    @property
+    def max_concurrent_requests(self) -> int | None:
+        """Maximum concurrent requests property definition."""
+        return self._max_concurrent_requests
+
+    @property
+    def endpoint_eject_after(self) -> int | None:
+        """Consecutive failures after which an endpoint is ejected property definition."""
+        return self._endpoint_eject_after
+
+    @property
+    def endpoint_eject_seconds(self) -> float | None:
+        """Endpoint ejection duration property definition."""
+        return self._endpoint_eject_seconds
+
     @property
     def encoding_model(self) -> str | None:
         """Encoding model property definition."""
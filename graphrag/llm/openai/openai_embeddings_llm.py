@@ -14,6 +14,7 @@ from graphrag.llm.types import (
 
 from .openai_configuration import OpenAIConfiguration
 from .types import OpenAIClientTypes
+from .utils import get_usage
 
 
 class OpenAIEmbeddingsLLM(BaseLLM[EmbeddingInput, EmbeddingOutput]):
@@ -29,6 +30,12 @@ class OpenAIEmbeddingsLLM(BaseLLM[EmbeddingInput, EmbeddingOutput]):
     async def _execute_llm(
         self, input: EmbeddingInput, **kwargs: Unpack[LLMInput]
     ) -> EmbeddingOutput | None:
+        output, _usage = await self._execute_llm_with_usage(input, **kwargs)
+        return output
+
+    async def _execute_llm_with_usage(
+        self, input: EmbeddingInput, **kwargs: Unpack[LLMInput]
+    ) -> tuple[EmbeddingOutput | None, dict[str, int] | None]:
         args = {
             "model": self.configuration.model,
             **(kwargs.get("model_parameters") or {}),
@@ -37,4 +44,4 @@ class OpenAIEmbeddingsLLM(BaseLLM[EmbeddingInput, EmbeddingOutput]):
             input=input,
             **args,
         )
-        return [d.embedding for d in embedding.data]
+        return [d.embedding for d in embedding.data], get_usage(embedding)
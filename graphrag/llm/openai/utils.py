@@ -13,6 +13,7 @@ import tiktoken
 from json_repair import repair_json
 from openai import (
     APIConnectionError,
+    APITimeoutError,
     InternalServerError,
     RateLimitError,
 )
@@ -29,6 +30,7 @@ RETRYABLE_ERRORS: list[type[Exception]] = [
     InternalServerError,
 ]
 RATE_LIMIT_ERRORS: list[type[Exception]] = [RateLimitError]
+TIMEOUT_ERRORS: list[type[Exception]] = [APITimeoutError]
 
 log = logging.getLogger(__name__)
 
@@ -89,6 +91,27 @@ def get_completion_llm_args(
     }
 
 
+def get_usage(response: Any) -> dict[str, int] | None:
+    """Get the token usage reported in an API response, if any."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return None
+    return {
+        key: value
+        for key in ("prompt_tokens", "completion_tokens", "total_tokens")
+        if isinstance(value := getattr(usage, key, None), int)
+    }
+
+
+def add_usage(
+    first: dict[str, int] | None, second: dict[str, int] | None
+) -> dict[str, int] | None:
+    """Add up the token usage of two API responses."""
+    if first is None or second is None:
+        return first or second
+    return {key: first.get(key, 0) + second.get(key, 0) for key in {*first, *second}}
+
+
 def try_parse_json_object(input: str) -> tuple[str, dict]:
     """JSON cleaning and formatting utilities."""
     # Sometimes, the LLM returns a json string with some extra description, this function will clean it up.
@@ -48,3 +48,6 @@ class LLMOutput(Generic[T]):
 
     history: list[dict] | None = field(default=None)
     """The history of the LLM invocation, if available (e.g. chat mode)"""
+
+    usage: dict[str, int] | None = field(default=None)
+    """The token usage reported by the LLM service (e.g. prompt_tokens, completion_tokens, total_tokens), if available."""
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from .named import Named
+from .types import Embedding
 
 
 @dataclass
@@ -25,10 +26,10 @@ class CommunityReport(Named):
     rank: float | None = 1.0
     """Rank of the report, used for sorting (optional). Higher means more important"""
 
-    summary_embedding: list[float] | None = None
+    summary_embedding: Embedding | None = None
     """The semantic (i.e. text) embedding of the report summary (optional)."""
 
-    full_content_embedding: list[float] | None = None
+    full_content_embedding: Embedding | None = None
     """The semantic (i.e. text) embedding of the full report content (optional)."""
 
     attributes: dict[str, Any] | None = None
@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from .named import Named
+from .types import Embedding
 
 
 @dataclass
@@ -25,10 +26,10 @@ class Document(Named):
     summary: str | None = None
     """Summary of the document (optional)."""
 
-    summary_embedding: list[float] | None = None
+    summary_embedding: Embedding | None = None
     """The semantic embedding for the document summary (optional)."""
 
-    raw_content_embedding: list[float] | None = None
+    raw_content_embedding: Embedding | None = None
     """The semantic embedding for the document raw content (optional)."""
 
     attributes: dict[str, Any] | None = None
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from .named import Named
+from .types import Embedding
 
 
 @dataclass
@@ -19,13 +20,13 @@ class Entity(Named):
     description: str | None = None
     """Description of the entity (optional)."""
 
-    description_embedding: list[float] | None = None
+    description_embedding: Embedding | None = None
     """The semantic (i.e. text) embedding of the entity (optional)."""
 
-    name_embedding: list[float] | None = None
+    name_embedding: Embedding | None = None
     """The semantic (i.e. text) embedding of the entity (optional)."""
 
-    graph_embedding: list[float] | None = None
+    graph_embedding: Embedding | None = None
     """The graph embedding of the entity, likely from node2vec (optional)."""
 
     community_ids: list[str] | None = None
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from .identified import Identified
+from .types import Embedding
 
 
 @dataclass
@@ -25,7 +26,7 @@ class Relationship(Identified):
     description: str | None = None
     """A description of the relationship (optional)."""
 
-    description_embedding: list[float] | None = None
+    description_embedding: Embedding | None = None
     """The semantic embedding for the relationship description (optional)."""
 
     text_unit_ids: list[str] | None = None
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from .identified import Identified
+from .types import Embedding
 
 
 @dataclass
@@ -16,7 +17,7 @@ class TextUnit(Identified):
     text: str
     """The text of the unit."""
 
-    text_embedding: list[float] | None = None
+    text_embedding: Embedding | None = None
     """The text embedding for the text unit (optional)."""
 
     entity_ids: list[str] | None = None
@@ -5,4 +5,10 @@
 
 from collections.abc import Callable
 
+import numpy as np
+
 TextEmbedder = Callable[[str], list[float]]
+TextBatchEmbedder = Callable[[list[str]], list[list[float]]]
+
+Embedding = list[float] | np.ndarray
+"""An embedding vector: a list of floats, or a read-only numpy view when the model was loaded lazily."""
@@ -5,6 +5,7 @@
 
 import logging
 import random
+from collections.abc import Sequence
 from typing import Any, cast
 
 import pandas as pd
@@ -21,8 +22,8 @@ NO_COMMUNITY_RECORDS_WARNING: str = (
 
 
 def build_community_context(
-    community_reports: list[CommunityReport],
-    entities: list[Entity] | None = None,
+    community_reports: Sequence[CommunityReport],
+    entities: Sequence[Entity] | None = None,
     token_encoder: tiktoken.Encoding | None = None,
     use_community_summary: bool = True,
     column_delimiter: str = "|",
@@ -185,11 +186,11 @@ def build_community_context(
 
 
 def _compute_community_weights(
-    community_reports: list[CommunityReport],
-    entities: list[Entity] | None,
+    community_reports: Sequence[CommunityReport],
+    entities: Sequence[Entity] | None,
     weight_attribute: str = "occurrence",
     normalize: bool = True,
-) -> list[CommunityReport]:
+) -> Sequence[CommunityReport]:
     """Calculate a community's weight as count of text units associated with entities within the community."""
     if not entities:
         return community_reports
@@ -4,6 +4,7 @@
 """Orchestration Context Builders."""
 
 from enum import Enum
+from itertools import islice
 
 from graphrag.model import Entity, Relationship
 from graphrag.query.input.retrieval.entities import (
@@ -11,8 +12,9 @@ from graphrag.query.input.retrieval.entities import (
     get_entity_by_key,
     get_entity_by_name,
 )
+from graphrag.query.input.retrieval.graph_index import GraphIndex
 from graphrag.query.llm.base import BaseTextEmbedding
-from graphrag.vector_stores import BaseVectorStore
+from graphrag.vector_stores import BaseVectorStore, VectorStoreSearchResult
 
 
 class EntityVectorStoreKey(str, Enum):
@@ -43,8 +45,15 @@ def map_query_to_entities(
     exclude_entity_names: list[str] | None = None,
     k: int = 10,
     oversample_scaler: int = 2,
+    graph_index: GraphIndex | None = None,
+    search_results: list[VectorStoreSearchResult] | None = None,
 ) -> list[Entity]:
-    """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions."""
+    """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions.
+
+    If a `graph_index` built over the entities is given, matches are looked up in it
+    instead of scanning all entities. If the `search_results` of the query were already
+    fetched, e.g. by a batched search, the vector store is not searched again.
+    """
     if include_entity_names is None:
         include_entity_names = []
     if exclude_entity_names is None:
@@ -54,16 +63,21 @@ def map_query_to_entities(
     if query != "":
         # get entities with highest semantic similarity to query
         # oversample to account for excluded entities
-        search_results = text_embedding_vectorstore.similarity_search_by_text(
-            text=query,
-            text_embedder=lambda t: text_embedder.embed(t),
-            k=k * oversample_scaler,
-        )
+        if search_results is None:
+            search_results = text_embedding_vectorstore.similarity_search_by_text(
+                text=query,
+                text_embedder=lambda t: text_embedder.embed(t),
+                k=k * oversample_scaler,
+            )
         for result in search_results:
             if embedding_vectorstore_key == EntityVectorStoreKey.ID and isinstance(
                 result.document.id, str
             ):
                 matched = get_entity_by_id(all_entities_dict, result.document.id)
+            elif graph_index is not None:
+                matched = graph_index.get_entity_by_key(
+                    key=embedding_vectorstore_key, value=result.document.id
+                )
             else:
                 matched = get_entity_by_key(
                     entities=all_entities,
@@ -78,16 +92,18 @@ def map_query_to_entities(
 
     # filter out excluded entities
     if exclude_entity_names:
+        excluded_names = set(exclude_entity_names)
         matched_entities = [
-            entity
-            for entity in matched_entities
-            if entity.title not in exclude_entity_names
+            entity for entity in matched_entities if entity.title not in excluded_names
         ]
 
     # add entities in the include_entity list
     included_entities = []
     for entity_name in include_entity_names:
-        included_entities.extend(get_entity_by_name(all_entities, entity_name))
+        if graph_index is not None:
+            included_entities.extend(graph_index.get_entities_by_titles([entity_name]))
+        else:
+            included_entities.extend(get_entity_by_name(all_entities, entity_name))
     return included_entities + matched_entities
 
 
@@ -99,28 +115,33 @@ def find_nearest_neighbors_by_graph_embeddings(
     embedding_vectorstore_key: str = EntityVectorStoreKey.ID,
     k: int = 10,
     oversample_scaler: int = 2,
+    graph_index: GraphIndex | None = None,
 ) -> list[Entity]:
     """Retrieve related entities by graph embeddings."""
     if exclude_entity_names is None:
         exclude_entity_names = []
+
+    def lookup(value: str | int) -> Entity | None:
+        if graph_index is not None:
+            return graph_index.get_entity_by_key(
+                key=embedding_vectorstore_key, value=value
+            )
+        return get_entity_by_key(
+            entities=all_entities, key=embedding_vectorstore_key, value=value
+        )
+
     # find nearest neighbors of this entity using graph embedding
-    query_entity = get_entity_by_key(
-        entities=all_entities, key=embedding_vectorstore_key, value=entity_id
-    )
+    query_entity = lookup(entity_id)
     query_embedding = query_entity.graph_embedding if query_entity else None
 
     # oversample to account for excluded entities
-    if query_embedding:
+    if query_embedding is not None and len(query_embedding) > 0:
         matched_entities = []
         search_results = graph_embedding_vectorstore.similarity_search_by_vector(
             query_embedding=query_embedding, k=k * oversample_scaler
         )
         for result in search_results:
-            matched = get_entity_by_key(
-                entities=all_entities,
-                key=embedding_vectorstore_key,
-                value=result.document.id,
-            )
+            matched = lookup(result.document.id)
             if matched:
                 matched_entities.append(matched)
 
@@ -143,10 +164,22 @@ def find_nearest_neighbors_by_entity_rank(
     all_relationships: list[Relationship],
     exclude_entity_names: list[str] | None = None,
     k: int | None = 10,
+    graph_index: GraphIndex | None = None,
 ) -> list[Entity]:
-    """Retrieve entities that have direct connections with the target entity, sorted by entity rank."""
-    if exclude_entity_names is None:
-        exclude_entity_names = []
+    """Retrieve entities that have direct connections with the target entity, sorted by entity rank.
+
+    If a `graph_index` built over the entities and relationships is given, its
+    rank-sorted neighbour lists are used instead of scanning both collections.
+    """
+    excluded_names = set(exclude_entity_names or [])
+    if graph_index is not None:
+        neighbors = (
+            entity
+            for entity in graph_index.get_neighbors(entity_name)
+            if entity.title not in excluded_names
+        )
+        return list(islice(neighbors, k)) if k else list(neighbors)
+
     entity_relationships = [
         rel
         for rel in all_relationships
@@ -155,7 +188,7 @@ def find_nearest_neighbors_by_entity_rank(
     source_entity_names = {rel.source for rel in entity_relationships}
     target_entity_names = {rel.target for rel in entity_relationships}
     related_entity_names = (source_entity_names.union(target_entity_names)).difference(
-        set(exclude_entity_names)
+        excluded_names
     )
     top_relations = [
         entity for entity in all_entities if entity.title in related_entity_names
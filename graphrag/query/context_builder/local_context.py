@@ -4,6 +4,7 @@
 """Local Context Builder."""
 
 from collections import defaultdict
+from collections.abc import Sequence
 from typing import Any, cast
 
 import pandas as pd
@@ -15,6 +16,7 @@ from graphrag.query.input.retrieval.covariates import (
     to_covariate_dataframe,
 )
 from graphrag.query.input.retrieval.entities import to_entity_dataframe
+from graphrag.query.input.retrieval.graph_index import GraphIndex
 from graphrag.query.input.retrieval.relationships import (
     get_candidate_relationships,
     get_entities_from_relationships,
@@ -88,7 +90,7 @@ def build_entity_context(
 
 def build_covariates_context(
     selected_entities: list[Entity],
-    covariates: list[Covariate],
+    covariates: Sequence[Covariate],
     token_encoder: tiktoken.Encoding | None = None,
     max_tokens: int = 8000,
     column_delimiter: str = "|",
@@ -152,7 +154,7 @@ def build_covariates_context(
 
 def build_relationship_context(
     selected_entities: list[Entity],
-    relationships: list[Relationship],
+    relationships: Sequence[Relationship],
     token_encoder: tiktoken.Encoding | None = None,
     include_relationship_weight: bool = False,
     max_tokens: int = 8000,
@@ -160,6 +162,7 @@ def build_relationship_context(
     relationship_ranking_attribute: str = "rank",
     column_delimiter: str = "|",
     context_name: str = "Relationships",
+    graph_index: GraphIndex | None = None,
 ) -> tuple[str, pd.DataFrame]:
     """Prepare relationship data tables as context data for system prompt."""
     selected_relationships = _filter_relationships(
@@ -167,6 +170,7 @@ def build_relationship_context(
         relationships=relationships,
         top_k_relationships=top_k_relationships,
         relationship_ranking_attribute=relationship_ranking_attribute,
+        graph_index=graph_index,
     )
 
     if len(selected_entities) == 0 or len(selected_relationships) == 0:
@@ -225,9 +229,10 @@ def build_relationship_context(
 
 def _filter_relationships(
     selected_entities: list[Entity],
-    relationships: list[Relationship],
+    relationships: Sequence[Relationship],
     top_k_relationships: int = 10,
     relationship_ranking_attribute: str = "rank",
+    graph_index: GraphIndex | None = None,
 ) -> list[Relationship]:
     """Filter and sort relationships based on a set of selected entities and a ranking attribute."""
     # First priority: in-network relationships (i.e. relationships between selected entities)
@@ -235,6 +240,7 @@ def _filter_relationships(
         selected_entities=selected_entities,
         relationships=relationships,
         ranking_attribute=relationship_ranking_attribute,
+        graph_index=graph_index,
     )
 
     # Second priority -  out-of-network relationships
@@ -243,39 +249,24 @@ def _filter_relationships(
         selected_entities=selected_entities,
         relationships=relationships,
         ranking_attribute=relationship_ranking_attribute,
+        graph_index=graph_index,
     )
     if len(out_network_relationships) <= 1:
         return in_network_relationships + out_network_relationships
 
     # within out-of-network relationships, prioritize mutual relationships
     # (i.e. relationships with out-network entities that are shared with multiple selected entities)
-    selected_entity_names = [entity.title for entity in selected_entities]
-    out_network_source_names = [
-        relationship.source
-        for relationship in out_network_relationships
-        if relationship.source not in selected_entity_names
-    ]
-    out_network_target_names = [
-        relationship.target
-        for relationship in out_network_relationships
-        if relationship.target not in selected_entity_names
-    ]
-    out_network_entity_names = list(
-        set(out_network_source_names + out_network_target_names)
-    )
-    out_network_entity_links = defaultdict(int)
-    for entity_name in out_network_entity_names:
-        targets = [
-            relationship.target
-            for relationship in out_network_relationships
-            if relationship.source == entity_name
-        ]
-        sources = [
-            relationship.source
-            for relationship in out_network_relationships
-            if relationship.target == entity_name
-        ]
-        out_network_entity_links[entity_name] = len(set(targets + sources))
+    selected_entity_names = {entity.title for entity in selected_entities}
+    out_network_entity_neighbors = defaultdict(set)
+    for relationship in out_network_relationships:
+        if relationship.source not in selected_entity_names:
+            out_network_entity_neighbors[relationship.source].add(relationship.target)
+        if relationship.target not in selected_entity_names:
+            out_network_entity_neighbors[relationship.target].add(relationship.source)
+    out_network_entity_links = {
+        entity_name: len(neighbors)
+        for entity_name, neighbors in out_network_entity_neighbors.items()
+    }
 
     # sort out-network relationships by number of links and rank_attributes
     for rel in out_network_relationships:
@@ -308,25 +299,29 @@ def _filter_relationships(
 
 def get_candidate_context(
     selected_entities: list[Entity],
-    entities: list[Entity],
-    relationships: list[Relationship],
-    covariates: dict[str, list[Covariate]],
+    entities: Sequence[Entity],
+    relationships: Sequence[Relationship],
+    covariates: dict[str, Sequence[Covariate]],
     include_entity_rank: bool = True,
     entity_rank_description: str = "number of relationships",
     include_relationship_weight: bool = False,
+    graph_index: GraphIndex | None = None,
 ) -> dict[str, pd.DataFrame]:
     """Prepare entity, relationship, and covariate data tables as context data for system prompt."""
     candidate_context = {}
     candidate_relationships = get_candidate_relationships(
         selected_entities=selected_entities,
         relationships=relationships,
+        graph_index=graph_index,
     )
     candidate_context["relationships"] = to_relationship_dataframe(
         relationships=candidate_relationships,
         include_relationship_weight=include_relationship_weight,
     )
     candidate_entities = get_entities_from_relationships(
-        relationships=candidate_relationships, entities=entities
+        relationships=candidate_relationships,
+        entities=entities,
+        graph_index=graph_index,
     )
     candidate_context["entities"] = to_entity_dataframe(
         entities=candidate_entities,
@@ -3,6 +3,8 @@
 
 """Query Factory methods to support CLI."""
 
+from collections.abc import Sequence
+
 import tiktoken
 from azure.identity import DefaultAzureCredential, get_bearer_token_provider
 
@@ -94,16 +96,17 @@ def get_text_embedder(config: GraphRagConfig) -> OpenAIEmbedding:
         deployment_name=config.embeddings.llm.deployment_name,
         api_version=config.embeddings.llm.api_version,
         max_retries=config.embeddings.llm.max_retries,
+        max_batch_size=config.embeddings.batch_size,
     )
 
 
 def get_local_search_engine(
     config: GraphRagConfig,
-    reports: list[CommunityReport],
-    text_units: list[TextUnit],
-    entities: list[Entity],
-    relationships: list[Relationship],
-    covariates: dict[str, list[Covariate]],
+    reports: Sequence[CommunityReport],
+    text_units: Sequence[TextUnit],
+    entities: Sequence[Entity],
+    relationships: Sequence[Relationship],
+    covariates: dict[str, Sequence[Covariate]],
     response_type: str,
     description_embedding_store: BaseVectorStore,
 ) -> LocalSearch:
@@ -154,8 +157,8 @@ def get_local_search_engine(
 
 def get_global_search_engine(
     config: GraphRagConfig,
-    reports: list[CommunityReport],
-    entities: list[Entity],
+    reports: Sequence[CommunityReport],
+    entities: Sequence[Entity],
     response_type: str,
 ) -> GlobalSearch:
     """Create a global search engine based on data + configuration."""
@@ -4,8 +4,12 @@
 
 The parts of these functions that do type adaptation, renaming, collating, etc. should eventually go away.
 Ideally this is just a straight read-thorugh into the object model.
+
+The adapters load lazily: data objects are assembled on first access and
+embeddings are kept as read-only numpy views into one float32 matrix per column.
 """
 
+from collections.abc import Sequence
 from typing import cast
 
 import pandas as pd
@@ -20,17 +24,18 @@ from graphrag.query.input.loaders.dfs import (
 )
 
 
-def read_indexer_text_units(final_text_units: pd.DataFrame) -> list[TextUnit]:
+def read_indexer_text_units(final_text_units: pd.DataFrame) -> Sequence[TextUnit]:
     """Read in the Text Units from the raw indexing outputs."""
     return read_text_units(
         df=final_text_units,
         short_id_col=None,
         # expects a covariate map of type -> ids
         covariates_col=None,
+        lazy=True,
     )
 
 
-def read_indexer_covariates(final_covariates: pd.DataFrame) -> list[Covariate]:
+def read_indexer_covariates(final_covariates: pd.DataFrame) -> Sequence[Covariate]:
     """Read in the Claims from the raw indexing outputs."""
     covariate_df = final_covariates
     covariate_df["id"] = covariate_df["id"].astype(str)
@@ -45,10 +50,13 @@ def read_indexer_covariates(final_covariates: pd.DataFrame) -> list[Covariate]:
             "description",
         ],
         text_unit_ids_col=None,
+        lazy=True,
     )
 
 
-def read_indexer_relationships(final_relationships: pd.DataFrame) -> list[Relationship]:
+def read_indexer_relationships(
+    final_relationships: pd.DataFrame,
+) -> Sequence[Relationship]:
     """Read in the Relationships from the raw indexing outputs."""
     return read_relationships(
         df=final_relationships,
@@ -56,6 +64,7 @@ def read_indexer_relationships(final_relationships: pd.DataFrame) -> list[Relati
         description_embedding_col=None,
         document_ids_col=None,
         attributes_cols=["rank"],
+        lazy=True,
     )
 
 
@@ -64,7 +73,7 @@ def read_indexer_reports(
     final_nodes: pd.DataFrame,
     community_level: int,
     content_embedding_col: str | None = None,
-) -> list[CommunityReport]:
+) -> Sequence[CommunityReport]:
     """Read in the Community Reports from the raw indexing outputs."""
     report_df = final_community_reports
     entity_df = final_nodes
@@ -85,6 +94,7 @@ def read_indexer_reports(
         short_id_col="community",
         summary_embedding_col=None,
         content_embedding_col=content_embedding_col,
+        lazy=True,
     )
 
 
@@ -92,7 +102,7 @@ def read_indexer_entities(
     final_nodes: pd.DataFrame,
     final_entities: pd.DataFrame,
     community_level: int,
-) -> list[Entity]:
+) -> Sequence[Entity]:
     """Read in the Entities from the raw indexing outputs."""
     entity_df = final_nodes
     entity_embedding_df = final_entities
@@ -130,6 +140,7 @@ def read_indexer_entities(
         graph_embedding_col=None,
         text_unit_ids_col="text_unit_ids",
         document_ids_col=None,
+        lazy=True,
     )
 
 
@@ -1,8 +1,18 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""Load data from dataframes into collections of data objects."""
+"""Load data from dataframes into collections of data objects.
 
+Each loader converts the columns it needs once and then assembles the data objects
+from the converted columns. With `lazy=True` a loader returns a read-only `LazyModelList`
+that only assembles an object when it is accessed, and keeps every embedding column
+as a single float32 matrix whose rows are handed out as read-only numpy views.
+"""
+
+from collections.abc import Callable, Sequence
+from typing import Any, TypeVar
+
+import numpy as np
 import pandas as pd
 
 from graphrag.model import (
@@ -14,17 +24,24 @@ from graphrag.model import (
     Relationship,
     TextUnit,
 )
+from graphrag.model.types import Embedding
 from graphrag.query.input.loaders.utils import (
-    to_list,
-    to_optional_dict,
-    to_optional_float,
-    to_optional_int,
-    to_optional_list,
-    to_optional_str,
-    to_str,
+    EmbeddingColumn,
+    LazyModelList,
+    to_attributes_column,
+    to_list_column,
+    to_optional_dict_column,
+    to_optional_embedding_matrix,
+    to_optional_float_column,
+    to_optional_int_column,
+    to_optional_list_column,
+    to_optional_str_column,
+    to_str_column,
 )
 from graphrag.vector_stores import BaseVectorStore, VectorStoreDocument
 
+T = TypeVar("T")
+
 
 def read_entities(
     df: pd.DataFrame,
@@ -41,37 +58,49 @@ def read_entities(
     document_ids_col: str | None = "document_ids",
     rank_col: str | None = "degree",
     attributes_cols: list[str] | None = None,
-) -> list[Entity]:
+    lazy: bool = False,
+) -> Sequence[Entity]:
     """Read entities from a dataframe."""
-    entities = []
-    for idx, row in df.iterrows():
-        entity = Entity(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col) if short_id_col else str(idx),
-            title=to_str(row, title_col),
-            type=to_optional_str(row, type_col),
-            description=to_optional_str(row, description_col),
-            name_embedding=to_optional_list(row, name_embedding_col, item_type=float),
-            description_embedding=to_optional_list(
-                row, description_embedding_col, item_type=float
-            ),
-            graph_embedding=to_optional_list(row, graph_embedding_col, item_type=float),
-            community_ids=to_optional_list(row, community_col, item_type=str),
-            text_unit_ids=to_optional_list(row, text_unit_ids_col),
-            document_ids=to_optional_list(row, document_ids_col),
-            rank=to_optional_int(row, rank_col),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
+    ids = to_str_column(df, id_col)
+    short_ids = _short_id_column(df, short_id_col)
+    titles = to_str_column(df, title_col)
+    types = to_optional_str_column(df, type_col)
+    descriptions = to_optional_str_column(df, description_col)
+    embeddings = _embedding_columns(
+        df,
+        lazy,
+        name_embedding=name_embedding_col,
+        description_embedding=description_embedding_col,
+        graph_embedding=graph_embedding_col,
+    )
+    community_ids = to_optional_list_column(df, community_col, item_type=str)
+    text_unit_ids = to_optional_list_column(df, text_unit_ids_col)
+    document_ids = to_optional_list_column(df, document_ids_col)
+    ranks = to_optional_int_column(df, rank_col)
+    attributes = to_attributes_column(df, attributes_cols)
+
+    def build(index: int) -> Entity:
+        return Entity(
+            id=ids[index],
+            short_id=short_ids[index],
+            title=titles[index],
+            type=types[index],
+            description=descriptions[index],
+            name_embedding=embeddings["name_embedding"][index],
+            description_embedding=embeddings["description_embedding"][index],
+            graph_embedding=embeddings["graph_embedding"][index],
+            community_ids=community_ids[index],
+            text_unit_ids=text_unit_ids[index],
+            document_ids=document_ids[index],
+            rank=ranks[index],
+            attributes=attributes[index],
         )
-        entities.append(entity)
-    return entities
+
+    return _to_models(build, len(df), embeddings, lazy)
 
 
 def store_entity_semantic_embeddings(
-    entities: list[Entity],
+    entities: Sequence[Entity],
     vectorstore: BaseVectorStore,
 ) -> BaseVectorStore:
     """Store entity semantic embeddings in a vectorstore."""
@@ -79,7 +108,7 @@ def store_entity_semantic_embeddings(
         VectorStoreDocument(
             id=entity.id,
             text=entity.description,
-            vector=entity.description_embedding,
+            vector=_to_vector(entity.description_embedding),
             attributes=(
                 {"title": entity.title, **entity.attributes}
                 if entity.attributes
@@ -93,7 +122,7 @@ def store_entity_semantic_embeddings(
 
 
 def store_entity_behavior_embeddings(
-    entities: list[Entity],
+    entities: Sequence[Entity],
     vectorstore: BaseVectorStore,
 ) -> BaseVectorStore:
     """Store entity behavior embeddings in a vectorstore."""
@@ -101,7 +130,7 @@ def store_entity_behavior_embeddings(
         VectorStoreDocument(
             id=entity.id,
             text=entity.description,
-            vector=entity.graph_embedding,
+            vector=_to_vector(entity.graph_embedding),
             attributes=(
                 {"title": entity.title, **entity.attributes}
                 if entity.attributes
@@ -126,30 +155,37 @@ def read_relationships(
     text_unit_ids_col: str | None = "text_unit_ids",
     document_ids_col: str | None = "document_ids",
     attributes_cols: list[str] | None = None,
-) -> list[Relationship]:
+    lazy: bool = False,
+) -> Sequence[Relationship]:
     """Read relationships from a dataframe."""
-    relationships = []
-    for idx, row in df.iterrows():
-        rel = Relationship(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col) if short_id_col else str(idx),
-            source=to_str(row, source_col),
-            target=to_str(row, target_col),
-            description=to_optional_str(row, description_col),
-            description_embedding=to_optional_list(
-                row, description_embedding_col, item_type=float
-            ),
-            weight=to_optional_float(row, weight_col),
-            text_unit_ids=to_optional_list(row, text_unit_ids_col, item_type=str),
-            document_ids=to_optional_list(row, document_ids_col, item_type=str),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
+    ids = to_str_column(df, id_col)
+    short_ids = _short_id_column(df, short_id_col)
+    sources = to_str_column(df, source_col)
+    targets = to_str_column(df, target_col)
+    descriptions = to_optional_str_column(df, description_col)
+    embeddings = _embedding_columns(
+        df, lazy, description_embedding=description_embedding_col
+    )
+    weights = to_optional_float_column(df, weight_col)
+    text_unit_ids = to_optional_list_column(df, text_unit_ids_col, item_type=str)
+    document_ids = to_optional_list_column(df, document_ids_col, item_type=str)
+    attributes = to_attributes_column(df, attributes_cols)
+
+    def build(index: int) -> Relationship:
+        return Relationship(
+            id=ids[index],
+            short_id=short_ids[index],
+            source=sources[index],
+            target=targets[index],
+            description=descriptions[index],
+            description_embedding=embeddings["description_embedding"][index],
+            weight=weights[index],
+            text_unit_ids=text_unit_ids[index],
+            document_ids=document_ids[index],
+            attributes=attributes[index],
         )
-        relationships.append(rel)
-    return relationships
+
+    return _to_models(build, len(df), embeddings, lazy)
 
 
 def read_covariates(
@@ -161,27 +197,33 @@ def read_covariates(
     text_unit_ids_col: str | None = "text_unit_ids",
     document_ids_col: str | None = "document_ids",
     attributes_cols: list[str] | None = None,
-) -> list[Covariate]:
+    lazy: bool = False,
+) -> Sequence[Covariate]:
     """Read covariates from a dataframe."""
-    covariates = []
-    for idx, row in df.iterrows():
-        cov = Covariate(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col) if short_id_col else str(idx),
-            subject_id=to_str(row, subject_col),
-            covariate_type=(
-                to_str(row, covariate_type_col) if covariate_type_col else "claim"
-            ),
-            text_unit_ids=to_optional_list(row, text_unit_ids_col, item_type=str),
-            document_ids=to_optional_list(row, document_ids_col, item_type=str),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
+    ids = to_str_column(df, id_col)
+    short_ids = _short_id_column(df, short_id_col)
+    subject_ids = to_str_column(df, subject_col)
+    covariate_types = (
+        to_str_column(df, covariate_type_col)
+        if covariate_type_col
+        else ["claim"] * len(df)
+    )
+    text_unit_ids = to_optional_list_column(df, text_unit_ids_col, item_type=str)
+    document_ids = to_optional_list_column(df, document_ids_col, item_type=str)
+    attributes = to_attributes_column(df, attributes_cols)
+
+    def build(index: int) -> Covariate:
+        return Covariate(
+            id=ids[index],
+            short_id=short_ids[index],
+            subject_id=subject_ids[index],
+            covariate_type=covariate_types[index],
+            text_unit_ids=text_unit_ids[index],
+            document_ids=document_ids[index],
+            attributes=attributes[index],
         )
-        covariates.append(cov)
-    return covariates
+
+    return _to_models(build, len(df), {}, lazy)
 
 
 def read_communities(
@@ -194,28 +236,33 @@ def read_communities(
     relationships_col: str | None = "relationship_ids",
     covariates_col: str | None = "covariate_ids",
     attributes_cols: list[str] | None = None,
-) -> list[Community]:
+    lazy: bool = False,
+) -> Sequence[Community]:
     """Read communities from a dataframe."""
-    communities = []
-    for idx, row in df.iterrows():
-        comm = Community(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col) if short_id_col else str(idx),
-            title=to_str(row, title_col),
-            level=to_str(row, level_col),
-            entity_ids=to_optional_list(row, entities_col, item_type=str),
-            relationship_ids=to_optional_list(row, relationships_col, item_type=str),
-            covariate_ids=to_optional_dict(
-                row, covariates_col, key_type=str, value_type=str
-            ),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
+    ids = to_str_column(df, id_col)
+    short_ids = _short_id_column(df, short_id_col)
+    titles = to_str_column(df, title_col)
+    levels = to_str_column(df, level_col)
+    entity_ids = to_optional_list_column(df, entities_col, item_type=str)
+    relationship_ids = to_optional_list_column(df, relationships_col, item_type=str)
+    covariate_ids = to_optional_dict_column(
+        df, covariates_col, key_type=str, value_type=str
+    )
+    attributes = to_attributes_column(df, attributes_cols)
+
+    def build(index: int) -> Community:
+        return Community(
+            id=ids[index],
+            short_id=short_ids[index],
+            title=titles[index],
+            level=levels[index],
+            entity_ids=entity_ids[index],
+            relationship_ids=relationship_ids[index],
+            covariate_ids=covariate_ids[index],
+            attributes=attributes[index],
         )
-        communities.append(comm)
-    return communities
+
+    return _to_models(build, len(df), {}, lazy)
 
 
 def read_community_reports(
@@ -230,32 +277,39 @@ def read_community_reports(
     summary_embedding_col: str | None = "summary_embedding",
     content_embedding_col: str | None = "full_content_embedding",
     attributes_cols: list[str] | None = None,
-) -> list[CommunityReport]:
+    lazy: bool = False,
+) -> Sequence[CommunityReport]:
     """Read community reports from a dataframe."""
-    reports = []
-    for idx, row in df.iterrows():
-        report = CommunityReport(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col) if short_id_col else str(idx),
-            title=to_str(row, title_col),
-            community_id=to_str(row, community_col),
-            summary=to_str(row, summary_col),
-            full_content=to_str(row, content_col),
-            rank=to_optional_float(row, rank_col),
-            summary_embedding=to_optional_list(
-                row, summary_embedding_col, item_type=float
-            ),
-            full_content_embedding=to_optional_list(
-                row, content_embedding_col, item_type=float
-            ),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
+    ids = to_str_column(df, id_col)
+    short_ids = _short_id_column(df, short_id_col)
+    titles = to_str_column(df, title_col)
+    community_ids = to_str_column(df, community_col)
+    summaries = to_str_column(df, summary_col)
+    full_contents = to_str_column(df, content_col)
+    ranks = to_optional_float_column(df, rank_col)
+    embeddings = _embedding_columns(
+        df,
+        lazy,
+        summary_embedding=summary_embedding_col,
+        full_content_embedding=content_embedding_col,
+    )
+    attributes = to_attributes_column(df, attributes_cols)
+
+    def build(index: int) -> CommunityReport:
+        return CommunityReport(
+            id=ids[index],
+            short_id=short_ids[index],
+            title=titles[index],
+            community_id=community_ids[index],
+            summary=summaries[index],
+            full_content=full_contents[index],
+            rank=ranks[index],
+            summary_embedding=embeddings["summary_embedding"][index],
+            full_content_embedding=embeddings["full_content_embedding"][index],
+            attributes=attributes[index],
         )
-        reports.append(report)
-    return reports
+
+    return _to_models(build, len(df), embeddings, lazy)
 
 
 def read_text_units(
@@ -270,30 +324,37 @@ def read_text_units(
     document_ids_col: str | None = "document_ids",
     embedding_col: str | None = "text_embedding",
     attributes_cols: list[str] | None = None,
-) -> list[TextUnit]:
+    lazy: bool = False,
+) -> Sequence[TextUnit]:
     """Read text units from a dataframe."""
-    text_units = []
-    for idx, row in df.iterrows():
-        chunk = TextUnit(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col) if short_id_col else str(idx),
-            text=to_str(row, text_col),
-            entity_ids=to_optional_list(row, entities_col, item_type=str),
-            relationship_ids=to_optional_list(row, relationships_col, item_type=str),
-            covariate_ids=to_optional_dict(
-                row, covariates_col, key_type=str, value_type=str
-            ),
-            text_embedding=to_optional_list(row, embedding_col, item_type=float),  # type: ignore
-            n_tokens=to_optional_int(row, tokens_col),
-            document_ids=to_optional_list(row, document_ids_col, item_type=str),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
+    ids = to_str_column(df, id_col)
+    short_ids = _short_id_column(df, short_id_col)
+    texts = to_str_column(df, text_col)
+    entity_ids = to_optional_list_column(df, entities_col, item_type=str)
+    relationship_ids = to_optional_list_column(df, relationships_col, item_type=str)
+    covariate_ids = to_optional_dict_column(
+        df, covariates_col, key_type=str, value_type=str
+    )
+    embeddings = _embedding_columns(df, lazy, text_embedding=embedding_col)
+    n_tokens = to_optional_int_column(df, tokens_col)
+    document_ids = to_optional_list_column(df, document_ids_col, item_type=str)
+    attributes = to_attributes_column(df, attributes_cols)
+
+    def build(index: int) -> TextUnit:
+        return TextUnit(
+            id=ids[index],
+            short_id=short_ids[index],
+            text=texts[index],
+            entity_ids=entity_ids[index],
+            relationship_ids=relationship_ids[index],
+            covariate_ids=covariate_ids[index],
+            text_embedding=embeddings["text_embedding"][index],
+            n_tokens=n_tokens[index],
+            document_ids=document_ids[index],
+            attributes=attributes[index],
         )
-        text_units.append(chunk)
-    return text_units
+
+    return _to_models(build, len(df), embeddings, lazy)
 
 
 def read_documents(
@@ -308,29 +369,78 @@ def read_documents(
     content_embedding_col: str | None = "raw_content_embedding",
     text_units_col: str | None = "text_units",
     attributes_cols: list[str] | None = None,
-) -> list[Document]:
+    lazy: bool = False,
+) -> Sequence[Document]:
     """Read documents from a dataframe."""
-    docs = []
-    for idx, row in df.iterrows():
-        doc = Document(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col) if short_id_col else str(idx),
-            title=to_str(row, title_col),
-            type=to_str(row, type_col),
-            summary=to_optional_str(row, summary_col),
-            raw_content=to_str(row, raw_content_col),
-            summary_embedding=to_optional_list(
-                row, summary_embedding_col, item_type=float
-            ),
-            raw_content_embedding=to_optional_list(
-                row, content_embedding_col, item_type=float
-            ),
-            text_units=to_list(row, text_units_col, item_type=str),  # type: ignore
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
+    ids = to_str_column(df, id_col)
+    short_ids = _short_id_column(df, short_id_col)
+    titles = to_str_column(df, title_col)
+    types = to_str_column(df, type_col)
+    summaries = to_optional_str_column(df, summary_col)
+    raw_contents = to_str_column(df, raw_content_col)
+    embeddings = _embedding_columns(
+        df,
+        lazy,
+        summary_embedding=summary_embedding_col,
+        raw_content_embedding=content_embedding_col,
+    )
+    text_unit_ids = to_list_column(df, text_units_col, item_type=str)
+    attributes = to_attributes_column(df, attributes_cols)
+
+    def build(index: int) -> Document:
+        return Document(
+            id=ids[index],
+            short_id=short_ids[index],
+            title=titles[index],
+            type=types[index],
+            summary=summaries[index],
+            raw_content=raw_contents[index],
+            summary_embedding=embeddings["summary_embedding"][index],
+            raw_content_embedding=embeddings["raw_content_embedding"][index],
+            text_unit_ids=text_unit_ids[index],
+            attributes=attributes[index],
         )
-        docs.append(doc)
-    return docs
+
+    return _to_models(build, len(df), embeddings, lazy)
+
+
+def _to_vector(embedding: Embedding | None) -> list[float] | None:
+    """Convert an embedding, which may be a lazily loaded numpy view, to a float list."""
+    if isinstance(embedding, np.ndarray):
+        return embedding.tolist()
+    return embedding
+
+
+def _short_id_column(df: pd.DataFrame, short_id_col: str | None) -> list[str | None]:
+    """Read the short ids, falling back to the dataframe index."""
+    if short_id_col:
+        return to_optional_str_column(df, short_id_col)
+    return [str(idx) for idx in df.index]
+
+
+def _embedding_columns(
+    df: pd.DataFrame, lazy: bool, **columns: str | None
+) -> dict[str, Any]:
+    """Read the embedding columns, as float32 matrices when lazy or as float lists otherwise."""
+    if lazy:
+        return {
+            name: to_optional_embedding_matrix(df, column)
+            for name, column in columns.items()
+        }
+    return {
+        name: to_optional_list_column(df, column, item_type=float)
+        for name, column in columns.items()
+    }
+
+
+def _to_models(
+    build: Callable[[int], T], length: int, embeddings: dict[str, Any], lazy: bool
+) -> Sequence[T]:
+    if lazy:
+        matrices = {
+            name: column
+            for name, column in embeddings.items()
+            if isinstance(column, EmbeddingColumn)
+        }
+        return LazyModelList(build, length, matrices)
+    return [build(index) for index in range(length)]
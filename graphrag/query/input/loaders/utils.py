@@ -3,6 +3,9 @@
 
 """Data load utils."""
 
+from collections.abc import Callable, Sequence
+from typing import Any, TypeVar, overload
+
 import numpy as np
 import pandas as pd
 
@@ -243,3 +246,290 @@ def to_optional_dict(
 
     msg = f"Column {column_name} not found in data"
     raise ValueError(msg)
+
+
+def row_dtype(df: pd.DataFrame) -> np.dtype:
+    """Get the dtype that `df.iterrows()` casts each row to.
+
+    Converting a column to this dtype yields the same values the row based helpers
+    above see, e.g. ints become floats when every column of the frame is numeric.
+    """
+    return df.iloc[:0].to_numpy().dtype
+
+
+def column_values(
+    df: pd.DataFrame, column_name: str | None, dtype: np.dtype | None = None
+) -> np.ndarray | None:
+    """Get the values of a column as they appear in `df.iterrows()`, or None if it is missing."""
+    if column_name is None or column_name not in df.columns:
+        return None
+    return df[column_name].to_numpy(dtype=dtype if dtype is not None else row_dtype(df))
+
+
+def to_str_column(df: pd.DataFrame, column_name: str | None) -> list[str]:
+    """Convert and validate a column to strings, see `to_str`."""
+    if len(df) == 0:
+        return []
+    values = _required_column(df, column_name)
+    return [str(value) for value in values]
+
+
+def to_optional_str_column(
+    df: pd.DataFrame, column_name: str | None
+) -> list[str | None]:
+    """Convert and validate a column to optional strings, see `to_optional_str`."""
+    if len(df) == 0:
+        return []
+    values = _required_column(df, column_name)
+    return [None if value is None else str(value) for value in values]
+
+
+def to_optional_list_column(
+    df: pd.DataFrame, column_name: str | None, item_type: type | None = None
+) -> list[list | None]:
+    """Convert and validate a column to optional lists, see `to_optional_list`."""
+    values = column_values(df, column_name)
+    if values is None:
+        return [None] * len(df)
+    return [_to_optional_list_value(value, item_type) for value in values]
+
+
+def to_list_column(
+    df: pd.DataFrame, column_name: str | None, item_type: type | None = None
+) -> list[list]:
+    """Convert and validate a column to lists, see `to_list`."""
+    if len(df) == 0:
+        return []
+    values = _required_column(df, column_name)
+    result = []
+    for value in values:
+        if value is None:
+            msg = f"value is not a list: {value} ({type(value)})"
+            raise ValueError(msg)
+        result.append(_to_optional_list_value(value, item_type))
+    return result
+
+
+def to_optional_int_column(
+    df: pd.DataFrame, column_name: str | None
+) -> list[int | None]:
+    """Convert and validate a column to optional ints, see `to_optional_int`."""
+    if column_name is None:
+        return [None] * len(df)
+    if len(df) == 0:
+        return []
+    values = _required_column(df, column_name)
+    return [_to_optional_int_value(value) for value in values]
+
+
+def to_optional_float_column(
+    df: pd.DataFrame, column_name: str | None
+) -> list[float | None]:
+    """Convert and validate a column to optional floats, see `to_optional_float`."""
+    if column_name is None:
+        return [None] * len(df)
+    if len(df) == 0:
+        return []
+    values = _required_column(df, column_name)
+    if values.dtype.kind == "f":
+        return values.tolist()
+    return [_to_optional_float_value(value) for value in values]
+
+
+def to_optional_dict_column(
+    df: pd.DataFrame,
+    column_name: str | None,
+    key_type: type | None = None,
+    value_type: type | None = None,
+) -> list[dict | None]:
+    """Convert and validate a column to optional dicts, see `to_optional_dict`."""
+    if column_name is None:
+        return [None] * len(df)
+    if len(df) == 0:
+        return []
+    values = _required_column(df, column_name)
+    return [_to_optional_dict_value(value, key_type, value_type) for value in values]
+
+
+def to_attributes_column(
+    df: pd.DataFrame, attributes_cols: list[str] | None
+) -> list[dict | None]:
+    """Collect the attribute columns into one dict per row, missing columns are None."""
+    if not attributes_cols:
+        return [None] * len(df)
+    dtype = row_dtype(df)
+    columns = [column_values(df, col, dtype) for col in attributes_cols]
+    return [
+        {
+            col: None if values is None else values[index]
+            for col, values in zip(attributes_cols, columns, strict=True)
+        }
+        for index in range(len(df))
+    ]
+
+
+def to_optional_embedding_matrix(
+    df: pd.DataFrame, column_name: str | None
+) -> "EmbeddingColumn":
+    """Convert a column of optional embeddings into one contiguous float32 matrix.
+
+    Rows without an embedding are zero-filled in the matrix and read back as None.
+    """
+    values = column_values(df, column_name, np.dtype(object))
+    present = np.zeros(len(df), dtype=bool)
+    if values is None:
+        return EmbeddingColumn(np.zeros((len(df), 0), dtype=np.float32), present)
+
+    dimensions = None
+    for index, value in enumerate(values):
+        if value is None:
+            continue
+        if not isinstance(value, np.ndarray | list):
+            msg = f"value is not a list: {value} ({type(value)})"
+            raise ValueError(msg)  # noqa: TRY004
+        if dimensions is None:
+            dimensions = len(value)
+        elif len(value) != dimensions:
+            msg = f"embeddings in column {column_name} have different dimensions: {dimensions} and {len(value)}"
+            raise ValueError(msg)
+        present[index] = True
+
+    matrix = np.zeros((len(df), dimensions or 0), dtype=np.float32)
+    for index in np.flatnonzero(present):
+        matrix[index] = values[index]
+    return EmbeddingColumn(matrix, present)
+
+
+class EmbeddingColumn:
+    """A column of optional embeddings stored as rows of a single float32 matrix.
+
+    Indexing returns a read-only view into the matrix, or None for rows without an
+    embedding, so no per-row Python lists are allocated.
+    """
+
+    def __init__(self, matrix: np.ndarray, present: np.ndarray):
+        matrix.flags.writeable = False
+        self.matrix = matrix
+        self.present = present
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.present)
+
+    def __getitem__(self, index: int) -> np.ndarray | None:
+        """Get the embedding of a row."""
+        return self.matrix[index] if self.present[index] else None
+
+
+T = TypeVar("T")
+
+
+class LazyModelList(Sequence[T]):
+    """A read-only list of data objects that are only built when they are accessed.
+
+    Loaders convert every column once up front; `factory` assembles the object at
+    a given position from those columns. Built objects are cached, so repeated
+    access returns the same instance.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[int], T],
+        length: int,
+        embeddings: dict[str, EmbeddingColumn] | None = None,
+    ):
+        self._factory = factory
+        self._items: list[T | None] = [None] * length
+        self.embeddings = embeddings or {}
+
+    def __len__(self) -> int:
+        """Return the number of objects."""
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        """Get the object(s) at a position, building them on first access."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = self._items[index]
+        if item is None:
+            item = self._factory(range(len(self))[index])
+            self._items[index] = item
+        return item
+
+
+def _required_column(df: pd.DataFrame, column_name: str | None) -> np.ndarray:
+    if column_name is None:
+        msg = "Column name is None"
+        raise ValueError(msg)
+    values = column_values(df, column_name)
+    if values is None:
+        msg = f"Column {column_name} not found in data"
+        raise ValueError(msg)
+    return values
+
+
+def _to_optional_list_value(value: Any, item_type: type | None) -> list | None:
+    if value is None:
+        return None
+    if isinstance(value, np.ndarray):
+        # every item of a float array is a python float once converted
+        skip_check = item_type is float and value.dtype.kind == "f"
+        value = value.tolist()
+        if skip_check:
+            return value
+    if not isinstance(value, list):
+        msg = f"value is not a list: {value} ({type(value)})"
+        raise ValueError(msg)  # noqa: TRY004
+    if item_type is not None:
+        for v in value:
+            if not isinstance(v, item_type):
+                msg = f"list item has item that is not {item_type}: {v} ({type(v)})"
+                raise TypeError(msg)
+    return value
+
+
+def _to_optional_dict_value(
+    value: Any, key_type: type | None, value_type: type | None
+) -> dict | None:
+    if value is None:
+        return None
+    if not isinstance(value, dict):
+        msg = f"value is not a dict: {value} ({type(value)})"
+        raise TypeError(msg)
+    if key_type is not None:
+        for v in value:
+            if not isinstance(v, key_type):
+                msg = f"dict key has item that is not {key_type}: {v} ({type(v)})"
+                raise TypeError(msg)
+    if value_type is not None:
+        for v in value.values():
+            if not isinstance(v, value_type):
+                msg = f"dict value has item that is not {value_type}: {v} ({type(v)})"
+                raise TypeError(msg)
+    return value
+
+
+def _to_optional_int_value(value: Any) -> int | None:
+    if value is None:
+        return None
+    if isinstance(value, float):
+        value = int(value)
+    if not isinstance(value, int):
+        msg = f"value is not an int: {value} ({type(value)})"
+        raise ValueError(msg)  # noqa: TRY004
+    return int(value)
+
+
+def _to_optional_float_value(value: Any) -> float | None:
+    if value is None:
+        return None
+    if not isinstance(value, float):
+        msg = f"value is not a float: {value} ({type(value)})"
+        raise ValueError(msg)  # noqa: TRY004
+    return float(value)
@@ -0,0 +1,151 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the GraphIndex lookup tables used at query time."""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from heapq import merge
+from itertools import groupby
+
+from graphrag.model import Entity, Relationship
+from graphrag.query.input.retrieval.entities import (
+    get_entity_by_key,
+    is_valid_uuid,
+)
+
+
+class GraphIndex:
+    """Immutable lookup tables over the entities and relationships of a graph.
+
+    Entities are indexed by id and by title, and every title maps to the
+    relationships incident to it and to its neighbouring entities sorted by rank.
+    Results are always returned in the order of the lists the index was built
+    from, so index lookups are drop-in replacements for linear scans.
+    """
+
+    def __init__(
+        self,
+        entities: Iterable[Entity],
+        relationships: Iterable[Relationship],
+    ):
+        self._entities = tuple(entities)
+        self._relationships = tuple(relationships)
+
+        entities_by_title = defaultdict[str, list[int]](list)
+        entities_by_id = dict[str, int]()
+        for position, entity in enumerate(self._entities):
+            entities_by_title[entity.title].append(position)
+            entities_by_id.setdefault(entity.id, position)
+
+        incident = defaultdict[str, list[int]](list)
+        for position, relationship in enumerate(self._relationships):
+            incident[relationship.source].append(position)
+            if relationship.target != relationship.source:
+                incident[relationship.target].append(position)
+
+        self._entities_by_title = {
+            title: tuple(positions) for title, positions in entities_by_title.items()
+        }
+        self._entities_by_id = entities_by_id
+        self._incident = {
+            title: tuple(positions) for title, positions in incident.items()
+        }
+        self._neighbors = {
+            title: self._rank_neighbors(title, positions)
+            for title, positions in self._incident.items()
+        }
+
+    @property
+    def entities(self) -> tuple[Entity, ...]:
+        """All indexed entities, in their original order."""
+        return self._entities
+
+    @property
+    def relationships(self) -> tuple[Relationship, ...]:
+        """All indexed relationships, in their original order."""
+        return self._relationships
+
+    def get_entity_by_id(self, id: str) -> Entity | None:
+        """Get the first entity with the given id."""
+        position = self._entities_by_id.get(id)
+        return None if position is None else self._entities[position]
+
+    def get_entity_by_title(self, title: str) -> Entity | None:
+        """Get the first entity with the given title."""
+        positions = self._entities_by_title.get(title)
+        return self._entities[positions[0]] if positions else None
+
+    def get_entities_by_titles(self, titles: Iterable[str]) -> list[Entity]:
+        """Get every entity whose title is in `titles`, in their original order."""
+        return [
+            self._entities[position]
+            for position in self._merge(self._entities_by_title, titles)
+        ]
+
+    def get_entity_by_key(self, key: str, value: str | int) -> Entity | None:
+        """Get the first entity whose `key` attribute matches `value`.
+
+        Lookups on `id` and `title` use the index, any other key falls back to a
+        linear scan. Matching follows `retrieval.entities.get_entity_by_key`.
+        """
+        if key not in ("id", "title"):
+            return get_entity_by_key(self._entities, key, value)
+        candidates = [value]
+        if isinstance(value, str) and is_valid_uuid(value):
+            candidates.append(value.replace("-", ""))
+        positions = [
+            position
+            for candidate in candidates
+            if (position := self._first_position(key, candidate)) is not None
+        ]
+        return self._entities[min(positions)] if positions else None
+
+    def get_relationships(self, titles: Iterable[str]) -> list[Relationship]:
+        """Get every relationship with an endpoint in `titles`, in their original order."""
+        return [
+            self._relationships[position]
+            for position in self._merge(self._incident, titles)
+        ]
+
+    def get_neighbors(self, title: str) -> tuple[Entity, ...]:
+        """Get the entities on any relationship incident to `title`, highest rank first.
+
+        As with a scan over the relationships, the entity itself is included
+        whenever it has at least one relationship.
+        """
+        return self._neighbors.get(title, ())
+
+    def _rank_neighbors(
+        self, title: str, positions: tuple[int, ...]
+    ) -> tuple[Entity, ...]:
+        names = {title}
+        for position in positions:
+            relationship = self._relationships[position]
+            names.add(relationship.source)
+            names.add(relationship.target)
+        neighbors = [
+            self._entities[position]
+            for position in self._merge(self._entities_by_title, names)
+        ]
+        # stable, so ties keep their original order
+        neighbors.sort(
+            key=lambda entity: entity.rank if entity.rank else 0, reverse=True
+        )
+        return tuple(neighbors)
+
+    def _first_position(self, key: str, value: str | int) -> int | None:
+        if not isinstance(value, str):
+            return None
+        if key == "id":
+            return self._entities_by_id.get(value)
+        positions = self._entities_by_title.get(value)
+        return positions[0] if positions else None
+
+    @staticmethod
+    def _merge(lookup: dict[str, tuple[int, ...]], titles: Iterable[str]) -> list[int]:
+        """Merge the sorted position lists of `titles` into one sorted, de-duplicated list."""
+        lists = [lookup[title] for title in set(titles) if title in lookup]
+        if len(lists) == 1:
+            return list(lists[0])
+        return [position for position, _ in groupby(merge(*lists))]
@@ -3,23 +3,32 @@
 
 """Util functions to retrieve relationships from a collection."""
 
+from collections.abc import Sequence
 from typing import Any, cast
 
 import pandas as pd
 
 from graphrag.model import Entity, Relationship
+from graphrag.query.input.retrieval.graph_index import GraphIndex
 
 
 def get_in_network_relationships(
     selected_entities: list[Entity],
-    relationships: list[Relationship],
+    relationships: Sequence[Relationship],
     ranking_attribute: str = "rank",
+    graph_index: GraphIndex | None = None,
 ) -> list[Relationship]:
-    """Get all directed relationships between selected entities, sorted by ranking_attribute."""
-    selected_entity_names = [entity.title for entity in selected_entities]
+    """Get all directed relationships between selected entities, sorted by ranking_attribute.
+
+    If a `graph_index` built over `relationships` is given, only the relationships
+    incident to the selected entities are visited.
+    """
+    selected_entity_names = {entity.title for entity in selected_entities}
     selected_relationships = [
         relationship
-        for relationship in relationships
+        for relationship in _incident_relationships(
+            selected_entity_names, relationships, graph_index
+        )
         if relationship.source in selected_entity_names
         and relationship.target in selected_entity_names
     ]
@@ -34,20 +43,28 @@ def get_in_network_relationships(
 
 def get_out_network_relationships(
     selected_entities: list[Entity],
-    relationships: list[Relationship],
+    relationships: Sequence[Relationship],
     ranking_attribute: str = "rank",
+    graph_index: GraphIndex | None = None,
 ) -> list[Relationship]:
-    """Get relationships from selected entities to other entities that are not within the selected entities, sorted by ranking_attribute."""
-    selected_entity_names = [entity.title for entity in selected_entities]
+    """Get relationships from selected entities to other entities that are not within the selected entities, sorted by ranking_attribute.
+
+    If a `graph_index` built over `relationships` is given, only the relationships
+    incident to the selected entities are visited.
+    """
+    selected_entity_names = {entity.title for entity in selected_entities}
+    candidate_relationships = _incident_relationships(
+        selected_entity_names, relationships, graph_index
+    )
     source_relationships = [
         relationship
-        for relationship in relationships
+        for relationship in candidate_relationships
         if relationship.source in selected_entity_names
         and relationship.target not in selected_entity_names
     ]
     target_relationships = [
         relationship
-        for relationship in relationships
+        for relationship in candidate_relationships
         if relationship.target in selected_entity_names
         and relationship.source not in selected_entity_names
     ]
@@ -59,28 +76,42 @@ def get_out_network_relationships(
 
 def get_candidate_relationships(
     selected_entities: list[Entity],
-    relationships: list[Relationship],
+    relationships: Sequence[Relationship],
+    graph_index: GraphIndex | None = None,
 ) -> list[Relationship]:
     """Get all relationships that are associated with the selected entities."""
-    selected_entity_names = [entity.title for entity in selected_entities]
-    return [
-        relationship
-        for relationship in relationships
-        if relationship.source in selected_entity_names
-        or relationship.target in selected_entity_names
-    ]
+    selected_entity_names = {entity.title for entity in selected_entities}
+    return _incident_relationships(selected_entity_names, relationships, graph_index)
 
 
 def get_entities_from_relationships(
-    relationships: list[Relationship], entities: list[Entity]
+    relationships: Sequence[Relationship],
+    entities: Sequence[Entity],
+    graph_index: GraphIndex | None = None,
 ) -> list[Entity]:
     """Get all entities that are associated with the selected relationships."""
-    selected_entity_names = [relationship.source for relationship in relationships] + [
-        relationship.target for relationship in relationships
-    ]
+    selected_entity_names = {relationship.source for relationship in relationships}
+    selected_entity_names.update(relationship.target for relationship in relationships)
+    if graph_index is not None:
+        return graph_index.get_entities_by_titles(selected_entity_names)
     return [entity for entity in entities if entity.title in selected_entity_names]
 
 
+def _incident_relationships(
+    entity_names: set[str],
+    relationships: Sequence[Relationship],
+    graph_index: GraphIndex | None,
+) -> list[Relationship]:
+    """Get the relationships with at least one endpoint in entity_names, in their original order."""
+    if graph_index is not None:
+        return graph_index.get_relationships(entity_names)
+    return [
+        relationship
+        for relationship in relationships
+        if relationship.source in entity_names or relationship.target in entity_names
+    ]
+
+
 def calculate_relationship_combined_rank(
     relationships: list[Relationship],
     entities: list[Entity],
@@ -63,3 +63,7 @@ class BaseTextEmbedding(ABC):
     @abstractmethod
     async def aembed(self, text: str, **kwargs: Any) -> list[float]:
         """Embed a text string asynchronously."""
+
+    def embed_batch(self, texts: list[str], **kwargs: Any) -> list[list[float]]:
+        """Embed several text strings, in as few requests as the model allows."""
+        return [self.embed(text, **kwargs) for text in texts]
@@ -47,6 +47,7 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
         request_timeout: float = 180.0,
         retry_error_types: tuple[type[BaseException]] = OPENAI_RETRY_ERROR_TYPES,  # type: ignore
         reporter: StatusLogger | None = None,
+        max_batch_size: int = 16,
     ):
         OpenAILLMImpl.__init__(
             self=self,
@@ -65,6 +66,7 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
         self.model = model
         self.encoding_name = encoding_name
         self.max_tokens = max_tokens
+        self.max_batch_size = max_batch_size
         self.token_encoder = tiktoken.get_encoding(self.encoding_name)
         self.retry_error_types = retry_error_types
 
@@ -97,6 +99,32 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
         chunk_embeddings = chunk_embeddings / np.linalg.norm(chunk_embeddings)
         return chunk_embeddings.tolist()
 
+    def embed_batch(self, texts: list[str], **kwargs: Any) -> list[list[float]]:
+        """
+        Embed several texts using OpenAI Embedding's sync function.
+
+        Texts that fit in max_tokens are embedded together, in requests of up to
+        max_batch_size texts. Longer texts are chunked and embedded one by one, see `embed`.
+        """
+        embeddings: list[list[float]] = [[] for _ in texts]
+        batch = []
+        for i, text in enumerate(texts):
+            if len(self.token_encoder.encode(text)) <= self.max_tokens:
+                batch.append(i)
+            else:
+                embeddings[i] = self.embed(text, **kwargs)
+        for start in range(0, len(batch), self.max_batch_size):
+            indices = batch[start : start + self.max_batch_size]
+            results = self._embed_batch_with_retry(
+                [texts[i] for i in indices], **kwargs
+            )
+            for i, embedding in zip(indices, results, strict=True):
+                if embedding:
+                    embeddings[i] = (
+                        np.asarray(embedding) / np.linalg.norm(embedding)
+                    ).tolist()
+        return embeddings
+
     async def aembed(self, text: str, **kwargs: Any) -> list[float]:
         """
         Embed text using OpenAI Embedding's async function.
@@ -151,6 +179,34 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
             # TODO: why not just throw in this case?
             return ([], 0)
 
+    def _embed_batch_with_retry(
+        self, texts: list[str], **kwargs: Any
+    ) -> list[list[float]]:
+        try:
+            retryer = Retrying(
+                stop=stop_after_attempt(self.max_retries),
+                wait=wait_exponential_jitter(max=10),
+                reraise=True,
+                retry=retry_if_exception_type(self.retry_error_types),
+            )
+            for attempt in retryer:
+                with attempt:
+                    data = self.sync_client.embeddings.create(  # type: ignore
+                        input=texts,
+                        model=self.model,
+                        **kwargs,  # type: ignore
+                    ).data
+                    embeddings: list[list[float]] = [[] for _ in texts]
+                    for item in data:
+                        embeddings[item.index] = item.embedding or []
+                    return embeddings
+        except RetryError as e:
+            self._reporter.error(
+                message="Error at embed_batch_with_retry()",
+                details={self.__class__.__name__: str(e)},
+            )
+        return [[] for _ in texts]
+
     async def _aembed_with_retry(
         self, text: str | tuple, **kwargs: Any
     ) -> tuple[list[float], int]:
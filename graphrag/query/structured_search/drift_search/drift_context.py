@@ -4,6 +4,7 @@
 """DRIFT Context Builder implementation."""
 
 import logging
+from collections.abc import Sequence
 from dataclasses import asdict
 from typing import Any
 
@@ -42,12 +43,12 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
         self,
         chat_llm: ChatOpenAI,
         text_embedder: BaseTextEmbedding,
-        entities: list[Entity],
+        entities: Sequence[Entity],
         entity_text_embeddings: BaseVectorStore,
-        text_units: list[TextUnit] | None = None,
-        reports: list[CommunityReport] | None = None,
-        relationships: list[Relationship] | None = None,
-        covariates: dict[str, list[Covariate]] | None = None,
+        text_units: Sequence[TextUnit] | None = None,
+        reports: Sequence[CommunityReport] | None = None,
+        relationships: Sequence[Relationship] | None = None,
+        covariates: dict[str, Sequence[Covariate]] | None = None,
         token_encoder: tiktoken.Encoding | None = None,
         embedding_vectorstore_key: str = EntityVectorStoreKey.ID,
         config: DRIFTSearchConfig | None = None,
@@ -95,14 +96,14 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
         )
 
     @staticmethod
-    def convert_reports_to_df(reports: list[CommunityReport]) -> pd.DataFrame:
+    def convert_reports_to_df(reports: Sequence[CommunityReport]) -> pd.DataFrame:
         """
         Convert a list of CommunityReport objects to a pandas DataFrame.
 
         Args
         ----
-        reports : list[CommunityReport]
-            List of CommunityReport objects.
+        reports : Sequence[CommunityReport]
+            Sequence of CommunityReport objects.
 
         Returns
         -------
@@ -113,6 +114,11 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
         ValueError: If some reports are missing full content or full content embeddings.
         """
         report_df = pd.DataFrame([asdict(report) for report in reports])
+        if "full_content_embedding" in report_df.columns:
+            # lazily loaded reports hold numpy views; score them as float lists like the query embedding
+            report_df["full_content_embedding"] = report_df[
+                "full_content_embedding"
+            ].map(lambda e: e.tolist() if isinstance(e, np.ndarray) else e)
         missing_content_error = "Some reports are missing full content."
         missing_embedding_error = "Some reports are missing full content embeddings."
 
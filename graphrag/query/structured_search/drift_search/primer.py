@@ -7,6 +7,7 @@ import json
 import logging
 import secrets
 import time
+from collections.abc import Sequence
 
 import numpy as np
 import pandas as pd
@@ -33,7 +34,7 @@ class PrimerQueryProcessor:
         self,
         chat_llm: ChatOpenAI,
         text_embedder: BaseTextEmbedding,
-        reports: list[CommunityReport],
+        reports: Sequence[CommunityReport],
         token_encoder: tiktoken.Encoding | None = None,
     ):
         """
@@ -42,7 +43,7 @@ class PrimerQueryProcessor:
         Args:
             chat_llm (ChatOpenAI): The language model used to process the query.
             text_embedder (BaseTextEmbedding): The text embedding model.
-            reports (list[CommunityReport]): List of community reports.
+            reports (Sequence[CommunityReport]): Sequence of community reports.
             token_encoder (tiktoken.Encoding, optional): Token encoder for token counting.
         """
         self.chat_llm = chat_llm
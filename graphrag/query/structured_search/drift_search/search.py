@@ -22,6 +22,9 @@ from graphrag.query.structured_search.drift_search.drift_context import (
 )
 from graphrag.query.structured_search.drift_search.primer import DRIFTPrimer
 from graphrag.query.structured_search.drift_search.state import QueryState
+from graphrag.query.structured_search.local_search.mixed_context import (
+    LocalSearchMixedContext,
+)
 from graphrag.query.structured_search.local_search.search import LocalSearch
 
 log = logging.getLogger(__name__)
@@ -159,6 +162,14 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
         -------
         list[DriftAction]: The results from executing the search actions asynchronously.
         """
+        pending = [action.query for action in actions if not action.is_complete]
+        if len(pending) > 1 and isinstance(
+            search_engine.context_builder, LocalSearchMixedContext
+        ):
+            # map all pending queries to entities with one embedding request and search
+            search_engine.context_builder.prefetch_query_entities(
+                pending, **search_engine.context_builder_params
+            )
         tasks = [
             action.asearch(search_engine=search_engine, global_query=global_query)
             for action in actions
@@ -3,6 +3,7 @@
 
 """Contains algorithms to build context data for global search prompt."""
 
+from collections.abc import Sequence
 from typing import Any
 
 import pandas as pd
@@ -23,8 +24,8 @@ class GlobalCommunityContext(GlobalContextBuilder):
 
     def __init__(
         self,
-        community_reports: list[CommunityReport],
-        entities: list[Entity] | None = None,
+        community_reports: Sequence[CommunityReport],
+        entities: Sequence[Entity] | None = None,
         token_encoder: tiktoken.Encoding | None = None,
         random_state: int = 86,
     ):
@@ -3,6 +3,7 @@
 """Algorithms to build context data for local search prompt."""
 
 import logging
+from collections.abc import Sequence
 from copy import deepcopy
 from typing import Any
 
@@ -39,11 +40,12 @@ from graphrag.query.context_builder.source_context import (
 from graphrag.query.input.retrieval.community_reports import (
     get_candidate_communities,
 )
+from graphrag.query.input.retrieval.graph_index import GraphIndex
 from graphrag.query.input.retrieval.text_units import get_candidate_text_units
 from graphrag.query.llm.base import BaseTextEmbedding
 from graphrag.query.llm.text_utils import num_tokens
 from graphrag.query.structured_search.base import LocalContextBuilder
-from graphrag.vector_stores import BaseVectorStore
+from graphrag.vector_stores import BaseVectorStore, VectorStoreSearchResult
 
 log = logging.getLogger(__name__)
 
@@ -53,13 +55,13 @@ class LocalSearchMixedContext(LocalContextBuilder):
 
     def __init__(
         self,
-        entities: list[Entity],
+        entities: Sequence[Entity],
         entity_text_embeddings: BaseVectorStore,
         text_embedder: BaseTextEmbedding,
-        text_units: list[TextUnit] | None = None,
-        community_reports: list[CommunityReport] | None = None,
-        relationships: list[Relationship] | None = None,
-        covariates: dict[str, list[Covariate]] | None = None,
+        text_units: Sequence[TextUnit] | None = None,
+        community_reports: Sequence[CommunityReport] | None = None,
+        relationships: Sequence[Relationship] | None = None,
+        covariates: dict[str, Sequence[Covariate]] | None = None,
         token_encoder: tiktoken.Encoding | None = None,
         embedding_vectorstore_key: str = EntityVectorStoreKey.ID,
     ):
@@ -79,16 +81,45 @@ class LocalSearchMixedContext(LocalContextBuilder):
         self.relationships = {
             relationship.id: relationship for relationship in relationships
         }
+        self.graph_index = GraphIndex(
+            self.entities.values(), self.relationships.values()
+        )
         self.covariates = covariates
         self.entity_text_embeddings = entity_text_embeddings
         self.text_embedder = text_embedder
         self.token_encoder = token_encoder
         self.embedding_vectorstore_key = embedding_vectorstore_key
+        self._prefetched_search_results: dict[
+            tuple[str, int], list[VectorStoreSearchResult]
+        ] = {}
 
     def filter_by_entity_keys(self, entity_keys: list[int] | list[str]):
         """Filter entity text embeddings by entity keys."""
         self.entity_text_embeddings.filter_by_id(entity_keys)
 
+    def prefetch_query_entities(
+        self,
+        queries: list[str],
+        top_k_mapped_entities: int = 10,
+        **kwargs: Any,
+    ) -> None:
+        """Embed and search the entity embeddings for several pending queries at once.
+
+        The results are used, once, by `build_context` calls for the same queries and
+        `top_k_mapped_entities`. Results of an earlier prefetch are dropped.
+        """
+        queries = list(dict.fromkeys(query for query in queries if query != ""))
+        k = top_k_mapped_entities * 2
+        search_results = self.entity_text_embeddings.similarity_search_by_texts(
+            texts=queries,
+            text_embedder=lambda texts: self.text_embedder.embed_batch(texts),
+            k=k,
+        )
+        self._prefetched_search_results = {
+            (query, k): results
+            for query, results in zip(queries, search_results, strict=True)
+        }
+
     def build_context(
         self,
         query: str,
@@ -147,6 +178,10 @@ class LocalSearchMixedContext(LocalContextBuilder):
             exclude_entity_names=exclude_entity_names,
             k=top_k_mapped_entities,
             oversample_scaler=2,
+            graph_index=self.graph_index,
+            search_results=self._prefetched_search_results.pop(
+                (query, top_k_mapped_entities * 2), None
+            ),
         )
 
         # build context
@@ -316,15 +351,10 @@ class LocalSearchMixedContext(LocalContextBuilder):
         text_unit_ids_set = set()
 
         unit_info_list = []
-        relationship_values = list(self.relationships.values())
 
         for index, entity in enumerate(selected_entities):
             # get matching relationships
-            entity_relationships = [
-                rel
-                for rel in relationship_values
-                if rel.source == entity.title or rel.target == entity.title
-            ]
+            entity_relationships = self.graph_index.get_relationships([entity.title])
 
             for text_id in entity.text_unit_ids or []:
                 if text_id not in text_unit_ids_set and text_id in self.text_units:
@@ -397,6 +427,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
         entity_tokens = num_tokens(entity_context, self.token_encoder)
 
         # build relationship-covariate context
+        relationships = self.graph_index.relationships
         added_entities = []
         final_context = []
         final_context_data = {}
@@ -413,7 +444,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
                 relationship_context_data,
             ) = build_relationship_context(
                 selected_entities=added_entities,
-                relationships=list(self.relationships.values()),
+                relationships=relationships,
                 token_encoder=self.token_encoder,
                 max_tokens=max_tokens,
                 column_delimiter=column_delimiter,
@@ -421,6 +452,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
                 include_relationship_weight=include_relationship_weight,
                 relationship_ranking_attribute=relationship_ranking_attribute,
                 context_name="Relationships",
+                graph_index=self.graph_index,
             )
             current_context.append(relationship_context)
             current_context_data["relationships"] = relationship_context_data
@@ -458,12 +490,13 @@ class LocalSearchMixedContext(LocalContextBuilder):
             # and add a tag to indicate which records were included in the context window
             candidate_context_data = get_candidate_context(
                 selected_entities=selected_entities,
-                entities=list(self.entities.values()),
-                relationships=list(self.relationships.values()),
+                entities=self.graph_index.entities,
+                relationships=relationships,
                 covariates=self.covariates,
                 include_entity_rank=include_entity_rank,
                 entity_rank_description=rank_description,
                 include_relationship_weight=include_relationship_weight,
+                graph_index=self.graph_index,
             )
             for key in candidate_context_data:
                 candidate_df = candidate_context_data[key]
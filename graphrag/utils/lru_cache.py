@@ -1,49 +1,91 @@
+import sys
+from time import time
 from typing import Any
 from collections import OrderedDict
+from collections.abc import Callable
 
 class _Item:
     prev:'_Item|None' = None
     next:'_Item|None' = None
     key:str
     value:Any
+    size:int
+    expiry:float|None
 
-    def __init__(self, key:str, value:Any, prev:'_Item|None' = None, next:'_Item|None' = None) -> None:
+    def __init__(self, key:str, value:Any, prev:'_Item|None' = None, next:'_Item|None' = None, size:int = 0, expiry:float|None = None) -> None:
         self.key = key
         self.value = value
         self.prev = prev
         self.next = next
+        self.size = size
+        self.expiry = expiry
         
 
 class LRUCache:
+    """A least-recently-used cache, optionally bounded by total value size and with a time-to-live per entry.
+
+    Args:
+        - max_size - The maximum number of entries to hold.
+        - max_bytes - The maximum total size of the held values (as measured by `size_of`), or None for no limit.
+        - ttl - The number of seconds an entry stays valid after it is set, or None for no expiry.
+        - size_of - The function used to measure a value, defaults to `sys.getsizeof`.
+    """
+
     max_size:int
+    max_bytes:int|None
+    ttl:float|None
     cache:dict[str, _Item]
     head:_Item|None
     tail:_Item|None
+    hits:int
+    misses:int
+    evictions:int
+    total_bytes:int
 
 
-    def __init__(self, max_size:int = 10_000):
+    def __init__(self, max_size:int = 10_000, max_bytes:int|None = None, ttl:float|None = None, size_of:Callable[[Any], int] | None = None):
         self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._size_of = size_of or sys.getsizeof
         self.cache = dict[str, _Item]()
         self.head = None
         self.tail = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.total_bytes = 0
         
 
     def __getitem__(self, key):
-        if key not in self.cache:
+        item = self.cache.get(key)
+        if item is None:
+            self.misses += 1
             return None
-        
-        item = self.cache[key]
+
+        if item.expiry is not None and item.expiry < time():
+            self.pop(key)
+            self.misses += 1
+            return None
+
+        self.hits += 1
         self._make_head(item)
         return item.value
 
     def __setitem__(self, key, value):
+        size = self._size_of(value) if self.max_bytes is not None else 0
+        expiry = time() + self.ttl if self.ttl is not None else None
         if key in self.cache:
             item = self.cache[key]
             item.value = value
+            self.total_bytes += size - item.size
+            item.size = size
+            item.expiry = expiry
             self._make_head(item)
         else:
-            item = _Item(key, value)
+            item = _Item(key, value, size=size, expiry=expiry)
             self.cache[key] = item
+            self.total_bytes += size
             if self.head is None:
                 self.head = item
                 self.tail = item
@@ -52,11 +94,24 @@ class LRUCache:
                 self.head.prev = item
                 self.head = item
 
-            if len(self.cache) > self.max_size:
-                if self.tail is not None:
-                    del self.cache[self.tail.key]
-                self.tail = self.tail.prev  # type: ignore
-                self.tail.next = None       # type: ignore
+        # Evict from the tail until both bounds are met (always keeping the newest entry)
+        while self.tail is not None and self.tail is not self.head and (
+            len(self.cache) > self.max_size
+            or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            self.pop(self.tail.key)
+            self.evictions += 1
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """The hit, miss and eviction counters along with the current number of entries and bytes held."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.cache),
+            "bytes": self.total_bytes,
+        }
 
     def __contains__(self, key):
         return key in self.cache
@@ -79,6 +134,7 @@ class LRUCache:
     def __delitem__(self, key):
         item = self.cache.pop(key, None)
         if item is not None:
+            self.total_bytes -= item.size
             if item == self.head:
                 self.head = item.next
             if item == self.tail:
@@ -105,6 +161,7 @@ class LRUCache:
         self.cache.clear()
         self.head = None
         self.tail = None
+        self.total_bytes = 0
 
     def keys(self):
         return self.cache.keys()
@@ -118,6 +175,7 @@ class LRUCache:
     def pop(self, key):
         item = self.cache.pop(key, None)
         if item is not None:
+            self.total_bytes -= item.size
             if item == self.head:
                 self.head = item.next
             if item == self.tail:
@@ -4,12 +4,14 @@
 """Base classes for vector stores."""
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 
-from graphrag.model.types import TextEmbedder
+from graphrag.model.types import TextBatchEmbedder, TextEmbedder
 
 DEFAULT_VECTOR_SIZE: int = 1536
+DEFAULT_CONCURRENT_SEARCHES: int = 8
 
 
 @dataclass
@@ -76,6 +78,68 @@ class BaseVectorStore(ABC):
     ) -> list[VectorStoreSearchResult]:
         """Perform ANN search by text."""
 
+    def similarity_search_by_vectors(
+        self, query_embeddings: list[list[float]], k: int = 10, **kwargs: Any
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform ANN search for a batch of vectors, returning the results of each vector.
+
+        Implementations should override this when the store can search several vectors
+        at once, the default searches them one by one.
+        """
+        return [
+            self.similarity_search_by_vector(query_embedding, k, **kwargs)
+            for query_embedding in query_embeddings
+        ]
+
+    def similarity_search_by_texts(
+        self,
+        texts: list[str],
+        text_embedder: TextBatchEmbedder,
+        k: int = 10,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform ANN search for a batch of texts, embedding them all in one call."""
+        if len(texts) == 0:
+            return []
+        query_embeddings = text_embedder(texts)
+        # texts that could not be embedded get no results, as in similarity_search_by_text
+        embedded = [
+            i
+            for i, query_embedding in enumerate(query_embeddings)
+            if query_embedding is not None and len(query_embedding) > 0
+        ]
+        results: list[list[VectorStoreSearchResult]] = [[] for _ in texts]
+        if embedded:
+            batch_results = self.similarity_search_by_vectors(
+                [query_embeddings[i] for i in embedded], k, **kwargs
+            )
+            for i, text_results in zip(embedded, batch_results, strict=True):
+                results[i] = text_results
+        return results
+
+    def _search_concurrently(
+        self, query_embeddings: list[list[float]], k: int, **kwargs: Any
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Run single vector searches on a thread pool, for stores without a batch query."""
+        if len(query_embeddings) <= 1:
+            return [
+                self.similarity_search_by_vector(query_embedding, k, **kwargs)
+                for query_embedding in query_embeddings
+            ]
+        max_workers = min(
+            len(query_embeddings),
+            self.kwargs.get("max_concurrent_searches", DEFAULT_CONCURRENT_SEARCHES),
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda query_embedding: self.similarity_search_by_vector(
+                        query_embedding, k, **kwargs
+                    ),
+                    query_embeddings,
+                )
+            )
+
     @abstractmethod
     def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
         """Build a query filter to filter documents by id."""
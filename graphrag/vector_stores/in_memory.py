@@ -0,0 +1,368 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""The in-process numpy vector storage implementation package."""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from graphrag.model.types import TextEmbedder
+
+from .base import (
+    BaseVectorStore,
+    VectorStoreDocument,
+    VectorStoreSearchResult,
+)
+
+VECTORS_FILE = "vectors.f32"
+DOCUMENTS_FILE = "documents.jsonl"
+
+DEFAULT_IVF_MIN_SIZE = 50_000
+DEFAULT_IVF_PROBES = 8
+_KMEANS_ITERATIONS = 10
+_KMEANS_SAMPLES_PER_LIST = 64
+_ASSIGN_BATCH_SIZE = 65_536
+# prefilters that select fewer rows than this fraction are scored on the selected rows only
+_GATHER_FRACTION = 0.25
+
+
+@dataclass
+class _IvfIndex:
+    """An inverted file index, rows grouped by their nearest centroid."""
+
+    centroids: np.ndarray
+    """Unit length centroids, one row per list."""
+
+    order: np.ndarray
+    """Row positions, sorted by list."""
+
+    offsets: np.ndarray
+    """Start of each list in `order`, with the total number of rows appended."""
+
+    def candidates(self, query: np.ndarray, probes: int) -> np.ndarray:
+        """Get the rows of the lists whose centroids are nearest to a query."""
+        scores = self.centroids @ query
+        probes = min(probes, len(scores))
+        lists = np.argpartition(-scores, probes - 1)[:probes]
+        lists.sort()
+        return np.concatenate([
+            self.order[self.offsets[i] : self.offsets[i + 1]] for i in lists
+        ])
+
+
+class InMemoryVectorStore(BaseVectorStore):
+    """In-process vector storage, holding all vectors in one normalised float32 matrix.
+
+    Similarity is the cosine similarity between the query and the stored vectors.
+    When a `db_uri` is given, the collection is persisted to
+    `<db_uri>/<collection_name>/` and read back (optionally memory-mapped) on connect.
+    Collections with at least `ivf_min_size` vectors are searched through an inverted
+    file index when `index_type` is `ivf`, otherwise every search is exact.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.directory: Path | None = None
+        self.memory_map = False
+        self.include_vectors = False
+        self.index_type = "flat"
+        self.ivf_min_size = DEFAULT_IVF_MIN_SIZE
+        self.ivf_lists: int | None = None
+        self.ivf_probes = DEFAULT_IVF_PROBES
+        self._reset()
+
+    def _reset(self) -> None:
+        self._ids: list[str | int] = []
+        self._texts: list[str | None] = []
+        self._attributes: list[dict[str, Any]] = []
+        self._norms: list[float] = []
+        self._chunks: list[np.ndarray] = []
+        self._matrix: np.ndarray | None = None
+        self._positions: dict[str, list[int]] | None = None
+        self._index: _IvfIndex | None = None
+
+    def connect(self, **kwargs: Any) -> Any:
+        """Connect to the vector storage, loading a persisted collection if one exists."""
+        db_uri = kwargs.get("db_uri")
+        self.memory_map = bool(kwargs.get("memory_map", False))
+        self.include_vectors = bool(kwargs.get("include_vectors", False))
+        self.index_type = kwargs.get("index_type", "flat")
+        if self.index_type not in ("flat", "ivf"):
+            msg = f"Unknown index type: {self.index_type}"
+            raise ValueError(msg)
+        self.ivf_min_size = int(kwargs.get("ivf_min_size", DEFAULT_IVF_MIN_SIZE))
+        self.ivf_lists = kwargs.get("ivf_lists")
+        self.ivf_probes = int(kwargs.get("ivf_probes", DEFAULT_IVF_PROBES))
+        self._reset()
+        self.directory = Path(db_uri) / self.collection_name if db_uri else None
+        if self.directory is not None and (self.directory / DOCUMENTS_FILE).exists():
+            self._read_documents()
+            if not self.memory_map:
+                self._chunks = [self._read_vectors()]
+
+    def load_documents(
+        self, documents: list[VectorStoreDocument], overwrite: bool = True
+    ) -> None:
+        """Load documents into vector storage."""
+        documents = [document for document in documents if document.vector is not None]
+        if overwrite:
+            self._reset()
+        self.query_filter = None
+        dimensions = self.dimensions
+        vectors = np.asarray(
+            [document.vector for document in documents], dtype=np.float32
+        ).reshape(len(documents), -1 if documents else dimensions)
+        if dimensions and vectors.shape[1] != dimensions:
+            msg = (
+                f"Expected vectors with {dimensions} dimensions, got {vectors.shape[1]}"
+            )
+            raise ValueError(msg)
+        norms = np.linalg.norm(vectors, axis=1)
+        np.divide(vectors, norms[:, None], out=vectors, where=norms[:, None] > 0)
+
+        if self.directory is not None:
+            self._write(documents, vectors, norms, overwrite)
+        if len(documents) == 0:
+            return
+        self._ids.extend(document.id for document in documents)
+        self._texts.extend(document.text for document in documents)
+        self._attributes.extend(document.attributes for document in documents)
+        self._norms.extend(norms.tolist())
+        if not self.memory_map or self.directory is None:
+            self._chunks.append(vectors)
+        self._matrix = None
+        self._positions = None
+        self._index = None
+
+    def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
+        """Build a query filter to filter documents by id.
+
+        The filter is a boolean mask over the stored vectors, ids are compared as strings.
+        """
+        if len(include_ids) == 0:
+            self.query_filter = None
+            return self.query_filter
+        if self._positions is None:
+            self._positions = {}
+            for position, id in enumerate(self._ids):
+                self._positions.setdefault(str(id), []).append(position)
+        mask = np.zeros(len(self._ids), dtype=bool)
+        for id in include_ids:
+            mask[self._positions.get(str(id), [])] = True
+        self.query_filter = mask
+        return self.query_filter
+
+    def similarity_search_by_vector(
+        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        """Perform a vector-based similarity search."""
+        queries = np.asarray(query_embedding, dtype=np.float32).reshape(1, -1)
+        return self._search(
+            queries, k, kwargs.get("include_vectors", self.include_vectors)
+        )[0]
+
+    def similarity_search_by_vectors(
+        self, query_embeddings: list[list[float]], k: int = 10, **kwargs: Any
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform a vector-based similarity search for a batch of vectors in one pass."""
+        if len(query_embeddings) == 0:
+            return []
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        return self._search(
+            queries, k, kwargs.get("include_vectors", self.include_vectors)
+        )
+
+    def similarity_search_by_text(
+        self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        """Perform a similarity search using a given input text."""
+        query_embedding = text_embedder(text)
+        if query_embedding is not None and len(query_embedding) > 0:
+            return self.similarity_search_by_vector(query_embedding, k, **kwargs)
+        return []
+
+    @property
+    def dimensions(self) -> int:
+        """The dimensions of the stored vectors, 0 while the store is empty."""
+        if self._chunks:
+            return self._chunks[0].shape[1]
+        return self.matrix.shape[1] if self._ids else 0
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """The read-only matrix of unit length vectors, one row per document."""
+        if self._matrix is None:
+            if self.memory_map and self.directory is not None:
+                self._matrix = self._read_vectors()
+            else:
+                if len(self._chunks) != 1:
+                    self._chunks = [
+                        np.concatenate(self._chunks)
+                        if self._chunks
+                        else np.empty((0, 0), dtype=np.float32)
+                    ]
+                self._matrix = self._chunks[0]
+                self._matrix.flags.writeable = False
+        return self._matrix
+
+    def _search(
+        self, queries: np.ndarray, k: int, include_vectors: bool
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Find the k most similar documents of each query, best first."""
+        if len(self._ids) == 0 or k <= 0:
+            return [[] for _ in queries]
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries = np.divide(queries, norms, out=np.zeros_like(queries), where=norms > 0)
+        mask: np.ndarray | None = self.query_filter
+        matrix = self.matrix
+
+        rows: np.ndarray | None = None
+        if mask is not None and mask.sum() < _GATHER_FRACTION * len(mask):
+            rows = np.flatnonzero(mask)
+        elif self._use_index():
+            return [
+                self._to_results(*self._index_top_k(query, k, mask), include_vectors)
+                for query in queries
+            ]
+
+        if rows is not None:
+            scores = queries @ matrix[rows].T
+        else:
+            scores = queries @ matrix.T
+            if mask is not None:
+                scores[:, ~mask] = -np.inf
+                k = min(k, int(mask.sum()))
+        results = []
+        for query_scores in scores:
+            top = _top_k(query_scores, k)
+            positions = rows[top] if rows is not None else top
+            results.append(
+                self._to_results(positions, query_scores[top], include_vectors)
+            )
+        return results
+
+    def _use_index(self) -> bool:
+        if self.index_type != "ivf" or len(self._ids) < self.ivf_min_size:
+            return False
+        if self._index is None:
+            self._index = _build_ivf_index(
+                self.matrix, self.ivf_lists or int(np.sqrt(len(self._ids)))
+            )
+        return True
+
+    def _index_top_k(
+        self, query: np.ndarray, k: int, mask: np.ndarray | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        rows = self._index.candidates(query, self.ivf_probes)  # type: ignore
+        if mask is not None:
+            rows = rows[mask[rows]]
+        scores = self.matrix[rows] @ query
+        top = _top_k(scores, k)
+        return rows[top], scores[top]
+
+    def _to_results(
+        self, positions: np.ndarray, scores: np.ndarray, include_vectors: bool
+    ) -> list[VectorStoreSearchResult]:
+        matrix = self.matrix
+        return [
+            VectorStoreSearchResult(
+                document=VectorStoreDocument(
+                    id=self._ids[position],
+                    text=self._texts[position],
+                    vector=(matrix[position] * self._norms[position]).tolist()
+                    if include_vectors
+                    else None,
+                    attributes=self._attributes[position],
+                ),
+                score=float(score),
+            )
+            for position, score in zip(positions.tolist(), scores.tolist(), strict=True)
+        ]
+
+    def _write(
+        self,
+        documents: list[VectorStoreDocument],
+        vectors: np.ndarray,
+        norms: np.ndarray,
+        overwrite: bool,
+    ) -> None:
+        directory: Path = self.directory  # type: ignore
+        directory.mkdir(parents=True, exist_ok=True)
+        mode = "w" if overwrite else "a"
+        with (directory / VECTORS_FILE).open(f"{mode}b") as file:
+            file.write(vectors.tobytes())
+        with (directory / DOCUMENTS_FILE).open(mode, encoding="utf-8") as file:
+            file.writelines(
+                json.dumps({
+                    "id": document.id,
+                    "text": document.text,
+                    "attributes": document.attributes,
+                    "norm": norm,
+                })
+                + "\n"
+                for document, norm in zip(documents, norms.tolist(), strict=True)
+            )
+
+    def _read_documents(self) -> None:
+        directory: Path = self.directory  # type: ignore
+        with (directory / DOCUMENTS_FILE).open(encoding="utf-8") as file:
+            for line in file:
+                document = json.loads(line)
+                self._ids.append(document["id"])
+                self._texts.append(document["text"])
+                self._attributes.append(document["attributes"])
+                self._norms.append(document["norm"])
+
+    def _read_vectors(self) -> np.ndarray:
+        path = self.directory / VECTORS_FILE  # type: ignore
+        count = len(self._ids)
+        dimensions = path.stat().st_size // (4 * count) if count else 0
+        if count == 0:
+            return np.empty((0, 0), dtype=np.float32)
+        if self.memory_map:
+            return np.memmap(
+                path, dtype=np.float32, mode="r", shape=(count, dimensions)
+            )
+        vectors = np.fromfile(path, dtype=np.float32).reshape(count, dimensions)
+        vectors.flags.writeable = False
+        return vectors
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Get the positions of the k highest scores, best first and ties by position."""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    top = np.argpartition(-scores, k - 1)[:k] if k < len(scores) else np.arange(k)
+    return top[np.lexsort((top, -scores[top]))]
+
+
+def _build_ivf_index(matrix: np.ndarray, lists: int, seed: int = 0) -> _IvfIndex:
+    """Cluster the rows with spherical k-means on a sample and group them by centroid."""
+    rng = np.random.default_rng(seed)
+    lists = max(1, min(lists, len(matrix)))
+    samples = min(len(matrix), lists * _KMEANS_SAMPLES_PER_LIST)
+    sample = matrix[np.sort(rng.choice(len(matrix), samples, replace=False))]
+    centroids = sample[rng.choice(samples, lists, replace=False)].copy()
+    for _ in range(_KMEANS_ITERATIONS):
+        assignments = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, sample)
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        # empty lists keep their previous centroid
+        centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+
+    assignments = np.concatenate([
+        np.argmax(matrix[start : start + _ASSIGN_BATCH_SIZE] @ centroids.T, axis=1)
+        for start in range(0, len(matrix), _ASSIGN_BATCH_SIZE)
+    ])
+    order = np.argsort(assignments, kind="stable")
+    offsets = np.concatenate([
+        [0],
+        np.cumsum(np.bincount(assignments, minlength=lists)),
+    ])
+    return _IvfIndex(centroids=centroids, order=order, offsets=offsets)
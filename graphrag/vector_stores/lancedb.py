@@ -127,6 +127,13 @@ class LanceDBVectorStore(BaseVectorStore):
             for doc in docs
         ]
 
+    def similarity_search_by_vectors(
+        self, query_embeddings: list[list[float]], k: int = 10, **kwargs: Any
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform a vector-based similarity search for a batch of vectors."""
+        # one query searches one vector, so the searches are issued concurrently
+        return self._search_concurrently(query_embeddings, k, **kwargs)
+
     def similarity_search_by_text(
         self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
     ) -> list[VectorStoreSearchResult]:
@@ -0,0 +1,84 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+"""Benchmark of the clustering strategies over a synthetic forest of components.
+
+Run with `python -m tests.benchmarks.benchmark_cluster_graph`. The graph is made of
+`--components` loosely linked cave graphs, and is clustered without the largest connected
+component restriction, so every component is clustered. The `leidenalg` strategy is only
+timed if the igraph and leidenalg packages are installed.
+"""
+
+import argparse
+import importlib.util
+import os
+import time
+
+import networkx as nx
+
+from graphrag.index.operations.cluster_graph import (
+    GraphCommunityStrategyType,
+    run_layout,
+)
+
+
+def make_forest(components: int, nodes: int, seed: int) -> nx.Graph:
+    graph = nx.Graph()
+    for i in range(components):
+        caves = nx.relaxed_caveman_graph(max(nodes // 20, 1), 20, 0.15, seed=seed + i)
+        graph.update(nx.relabel_nodes(caves, {n: f"C{i}_{n}" for n in caves}))
+    return graph
+
+
+def _time(strategy: dict, graph: nx.Graph, repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    communities = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        communities = run_layout(strategy, graph)
+        best = min(best, time.perf_counter() - start)
+    return best, len(communities)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--components", type=int, default=32)
+    parser.add_argument("--nodes", type=int, default=2_000)
+    parser.add_argument("--max-cluster-size", type=int, default=10)
+    parser.add_argument(
+        "--processes", type=int, nargs="+", default=[1, os.cpu_count() or 1]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    graph = make_forest(args.components, args.nodes, seed=0)
+    print(
+        f"{graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges, "
+        f"{args.components} components"
+    )
+
+    base = {"max_cluster_size": args.max_cluster_size, "use_lcc": False}
+    runs = [("leiden", {**base, "type": GraphCommunityStrategyType.leiden})]
+    strategy_types = [GraphCommunityStrategyType.parallel_leiden]
+    if importlib.util.find_spec("leidenalg") is not None:
+        strategy_types.append(GraphCommunityStrategyType.leidenalg)
+    for strategy_type in strategy_types:
+        runs.extend(
+            (
+                f"{strategy_type.value} x{processes}",
+                {**base, "type": strategy_type, "num_processes": processes},
+            )
+            for processes in dict.fromkeys(args.processes)
+        )
+
+    print(f"{'strategy':>22} {'time':>10} {'communities':>12} {'speedup':>9}")
+    baseline = None
+    for name, strategy in runs:
+        elapsed, communities = _time(strategy, graph, args.repeat)
+        baseline = baseline or elapsed
+        print(
+            f"{name:>22} {elapsed:>9.3f}s {communities:>12} {baseline / elapsed:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
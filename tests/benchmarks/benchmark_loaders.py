@@ -0,0 +1,85 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+"""Load-time benchmark for the DataFrame to model loaders over synthetic entities.
+
+Run with `python -m tests.benchmarks.benchmark_loaders`. The legacy implementation
+converts row by row with `iterrows`, so it is only timed up to `--legacy-max` rows.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from graphrag.query.input.loaders.dfs import read_entities
+from tests.unit.query.input.loaders.test_dfs import legacy_read_entities
+
+COLUMNS = {
+    "short_id_col": "human_readable_id",
+    "community_col": "community",
+    "rank_col": "rank",
+    "name_embedding_col": None,
+    "graph_embedding_col": None,
+    "document_ids_col": None,
+}
+
+
+def make_entities(size: int, dimensions: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    embeddings = rng.random((size, dimensions))
+    return pd.DataFrame({
+        "id": [f"entity-{i}" for i in range(size)],
+        "human_readable_id": np.arange(size),
+        "title": [f"ENTITY_{i}" for i in range(size)],
+        "type": rng.choice(["person", "organization", "geo"], size),
+        "description": [f"description of entity {i}" for i in range(size)],
+        "description_embedding": list(embeddings),
+        "community": [[str(i % 100)] for i in range(size)],
+        "text_unit_ids": [[f"unit-{i % 1_000}"] for i in range(size)],
+        "rank": rng.integers(0, 50, size).astype(float),
+    })
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--dimensions", type=int, default=1536)
+    parser.add_argument("--legacy-max", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'eager':>10} {'lazy':>10} {'legacy':>10} {'speedup':>9}")
+    for size in args.sizes:
+        entities = make_entities(size, args.dimensions, seed=size)
+        eager = _time(lambda: read_entities(entities, **COLUMNS), args.repeat)  # noqa: B023
+        lazy = _time(
+            lambda: read_entities(entities, lazy=True, **COLUMNS),  # noqa: B023
+            args.repeat,
+        )
+        if size <= args.legacy_max:
+            legacy = _time(
+                lambda: legacy_read_entities(entities, **COLUMNS),  # noqa: B023
+                args.repeat,
+            )
+            print(
+                f"{size:>8} {eager:>9.3f}s {lazy:>9.3f}s {legacy:>9.3f}s"
+                f" {legacy / lazy:>8.1f}x"
+            )
+        else:
+            print(f"{size:>8} {eager:>9.3f}s {lazy:>9.3f}s {'-':>10} {'-':>9}")
+
+
+if __name__ == "__main__":
+    main()
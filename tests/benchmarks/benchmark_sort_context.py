@@ -0,0 +1,58 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+"""Micro-benchmark for sort_context over synthetic communities.
+
+Run with `python -m tests.benchmarks.benchmark_sort_context`. The legacy implementation
+re-renders the whole context for every edge, so it is only timed up to `--legacy-max`
+edges.
+"""
+
+import argparse
+import time
+
+from graphrag.index.graph.extractors.community_reports import sort_context
+from tests.unit.indexing.graph.extractors.community_reports.test_sort_context import (
+    legacy_sort_context,
+    make_community,
+)
+
+
+def _time(fn, community: list[dict], max_tokens: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(community, max_tokens=max_tokens)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 100, 1_000, 10_000]
+    )
+    parser.add_argument("--max-tokens", type=int, default=16_000)
+    parser.add_argument("--legacy-max", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'edges':>8} {'sort_context':>14} {'legacy':>14} {'speedup':>9}")
+    for size in args.sizes:
+        community = make_community(size, seed=size)
+        current = _time(sort_context, community, args.max_tokens, args.repeat)
+        if size <= args.legacy_max:
+            expected = legacy_sort_context(community, max_tokens=args.max_tokens)
+            actual = sort_context(community, max_tokens=args.max_tokens)
+            if actual != expected:
+                msg = f"sort_context output differs from legacy for {size} edges"
+                raise AssertionError(msg)
+            legacy = _time(legacy_sort_context, community, args.max_tokens, args.repeat)
+            print(
+                f"{size:>8} {current:>13.4f}s {legacy:>13.4f}s {legacy / current:>8.1f}x"
+            )
+        else:
+            print(f"{size:>8} {current:>13.4f}s {'-':>14} {'-':>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+import os
+from io import BytesIO
+from typing import Any
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+import graphrag.api.query_session as query_session
+from graphrag.api import QuerySession
+from graphrag.config import create_graphrag_config
+from graphrag.index.storage import MemoryPipelineStorage
+from graphrag.query.structured_search.base import SearchResult
+
+DATA_DIR = "tests/verbs/data"
+
+
+class FakeSearch:
+    def __init__(self, search_type: str, response_type: str, **data: Any):
+        self.search_type = search_type
+        self.response_type = response_type
+        self.context_builder = object()
+        self.data = data
+
+    async def asearch(self, query: str) -> SearchResult:
+        await asyncio.sleep(0)
+        return SearchResult(
+            response=f"{self.search_type}:{self.response_type}:{query}",
+            context_data={"entities": pd.DataFrame({"id": ["1", "2"]})},
+            context_text="",
+            completion_time=0,
+            llm_calls=1,
+            prompt_tokens=1,
+        )
+
+    async def astream_search(self, query: str):
+        yield {"entities": pd.DataFrame({"id": ["1"]})}
+        for token in query.split():
+            yield token
+
+
+@pytest.fixture
+def engines(monkeypatch) -> list[FakeSearch]:
+    created: list[FakeSearch] = []
+
+    def local_engine(**kwargs: Any) -> FakeSearch:
+        engine = FakeSearch("local", **kwargs)
+        created.append(engine)
+        return engine
+
+    def global_engine(config: Any, **kwargs: Any) -> FakeSearch:
+        engine = FakeSearch("global", **kwargs)
+        created.append(engine)
+        return engine
+
+    monkeypatch.setattr(query_session, "get_local_search_engine", local_engine)
+    monkeypatch.setattr(query_session, "get_global_search_engine", global_engine)
+    monkeypatch.setattr(
+        query_session, "_create_description_embedding_store", lambda config: None
+    )
+    return created
+
+
+def _config():
+    with mock.patch.dict(os.environ, {"GRAPHRAG_API_KEY": "test"}, clear=True):
+        return create_graphrag_config()
+
+
+def _parquet(table: pd.DataFrame) -> bytes:
+    buffer = BytesIO()
+    table.to_parquet(buffer)
+    return buffer.getvalue()
+
+
+async def _storage(nodes: pd.DataFrame | None = None) -> MemoryPipelineStorage:
+    storage = MemoryPipelineStorage()
+    if nodes is None:
+        nodes = pd.read_parquet(f"{DATA_DIR}/create_final_nodes.parquet")
+    entities = (
+        nodes.drop_duplicates(subset=["title"])
+        .rename(columns={"title": "name", "source_id": "text_unit_ids"})
+        .loc[:, ["id", "name", "type", "description", "human_readable_id"]]
+    )
+    entities["text_unit_ids"] = [[] for _ in range(len(entities))]
+    entities["description_embedding"] = None
+    await storage.set("create_final_nodes.parquet", _parquet(nodes))
+    await storage.set("create_final_entities.parquet", _parquet(entities))
+    for name in [
+        "create_final_community_reports",
+        "create_final_text_units",
+        "create_final_relationships",
+    ]:
+        await storage.set(
+            f"{name}.parquet", _parquet(pd.read_parquet(f"{DATA_DIR}/{name}.parquet"))
+        )
+    return storage
+
+
+async def test_searches_share_the_loaded_index(engines):
+    session = await QuerySession.create(
+        _config(), response_type="List", storage=await _storage()
+    )
+    assert session.loaded
+    assert [engine.search_type for engine in engines] == ["local", "global"]
+    local_engine, global_engine = engines
+    assert len(local_engine.data["entities"]) > 0
+    assert len(local_engine.data["relationships"]) > 0
+    assert local_engine.data["covariates"] == {"claims": []}
+    # each engine gets its own reports, so global weights do not leak into local context
+    assert local_engine.data["reports"] is not global_engine.data["reports"]
+
+    results = await asyncio.gather(
+        *[session.local_search(f"query {i}") for i in range(10)],
+        session.global_search("query"),
+    )
+    assert [response for response, _ in results[:10]] == [
+        f"local:List:query {i}" for i in range(10)
+    ]
+    assert results[10][0] == "global:List:query"
+    assert results[0][1]["entities"] == [{"id": "1"}, {"id": "2"}]
+    assert results[0][1]["reports"] == []
+    # no engine was built per query
+    assert len(engines) == 2
+
+
+async def test_response_type_override_shares_the_engine(engines):
+    session = await QuerySession.create(
+        _config(), response_type="List", storage=await _storage()
+    )
+    response, _ = await session.local_search("query", response_type="Single Sentence")
+    assert response == "local:Single Sentence:query"
+    response, _ = await session.local_search("query")
+    assert response == "local:List:query"
+    assert len(engines) == 2
+
+
+async def test_streaming(engines):
+    session = await QuerySession.create(_config(), storage=await _storage())
+    chunks = [chunk async for chunk in session.global_search_streaming("a b c")]
+    assert chunks[0]["entities"] == [{"id": "1"}]
+    assert chunks[1:] == ["a", "b", "c"]
+
+
+async def test_reload_swaps_in_the_new_index(engines):
+    nodes = pd.read_parquet(f"{DATA_DIR}/create_final_nodes.parquet")
+    storage = await _storage(nodes)
+    await storage.set(
+        "create_final_covariates.parquet",
+        _parquet(pd.read_parquet(f"{DATA_DIR}/create_final_covariates.parquet")),
+    )
+    session = await QuerySession.create(_config(), storage=storage)
+    first_entities = engines[0].data["entities"]
+    assert len(engines[0].data["covariates"]["claims"]) > 0
+
+    # a new index version with fewer entities lands
+    new_storage = await _storage(nodes[nodes.title.isin(nodes.title.unique()[:10])])
+    session._storage = new_storage  # noqa: SLF001
+    await session.reload()
+
+    assert len(engines) == 4
+    assert len(engines[2].data["entities"]) < len(first_entities)
+    assert engines[2].data["covariates"] == {"claims": []}
+
+
+async def test_search_before_load_raises(engines):
+    session = QuerySession(_config())
+    assert not session.loaded
+    with pytest.raises(ValueError, match="has not been loaded"):
+        await session.local_search("query")
@@ -51,6 +51,8 @@ from graphrag.config import (
     StorageConfig,
     StorageConfigInput,
     StorageType,
+    StreamingConfig,
+    StreamingConfigInput,
     SummarizeDescriptionsConfig,
     SummarizeDescriptionsConfigInput,
     TextEmbeddingConfig,
@@ -94,11 +96,17 @@ ALL_ENV_VARS = {
     "GRAPHRAG_CLAIM_EXTRACTION_MAX_GLEANINGS": "5000",
     "GRAPHRAG_CLAIM_EXTRACTION_PROMPT_FILE": "tests/unit/config/prompt-a.txt",
     "GRAPHRAG_CLAIM_EXTRACTION_ENCODING_MODEL": "encoding_a",
+    "GRAPHRAG_COMMUNITY_REPORTS_INCREMENTAL": "True",
     "GRAPHRAG_COMMUNITY_REPORTS_MAX_LENGTH": "23456",
     "GRAPHRAG_COMMUNITY_REPORTS_PROMPT_FILE": "tests/unit/config/prompt-b.txt",
     "GRAPHRAG_EMBEDDING_BATCH_MAX_TOKENS": "17",
     "GRAPHRAG_EMBEDDING_BATCH_SIZE": "1000000",
     "GRAPHRAG_EMBEDDING_CONCURRENT_REQUESTS": "12",
+    "GRAPHRAG_EMBEDDING_ADAPTIVE_CONCURRENCY": "true",
+    "GRAPHRAG_EMBEDDING_MIN_CONCURRENT_REQUESTS": "2",
+    "GRAPHRAG_EMBEDDING_MAX_CONCURRENT_REQUESTS": "24",
+    "GRAPHRAG_EMBEDDING_ENDPOINT_EJECT_AFTER": "4",
+    "GRAPHRAG_EMBEDDING_ENDPOINT_EJECT_SECONDS": "7.5",
     "GRAPHRAG_EMBEDDING_DEPLOYMENT_NAME": "model-deployment-name",
     "GRAPHRAG_EMBEDDING_MAX_RETRIES": "3",
     "GRAPHRAG_EMBEDDING_MAX_RETRY_WAIT": "0.1123",
@@ -130,7 +138,13 @@ ALL_ENV_VARS = {
     "GRAPHRAG_INPUT_TIMESTAMP_FORMAT": "test_format",
     "GRAPHRAG_INPUT_TITLE_COLUMN": "test_title",
     "GRAPHRAG_INPUT_FILE_TYPE": "text",
+    "GRAPHRAG_MAX_PARALLEL_WORKFLOWS": "3",
     "GRAPHRAG_LLM_CONCURRENT_REQUESTS": "12",
+    "GRAPHRAG_LLM_ADAPTIVE_CONCURRENCY": "true",
+    "GRAPHRAG_LLM_MIN_CONCURRENT_REQUESTS": "3",
+    "GRAPHRAG_LLM_MAX_CONCURRENT_REQUESTS": "48",
+    "GRAPHRAG_LLM_ENDPOINT_EJECT_AFTER": "5",
+    "GRAPHRAG_LLM_ENDPOINT_EJECT_SECONDS": "12.5",
     "GRAPHRAG_LLM_DEPLOYMENT_NAME": "model-deployment-name-x",
     "GRAPHRAG_LLM_MAX_RETRIES": "312",
     "GRAPHRAG_LLM_MAX_RETRY_WAIT": "0.1122",
@@ -161,6 +175,8 @@ ALL_ENV_VARS = {
     "GRAPHRAG_SNAPSHOT_GRAPHML": "true",
     "GRAPHRAG_SNAPSHOT_RAW_ENTITIES": "true",
     "GRAPHRAG_SNAPSHOT_TOP_LEVEL_NODES": "true",
+    "GRAPHRAG_STREAMING_ENABLED": "true",
+    "GRAPHRAG_STREAMING_BATCH_SIZE": "250",
     "GRAPHRAG_STORAGE_STORAGE_ACCOUNT_BLOB_URL": "storage_account_blob_url",
     "GRAPHRAG_STORAGE_BASE_DIR": "/some/storage/dir",
     "GRAPHRAG_STORAGE_CONNECTION_STRING": "test_cs",
@@ -168,6 +184,11 @@ ALL_ENV_VARS = {
     "GRAPHRAG_STORAGE_TYPE": "blob",
     "GRAPHRAG_SUMMARIZE_DESCRIPTIONS_MAX_LENGTH": "12345",
     "GRAPHRAG_SUMMARIZE_DESCRIPTIONS_PROMPT_FILE": "tests/unit/config/prompt-d.txt",
+    "GRAPHRAG_SUMMARIZE_DESCRIPTIONS_TREE_REDUCE": "True",
+    "GRAPHRAG_SUMMARIZE_DESCRIPTIONS_FAN_OUT": "8",
+    "GRAPHRAG_SUMMARIZE_DESCRIPTIONS_BATCHED": "True",
+    "GRAPHRAG_SUMMARIZE_DESCRIPTIONS_BATCH_MAX_TOKENS": "3000",
+    "GRAPHRAG_SUMMARIZE_DESCRIPTIONS_BATCH_SIZE": "16",
     "GRAPHRAG_LLM_TEMPERATURE": "0.0",
     "GRAPHRAG_LLM_TOP_P": "1.0",
     "GRAPHRAG_UMAP_ENABLED": "true",
@@ -211,6 +232,7 @@ class TestDefaultConfig(unittest.TestCase):
         assert ReportingConfig is not None
         assert SnapshotsConfig is not None
         assert StorageConfig is not None
+        assert StreamingConfig is not None
         assert SummarizeDescriptionsConfig is not None
         assert TextEmbeddingConfig is not None
         assert UmapConfig is not None
@@ -547,6 +569,7 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.claim_extraction.prompt == "tests/unit/config/prompt-a.txt"
         assert parameters.claim_extraction.encoding_model == "encoding_a"
         assert parameters.cluster_graph.max_cluster_size == 123
+        assert parameters.community_reports.incremental
         assert parameters.community_reports.max_length == 23456
         assert parameters.community_reports.prompt == "tests/unit/config/prompt-b.txt"
         assert parameters.embed_graph.enabled
@@ -558,6 +581,11 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.embeddings.batch_max_tokens == 17
         assert parameters.embeddings.batch_size == 1_000_000
         assert parameters.embeddings.llm.concurrent_requests == 12
+        assert parameters.embeddings.llm.adaptive_concurrency
+        assert parameters.embeddings.llm.min_concurrent_requests == 2
+        assert parameters.embeddings.llm.max_concurrent_requests == 24
+        assert parameters.embeddings.llm.endpoint_eject_after == 4
+        assert parameters.embeddings.llm.endpoint_eject_seconds == 7.5
         assert parameters.embeddings.llm.deployment_name == "model-deployment-name"
         assert parameters.embeddings.llm.max_retries == 3
         assert parameters.embeddings.llm.max_retry_wait == 0.1123
@@ -593,7 +621,13 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.llm.api_base == "http://some/base"
         assert parameters.llm.api_key == "test"
         assert parameters.llm.api_version == "v1234"
+        assert parameters.max_parallel_workflows == 3
         assert parameters.llm.concurrent_requests == 12
+        assert parameters.llm.adaptive_concurrency
+        assert parameters.llm.min_concurrent_requests == 3
+        assert parameters.llm.max_concurrent_requests == 48
+        assert parameters.llm.endpoint_eject_after == 5
+        assert parameters.llm.endpoint_eject_seconds == 12.5
         assert parameters.llm.deployment_name == "model-deployment-name-x"
         assert parameters.llm.max_retries == 312
         assert parameters.llm.max_retry_wait == 0.1122
@@ -624,12 +658,19 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.snapshots.graphml
         assert parameters.snapshots.raw_entities
         assert parameters.snapshots.top_level_nodes
+        assert parameters.streaming.enabled
+        assert parameters.streaming.batch_size == 250
         assert parameters.storage.storage_account_blob_url == "storage_account_blob_url"
         assert parameters.storage.base_dir == "/some/storage/dir"
         assert parameters.storage.connection_string == "test_cs"
         assert parameters.storage.container_name == "test_cn"
         assert parameters.storage.type == StorageType.blob
         assert parameters.summarize_descriptions.max_length == 12345
+        assert parameters.summarize_descriptions.tree_reduce
+        assert parameters.summarize_descriptions.fan_out == 8
+        assert parameters.summarize_descriptions.batched
+        assert parameters.summarize_descriptions.batch_max_tokens == 3000
+        assert parameters.summarize_descriptions.batch_size == 16
         assert (
             parameters.summarize_descriptions.prompt == "tests/unit/config/prompt-d.txt"
         )
@@ -717,18 +758,26 @@ class TestDefaultConfig(unittest.TestCase):
                     raw_entities=True,
                     top_level_nodes=True,
                 ),
+                streaming=StreamingConfigInput(enabled=True, batch_size=250),
                 entity_extraction=EntityExtractionConfigInput(
                     max_gleanings=112,
                     entity_types=["cat", "dog", "elephant"],
                     prompt="entity_extraction_prompt_file.txt",
                 ),
                 summarize_descriptions=SummarizeDescriptionsConfigInput(
-                    max_length=12345, prompt="summarize_prompt_file.txt"
+                    max_length=12345,
+                    prompt="summarize_prompt_file.txt",
+                    tree_reduce=True,
+                    fan_out=8,
+                    batched=True,
+                    batch_max_tokens=3000,
+                    batch_size=16,
                 ),
                 community_reports=CommunityReportsConfigInput(
                     max_length=23456,
                     prompt="community_report_prompt_file.txt",
                     max_input_length=12345,
+                    incremental=True,
                 ),
                 claim_extraction=ClaimExtractionConfigInput(
                     description="test 123",
@@ -757,6 +806,7 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.claim_extraction.max_gleanings == 5000
         assert parameters.claim_extraction.prompt == "claim_extraction_prompt_file.txt"
         assert parameters.cluster_graph.max_cluster_size == 123
+        assert parameters.community_reports.incremental
         assert parameters.community_reports.max_input_length == 12345
         assert parameters.community_reports.max_length == 23456
         assert parameters.community_reports.prompt == "community_report_prompt_file.txt"
@@ -803,6 +853,8 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.snapshots.graphml
         assert parameters.snapshots.raw_entities
         assert parameters.snapshots.top_level_nodes
+        assert parameters.streaming.enabled
+        assert parameters.streaming.batch_size == 250
         assert parameters.storage.base_dir == "/some/storage/dir"
         assert parameters.storage.connection_string == "test_cs"
         assert parameters.storage.container_name == "test_cn"
@@ -810,6 +862,11 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.storage.storage_account_blob_url == "storage_account_blob_url"
         assert parameters.summarize_descriptions.max_length == 12345
         assert parameters.summarize_descriptions.prompt == "summarize_prompt_file.txt"
+        assert parameters.summarize_descriptions.tree_reduce
+        assert parameters.summarize_descriptions.fan_out == 8
+        assert parameters.summarize_descriptions.batched
+        assert parameters.summarize_descriptions.batch_max_tokens == 3000
+        assert parameters.summarize_descriptions.batch_size == 16
         assert parameters.umap.enabled
 
     @mock.patch.dict(
@@ -828,6 +885,30 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.chunks.size == defs.CHUNK_SIZE
         assert parameters.claim_extraction.description == defs.CLAIM_DESCRIPTION
         assert parameters.claim_extraction.max_gleanings == defs.CLAIM_MAX_GLEANINGS
+        assert (
+            parameters.community_reports.incremental
+            == defs.COMMUNITY_REPORT_INCREMENTAL
+        )
+        assert (
+            parameters.summarize_descriptions.tree_reduce
+            == defs.SUMMARIZE_DESCRIPTIONS_TREE_REDUCE
+        )
+        assert (
+            parameters.summarize_descriptions.fan_out
+            == defs.SUMMARIZE_DESCRIPTIONS_FAN_OUT
+        )
+        assert (
+            parameters.summarize_descriptions.batched
+            == defs.SUMMARIZE_DESCRIPTIONS_BATCHED
+        )
+        assert (
+            parameters.summarize_descriptions.batch_max_tokens
+            == defs.SUMMARIZE_DESCRIPTIONS_BATCH_MAX_TOKENS
+        )
+        assert (
+            parameters.summarize_descriptions.batch_size
+            == defs.SUMMARIZE_DESCRIPTIONS_BATCH_SIZE
+        )
         assert (
             parameters.community_reports.max_input_length
             == defs.COMMUNITY_REPORT_MAX_INPUT_LENGTH
@@ -866,6 +947,11 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.input.text_column == defs.INPUT_TEXT_COLUMN
         assert parameters.input.file_type == defs.INPUT_FILE_TYPE
         assert parameters.llm.concurrent_requests == defs.LLM_CONCURRENT_REQUESTS
+        assert not parameters.llm.adaptive_concurrency
+        assert parameters.max_parallel_workflows == defs.MAX_PARALLEL_WORKFLOWS
+        assert parameters.llm.endpoints is None
+        assert parameters.llm.endpoint_eject_after == defs.LLM_ENDPOINT_EJECT_AFTER
+        assert parameters.llm.endpoint_eject_seconds == defs.LLM_ENDPOINT_EJECT_SECONDS
         assert parameters.llm.max_retries == defs.LLM_MAX_RETRIES
         assert parameters.llm.max_retry_wait == defs.LLM_MAX_RETRY_WAIT
         assert parameters.llm.max_tokens == defs.LLM_MAX_TOKENS
@@ -894,6 +980,8 @@ class TestDefaultConfig(unittest.TestCase):
         assert parameters.snapshots.graphml == defs.SNAPSHOTS_GRAPHML
         assert parameters.snapshots.raw_entities == defs.SNAPSHOTS_RAW_ENTITIES
         assert parameters.snapshots.top_level_nodes == defs.SNAPSHOTS_TOP_LEVEL_NODES
+        assert parameters.streaming.enabled == defs.STREAMING_ENABLED
+        assert parameters.streaming.batch_size == defs.STREAMING_BATCH_SIZE
         assert parameters.storage.base_dir == defs.STORAGE_BASE_DIR
         assert parameters.storage.type == defs.STORAGE_TYPE
         assert parameters.umap.enabled == defs.UMAP_ENABLED
@@ -923,6 +1011,34 @@ class TestDefaultConfig(unittest.TestCase):
         strategy = config.summarize_descriptions.resolved_strategy(".")
         assert strategy["summarize_prompt"] == "Hello, World! D"
 
+    @mock.patch.dict(
+        os.environ,
+        {"GRAPHRAG_API_KEY": "test"},
+        clear=True,
+    )
+    def test_llm_endpoints(self):
+        config = create_graphrag_config({
+            "llm": {
+                "endpoints": [
+                    {"api_base": "http://east", "weight": 2},
+                    {"api_base": "http://west", "tokens_per_minute": 1000},
+                ]
+            },
+            "embeddings": {
+                "llm": {"endpoints": [{"api_base": "http://embeddings"}]},
+            },
+        })
+        east, west = config.llm.endpoints or []
+        assert (east.api_base, east.weight) == ("http://east", 2)
+        assert (west.api_base, west.weight) == ("http://west", defs.LLM_ENDPOINT_WEIGHT)
+        assert west.tokens_per_minute == 1000
+        # the workflows inherit the endpoints of the root LLM
+        assert config.entity_extraction.llm.endpoints == config.llm.endpoints
+        assert [e.api_base for e in config.embeddings.llm.endpoints or []] == [
+            "http://embeddings"
+        ]
+        assert config.llm.model_dump()["endpoints"][0]["api_base"] == "http://east"
+
 
 @mock.patch.dict(
     os.environ,
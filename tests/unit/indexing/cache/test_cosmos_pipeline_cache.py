@@ -0,0 +1,147 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, cast
+
+import pytest
+from azure.cosmos.exceptions import CosmosResourceNotFoundError
+
+import graphrag.index.cache.cosmos_pipeline_cache as cosmos_pipeline_cache
+from graphrag.index.cache.cosmos_pipeline_cache import (
+    WRITE_BEHIND_BATCH_SIZE,
+    CosmosPipelineCache,
+)
+from graphrag.index.storage import PipelineStorage
+
+
+class MockContainer:
+    def __init__(self):
+        self.items: dict[str, dict[str, Any]] = {}
+
+    def read_item(self, item: str, partition_key: str):
+        if item not in self.items:
+            raise CosmosResourceNotFoundError(status_code=404, message="not found")
+        return self.items[item]
+
+    def upsert_item(self, body: dict[str, Any]):
+        self.items[body["id"]] = body
+        return body
+
+    def delete_item(self, item: str, partition_key: str):
+        self.read_item(item, partition_key)
+        del self.items[item]
+
+
+class MockCosmosStorage:
+    _db = None
+
+    def __init__(self):
+        self.container = MockContainer()
+        self._executor = ThreadPoolExecutor(max_workers=4)
+
+    def get_client(self, container_name: str, create_if_not_exists: bool = True):
+        return self.container
+
+    async def run_in_executor(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+
+def create_cache(write_behind: bool) -> tuple[CosmosPipelineCache, MockContainer]:
+    storage = MockCosmosStorage()
+    cache = CosmosPipelineCache(
+        cast(PipelineStorage, storage), write_behind=write_behind
+    )
+    return cache, storage.container
+
+
+async def test_has_is_false_for_missing_keys():
+    cache, _ = create_cache(write_behind=False)
+
+    assert not await cache.has("missing")
+
+
+async def test_write_through_upserts_immediately():
+    cache, container = create_cache(write_behind=False)
+
+    await cache.set("key", {"result": "value"})
+
+    assert container.items["key"]["value"] == {"result": "value"}
+    assert await cache.get("key") == {"result": "value"}
+
+
+async def test_write_behind_serves_pending_writes_and_flushes():
+    cache, container = create_cache(write_behind=True)
+
+    await cache.set("key", "value")
+
+    assert "key" not in container.items
+    assert await cache.get("key") == "value"
+    assert await cache.has("key")
+
+    await cache.flush()
+
+    assert container.items["key"]["value"] == "value"
+    assert await cache.get("key") == "value"
+
+
+async def test_write_behind_flushes_full_batches_in_background():
+    cache, container = create_cache(write_behind=True)
+
+    for i in range(WRITE_BEHIND_BATCH_SIZE):
+        await cache.set(f"key-{i}", i)
+    for _ in range(100):
+        if len(container.items) == WRITE_BEHIND_BATCH_SIZE:
+            break
+        await asyncio.sleep(0.01)
+
+    assert len(container.items) == WRITE_BEHIND_BATCH_SIZE
+    await cache.flush()
+
+
+async def test_delete_drops_pending_writes():
+    cache, container = create_cache(write_behind=True)
+
+    await cache.set("key", "value")
+    await cache.delete("key")
+    await cache.flush()
+
+    assert "key" not in container.items
+    assert await cache.get("key") is None
+
+
+class FlakyContainer(MockContainer):
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+
+    def upsert_item(self, body: dict[str, Any]):
+        if self.failures > 0:
+            self.failures -= 1
+            msg = "upsert failed"
+            raise ValueError(msg)
+        return super().upsert_item(body)
+
+
+async def test_flush_retries_failed_writes(monkeypatch):
+    monkeypatch.setattr(cosmos_pipeline_cache, "FLUSH_RETRY_DELAY", 0)
+    cache, _ = create_cache(write_behind=True)
+    container = FlakyContainer(failures=2)
+    monkeypatch.setattr(cache, "_cache_client", container)
+
+    await cache.set("key", "value")
+    await cache.flush()
+
+    assert container.items["key"]["value"] == "value"
+
+
+async def test_flush_raises_when_writes_keep_failing(monkeypatch):
+    monkeypatch.setattr(cosmos_pipeline_cache, "FLUSH_RETRY_DELAY", 0)
+    cache, _ = create_cache(write_behind=True)
+    monkeypatch.setattr(cache, "_cache_client", FlakyContainer(failures=100))
+
+    await cache.set("key", "value")
+    with pytest.raises(RuntimeError, match="1 cache entries"):
+        await cache.flush()
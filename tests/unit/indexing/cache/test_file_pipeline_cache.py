@@ -74,3 +74,10 @@ class TestFilePipelineCache(unittest.IsolatedAsyncioTestCase):
         assert await self.cache.get("test1") == test1
         assert await self.cache.get("test2") == test2
         assert await self.cache.get("test3") == test3
+
+    async def test_get_many_and_set_many(self):
+        values = {f"key{i}": f"value{i}" for i in range(40)}
+        await self.cache.set_many(values)
+
+        keys = [*values, "missing"]
+        assert await self.cache.get_many(keys) == [*values.values(), None]
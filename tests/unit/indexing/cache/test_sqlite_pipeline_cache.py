@@ -0,0 +1,121 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+from pathlib import Path
+
+from graphrag.cli.cache import migrate_cache
+from graphrag.index.cache import JsonPipelineCache, SqlitePipelineCache, load_cache
+from graphrag.index.cache.sqlite_pipeline_cache import SQLITE_CACHE_FILENAME
+from graphrag.index.config.cache import PipelineSqliteCacheConfig
+from graphrag.index.storage import FilePipelineStorage
+
+
+async def test_get_set_has_delete(tmp_path: Path):
+    cache = SqlitePipelineCache(tmp_path / "cache.sqlite")
+    assert await cache.get("missing") is None
+    assert not await cache.has("missing")
+
+    await cache.set("key", {"text": "välue"}, debug_data={"input": "prompt"})
+    assert await cache.has("key")
+    assert await cache.get("key") == {"text": "välue"}
+    await cache.set("none", None)
+    assert not await cache.has("none")
+
+    await cache.set("key", "replaced")
+    assert await cache.get("key") == "replaced"
+    await cache.delete("key")
+    await cache.delete("key")
+    assert await cache.get("key") is None
+
+
+async def test_batched_get_and_set(tmp_path: Path):
+    cache = SqlitePipelineCache(tmp_path / "cache.sqlite")
+    values = {f"key-{i}": i for i in range(1_200)}
+    await cache.set_many({**values, "skipped": None})
+    keys = [*values, "missing", "key-7"]
+    assert await cache.get_many(keys) == [*values.values(), None, 7]
+    assert not await cache.has("skipped")
+
+
+async def test_children_share_the_database_with_prefixed_keys(tmp_path: Path):
+    cache = SqlitePipelineCache(tmp_path / "cache.sqlite")
+    extraction = cache.child("entity_extraction")
+    summaries = cache.child("summarize_descriptions")
+    await extraction.set("key", "extracted")
+    await summaries.set("key", "summarized")
+    await summaries.child("nested").set("key", "nested")
+
+    assert await extraction.get("key") == "extracted"
+    assert await summaries.get("key") == "summarized"
+    assert await cache.get("entity_extraction/key") == "extracted"
+    assert await cache.get("summarize_descriptions/nested/key") == "nested"
+
+    # clearing a child only removes its own (and its children's) entries
+    await summaries.clear()
+    assert await summaries.get("key") is None
+    assert await cache.get("summarize_descriptions/nested/key") is None
+    assert await extraction.get("key") == "extracted"
+    await cache.clear()
+    assert await extraction.get("key") is None
+
+
+async def test_persisted_and_compacted(tmp_path: Path):
+    path = tmp_path / "cache.sqlite"
+    cache = SqlitePipelineCache(path).child("llm")
+    await cache.set_many({f"key-{i}": "x" * 1_000 for i in range(500)})
+    await cache.set("kept", "value")
+    cache.close()
+
+    cache = SqlitePipelineCache(path).child("llm")
+    assert await cache.get("kept") == "value"
+    for i in range(500):
+        await cache.delete(f"key-{i}")
+    size = path.stat().st_size
+    cache.compact()
+    assert path.stat().st_size < size
+    assert await cache.get("kept") == "value"
+    cache.close()
+
+
+async def test_invalid_entries_are_dropped(tmp_path: Path):
+    cache = SqlitePipelineCache(tmp_path / "cache.sqlite")
+    cache._database.store([("broken", "{not json")])  # noqa: SLF001
+    assert await cache.has("broken")
+    assert await cache.get("broken") is None
+    assert not await cache.has("broken")
+
+
+async def test_import_json_cache(tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+    json_cache = JsonPipelineCache(FilePipelineStorage(str(cache_dir)))
+    await json_cache.child("entity_extraction").set(
+        "chat-1", "response", debug_data={"input": "prompt"}
+    )
+    await json_cache.child("text_embedding").set("embedding-1", [0.5, 0.25])
+    await json_cache.set("top", {"a": 1})
+    (cache_dir / "not_json").write_text("plain text", encoding="utf-8")
+
+    # the database lives next to the cache entries, as with the default configuration
+    sqlite_cache = SqlitePipelineCache(cache_dir / SQLITE_CACHE_FILENAME)
+    await sqlite_cache.set("existing", "value")
+    assert sqlite_cache.import_json_cache(cache_dir) == 3
+    assert await sqlite_cache.child("entity_extraction").get("chat-1") == "response"
+    assert await sqlite_cache.child("text_embedding").get("embedding-1") == [
+        0.5,
+        0.25,
+    ]
+    assert await sqlite_cache.get("top") == {"a": 1}
+    assert await sqlite_cache.get("existing") == "value"
+    sqlite_cache.close()
+
+
+async def test_migrate_cache_command_and_load_cache(tmp_path: Path):
+    json_cache = JsonPipelineCache(FilePipelineStorage(str(tmp_path / "cache")))
+    await json_cache.child("community_reporting").set("report-1", "report")
+
+    assert migrate_cache(tmp_path, compact=True) == 1
+
+    cache = load_cache(PipelineSqliteCacheConfig(base_dir="cache"), str(tmp_path))
+    assert isinstance(cache, SqlitePipelineCache)
+    assert cache.path == tmp_path / "cache" / SQLITE_CACHE_FILENAME
+    assert await cache.child("community_reporting").get("report-1") == "report"
+    cache.close()
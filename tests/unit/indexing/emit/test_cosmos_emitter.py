@@ -0,0 +1,120 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from types import SimpleNamespace
+from typing import Any, cast
+
+import numpy as np
+import pandas as pd
+from azure.cosmos.exceptions import CosmosHttpResponseError
+
+from graphrag.index.emit.cosmos_emitter import CosmosEmitter
+from graphrag.index.storage import PipelineStorage
+
+
+class MockContainer:
+    def __init__(self, throttle_ids: set[str] | None = None):
+        self.items: dict[str, dict[str, Any]] = {}
+        self.throttle_ids = throttle_ids or set()
+
+    def upsert_item(self, body: dict[str, Any], raw_response_hook=None, **_kwargs):
+        # cosmos serializes with the stdlib json module, so anything numpy would fail here
+        json.dumps(body, allow_nan=False)
+        if body["id"] in self.throttle_ids:
+            self.throttle_ids.remove(body["id"])
+            error = CosmosHttpResponseError(status_code=429, message="throttled")
+            error.response = SimpleNamespace(headers={"x-ms-retry-after-ms": "1"})
+            raise error
+        self.items[body["id"]] = body
+        if raw_response_hook is not None:
+            raw_response_hook(
+                SimpleNamespace(
+                    http_response=SimpleNamespace(
+                        headers={"x-ms-request-charge": "5.5"}
+                    )
+                )
+            )
+        return body
+
+
+class MockCosmosStorage:
+    def __init__(self, container: MockContainer, concurrent_requests: int = 4):
+        self.container = container
+        self.concurrent_requests = concurrent_requests
+        self._executor = ThreadPoolExecutor(max_workers=concurrent_requests)
+
+    def get_client(self, container_name: str, create_if_not_exists: bool = True):
+        return self.container
+
+    async def run_in_executor(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+
+class MockCallbacks:
+    def __init__(self):
+        self.measures: dict[str, float] = {}
+
+    def on_measure(self, name: str, value: float, details: dict | None = None):
+        self.measures[name] = value
+
+
+def create_emitter(container: MockContainer, callbacks=None, errors=None):
+    storage = cast(PipelineStorage, MockCosmosStorage(container))
+    return CosmosEmitter(
+        storage,
+        lambda e, _s, _d: errors.append(e) if errors is not None else None,
+        cast(Any, callbacks),
+    )
+
+
+async def test_emit_converts_columns_to_json_safe_values():
+    container = MockContainer()
+    data = pd.DataFrame({
+        "id": ["a", "b"],
+        "rank": [1, 2],
+        "weight": [0.5, np.nan],
+        "created": pd.to_datetime(["2024-01-01", None]),
+        "embedding": [np.array([0.1, 0.2]), np.array([0.3, 0.4])],
+        "text_unit_ids": [np.array(["t1"], dtype=object), None],
+    })
+
+    await create_emitter(container).emit("entities", data)
+
+    assert container.items["a"] == {
+        "id": "a",
+        "rank": 1,
+        "weight": 0.5,
+        "created": "2024-01-01T00:00:00",
+        "embedding": [0.1, 0.2],
+        "text_unit_ids": ["t1"],
+    }
+    assert container.items["b"]["weight"] is None
+    assert container.items["b"]["created"] is None
+    assert container.items["b"]["text_unit_ids"] is None
+
+
+async def test_emit_uses_index_when_id_column_is_missing():
+    container = MockContainer()
+    data = pd.DataFrame({"text": ["x", "y", "z"]})
+
+    await create_emitter(container).emit("documents", data)
+
+    assert sorted(container.items.keys()) == ["0", "1", "2"]
+
+
+async def test_emit_retries_throttled_documents_and_reports_metrics():
+    container = MockContainer(throttle_ids={"3", "7"})
+    callbacks = MockCallbacks()
+    errors = []
+    data = pd.DataFrame({"id": [str(i) for i in range(20)], "value": range(20)})
+
+    await create_emitter(container, callbacks, errors).emit("values", data)
+
+    assert errors == []
+    assert len(container.items) == 20
+    assert callbacks.measures["emit_request_charge"] == 20 * 5.5
+    assert callbacks.measures["emit_rows_per_second"] > 0
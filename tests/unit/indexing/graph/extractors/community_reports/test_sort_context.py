@@ -2,7 +2,14 @@
 # Licensed under the MIT License
 import math
 import platform
+import random
+import re
+from unittest import mock
 
+import pandas as pd
+import pytest
+
+import graphrag.index.graph.extractors.community_reports.schemas as schemas
 from graphrag.index.graph.extractors.community_reports import sort_context
 from graphrag.query.llm.text_utils import num_tokens
 
@@ -211,3 +218,174 @@ def test_sort_context_max_tokens():
     ctx = sort_context(context, max_tokens=800)
     assert ctx is not None
     assert num_tokens(ctx) <= 800
+
+
+def make_community(num_edges: int, seed: int = 0) -> list[dict]:
+    """Build a synthetic community shaped like the output of prepare_community_reports."""
+    rng = random.Random(seed)
+    num_nodes = max(2, num_edges // 2)
+    names = [f"ENTITY {i}" for i in range(num_nodes)]
+    records = {
+        name: {
+            schemas.NODE_NAME: name,
+            schemas.NODE_DEGREE: 0,
+            schemas.NODE_DETAILS: {
+                schemas.NODE_ID: i,
+                schemas.NODE_NAME: name,
+                schemas.NODE_DESCRIPTION: f"{name}, a node with a description of {rng.randint(5, 60)} words"
+                + " lorem" * rng.randint(5, 60),
+                schemas.NODE_DEGREE: rng.randint(1, 40),
+            },
+            schemas.EDGE_DETAILS: [math.nan],
+            schemas.CLAIM_DETAILS: [math.nan],
+        }
+        for i, name in enumerate(names)
+    }
+    for i in range(num_edges):
+        source, target = rng.sample(names, 2)
+        edge = {
+            schemas.EDGE_ID: i,
+            schemas.EDGE_SOURCE: source,
+            schemas.EDGE_TARGET: target,
+            schemas.EDGE_DESCRIPTION: f'{source} relates to "{target}",\n'
+            + " ipsum" * rng.randint(1, 30),
+            # plenty of ties so the sort order matters
+            schemas.EDGE_DEGREE: rng.randint(1, 10),
+        }
+        # every edge shows up on both of its nodes
+        records[source][schemas.EDGE_DETAILS].append(edge)
+        records[target][schemas.EDGE_DETAILS].append(edge)
+    for name in rng.sample(names, num_nodes // 4):
+        records[name][schemas.CLAIM_DETAILS] = [
+            {
+                schemas.CLAIM_ID: rng.randint(0, num_nodes),
+                schemas.CLAIM_SUBJECT: name,
+                schemas.CLAIM_TYPE: "FACT",
+                schemas.CLAIM_STATUS: "TRUE",
+                schemas.CLAIM_DESCRIPTION: f"{name} has a claim",
+            }
+        ]
+    return list(records.values())
+
+
+def legacy_sort_context(
+    local_context: list[dict],
+    sub_community_reports: list[dict] | None = None,
+    max_tokens: int | None = None,
+) -> str:
+    """Reference copy of sort_context that re-renders the whole context for every edge."""
+
+    def _section(title: str, rows: list[dict], id_column: str) -> str | None:
+        rows = [
+            row
+            for row in rows
+            if id_column in row and row[id_column] and str(row[id_column]).strip() != ""
+        ]
+        table = pd.DataFrame(rows).drop_duplicates()
+        if table.empty:
+            return None
+        if table[id_column].dtype == float:
+            table[id_column] = table[id_column].astype(int)
+        return f"{title}\n{table.to_csv(index=False, sep=',')}"
+
+    def _get_context_string(entities, edges, claims, sub_community_reports=None):
+        sections = []
+        if sub_community_reports:
+            sections.append(
+                _section(
+                    "----Reports-----", sub_community_reports, schemas.COMMUNITY_ID
+                )
+            )
+        sections.append(_section("-----Entities-----", entities, schemas.NODE_ID))
+        if claims:
+            sections.append(_section("-----Claims-----", claims, schemas.CLAIM_ID))
+        sections.append(_section("-----Relationships-----", edges, schemas.EDGE_ID))
+        return "\n\n".join(section for section in sections if section is not None)
+
+    edges = []
+    node_details = {}
+    claim_details = {}
+    for record in local_context:
+        node_name = record[schemas.NODE_NAME]
+        edges.extend(e for e in record.get(schemas.EDGE_DETAILS, []) if not pd.isna(e))
+        node_details[node_name] = record[schemas.NODE_DETAILS]
+        claim_details[node_name] = [
+            c for c in record.get(schemas.CLAIM_DETAILS, []) if not pd.isna(c)
+        ]
+
+    edges = [edge for edge in edges if isinstance(edge, dict)]
+    edges = sorted(edges, key=lambda x: x[schemas.EDGE_DEGREE], reverse=True)
+
+    sorted_edges = []
+    sorted_nodes = []
+    sorted_claims = []
+    context_string = ""
+    for edge in edges:
+        source = edge[schemas.EDGE_SOURCE]
+        target = edge[schemas.EDGE_TARGET]
+        sorted_nodes.extend([
+            node_details.get(source, {}),
+            node_details.get(target, {}),
+        ])
+        sorted_edges.append(edge)
+        source_claims = claim_details.get(source, [])
+        target_claims = claim_details.get(target, [])
+        sorted_claims.extend(source_claims if source_claims else [])
+        sorted_claims.extend(target_claims if source_claims else [])
+        if max_tokens:
+            new_context_string = _get_context_string(
+                sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
+            )
+            if num_tokens(new_context_string) > max_tokens:
+                break
+            context_string = new_context_string
+
+    if context_string == "":
+        return _get_context_string(
+            sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
+        )
+    return context_string
+
+
+def fake_num_tokens(text: str, token_encoder=None) -> int:
+    # runs of whitespace are a single token, so the count is not additive across rows
+    return len(re.findall(r"\w+|[^\w\s]+|\s+", text))
+
+
+SUB_COMMUNITY_REPORTS = [
+    {schemas.COMMUNITY_ID: 3, schemas.FULL_CONTENT: "A report, about things"},
+    {schemas.COMMUNITY_ID: 4, schemas.FULL_CONTENT: "Another report"},
+]
+
+
+@pytest.mark.parametrize("num_edges", [0, 1, 10, 100, 400])
+@pytest.mark.parametrize("max_tokens", [None, 1, 50, 300, 2_000, 20_000])
+@pytest.mark.parametrize("sub_community_reports", [None, SUB_COMMUNITY_REPORTS])
+def test_sort_context_matches_legacy(num_edges, max_tokens, sub_community_reports):
+    community = make_community(num_edges, seed=num_edges)
+    with (
+        mock.patch(
+            "graphrag.index.graph.extractors.community_reports.sort_context.num_tokens",
+            fake_num_tokens,
+        ),
+        mock.patch(f"{__name__}.num_tokens", fake_num_tokens),
+    ):
+        expected = legacy_sort_context(
+            community, sub_community_reports, max_tokens=max_tokens
+        )
+        actual = sort_context(community, sub_community_reports, max_tokens=max_tokens)
+    assert actual == expected
+
+
+def test_sort_context_matches_legacy_on_sample():
+    with (
+        mock.patch(
+            "graphrag.index.graph.extractors.community_reports.sort_context.num_tokens",
+            fake_num_tokens,
+        ),
+        mock.patch(f"{__name__}.num_tokens", fake_num_tokens),
+    ):
+        for max_tokens in range(0, 1_200, 25):
+            assert sort_context(context, max_tokens=max_tokens) == legacy_sort_context(
+                context, max_tokens=max_tokens
+            )
@@ -0,0 +1,110 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import json
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from graphrag.index.graph.extractors.summarize import (
+    BatchSummarizeExtractor,
+    SummarizeExtractor,
+)
+
+module = sys.modules[
+    "graphrag.index.graph.extractors.summarize.description_summary_extractor"
+]
+
+
+class FakeLLM:
+    def __init__(self, batch_response=None, fail: bool = False):
+        self.batch_response = batch_response
+        self.fail = fail
+        self.batches: list[dict] = []
+        self.singles: list[str] = []
+
+    async def __call__(self, _prompt, variables, **kwargs):
+        if kwargs.get("json"):
+            items = json.loads(variables["items"])
+            self.batches.append(items)
+            if self.fail:
+                msg = "Failed to generate valid JSON output"
+                raise RuntimeError(msg)
+            response = self.batch_response or {
+                key: f"batch summary of {item['entities']}"
+                for key, item in items.items()
+            }
+            return SimpleNamespace(json=response, output="")
+        self.singles.append(variables["entity_name"])
+        return SimpleNamespace(output=f"single summary of {variables['entity_name']}")
+
+
+@pytest.fixture(autouse=True)
+def count_words(monkeypatch):
+    monkeypatch.setattr(module, "num_tokens_from_string", lambda s: len(s.split()))
+
+
+def make_extractor(llm: FakeLLM) -> BatchSummarizeExtractor:
+    return BatchSummarizeExtractor(
+        llm, SummarizeExtractor(llm, max_input_tokens=100_000)
+    )
+
+
+BATCH = [
+    ("A", ["a2", "a1"]),
+    (("A", "B"), ["ab1", "ab2"]),
+    ("B", ["b1", "b2"]),
+]
+
+
+async def test_batch_is_summarized_with_a_single_call():
+    llm = FakeLLM()
+
+    results = await make_extractor(llm)(BATCH)
+
+    assert llm.batches == [
+        {
+            "1": {"entities": "A", "descriptions": ["a1", "a2"]},
+            "2": {"entities": ["A", "B"], "descriptions": ["ab1", "ab2"]},
+            "3": {"entities": "B", "descriptions": ["b1", "b2"]},
+        }
+    ]
+    assert llm.singles == []
+    assert [r.items for r in results] == ["A", ("A", "B"), "B"]
+    assert [r.description for r in results] == [
+        "batch summary of A",
+        "batch summary of ['A', 'B']",
+        "batch summary of B",
+    ]
+
+
+async def test_missing_items_fall_back_to_single_calls():
+    llm = FakeLLM(batch_response={"1": "summary of A", "2": "", "4": "unknown"})
+
+    results = await make_extractor(llm)(BATCH)
+
+    assert [r.description for r in results] == [
+        "summary of A",
+        'single summary of ["A", "B"]',
+        'single summary of "B"',
+    ]
+
+
+async def test_failed_batch_falls_back_to_single_calls():
+    errors = []
+    llm = FakeLLM(fail=True)
+    extractor = BatchSummarizeExtractor(
+        llm,
+        SummarizeExtractor(llm, max_input_tokens=100_000),
+        on_error=lambda e, _s, _d: errors.append(e),
+    )
+
+    results = await extractor(BATCH)
+
+    assert len(llm.batches) == 1
+    assert len(errors) == 1
+    assert [r.description for r in results] == [
+        'single summary of "A"',
+        'single summary of ["A", "B"]',
+        'single summary of "B"',
+    ]
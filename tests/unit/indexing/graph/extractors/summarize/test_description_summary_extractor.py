@@ -0,0 +1,91 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+import json
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from graphrag.index.graph.extractors.summarize import SummarizeExtractor
+
+module = sys.modules[
+    "graphrag.index.graph.extractors.summarize.description_summary_extractor"
+]
+
+
+class RecordingLLM:
+    def __init__(self):
+        self.calls: list[list[str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, _prompt, variables, **_kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.calls.append(json.loads(variables["description_list"]))
+        summary = f"summary{len(self.calls)}"
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return SimpleNamespace(output=summary)
+
+
+@pytest.fixture(autouse=True)
+def count_words(monkeypatch):
+    monkeypatch.setattr(module, "num_tokens_from_string", lambda s: len(s.split()))
+
+
+def make_extractor(llm: RecordingLLM, **kwargs) -> SummarizeExtractor:
+    # a one word prompt leaves room for four one word descriptions
+    return SummarizeExtractor(
+        llm, summarization_prompt="prompt", max_input_tokens=5, **kwargs
+    )
+
+
+async def test_tree_reduce_summarizes_groups_concurrently():
+    llm = RecordingLLM()
+    descriptions = [f"d{i:02}" for i in range(64)]
+
+    result = await make_extractor(llm, tree_reduce=True, fan_out=4)(
+        "ENTITY", descriptions
+    )
+
+    # 16 groups, reduced to 4 partial summaries, reduced to 1
+    assert len(llm.calls) == 16 + 4 + 1
+    assert llm.max_in_flight == 16
+    assert sorted(d for call in llm.calls[:16] for d in call) == descriptions
+    assert all(len(call) <= 4 for call in llm.calls)
+    assert result.description == "summary21"
+
+
+async def test_fan_out_bounds_the_reduce_groups():
+    llm = RecordingLLM()
+    descriptions = [f"d{i:02}" for i in range(16)]
+
+    await make_extractor(llm, tree_reduce=True, fan_out=2)("ENTITY", descriptions)
+
+    # 4 groups, then 2 rounds of pairs
+    assert [len(call) for call in llm.calls] == [4] * 4 + [2] * 3
+
+
+async def test_tree_reduce_ends_with_oversized_descriptions():
+    llm = RecordingLLM()
+    descriptions = [" ".join([f"d{i}"] * 10) for i in range(5)]
+
+    result = await make_extractor(llm, tree_reduce=True)("ENTITY", descriptions)
+
+    # pairs are summarized even when they exceed the budget, so every round makes progress
+    assert [len(call) for call in llm.calls] == [2, 2, 2, 2]
+    assert result.description == "summary4"
+
+
+async def test_sequential_by_default():
+    llm = RecordingLLM()
+    descriptions = [f"d{i:02}" for i in range(16)]
+
+    result = await make_extractor(llm)("ENTITY", descriptions)
+
+    assert llm.max_in_flight == 1
+    # every partial summary is folded into the next call
+    assert all(f"summary{i}" in call for i, call in enumerate(llm.calls[1:], 1))
+    assert result.description == f"summary{len(llm.calls)}"
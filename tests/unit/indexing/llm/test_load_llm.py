@@ -0,0 +1,102 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+from graphrag.index.llm import concurrency_limiter_stats, endpoint_stats
+from graphrag.index.llm.load_llm import (
+    _create_endpoints,
+    _create_limiter,
+    _create_openai_chat_llm,
+)
+from graphrag.llm import OpenAIConfiguration
+
+
+def configuration(**kwargs) -> OpenAIConfiguration:
+    return OpenAIConfiguration({"api_key": "key", "tokens_per_minute": 1_000, **kwargs})
+
+
+def test_llms_calling_the_same_deployment_share_a_budget():
+    endpoint = "https://example.openai.azure.com/"
+    chat = _create_limiter(
+        configuration(model="gpt-4o", deployment_name="shared", api_base=endpoint)
+    )
+    embeddings = _create_limiter(
+        configuration(
+            model="text-embedding-3-small",
+            deployment_name="shared",
+            api_base=endpoint.rstrip("/"),
+        )
+    )
+    assert chat is embeddings
+    assert (
+        _create_limiter(
+            configuration(model="gpt-4o", deployment_name="other", api_base=endpoint)
+        )
+        is not chat
+    )
+    assert (
+        _create_limiter(configuration(model="gpt-4o", api_base="https://other/"))
+        is not chat
+    )
+
+
+def test_endpoints_override_the_model_configuration():
+    parent = configuration(
+        model="gpt-4o", api_base="https://parent/", max_retries=10, api_version="v1"
+    )
+    endpoints = _create_endpoints(
+        parent,
+        [
+            {"api_base": "https://east/", "weight": 3, "api_key": None},
+            {
+                "api_base": "https://west/",
+                "deployment_name": "west",
+                "tokens_per_minute": 500,
+            },
+        ],
+        azure=False,
+    )
+    assert endpoints is not None
+    east, west = endpoints
+    assert (east.name, east.weight) == ("https://east/gpt-4o", 3)
+    assert (west.name, west.weight) == ("https://west/west", 1.0)
+    assert east.config.api_key == "key"
+    assert east.config.api_version == "v1"
+    assert west.config.deployment_name == "west"
+    assert west.config.tokens_per_minute == 500
+    # the balancer retries the failed requests, on the other endpoints
+    assert east.config.max_retries == 1
+    assert east.limiter is not west.limiter
+    assert east.limiter is _create_limiter(east.config)
+    assert east.metrics is not None
+    assert "https://east/gpt-4o" in endpoint_stats()
+    assert _create_endpoints(parent, None, azure=False) is None
+
+
+def test_endpoints_adapt_their_own_concurrency():
+    parent = configuration(
+        model="gpt-4o",
+        api_base="https://parent/",
+        adaptive_concurrency=True,
+        concurrent_requests=8,
+        max_concurrent_requests=16,
+    )
+    endpoints = _create_endpoints(
+        parent,
+        [{"api_base": "https://north/"}, {"api_base": "https://south/"}],
+        azure=False,
+    )
+    assert endpoints is not None
+    north, south = endpoints
+    assert north.concurrency_limiter is not None
+    assert north.concurrency_limiter is not south.concurrency_limiter
+    assert north.semaphore is None
+
+
+def test_balanced_llms_skip_the_model_limits():
+    parent = configuration(
+        model="gpt-4o", api_base="https://unused/", adaptive_concurrency=True
+    )
+    _create_openai_chat_llm(
+        parent, lambda *_: None, None, endpoints=[{"api_base": "https://used/"}]
+    )
+    assert "https://used/gpt-4o" in concurrency_limiter_stats()
+    assert "https://unused/gpt-4o" not in concurrency_limiter_stats()
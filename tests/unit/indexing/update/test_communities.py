@@ -0,0 +1,206 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import json
+import sys
+
+import networkx as nx
+import pandas as pd
+from datashaper import NoopVerbCallbacks
+
+from graphrag.index.cache import InMemoryCache
+from graphrag.index.operations.cluster_graph import (
+    Communities,
+    GraphCommunityStrategyType,
+    run_layout,
+)
+from graphrag.index.storage import MemoryPipelineStorage
+from graphrag.index.update.communities import (
+    CommunityChanges,
+    update_communities,
+    update_community_outputs,
+    update_community_reports,
+)
+
+strategy = {
+    "type": GraphCommunityStrategyType.parallel_leiden,
+    "max_cluster_size": 10,
+    "use_lcc": False,
+}
+
+
+def make_forest(num_components: int) -> nx.Graph:
+    graph = nx.Graph()
+    for i in range(num_components):
+        caves = nx.relaxed_caveman_graph(4, 8, 0.2, seed=i)
+        graph.update(nx.relabel_nodes(caves, {n: f"C{i}_{n}" for n in caves}))
+    return graph
+
+
+def of_component(communities: Communities, prefix: str) -> Communities:
+    return [c for c in communities if c[2][0].startswith(prefix)]
+
+
+def test_nothing_touched_keeps_every_community():
+    graph = make_forest(3)
+    previous = run_layout(strategy, graph)
+
+    communities, changes = update_communities(graph, previous, set(), strategy)
+
+    assert sorted(communities) == sorted(previous)
+    assert changes.created == changes.modified == changes.dissolved == []
+
+
+def test_only_touched_components_are_reclustered():
+    graph = make_forest(3)
+    previous = run_layout(strategy, graph)
+    graph.add_edge("C0_0", "C0_NEW", weight=1.0)
+
+    communities, changes = update_communities(
+        graph, previous, {"C0_0", "C0_NEW"}, strategy
+    )
+
+    # the untouched components keep their communities and ids
+    for prefix in ["C1_", "C2_"]:
+        assert sorted(of_component(communities, prefix)) == sorted(
+            of_component(previous, prefix)
+        )
+    changed = {*changes.created, *changes.modified, *changes.dissolved}
+    assert changed
+    assert changed <= {c[1] for c in of_component(communities + previous, "C0_")}
+    # the community the new node joined keeps the id of its previous community
+    new_node_community = next(c for c in communities if c[0] == 0 and "C0_NEW" in c[2])
+    previous_community = next(c for c in previous if c[0] == 0 and "C0_0" in c[2])
+    assert new_node_community[1] == previous_community[1]
+    assert new_node_community[1] in changes.modified
+    # ids stay unique
+    assert len({c[1] for c in communities}) == len(communities)
+
+
+def test_new_component_creates_communities():
+    graph = make_forest(2)
+    previous = run_layout(strategy, graph)
+    graph.add_edge("X", "Y", weight=1.0)
+
+    communities, changes = update_communities(graph, previous, {"X", "Y"}, strategy)
+
+    next_id = str(max(int(c[1]) for c in previous) + 1)
+    assert changes.created == [next_id]
+    assert changes.modified == changes.dissolved == []
+    assert (0, next_id, ["X", "Y"]) in [(c[0], c[1], sorted(c[2])) for c in communities]
+
+
+async def test_update_community_outputs_writes_the_change_set():
+    storage = MemoryPipelineStorage()
+    old_nodes = pd.DataFrame({
+        "level": 0,
+        "title": ["A", "B", "C", "D"],
+        "source_id": "t1",
+        "community": ["0", "0", "1", "1"],
+        "degree": 1,
+        "human_readable_id": range(4),
+        "id": ["a", "b", "c", "d"],
+    })
+    old_relationships = pd.DataFrame({
+        "source": ["A", "C"],
+        "target": ["B", "D"],
+        "weight": 1.0,
+        "text_unit_ids": [["t1"], ["t1"]],
+        "id": ["ab", "cd"],
+    })
+    await storage.set("create_final_nodes.parquet", old_nodes.to_parquet())
+    await storage.set(
+        "create_final_relationships.parquet", old_relationships.to_parquet()
+    )
+    delta = {
+        "create_final_nodes": pd.DataFrame({
+            "level": 0,
+            "title": ["B", "E"],
+            "source_id": "t2",
+            "community": ["0", "0"],
+            "degree": 1,
+            "human_readable_id": range(2),
+            "id": ["b2", "e"],
+        }),
+        "create_final_relationships": pd.DataFrame({
+            "source": ["B"],
+            "target": ["E"],
+            "weight": 1.0,
+            "text_unit_ids": [["t2"]],
+            "id": ["be"],
+        }),
+    }
+
+    changes = await update_community_outputs(delta, storage, strategy)
+
+    assert json.loads(await storage.get("community_changes.json")) == {
+        "created": [],
+        "modified": ["0"],
+        "dissolved": [],
+    }
+    assert changes.modified == ["0"]
+    nodes = await storage.load_table("create_final_nodes_new.parquet")
+    assert list(nodes.columns) == list(old_nodes.columns)
+    assert dict(zip(nodes["title"], nodes["community"], strict=True)) == {
+        "A": "0",
+        "B": "0",
+        "C": "1",
+        "D": "1",
+        "E": "0",
+    }
+    assert list(nodes["human_readable_id"]) == [0, 1, 2, 3, 4]
+    communities = await storage.load_table("create_final_communities_new.parquet")
+    assert sorted(communities["id"]) == ["0", "1"]
+    relationship_ids = dict(
+        zip(communities["id"], communities["relationship_ids"], strict=True)
+    )
+    assert sorted(relationship_ids["0"]) == ["ab", "be"]
+
+
+async def test_update_community_reports_regenerates_the_changed_communities(
+    monkeypatch,
+):
+    storage = MemoryPipelineStorage()
+    nodes = pd.DataFrame({"title": ["A", "B"], "level": 0, "community": ["0", "1"]})
+    relationships = pd.DataFrame({"source": ["A"], "target": ["B"], "id": ["ab"]})
+    previous_reports = pd.DataFrame({"community": ["0", "1"], "title": ["r0", "r1"]})
+    await storage.set("create_final_nodes_new.parquet", nodes.to_parquet())
+    await storage.set("create_final_relationships.parquet", relationships.to_parquet())
+    await storage.set(
+        "create_final_community_reports.parquet", previous_reports.to_parquet()
+    )
+    calls = []
+
+    async def create_final_community_reports(  # noqa RUF029
+        nodes_input, edges_input, claims_input, *args, **kwargs
+    ):
+        calls.append((nodes_input, claims_input, kwargs))
+        return kwargs["previous_reports"]
+
+    communities = sys.modules["graphrag.index.update.communities"]
+    monkeypatch.setattr(
+        communities, "create_final_community_reports", create_final_community_reports
+    )
+    delta = {
+        "create_final_relationships": pd.DataFrame({
+            "source": ["B"],
+            "target": ["C"],
+            "id": ["bc"],
+        })
+    }
+    changes = CommunityChanges(created=["2"], modified=["1"], dissolved=["3"])
+
+    await update_community_reports(
+        delta,
+        storage,
+        InMemoryCache(),
+        NoopVerbCallbacks(),
+        changes,
+        {"summarization_strategy": {"type": "graph_intelligence"}},
+    )
+
+    [(nodes_input, claims_input, kwargs)] = calls
+    assert list(nodes_input["title"]) == ["A", "B"]
+    assert claims_input is None
+    assert kwargs["changed_communities"] == ["2", "1"]
+    assert list(kwargs["previous_reports"]["title"]) == ["r0", "r1"]
+    assert await storage.has("create_final_community_reports_new.parquet")
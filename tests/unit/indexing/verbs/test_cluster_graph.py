@@ -0,0 +1,122 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import random
+
+import networkx as nx
+import pytest
+
+from graphrag.index.operations.cluster_graph import (
+    Communities,
+    GraphCommunityStrategyType,
+    run_layout,
+)
+
+
+def make_forest(num_components: int, seed: int = 0) -> nx.Graph:
+    """Components of a few caves each, with the caves loosely linked."""
+    graph = nx.Graph()
+    for i in range(num_components):
+        caves = nx.relaxed_caveman_graph(3 + i % 3, 8, 0.2, seed=seed + i)
+        graph.update(nx.relabel_nodes(caves, {n: f"C{i}_{n}" for n in caves}))
+    graph.add_node("SINGLE")
+    return graph
+
+
+def partition(communities: Communities) -> set[tuple[int, frozenset[str]]]:
+    return {(level, frozenset(nodes)) for level, _, nodes in communities}
+
+
+def strategy(strategy_type: GraphCommunityStrategyType, **kwargs) -> dict:
+    return {"type": strategy_type, "max_cluster_size": 10, "use_lcc": False, **kwargs}
+
+
+def test_parallel_leiden_is_the_same_for_any_number_of_processes():
+    graph = make_forest(6)
+    sequential = run_layout(
+        strategy(GraphCommunityStrategyType.parallel_leiden, num_processes=1), graph
+    )
+    parallel = run_layout(
+        strategy(GraphCommunityStrategyType.parallel_leiden, num_processes=3), graph
+    )
+
+    assert parallel == sequential
+
+
+def test_parallel_leiden_does_not_depend_on_the_graph_order():
+    graph = make_forest(4)
+    edges = list(graph.edges(data=True))
+    random.Random(1).shuffle(edges)
+    shuffled = nx.Graph()
+    shuffled.add_edges_from(edges)
+
+    assert run_layout(
+        strategy(GraphCommunityStrategyType.parallel_leiden), shuffled
+    ) == run_layout(strategy(GraphCommunityStrategyType.parallel_leiden), graph)
+
+
+def test_components_are_clustered_on_their_own():
+    graph = make_forest(4)
+    component = graph.subgraph(nx.node_connected_component(graph, "C0_0")).copy()
+
+    whole = partition(
+        run_layout(strategy(GraphCommunityStrategyType.parallel_leiden), graph)
+    )
+    alone = partition(
+        run_layout(strategy(GraphCommunityStrategyType.parallel_leiden), component)
+    )
+
+    assert alone <= whole
+
+
+def test_parallel_leiden_numbers_clusters_level_by_level():
+    communities = run_layout(
+        strategy(GraphCommunityStrategyType.parallel_leiden), make_forest(6)
+    )
+
+    by_id = sorted(communities, key=lambda c: int(c[1]))
+    assert [int(cluster) for _, cluster, _ in by_id] == list(range(len(communities)))
+    # ids grow with the level
+    levels = [level for level, _, _ in by_id]
+    assert levels == sorted(levels)
+    # single nodes are not clustered, as with leiden
+    assert all("SINGLE" not in nodes for _, _, nodes in communities)
+    level_0 = {n for level, _, nodes in communities if level == 0 for n in nodes}
+    assert level_0 == set(make_forest(6).nodes) - {"SINGLE"}
+
+
+def test_parallel_leiden_uses_the_largest_component():
+    graph = make_forest(4)
+    communities = run_layout(
+        strategy(GraphCommunityStrategyType.parallel_leiden, use_lcc=True), graph
+    )
+
+    nodes = {n for level, _, members in communities if level == 0 for n in members}
+    assert nodes == set(max(nx.connected_components(graph), key=len))
+
+
+def test_leidenalg_clusters_hierarchically():
+    pytest.importorskip("leidenalg")
+    graph = make_forest(6)
+
+    communities = run_layout(
+        strategy(GraphCommunityStrategyType.leidenalg, max_cluster_size=8), graph
+    )
+    parallel = run_layout(
+        strategy(
+            GraphCommunityStrategyType.leidenalg, max_cluster_size=8, num_processes=2
+        ),
+        graph,
+    )
+
+    assert parallel == communities
+    clusters = partition(communities)
+    level_0 = [nodes for level, nodes in clusters if level == 0]
+    assert set().union(*level_0) == set(graph.nodes) - {"SINGLE"}
+    # every deeper cluster splits a cluster above the size limit
+    for level, nodes in clusters:
+        if level > 0:
+            assert any(
+                nodes < parent and len(parent) > 8
+                for parent_level, parent in clusters
+                if parent_level == level - 1
+            )
@@ -0,0 +1,194 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import json
+
+import networkx as nx
+import pandas as pd
+import pytest
+from datashaper import NoopVerbCallbacks
+
+from graphrag.index.flows.create_base_entity_graph import _extract_graph_in_batches
+from graphrag.index.operations.merge_graphs import merge_graphs
+from graphrag.index.operations.spill_batches import (
+    delete_partitions,
+    load_partitions,
+    spill_batches,
+)
+from graphrag.index.storage import MemoryPipelineStorage
+
+text_units = pd.DataFrame({
+    "id": [f"t{i}" for i in range(7)],
+    "chunk": [f"text {i}" for i in range(7)],
+})
+node_operations = {"description": {"operation": "concat", "separator": "\n"}}
+edge_operations = {
+    "weight": "sum",
+    "description": {"operation": "concat", "separator": "\n"},
+}
+
+
+async def test_batches_are_spilled_in_order():
+    storage = MemoryPipelineStorage()
+    processed = []
+
+    async def process(batch: pd.DataFrame) -> pd.DataFrame:  # noqa RUF029
+        processed.append(list(batch["id"]))
+        return batch.assign(length=batch["chunk"].str.len())
+
+    keys = [
+        key
+        async for key, _ in spill_batches(
+            text_units, 3, "lengths", "id", storage, process
+        )
+    ]
+
+    assert processed == [["t0", "t1", "t2"], ["t3", "t4", "t5"], ["t6"]]
+    assert sorted(storage.keys()) == keys
+    assert all(key.startswith("lengths.part-") for key in keys)
+    partitions = [partition async for partition in load_partitions(keys, storage)]
+    assert list(pd.concat(partitions)["id"]) == list(text_units["id"])
+
+    await delete_partitions(keys, storage)
+    assert storage.keys() == []
+
+
+async def test_spilled_batches_are_reused():
+    storage = MemoryPipelineStorage()
+    processed = []
+
+    async def process(batch: pd.DataFrame) -> pd.DataFrame:  # noqa RUF029
+        processed.append(list(batch["id"]))
+        return batch
+
+    _ = [
+        key
+        async for key, _ in spill_batches(text_units, 3, "p", "id", storage, process)
+    ]
+    processed.clear()
+
+    # a changed batch is processed again, the unchanged ones are loaded
+    changed = text_units.assign(id=[*text_units["id"][:6], "t7"])
+    results = [
+        result
+        async for _, result in spill_batches(changed, 3, "p", "id", storage, process)
+    ]
+
+    assert processed == [["t7"]]
+    assert list(pd.concat(results)["id"]) == list(changed["id"])
+
+
+async def test_invalid_batch_size_throws():
+    async def process(batch: pd.DataFrame) -> pd.DataFrame:  # noqa RUF029
+        return batch
+
+    with pytest.raises(ValueError):  # noqa PT011
+        _ = [
+            key
+            async for key, _ in spill_batches(
+                text_units, 0, "p", "id", MemoryPipelineStorage(), process
+            )
+        ]
+
+
+def _graph(i: int) -> nx.Graph:
+    # overlapping graphs, so nodes and edges are merged across batches
+    graph = nx.Graph()
+    for node in [f"N{i % 3}", f"N{(i + 1) % 4}", f"N{i}"]:
+        graph.add_node(node, type="T", description=f"d{i}", source_id=f"t{i}")
+    graph.add_edge(f"N{i}", f"N{i % 3}", weight=1.0, description=f"e{i}")
+    graph.add_edge(f"N{(i + 1) % 4}", f"N{i}", weight=2.0, description=f"f{i}")
+    return graph
+
+
+async def _extract(  # noqa RUF029 async is required for interface
+    batch: pd.DataFrame,
+) -> tuple[pd.DataFrame, list[nx.Graph]]:
+    graphs = [_graph(int(id[1:])) for id in batch["id"]]
+    entities = batch.assign(
+        entities=[[{"name": n, **d} for n, d in g.nodes(data=True)] for g in graphs]
+    )
+    return entities, graphs
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 3, 100])
+async def test_graph_extracted_in_batches_is_the_same(batch_size):
+    storage = MemoryPipelineStorage()
+    _, graphs = await _extract(text_units)
+    expected = merge_graphs(
+        graphs, NoopVerbCallbacks(), node_operations, edge_operations
+    )
+
+    actual = await _extract_graph_in_batches(
+        text_units,
+        _extract,
+        NoopVerbCallbacks(),
+        storage,
+        "id",
+        batch_size,
+        node_operations,
+        edge_operations,
+        raw_entity_snapshot_enabled=False,
+    )
+
+    assert list(actual.nodes(data=True)) == list(expected.nodes(data=True))
+    assert list(actual.edges(data=True)) == list(expected.edges(data=True))
+    assert storage.keys() == []
+
+
+async def test_raw_entities_are_snapshot_per_batch():
+    storage = MemoryPipelineStorage()
+
+    await _extract_graph_in_batches(
+        text_units,
+        _extract,
+        NoopVerbCallbacks(),
+        storage,
+        "id",
+        4,
+        node_operations,
+        edge_operations,
+        raw_entity_snapshot_enabled=True,
+    )
+
+    assert storage.keys() == [
+        "raw_extracted_entities.part-00000.json",
+        "raw_extracted_entities.part-00001.json",
+    ]
+    rows = [
+        json.loads(line)
+        for key in storage.keys()  # noqa: SIM118
+        for line in (await storage.get(key)).splitlines()
+    ]
+    assert [row["id"] for row in rows] == list(text_units["id"])
+    assert rows[0]["entities"][0] == {
+        "name": "N0",
+        "type": "T",
+        "description": "d0",
+        "source_id": "t0",
+    }
+
+
+async def test_spilled_batches_are_not_reused_with_another_config():
+    storage = MemoryPipelineStorage()
+    processed = []
+
+    async def process(batch: pd.DataFrame) -> pd.DataFrame:  # noqa RUF029
+        processed.append(list(batch["id"]))
+        return batch
+
+    _ = [
+        key
+        async for key, _ in spill_batches(
+            text_units, 3, "p", "id", storage, process, {"prompt": "a"}
+        )
+    ]
+    processed.clear()
+
+    _ = [
+        key
+        async for key, _ in spill_batches(
+            text_units, 3, "p", "id", storage, process, {"prompt": "b"}
+        )
+    ]
+
+    assert processed == [["t0", "t1", "t2"], ["t3", "t4", "t5"], ["t6"]]
@@ -0,0 +1,136 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+import sys
+import time
+
+import pandas as pd
+import pytest
+from datashaper import NoopVerbCallbacks
+from datashaper.errors import VerbParallelizationError
+
+from graphrag.index.cache import InMemoryCache
+from graphrag.index.flows.create_final_community_reports import (
+    _prep_edges,
+    _prep_nodes,
+)
+from graphrag.index.operations.summarize_communities import (
+    prepare_community_reports,
+    restore_community_hierarchy,
+    summarize_communities,
+)
+
+# the package exports the function under the name of its module
+module = sys.modules[
+    "graphrag.index.operations.summarize_communities.summarize_communities"
+]
+# two top communities, each split into two sub-communities of three nodes
+SUB_COMMUNITIES = {"0": ["2", "3"], "1": ["4", "5"]}
+STRATEGY = {"type": "graph_intelligence", "max_input_tokens": 400}
+
+
+def make_nodes() -> pd.DataFrame:
+    rows = []
+    for i in range(12):
+        sub = str(2 + i // 3)
+        top = "0" if sub in SUB_COMMUNITIES["0"] else "1"
+        for level, community in [(0, top), (1, sub)]:
+            rows.append({
+                "level": level,
+                "title": f"N{i}",
+                "community": community,
+                "degree": 2,
+                "human_readable_id": i,
+                "description": f"node {i} " + "words " * 40,
+            })
+    return pd.DataFrame(rows)
+
+
+def make_edges() -> pd.DataFrame:
+    pairs = [(f"N{i}", f"N{i + 1}") for i in range(12) if i % 3 != 2]
+    pairs += [("N2", "N3"), ("N8", "N9")]
+    return pd.DataFrame({
+        "human_readable_id": range(len(pairs)),
+        "source": [source for source, _ in pairs],
+        "target": [target for _, target in pairs],
+        "description": ["related " * 20] * len(pairs),
+        "rank": 2,
+    })
+
+
+class Recorder:
+    def __init__(self, delays: dict[str, float] | None = None, fail: str | None = None):
+        self.delays = delays or {}
+        self.fail = fail
+        self.times: dict[str, tuple[float, float]] = {}
+        self.contexts: dict[str, str] = {}
+
+    async def runner(self, community, context, level, _callbacks, _cache, _strategy):
+        start = time.monotonic()
+        self.contexts[community] = context
+        await asyncio.sleep(self.delays.get(community, 0.01))
+        if community == self.fail:
+            msg = f"report {community} failed"
+            raise ValueError(msg)
+        self.times[community] = (start, time.monotonic())
+        return {
+            "community": community,
+            "level": level,
+            "title": f"Report {community}",
+            "summary": "",
+            "full_content": f"FULL REPORT OF {community}",
+            "full_content_json": "",
+            "rank": 1.0,
+            "rank_explanation": "",
+            "findings": [],
+        }
+
+
+async def summarize(monkeypatch, recorder: Recorder, num_threads: int = 4):
+    monkeypatch.setattr(module, "load_strategy", lambda _type: recorder.runner)
+    nodes = _prep_nodes(make_nodes())
+    local_contexts = prepare_community_reports(
+        nodes, _prep_edges(make_edges()), None, NoopVerbCallbacks(), 400
+    )
+    return await summarize_communities(
+        local_contexts,
+        nodes,
+        restore_community_hierarchy(nodes),
+        NoopVerbCallbacks(),
+        InMemoryCache(),
+        STRATEGY,
+        num_threads=num_threads,
+    )
+
+
+async def test_parents_wait_for_their_own_sub_communities(monkeypatch):
+    recorder = Recorder(delays={"2": 0.3})
+    reports = await summarize(monkeypatch, recorder)
+
+    assert list(reports["community"]) == ["2", "3", "4", "5", "0", "1"]
+    for parent, subs in SUB_COMMUNITIES.items():
+        assert all(recorder.times[parent][0] >= recorder.times[sub][1] for sub in subs)
+        # the context is built from the sub-community reports
+        assert all(f"FULL REPORT OF {sub}" in recorder.contexts[parent] for sub in subs)
+    # the slow sub-community only holds back its own parent
+    assert recorder.times["1"][1] < recorder.times["2"][1]
+
+
+async def test_concurrency_is_limited(monkeypatch):
+    recorder = Recorder(delays=dict.fromkeys("2345", 0.1))
+    await summarize(monkeypatch, recorder, num_threads=2)
+
+    assert len(recorder.times) == 6
+    # never more than two reports in flight
+    assert all(
+        sum(start <= t < end for start, end in recorder.times.values()) <= 2
+        for t, _ in recorder.times.values()
+    )
+
+
+async def test_failed_report_throws(monkeypatch):
+    recorder = Recorder(fail="3")
+    with pytest.raises(VerbParallelizationError):
+        await summarize(monkeypatch, recorder)
+    # the parent still ran once its sub-communities were done
+    assert "0" in recorder.times
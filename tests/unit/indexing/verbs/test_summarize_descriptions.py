@@ -0,0 +1,104 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import json
+import sys
+from types import SimpleNamespace
+
+import networkx as nx
+import pytest
+from datashaper import NoopVerbCallbacks
+
+import graphrag.index.operations.summarize_descriptions.strategies as strategies
+from graphrag.index.cache import InMemoryCache, SqlitePipelineCache
+from graphrag.index.operations.summarize_descriptions import summarize_descriptions
+
+# the package exports the function under the name of its module
+module = sys.modules[
+    "graphrag.index.operations.summarize_descriptions.summarize_descriptions"
+]
+extractor = sys.modules[
+    "graphrag.index.graph.extractors.summarize.description_summary_extractor"
+]
+STRATEGY = {
+    "type": "graph_intelligence",
+    "llm": {"type": "static_response", "model": "fake"},
+    "batched": True,
+    "batch_max_tokens": 10,
+    "batch_size": 3,
+}
+
+
+class BatchLLM:
+    def __init__(self):
+        self.batches: list[list[str]] = []
+        self.singles: list[str] = []
+
+    async def __call__(self, _prompt, variables, **kwargs):
+        if kwargs.get("json"):
+            items = json.loads(variables["items"])
+            self.batches.append([str(item["entities"]) for item in items.values()])
+            summaries = {
+                key: f"summary of {item['entities']}" for key, item in items.items()
+            }
+            return SimpleNamespace(json=summaries, output="")
+        self.singles.append(json.loads(variables["entity_name"]))
+        return SimpleNamespace(output=f"summary of {variables['entity_name']}")
+
+
+@pytest.fixture(autouse=True)
+def count_words(monkeypatch):
+    for tokenized in [module, extractor]:
+        monkeypatch.setattr(
+            tokenized, "num_tokens_from_string", lambda s: len(s.split())
+        )
+
+
+def make_graph() -> nx.Graph:
+    graph = nx.Graph()
+    graph.add_node("LONG", description="\n".join(["many words"] * 4 + ["x " * 10]))
+    for i in range(7):
+        graph.add_node(f"N{i}", description=f"a{i}\nb{i}")
+    graph.add_node("ALONE", description="only description")
+    graph.add_edge("N0", "N1", description="related\nlinked")
+    return graph
+
+
+async def summarize(monkeypatch, llm: BatchLLM, graph: nx.Graph, cache) -> nx.Graph:
+    monkeypatch.setattr(strategies, "load_llm", lambda *_args: llm)
+    return await summarize_descriptions(
+        graph, NoopVerbCallbacks(), cache, strategy=STRATEGY, num_threads=2
+    )
+
+
+async def test_items_are_packed_into_batches(monkeypatch):
+    llm = BatchLLM()
+
+    graph = await summarize(monkeypatch, llm, make_graph(), InMemoryCache())
+
+    # at most three items and ten description tokens per batch
+    assert llm.batches == [
+        ["N0", "N1", "N2"],
+        ["N3", "N4", "N5"],
+        ["N6", "['N0', 'N1']"],
+    ]
+    # a batch of a single item is summarized on its own
+    assert llm.singles == ["LONG"]
+    assert graph.nodes["N3"]["description"] == "summary of N3"
+    assert graph.nodes["ALONE"]["description"] == "only description"
+    assert graph.edges["N0", "N1"]["description"] == "summary of ['N0', 'N1']"
+
+
+async def test_summaries_are_cached_by_item(monkeypatch, tmp_path):
+    # the children of an in-memory cache do not share its values
+    cache = SqlitePipelineCache(tmp_path / "cache.db")
+    await summarize(monkeypatch, BatchLLM(), make_graph(), cache)
+
+    graph = make_graph()
+    graph.nodes["N2"]["description"] += "\nc2"
+    llm = BatchLLM()
+    graph = await summarize(monkeypatch, llm, graph, cache)
+
+    # only the changed item is summarized again, the others come from the cache
+    assert llm.batches == []
+    assert llm.singles == ["N2"]
+    assert graph.nodes["N3"]["description"] == "summary of N3"
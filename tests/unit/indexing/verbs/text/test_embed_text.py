@@ -0,0 +1,211 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+from datashaper import NoopVerbCallbacks
+
+import graphrag.index.operations.embed_text.strategies.openai as openai
+from graphrag.index.cache import InMemoryCache, SqlitePipelineCache
+
+# the package exports the function under the name of its module
+embed_text = sys.modules["graphrag.index.operations.embed_text.embed_text"]
+
+ARGS = {"llm": {"type": "openai_embedding", "model": "fake"}, "batch_size": 2}
+
+
+class WordSplitter:
+    def split_text(self, text: str) -> list[str]:
+        return [text]
+
+    def num_tokens(self, text: str) -> int:
+        return len(text.split())
+
+
+class RecordingLLM:
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    async def __call__(self, batch: list[str], **_kwargs):
+        self.batches.append(batch)
+        return SimpleNamespace(output=[[float(len(text)), 1.0] for text in batch])
+
+
+@pytest.fixture
+def cache(tmp_path):
+    # the children of an in-memory cache do not share its values
+    return SqlitePipelineCache(tmp_path / "cache.db")
+
+
+async def embed(monkeypatch, embedder: RecordingLLM, texts: list[str], cache, **args):
+    monkeypatch.setattr(openai, "_get_splitter", lambda *_args: WordSplitter())
+    monkeypatch.setattr(openai, "_get_llm", lambda *_args: embedder)
+    result = await openai.run(texts, NoopVerbCallbacks(), cache, {**ARGS, **args})
+    return result.embeddings
+
+
+async def test_identical_texts_are_embedded_once(monkeypatch, cache):
+    llm = RecordingLLM()
+
+    embeddings = await embed(monkeypatch, llm, ["a", "bb", "a", "ccc", "bb"], cache)
+
+    assert llm.batches == [["a", "bb"], ["ccc"]]
+    assert [list(e) for e in embeddings] == [
+        [1.0, 1.0],
+        [2.0, 1.0],
+        [1.0, 1.0],
+        [3.0, 1.0],
+        [2.0, 1.0],
+    ]
+
+
+async def test_only_new_texts_are_embedded_again(monkeypatch, cache):
+    await embed(monkeypatch, RecordingLLM(), ["a", "bb", "ccc"], cache)
+
+    llm = RecordingLLM()
+    embeddings = await embed(
+        monkeypatch, llm, ["dddd", "a", "bb", "ccc"], cache, batch_size=16
+    )
+
+    # a new text and a different batch size leave the cached snippets valid
+    assert llm.batches == [["dddd"]]
+    np.testing.assert_array_equal(
+        np.array(embeddings), [[4.0, 1.0], [1.0, 1.0], [2.0, 1.0], [3.0, 1.0]]
+    )
+
+
+async def test_cache_is_keyed_by_model_and_dimensions(monkeypatch, cache):
+    await embed(monkeypatch, RecordingLLM(), ["a"], cache)
+
+    llm = RecordingLLM()
+    await embed(monkeypatch, llm, ["a"], cache, dimensions=256)
+    await embed(
+        monkeypatch, llm, ["a"], cache, llm={"type": "openai_embedding", "model": "x"}
+    )
+
+    assert llm.batches == [["a"], ["a"]]
+
+
+async def test_cache_keys_do_not_run_into_each_other(monkeypatch, cache):
+    await embed(monkeypatch, RecordingLLM(), ["3x"], cache, dimensions=12)
+
+    llm = RecordingLLM()
+    await embed(monkeypatch, llm, ["23x"], cache, dimensions=1)
+
+    assert llm.batches == [["23x"]]
+
+
+async def test_shared_semaphore_bounds_the_requests(monkeypatch, cache):
+    class ConcurrentLLM(RecordingLLM):
+        def __init__(self):
+            super().__init__()
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        async def __call__(self, batch: list[str], **kwargs):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            return await super().__call__(batch, **kwargs)
+
+    llm = ConcurrentLLM()
+    semaphore = asyncio.Semaphore(2)
+    texts = [[f"{run}-{i}" for i in range(8)] for run in range(3)]
+
+    await asyncio.gather(*[
+        embed(monkeypatch, llm, run, cache, num_threads=4, semaphore=semaphore)
+        for run in texts
+    ])
+
+    assert len(llm.batches) == 12
+    assert llm.max_in_flight == 2
+
+
+class RecordingVectorStore:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.loads: list[tuple[list[str], bool]] = []
+
+    def load_documents(self, documents, overwrite: bool = True):
+        time.sleep(self.delay)
+        self.loads.append(([d.id for d in documents], overwrite))
+
+
+class SlowStrategy:
+    def __init__(self, store: RecordingVectorStore, fail: str | None = None):
+        self.store = store
+        self.fail = fail
+        self.max_unwritten = 0
+        self.started: list[str] = []
+        self.semaphores: list[asyncio.Semaphore] = []
+
+    async def __call__(self, texts, _callbacks, _cache, args):
+        self.started.append(texts[0])
+        self.semaphores.append(args["semaphore"])
+        unwritten = len(self.started) - len(self.store.loads)
+        self.max_unwritten = max(self.max_unwritten, unwritten)
+        # the later slices are embedded faster
+        await asyncio.sleep(0.05 / len(self.started))
+        if texts[0] == self.fail:
+            msg = "embedding failed"
+            raise ValueError(msg)
+        return SimpleNamespace(embeddings=[np.array([float(len(t))]) for t in texts])
+
+
+async def embed_into_store(monkeypatch, strategy: SlowStrategy, rows: int):
+    monkeypatch.setattr(embed_text, "load_strategy", lambda _type: strategy)
+    monkeypatch.setattr(
+        embed_text, "_create_vector_store", lambda *_args: strategy.store
+    )
+    input = pd.DataFrame({
+        "id": [f"id{i}" for i in range(rows)],
+        "title": [f"title{i}" for i in range(rows)],
+        "text": ["x" * i for i in range(rows)],
+    })
+    return await embed_text.embed_text(
+        input,
+        NoopVerbCallbacks(),
+        InMemoryCache(),
+        "text",
+        {
+            "type": "mock",
+            "num_threads": 2,
+            "vector_store": {"batch_size": 3, "store_in_table": True},
+        },
+    )
+
+
+async def test_slices_are_loaded_in_order(monkeypatch):
+    store = RecordingVectorStore(delay=0.02)
+    strategy = SlowStrategy(store)
+
+    embeddings = await embed_into_store(monkeypatch, strategy, 10)
+
+    assert store.loads == [
+        (["id0", "id1", "id2"], True),
+        (["id3", "id4", "id5"], False),
+        (["id6", "id7", "id8"], False),
+        (["id9"], False),
+    ]
+    assert [e.tolist() for e in embeddings] == [[float(i)] for i in range(10)]
+    # two slices embedded concurrently, and never more than two waiting to be written
+    assert strategy.started[:2] == ["", "xxx"]
+    assert strategy.max_unwritten == 2
+    # the slices share one limit on the requests in flight
+    assert len(set(map(id, strategy.semaphores))) == 1
+
+
+async def test_failed_slice_throws(monkeypatch):
+    store = RecordingVectorStore()
+    strategy = SlowStrategy(store, fail="xxx")
+
+    with pytest.raises(ValueError, match="embedding failed"):
+        await embed_into_store(monkeypatch, strategy, 10)
+
+    assert [ids for ids, _ in store.loads] == [["id0", "id1", "id2"]]
@@ -0,0 +1,136 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+import json
+import time
+from typing import Any, cast
+
+import pandas as pd
+from datashaper import Table, VerbInput, VerbResult, create_verb_result
+
+from graphrag.index.config import PipelineWorkflowReference
+from graphrag.index.run import run_pipeline
+from graphrag.index.storage import MemoryPipelineStorage
+
+DELAY = 0.2
+
+
+class Timeline:
+    def __init__(self):
+        self.events: dict[str, tuple[float, float]] = {}
+        self.inputs: dict[str, int] = {}
+
+    def verbs(self) -> Any:
+        async def timed_verb(
+            input: VerbInput, name: str, fail: bool = False, **_kwargs
+        ) -> VerbResult:
+            start = time.monotonic()
+            await asyncio.sleep(DELAY)
+            if fail:
+                msg = f"{name} failed"
+                raise ValueError(msg)
+            self.events[name] = (start, time.monotonic())
+            source = cast(pd.DataFrame, input.get_input())
+            self.inputs[name] = len(source)
+            return create_verb_result(cast(Table, pd.DataFrame({"id": [name]})))
+
+        return {"timed_verb": timed_verb}
+
+
+def workflow(name: str, depends_on: list[str] | None = None, fail: bool = False):
+    step: dict[str, Any] = {"verb": "timed_verb", "args": {"name": name, "fail": fail}}
+    if depends_on:
+        step["input"] = {
+            "source": f"workflow:{depends_on[0]}",
+            "others": [f"workflow:{d}" for d in depends_on[1:]],
+        }
+    return lambda _config: [step]
+
+
+# a and b are independent, c depends on both and d on c
+mock_workflows: Any = {
+    "a": workflow("a"),
+    "b": workflow("b"),
+    "c": workflow("c", ["a", "b"]),
+    "d": workflow("d", ["c"]),
+}
+references = [
+    PipelineWorkflowReference(name=name, config=None) for name in ["a", "b", "c", "d"]
+]
+dataset = pd.DataFrame({"id": [1, 2, 3], "text": ["x", "y", "z"], "title": "t"})
+
+
+async def run(
+    timeline: Timeline,
+    storage: MemoryPipelineStorage,
+    workflows: Any = mock_workflows,
+    **kwargs,
+):
+    return [
+        result
+        async for result in run_pipeline(
+            references,
+            dataset,
+            storage=storage,
+            additional_workflows=workflows,
+            additional_verbs=timeline.verbs(),
+            **kwargs,
+        )
+    ]
+
+
+async def test_independent_workflows_overlap():
+    timeline = Timeline()
+    storage = MemoryPipelineStorage()
+    results = await run(timeline, storage, max_parallel_workflows=4)
+
+    assert [result.workflow for result in results] == ["a", "b", "c", "d"]
+    assert all(not result.errors for result in results)
+    a, b, c, d = (timeline.events[name] for name in "abcd")
+    # a and b run together, c waits for both and d for c
+    assert b[0] < a[1]
+    assert c[0] >= max(a[1], b[1])
+    assert d[0] >= c[1]
+    assert timeline.inputs["c"] == 1
+
+    stats = json.loads(await storage.get("stats.json"))
+    assert set(stats["workflows"]) == {"a", "b", "c", "d"}
+    assert all(stats["workflows"][name]["overall"] >= DELAY for name in "abcd")
+
+
+async def test_workflows_run_one_at_a_time_by_default():
+    timeline = Timeline()
+    results = await run(timeline, MemoryPipelineStorage())
+
+    assert [result.workflow for result in results] == ["a", "b", "c", "d"]
+    starts = [timeline.events[name][0] for name in "abcd"]
+    ends = [timeline.events[name][1] for name in "abcd"]
+    assert all(start >= end for start, end in zip(starts[1:], ends[:-1], strict=True))
+
+
+async def test_resume_skips_emitted_workflows():
+    timeline = Timeline()
+    storage = MemoryPipelineStorage()
+    await run(Timeline(), storage, max_parallel_workflows=4)
+
+    await storage.delete("c.parquet")
+    await storage.delete("d.parquet")
+    results = await run(timeline, storage, max_parallel_workflows=4, is_resume_run=True)
+
+    assert [result.workflow for result in results] == ["c", "d"]
+    # c reads the outputs of a and b from the storage
+    assert timeline.inputs["c"] == 1
+
+
+async def test_failed_workflow_stops_the_pipeline():
+    timeline = Timeline()
+    workflows = {**mock_workflows, "b": workflow("b", fail=True)}
+    results = await run(
+        timeline, MemoryPipelineStorage(), workflows, max_parallel_workflows=4
+    )
+
+    assert results[-1].workflow == "b"
+    assert results[-1].errors
+    assert "c" not in timeline.events
+    assert "d" not in timeline.events
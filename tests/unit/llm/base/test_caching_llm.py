@@ -71,3 +71,92 @@ async def test_composite_llm() -> None:
     response = await llm("input 2", history=history)
     history: list[dict] = cast(list[dict], response.history)
     assert len(history) == 4
+
+
+class CountingResponder:
+    def __init__(self, fail_first: bool = False):
+        self.calls = 0
+        self.fail_first = fail_first
+
+    async def __call__(self, input: str, **kwargs: dict) -> LLMOutput:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.fail_first and self.calls == 1:
+            raise ValueError
+        return LLMOutput(output=f"response to [{input}]")
+
+
+async def test_concurrent_identical_calls_are_coalesced() -> None:
+    responder = CountingResponder()
+    cache = TestCache()
+    llm = CachingLLM(
+        cast(CompletionLLM, responder),
+        llm_parameters={},
+        operation="test",
+        cache=cache,
+    )
+    hits: list[str] = []
+    misses: list[str] = []
+    llm.on_cache_hit(lambda key, _name: hits.append(key))
+    llm.on_cache_miss(lambda key, _name: misses.append(key))
+
+    responses = await asyncio.gather(*[
+        llm(input, name="extract") for input in ["a", "b", "a", "a", "b"]
+    ])
+    assert [response.output for response in responses] == [
+        f"response to [{input}]" for input in ["a", "b", "a", "a", "b"]
+    ]
+    assert responder.calls == 2
+    assert len(misses) == 2
+    assert len(hits) == 3
+    assert set(hits) == set(misses)
+    assert llm.coalesced_hits == 3
+    assert len(cache.cache) == 2
+
+    # later calls are served by the cache, without being counted as coalesced
+    await llm("a", name="extract")
+    assert responder.calls == 2
+    assert llm.coalesced_hits == 3
+    # calls with different parameters are not coalesced
+    await asyncio.gather(
+        llm("c", name="extract"),
+        llm("c", name="extract", model_parameters={"temperature": 1}),
+    )
+    assert responder.calls == 4
+
+
+async def test_waiting_calls_are_retried_when_the_first_call_fails() -> None:
+    responder = CountingResponder(fail_first=True)
+    llm = CachingLLM(
+        cast(CompletionLLM, responder),
+        llm_parameters={},
+        operation="test",
+        cache=TestCache(),
+    )
+    first, *others = await asyncio.gather(
+        llm("a"), llm("a"), llm("a"), return_exceptions=True
+    )
+    assert isinstance(first, ValueError)
+    assert [cast(LLMOutput, other).output for other in others] == [
+        "response to [a]"
+    ] * 2
+    assert responder.calls == 2
+    assert llm.coalesced_hits == 1
+
+
+async def test_waiting_calls_survive_a_cancelled_first_call() -> None:
+    responder = CountingResponder()
+    llm = CachingLLM(
+        cast(CompletionLLM, responder),
+        llm_parameters={},
+        operation="test",
+        cache=TestCache(),
+    )
+    first = asyncio.create_task(llm("a"))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(llm("a"))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert (await second).output == "response to [a]"
+    assert first.cancelled()
+    assert responder.calls == 2
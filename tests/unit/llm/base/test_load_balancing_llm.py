@@ -0,0 +1,287 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+"""Load Balancing LLM Tests, against local mock OpenAI servers."""
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from openai import AsyncOpenAI, InternalServerError, RateLimitError
+
+from graphrag.llm import (
+    LoadBalancingLLM,
+    OpenAIConfiguration,
+    OpenAIEndpoint,
+    TokenBudget,
+    TpmRpmLLMLimiter,
+    create_openai_chat_llm,
+    create_openai_embedding_llm,
+)
+from graphrag.llm.openai import factories
+
+
+class _Server(ThreadingHTTPServer):
+    request_queue_size = 128
+
+
+class MockOpenAIServer:
+    """A local server answering chat and embedding requests in the OpenAI format."""
+
+    def __init__(self, status: int = 200, delay: float = 0.0):
+        self.status = status
+        self.delay = delay
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):  # noqa: N802
+                length = int(self.headers["Content-Length"])
+                body = json.loads(self.rfile.read(length))
+                server.requests += 1
+                time.sleep(server.delay)
+                if server.status != 200:
+                    self._respond(server.status, {"error": {"message": "unavailable"}})
+                elif self.path.endswith("/embeddings"):
+                    self._respond(200, _embeddings(body))
+                else:
+                    self._respond(200, _completion(body))
+
+            def _respond(self, status: int, payload: dict):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = _Server(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.01,), daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}/v1"
+
+    def __enter__(self) -> "MockOpenAIServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _completion(body: dict) -> dict:
+    prompt = body["messages"][-1]["content"]
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": body["model"],
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": f"echo {prompt}"},
+            }
+        ],
+        "usage": {
+            "prompt_tokens": len(prompt.split()),
+            "completion_tokens": 2,
+            "total_tokens": len(prompt.split()) + 2,
+        },
+    }
+
+
+def _embeddings(body: dict) -> dict:
+    texts = body["input"]
+    return {
+        "object": "list",
+        "model": body["model"],
+        "data": [
+            {"object": "embedding", "index": i, "embedding": [float(len(text)), 1.0]}
+            for i, text in enumerate(texts)
+        ],
+        "usage": {"prompt_tokens": len(texts), "total_tokens": len(texts)},
+    }
+
+
+@pytest.fixture(autouse=True)
+def _count_words(monkeypatch: pytest.MonkeyPatch) -> None:
+    # count words instead of loading a tiktoken encoding
+    monkeypatch.setattr(
+        factories, "get_token_counter", lambda _config: lambda s: len(s.split())
+    )
+
+
+@pytest.fixture
+def servers() -> Iterator[list[MockOpenAIServer]]:
+    with MockOpenAIServer() as first, MockOpenAIServer() as second:
+        yield [first, second]
+
+
+def config(**kwargs) -> OpenAIConfiguration:
+    return OpenAIConfiguration({
+        "api_key": "key",
+        "model": "gpt-4o",
+        "max_retries": 4,
+        "max_retry_wait": 0.01,
+        "endpoint_eject_after": 2,
+        "endpoint_eject_seconds": 60,
+        **kwargs,
+    })
+
+
+def endpoint(
+    server: MockOpenAIServer, weight: float = 1.0, limiter=None
+) -> OpenAIEndpoint:
+    endpoint_config = config(api_base=server.url, max_retries=1)
+    return OpenAIEndpoint(
+        server.url,
+        AsyncOpenAI(api_key="key", base_url=server.url, max_retries=0),
+        endpoint_config,
+        weight,
+        limiter,
+    )
+
+
+def balancer_of(llm) -> LoadBalancingLLM:
+    while not isinstance(llm, LoadBalancingLLM):
+        llm = llm._delegate  # noqa: SLF001
+    return llm
+
+
+async def test_requests_are_balanced_by_weight(servers):
+    first, second = servers
+    first.delay = second.delay = 0.05
+    llm = create_openai_chat_llm(
+        None,  # type: ignore
+        config(),
+        endpoints=[endpoint(first, weight=3), endpoint(second)],
+    )
+
+    results = await asyncio.gather(*[llm(f"prompt {i}") for i in range(40)])
+
+    assert [result.output for result in results] == [
+        f"echo prompt {i}" for i in range(40)
+    ]
+    assert (first.requests, second.requests) == (30, 10)
+    metrics = balancer_of(llm).metrics
+    assert metrics[first.url]["requests"] == 30
+    assert metrics[second.url]["requests"] == 10
+
+
+async def test_requests_go_to_the_endpoint_with_the_most_free_capacity(servers):
+    first, second = servers
+    busy = TpmRpmLLMLimiter(TokenBudget(1_000), None)
+    idle = TpmRpmLLMLimiter(TokenBudget(1_000), None)
+    await busy.acquire(500)
+    llm = create_openai_chat_llm(
+        None,  # type: ignore
+        config(),
+        endpoints=[endpoint(first, limiter=busy), endpoint(second, limiter=idle)],
+    )
+
+    for i in range(5):
+        await llm(f"prompt {i}")
+
+    # the idle endpoint still has more free tokens after five small requests
+    assert (first.requests, second.requests) == (0, 5)
+    assert busy.headroom < idle.headroom
+
+
+@pytest.mark.parametrize("status", [429, 500])
+async def test_failing_endpoint_is_ejected(servers, status):
+    first, second = servers
+    first.status = status
+    llm = create_openai_chat_llm(
+        None,  # type: ignore
+        config(),
+        endpoints=[endpoint(first, weight=2), endpoint(second)],
+    )
+
+    results = [await llm(f"prompt {i}") for i in range(6)]
+
+    assert all(result.output is not None for result in results)
+    # two consecutive failures eject the endpoint, the other serves the rest
+    assert (first.requests, second.requests) == (2, 6)
+    metrics = balancer_of(llm).metrics
+    assert metrics[first.url]["failures"] == 2
+    assert metrics[first.url]["ejections"] == 1
+    assert metrics[first.url]["requests"] == 0
+    assert metrics[second.url]["requests"] == 6
+
+
+async def test_ejected_endpoints_return_and_retries_are_bounded(servers):
+    first, second = servers
+    first.status = second.status = 500
+    llm = create_openai_chat_llm(
+        None,  # type: ignore
+        config(max_retries=6, endpoint_eject_after=1, endpoint_eject_seconds=0.05),
+        endpoints=[endpoint(first), endpoint(second)],
+    )
+
+    started = time.monotonic()
+    with pytest.raises(InternalServerError):
+        await llm("prompt")
+
+    assert first.requests + second.requests == 6
+    # every endpoint was ejected, so the retries waited for them to return
+    assert time.monotonic() - started >= 0.1
+    assert sum(m["ejections"] for m in balancer_of(llm).metrics.values()) == 6
+
+
+async def test_rate_limit_errors_exhaust_the_retries(servers):
+    first, second = servers
+    first.status = second.status = 429
+    llm = create_openai_chat_llm(
+        None,  # type: ignore
+        config(max_retries=2),
+        endpoints=[endpoint(first), endpoint(second)],
+    )
+
+    with pytest.raises(RateLimitError):
+        await llm("prompt")
+    assert (first.requests, second.requests) == (1, 1)
+
+
+async def test_endpoint_metrics(servers):
+    first, second = servers
+    first.delay = 0.02
+    llm = create_openai_chat_llm(
+        None,  # type: ignore
+        config(),
+        endpoints=[endpoint(first, weight=2), endpoint(second)],
+    )
+    await llm("one two three")
+    await llm("four five")
+
+    metrics = balancer_of(llm).metrics[first.url]
+    assert metrics["requests"] == 2
+    assert metrics["input_tokens"] == 5
+    # the output tokens are reported by the service
+    assert metrics["output_tokens"] == 4
+    assert metrics["mean_latency"] >= 0.02
+
+
+async def test_embeddings_are_balanced(servers):
+    first, second = servers
+    first.status = 500
+    llm = create_openai_embedding_llm(
+        None,  # type: ignore
+        config(model="text-embedding-3-small"),
+        endpoints=[endpoint(first, weight=2), endpoint(second)],
+    )
+
+    result = await llm(["a", "bcd"])
+
+    assert result.output == [[1.0, 1.0], [3.0, 1.0]]
+    assert (first.requests, second.requests) == (1, 1)
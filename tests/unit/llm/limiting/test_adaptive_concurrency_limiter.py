@@ -0,0 +1,129 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+from typing import Any, cast
+
+import pytest
+
+from graphrag.llm import CompletionLLM, LLMOutput, OpenAIConfiguration
+from graphrag.llm.base import RateLimitingLLM
+from graphrag.llm.limiting import AdaptiveConcurrencyLimiter
+
+
+class ThrottledError(Exception):
+    pass
+
+
+class QuotaEndpoint:
+    """An endpoint that throttles the requests beyond its concurrency quota."""
+
+    def __init__(self, quota: int):
+        self.quota = quota
+        self.in_flight = 0
+        self.peak = 0
+        self.throttled = 0
+
+    async def __call__(self, input: str, **kwargs: Any) -> LLMOutput:
+        if self.in_flight >= self.quota:
+            self.throttled += 1
+            await asyncio.sleep(0.001)
+            raise ThrottledError
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.002)
+        finally:
+            self.in_flight -= 1
+        return LLMOutput(output=f"response to [{input}]")
+
+
+async def test_window_bounds_requests_in_flight():
+    limiter = AdaptiveConcurrencyLimiter(2, min_limit=1, max_limit=4)
+    in_flight = 0
+    peak = 0
+
+    async def request():
+        nonlocal in_flight, peak
+        started = await limiter.acquire()
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        limiter.release(started, succeeded=True, throttled=False)
+
+    await asyncio.gather(*[request() for _ in range(40)])
+    assert peak <= 4
+    assert limiter.in_flight == 0
+    # 40 healthy requests grow the window additively, up to its maximum
+    assert limiter.limit == 4
+    assert limiter.stats["successes"] == 40
+
+
+async def test_throttles_shrink_the_window_once_per_burst():
+    limiter = AdaptiveConcurrencyLimiter(16, min_limit=2, max_limit=32)
+    started = [await limiter.acquire() for _ in range(8)]
+    for start in started:
+        limiter.release(start, succeeded=False, throttled=True)
+    assert limiter.limit == 8
+    assert limiter.stats["throttle_events"] == 8
+    assert limiter.stats["window_decreases"] == 1
+
+    # a request started after the decrease shrinks the window again, down to its minimum
+    for _ in range(3):
+        limiter.release(await limiter.acquire(), succeeded=False, throttled=True)
+    assert limiter.limit == 2
+    assert limiter.stats == {
+        "window": 2,
+        "min_window": 2,
+        "max_window": 32,
+        "peak_window": 16,
+        "successes": 0,
+        "throttle_events": 11,
+        "window_decreases": 4,
+    }
+
+
+async def test_cancelled_waiters_do_not_leak_slots():
+    limiter = AdaptiveConcurrencyLimiter(1)
+    started = await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    limiter.release(started, succeeded=True, throttled=False)
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.in_flight == 0
+    await asyncio.wait_for(limiter.acquire(), timeout=1)
+
+
+def test_invalid_bounds():
+    with pytest.raises(ValueError, match="Invalid concurrency bounds"):
+        AdaptiveConcurrencyLimiter(4, min_limit=8, max_limit=4)
+
+
+async def test_rate_limiting_llm_adapts_to_the_endpoint_quota():
+    endpoint = QuotaEndpoint(quota=4)
+    limiter = AdaptiveConcurrencyLimiter(32, min_limit=1, max_limit=64)
+    llm = RateLimitingLLM(
+        cast(CompletionLLM, endpoint),
+        OpenAIConfiguration({
+            "api_key": "key",
+            "model": "model",
+            "max_retries": 100,
+            "max_retry_wait": 0.005,
+        }),
+        "chat",
+        retryable_errors=[ThrottledError],
+        rate_limit_errors=[ThrottledError],
+        concurrency_limiter=limiter,
+    )
+
+    results = await asyncio.gather(*[llm(f"input {i}") for i in range(200)])
+    assert [result.output for result in results] == [
+        f"response to [input {i}]" for i in range(200)
+    ]
+    assert endpoint.peak <= 4
+    assert limiter.in_flight == 0
+    assert limiter.stats["throttle_events"] == endpoint.throttled > 0
+    assert limiter.stats["window_decreases"] >= 3
+    assert limiter.limit <= 8
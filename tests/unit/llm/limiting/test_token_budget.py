@@ -0,0 +1,170 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+import random
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, cast
+from unittest.mock import patch
+
+import pytest
+
+from graphrag.llm import (
+    CompletionLLM,
+    LLMLimiter,
+    LLMOutput,
+    OpenAIConfiguration,
+    TokenBudget,
+    TpmRpmLLMLimiter,
+)
+from graphrag.llm.base import RateLimitingLLM
+
+TOKENS_PER_MINUTE = 60_000
+MAX_TOKENS = 1_000
+
+
+@contextmanager
+def virtual_time() -> Iterator[Callable[[], float]]:
+    """Run the event loop on a virtual clock, which jumps to the next timer instead of waiting for it."""
+    loop = asyncio.get_running_loop()
+    selector = loop._selector  # type: ignore # noqa: SLF001
+    select = selector.select
+    now = 0.0
+
+    def virtual_select(timeout: float | None = None):
+        nonlocal now
+        if timeout:
+            now += timeout
+        return select(0)
+
+    with (
+        patch.object(loop, "time", lambda: now),
+        patch.object(selector, "select", virtual_select),
+    ):
+        yield lambda: now
+
+
+class SimulatedEndpoint:
+    """A chat endpoint whose completions have random lengths, recording the tokens each request used."""
+
+    def __init__(self, clock: Callable[[], float], seed: int = 0):
+        self.clock = clock
+        self.random = random.Random(seed)
+        self.requests: list[tuple[float, int]] = []
+
+    async def __call__(self, input: str, **kwargs: Any) -> LLMOutput:
+        started = self.clock()
+        prompt_tokens = len(input.split())
+        completion_tokens = self.random.randint(50, MAX_TOKENS)
+        await asyncio.sleep(1 + completion_tokens / 200)
+        self.requests.append((started, prompt_tokens + completion_tokens))
+        return LLMOutput(
+            output="completion",
+            usage={
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        )
+
+
+def create_llm(endpoint: Any, limiter: Any) -> RateLimitingLLM:
+    return RateLimitingLLM(
+        cast(CompletionLLM, endpoint),
+        OpenAIConfiguration({
+            "api_key": "key",
+            "model": "model",
+            "max_tokens": MAX_TOKENS,
+        }),
+        "chat",
+        retryable_errors=[],
+        rate_limit_errors=[],
+        rate_limiter=limiter,
+        count_tokens=lambda text: len(text.split()),
+    )
+
+
+async def test_sustained_usage_stays_under_the_budget():
+    with virtual_time() as clock:
+        endpoint = SimulatedEndpoint(clock)
+        budget = TokenBudget(TOKENS_PER_MINUTE)
+        llm = create_llm(endpoint, TpmRpmLLMLimiter(budget, None))
+        # all requests are submitted at once, the worst case for a burst of long completions
+        await asyncio.gather(*[llm("word " * 500) for _ in range(400)])
+        end = clock()
+
+    used = sum(tokens for _, tokens in endpoint.requests)
+    assert len(endpoint.requests) == 400
+    # beyond the initial burst of one (empty) bucket, the sustained usage stays under
+    # the budget, as reserving input + max_tokens accounts for the completions in flight
+    assert (used - TOKENS_PER_MINUTE) / (end / 60) <= TOKENS_PER_MINUTE
+    # every minute after the first one stays within a few percent of the budget, as
+    # refunded tokens may be used again within the same minute
+    for window_start in range(60, int(end) - 60, 5):
+        window_usage = sum(
+            tokens
+            for started, tokens in endpoint.requests
+            if window_start <= started < window_start + 60
+        )
+        assert window_usage <= 1.05 * TOKENS_PER_MINUTE
+    # ...while refunding the unused reservations keeps the budget well used
+    assert used / (end / 60) >= 0.85 * TOKENS_PER_MINUTE
+
+
+async def test_reservations_are_refunded_and_charged():
+    with virtual_time():
+        budget = TokenBudget(1_000)
+        limiter = TpmRpmLLMLimiter(budget, None)
+        await limiter.acquire(600)
+        assert budget.level == 600
+        await limiter.reconcile(600, 250)
+        assert budget.level == 250
+        await limiter.reconcile(0, 1_200)
+        assert budget.level == 1_450
+
+        # an overdrawn budget delays the next reservation until it has drained
+        await limiter.acquire(1_000)
+        assert asyncio.get_running_loop().time() == pytest.approx(87)
+        # a reservation larger than the budget waits for an empty bucket
+        await limiter.acquire(5_000)
+        assert asyncio.get_running_loop().time() == pytest.approx(147)
+
+
+async def test_failed_attempts_refund_the_response_tokens():
+    with virtual_time():
+        # a budget that does not drain while the attempt is retried
+        budget = TokenBudget(TOKENS_PER_MINUTE, time_period=1e9)
+        attempts = 0
+
+        async def flaky_endpoint(input: str, **kwargs: Any) -> LLMOutput:
+            nonlocal attempts
+            attempts += 1
+            await asyncio.sleep(0.1)
+            if attempts == 1:
+                raise ConnectionError
+            return LLMOutput(output="one two three")
+
+        llm = create_llm(flaky_endpoint, TpmRpmLLMLimiter(budget, None))
+        llm._retryable_errors = [ConnectionError]  # noqa: SLF001
+        await llm("word " * 100, model_parameters={"max_tokens": 10_000})
+        # the failed attempt is charged its prompt, the second attempt its prompt and
+        # response (counted, as the endpoint reports no usage)
+        assert budget.level == pytest.approx(203, abs=1)
+
+
+async def test_default_reconcile_acquires_the_excess():
+    class CountingLimiter(LLMLimiter):
+        def __init__(self):
+            self.acquired: list[int] = []
+
+        @property
+        def needs_token_count(self) -> bool:
+            return True
+
+        async def acquire(self, num_tokens: int = 1) -> None:
+            self.acquired.append(num_tokens)
+
+    limiter = CountingLimiter()
+    await limiter.reconcile(100, 40)
+    await limiter.reconcile(100, 140)
+    assert limiter.acquired == [40]
@@ -0,0 +1,393 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from collections.abc import Sequence
+from dataclasses import asdict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from graphrag.model import (
+    Community,
+    CommunityReport,
+    Covariate,
+    Entity,
+    Relationship,
+    TextUnit,
+)
+from graphrag.query.indexer_adapters import (
+    read_indexer_covariates,
+    read_indexer_relationships,
+    read_indexer_reports,
+    read_indexer_text_units,
+)
+from graphrag.query.input.loaders.dfs import (
+    read_communities,
+    read_covariates,
+    read_entities,
+    store_entity_semantic_embeddings,
+)
+from graphrag.query.input.loaders.utils import (
+    LazyModelList,
+    to_optional_dict,
+    to_optional_float,
+    to_optional_int,
+    to_optional_list,
+    to_optional_str,
+    to_str,
+)
+
+DATA_DIR = "tests/verbs/data"
+
+
+# row based reference implementations, as the loaders were before they were vectorised
+def legacy_read_entities(frame: pd.DataFrame, **cols) -> list[Entity]:
+    c = {
+        "id_col": "id",
+        "short_id_col": "short_id",
+        "title_col": "title",
+        "type_col": "type",
+        "description_col": "description",
+        "name_embedding_col": "name_embedding",
+        "description_embedding_col": "description_embedding",
+        "graph_embedding_col": "graph_embedding",
+        "community_col": "community_ids",
+        "text_unit_ids_col": "text_unit_ids",
+        "document_ids_col": "document_ids",
+        "rank_col": "degree",
+        "attributes_cols": None,
+        **cols,
+    }
+    return [
+        Entity(
+            id=to_str(row, c["id_col"]),
+            short_id=to_optional_str(row, c["short_id_col"])
+            if c["short_id_col"]
+            else str(idx),
+            title=to_str(row, c["title_col"]),
+            type=to_optional_str(row, c["type_col"]),
+            description=to_optional_str(row, c["description_col"]),
+            name_embedding=to_optional_list(
+                row, c["name_embedding_col"], item_type=float
+            ),
+            description_embedding=to_optional_list(
+                row, c["description_embedding_col"], item_type=float
+            ),
+            graph_embedding=to_optional_list(
+                row, c["graph_embedding_col"], item_type=float
+            ),
+            community_ids=to_optional_list(row, c["community_col"], item_type=str),
+            text_unit_ids=to_optional_list(row, c["text_unit_ids_col"]),
+            document_ids=to_optional_list(row, c["document_ids_col"]),
+            rank=to_optional_int(row, c["rank_col"]),
+            attributes={col: row.get(col) for col in c["attributes_cols"]}
+            if c["attributes_cols"]
+            else None,
+        )
+        for idx, row in frame.iterrows()
+    ]
+
+
+def legacy_read_relationships(frame: pd.DataFrame, **cols) -> list[Relationship]:
+    c = {
+        "short_id_col": "short_id",
+        "description_embedding_col": "description_embedding",
+        "document_ids_col": "document_ids",
+        "attributes_cols": None,
+        **cols,
+    }
+    return [
+        Relationship(
+            id=to_str(row, "id"),
+            short_id=to_optional_str(row, c["short_id_col"])
+            if c["short_id_col"]
+            else str(idx),
+            source=to_str(row, "source"),
+            target=to_str(row, "target"),
+            description=to_optional_str(row, "description"),
+            description_embedding=to_optional_list(
+                row, c["description_embedding_col"], item_type=float
+            ),
+            weight=to_optional_float(row, "weight"),
+            text_unit_ids=to_optional_list(row, "text_unit_ids", item_type=str),
+            document_ids=to_optional_list(row, c["document_ids_col"], item_type=str),
+            attributes={col: row.get(col) for col in c["attributes_cols"]}
+            if c["attributes_cols"]
+            else None,
+        )
+        for idx, row in frame.iterrows()
+    ]
+
+
+def legacy_read_text_units(frame: pd.DataFrame) -> list[TextUnit]:
+    return [
+        TextUnit(
+            id=to_str(row, "id"),
+            short_id=str(idx),
+            text=to_str(row, "text"),
+            entity_ids=to_optional_list(row, "entity_ids", item_type=str),
+            relationship_ids=to_optional_list(row, "relationship_ids", item_type=str),
+            covariate_ids=None,
+            text_embedding=to_optional_list(row, "text_embedding", item_type=float),  # type: ignore
+            n_tokens=to_optional_int(row, "n_tokens"),
+            document_ids=to_optional_list(row, "document_ids", item_type=str),
+            attributes=None,
+        )
+        for idx, row in frame.iterrows()
+    ]
+
+
+def legacy_read_community_reports(
+    frame: pd.DataFrame, content_embedding_col: str | None = None
+) -> list[CommunityReport]:
+    return [
+        CommunityReport(
+            id=to_str(row, "community"),
+            short_id=to_optional_str(row, "community"),
+            title=to_str(row, "title"),
+            community_id=to_str(row, "community"),
+            summary=to_str(row, "summary"),
+            full_content=to_str(row, "full_content"),
+            rank=to_optional_float(row, "rank"),
+            summary_embedding=None,
+            full_content_embedding=to_optional_list(
+                row, content_embedding_col, item_type=float
+            ),
+            attributes=None,
+        )
+        for _, row in frame.iterrows()
+    ]
+
+
+def legacy_read_covariates(frame: pd.DataFrame, attributes_cols: list[str]):
+    return [
+        Covariate(
+            id=to_str(row, "id"),
+            short_id=to_optional_str(row, "human_readable_id"),
+            subject_id=to_str(row, "subject_id"),
+            covariate_type=to_str(row, "type"),
+            text_unit_ids=None,
+            document_ids=to_optional_list(row, "document_ids", item_type=str),
+            attributes={col: row.get(col) for col in attributes_cols},
+        )
+        for _, row in frame.iterrows()
+    ]
+
+
+def legacy_read_communities(frame: pd.DataFrame) -> list[Community]:
+    return [
+        Community(
+            id=to_str(row, "id"),
+            short_id=str(idx),
+            title=to_str(row, "title"),
+            level=to_str(row, "level"),
+            entity_ids=None,
+            relationship_ids=to_optional_list(row, "relationship_ids", item_type=str),
+            covariate_ids=to_optional_dict(row, "covariate_ids", str, str),
+            attributes=None,
+        )
+        for idx, row in frame.iterrows()
+    ]
+
+
+def assert_same(actual: Sequence, expected: list):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected, strict=True):
+        assert type(a) is type(e)
+        actual_fields, expected_fields = asdict(a), asdict(e)
+        assert actual_fields.keys() == expected_fields.keys()
+        for key, value in expected_fields.items():
+            assert type(actual_fields[key]) is type(value), key
+            # NaN attribute values do not compare equal to themselves
+            assert str(actual_fields[key]) == str(value), key
+
+
+def entity_frame() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "id": [f"e{i}" for i in range(6)],
+        "human_readable_id": [0, 1, 2, 3, 4, 5],
+        "title": ["A", "B", "C", "D", "E", "F"],
+        "type": ["person", None, "org", "org", None, "geo"],
+        "description": ["a", "b", None, "d", "e", "f"],
+        "description_embedding": [rng.random(8) for _ in range(5)] + [None],
+        "graph_embedding": [None] * 6,
+        "community": [["1"], ["2"], [], ["1", "3"], None, ["4"]],
+        "text_unit_ids": [np.array(["t1"]), ["t2", "t3"], [], None, ["t1"], ["t4"]],
+        "rank": [3, 1, 0, 2, 5, 4],
+        "score": [0.5, np.nan, 1.0, 2.0, None, 3.0],
+    })
+
+
+def test_read_entities_matches_legacy():
+    frame = entity_frame()
+    cols = {
+        "short_id_col": "human_readable_id",
+        "community_col": "community",
+        "rank_col": "rank",
+        "name_embedding_col": None,
+        "document_ids_col": None,
+        "attributes_cols": ["score", "missing"],
+    }
+    assert_same(read_entities(frame, **cols), legacy_read_entities(frame, **cols))
+    cols["short_id_col"] = None
+    assert_same(read_entities(frame, **cols), legacy_read_entities(frame, **cols))
+    assert_same(read_entities(frame.iloc[:0], **cols), [])
+
+
+def test_read_entities_all_numeric_frame_matches_legacy():
+    # iterrows casts every value of an all-numeric frame to float
+    frame = pd.DataFrame({"id": [1, 2], "title": [3, 4], "degree": [1.0, 2.5]})
+    cols = {
+        "short_id_col": None,
+        "type_col": "id",
+        "description_col": "title",
+    }
+    assert_same(read_entities(frame, **cols), legacy_read_entities(frame, **cols))
+
+
+@pytest.mark.parametrize(
+    ("column", "value", "error"),
+    [
+        ("rank", "high", ValueError),
+        ("community", [1], TypeError),
+        ("description_embedding", "not a vector", ValueError),
+    ],
+)
+def test_read_entities_raises_like_legacy(column, value, error):
+    frame = entity_frame()
+    values = frame[column].tolist()
+    values[2] = value
+    frame[column] = pd.Series(values, dtype=object)
+    cols = {
+        "short_id_col": "human_readable_id",
+        "community_col": "community",
+        "rank_col": "rank",
+    }
+    with pytest.raises(error):
+        legacy_read_entities(frame, **cols)
+    with pytest.raises(error):
+        read_entities(frame, **cols)
+
+
+def test_read_entities_missing_column_raises():
+    with pytest.raises(ValueError, match="Column title not found"):
+        read_entities(entity_frame().drop(columns=["title"]), short_id_col=None)
+
+
+def test_read_indexer_tables_match_legacy():
+    relationships = pd.read_parquet(f"{DATA_DIR}/create_final_relationships.parquet")
+    assert_same(
+        read_indexer_relationships(relationships),
+        legacy_read_relationships(
+            relationships,
+            short_id_col="human_readable_id",
+            description_embedding_col=None,
+            document_ids_col=None,
+            attributes_cols=["rank"],
+        ),
+    )
+
+    text_units = pd.read_parquet(f"{DATA_DIR}/create_final_text_units.parquet")
+    assert_same(read_indexer_text_units(text_units), legacy_read_text_units(text_units))
+
+    nodes = pd.read_parquet(f"{DATA_DIR}/create_final_nodes.parquet")
+    reports = pd.read_parquet(f"{DATA_DIR}/create_final_community_reports.parquet")
+    actual_reports = read_indexer_reports(reports, nodes, 2)
+    assert isinstance(actual_reports, LazyModelList)
+    assert len(actual_reports) > 0
+    reports = reports[reports.level <= 2]
+    reports = reports[reports.community.isin([r.community_id for r in actual_reports])]
+    assert_same(actual_reports, legacy_read_community_reports(reports))
+
+    covariates = pd.read_parquet(f"{DATA_DIR}/create_final_covariates.parquet")
+    attributes_cols = ["object_id", "status", "start_date", "end_date", "description"]
+    assert_same(
+        read_covariates(
+            covariates,
+            short_id_col="human_readable_id",
+            attributes_cols=attributes_cols,
+            text_unit_ids_col=None,
+        ),
+        legacy_read_covariates(covariates, attributes_cols),
+    )
+    assert len(read_indexer_covariates(covariates)) == len(covariates)
+
+
+def test_read_communities_matches_legacy():
+    frame = pd.DataFrame({
+        "id": ["1", "2"],
+        "title": ["Community 1", "Community 2"],
+        "level": [0, 1],
+        "relationship_ids": [["r1"], None],
+        "covariate_ids": [{"claim": "c1"}, None],
+    })
+    assert_same(
+        read_communities(frame, short_id_col=None, entities_col=None),
+        legacy_read_communities(frame),
+    )
+
+
+def test_lazy_loading_shares_one_embedding_matrix():
+    frame = entity_frame()
+    cols = {
+        "short_id_col": "human_readable_id",
+        "community_col": "community",
+        "rank_col": "rank",
+    }
+    eager = read_entities(frame, **cols)
+    entities = read_entities(frame, lazy=True, **cols)
+    assert isinstance(entities, LazyModelList)
+    assert len(entities) == len(eager)
+
+    matrix = entities.embeddings["description_embedding"].matrix
+    assert matrix.dtype == np.float32
+    assert matrix.shape == (6, 8)
+    assert matrix.flags.c_contiguous
+    # nothing is built until it is accessed
+    assert entities._items == [None] * 6  # noqa: SLF001
+
+    first = entities[0]
+    assert entities[0] is first
+    assert first.description_embedding is not None
+    assert np.shares_memory(first.description_embedding, matrix)
+    np.testing.assert_allclose(
+        first.description_embedding, eager[0].description_embedding, rtol=1e-6
+    )
+    assert entities[-1].description_embedding is None
+    assert entities[-1].graph_embedding is None
+    assert entities[1:3] == [entities[1], entities[2]]
+    assert [entity.title for entity in entities] == [entity.title for entity in eager]
+    assert entities[3].community_ids == eager[3].community_ids
+
+
+def test_lazy_entities_are_stored_with_float_vectors():
+    class RecordingVectorStore:
+        def load_documents(self, documents):
+            self.documents = documents
+
+    entities = read_entities(
+        entity_frame(),
+        short_id_col=None,
+        community_col="community",
+        rank_col="rank",
+        lazy=True,
+    )
+    store = RecordingVectorStore()
+    store_entity_semantic_embeddings(entities, store)  # type: ignore
+
+    vector = store.documents[0].vector
+    assert type(vector) is list
+    assert type(vector[0]) is float
+    np.testing.assert_allclose(vector, entities[0].description_embedding)
+    assert store.documents[-1].vector is None
+
+
+def test_lazy_loading_rejects_ragged_embeddings():
+    frame = entity_frame()
+    embeddings = frame["description_embedding"].tolist()
+    embeddings[1] = np.zeros(3)
+    frame["description_embedding"] = embeddings
+    with pytest.raises(ValueError, match="different dimensions"):
+        read_entities(frame, short_id_col=None, lazy=True)
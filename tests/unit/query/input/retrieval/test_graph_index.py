@@ -0,0 +1,224 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import random
+from typing import Any, cast
+
+import pytest
+
+from graphrag.model import Entity, Relationship
+from graphrag.query.context_builder.entity_extraction import (
+    find_nearest_neighbors_by_entity_rank,
+)
+from graphrag.query.context_builder.local_context import (
+    build_relationship_context,
+    get_candidate_context,
+)
+from graphrag.query.input.retrieval.entities import get_entity_by_key
+from graphrag.query.input.retrieval.graph_index import GraphIndex
+from graphrag.query.input.retrieval.relationships import (
+    get_candidate_relationships,
+    get_entities_from_relationships,
+    get_in_network_relationships,
+    get_out_network_relationships,
+)
+
+
+class WordEncoder:
+    """Token encoder stand-in, so the tests do not need to download a tiktoken vocabulary."""
+
+    def encode(self, text: str) -> list[str]:
+        return text.split()
+
+
+TOKEN_ENCODER = cast(Any, WordEncoder())
+
+
+def make_graph(
+    seed: int, num_entities: int = 40, num_relationships: int = 120
+) -> tuple[list[Entity], list[Relationship]]:
+    rng = random.Random(seed)
+    titles = [f"ENTITY_{i}" for i in range(num_entities)]
+    entities = [
+        Entity(
+            id=f"entity-{i}",
+            short_id=str(i),
+            title=title,
+            rank=rng.choice([None, *range(5)]),
+        )
+        for i, title in enumerate(titles)
+    ]
+    # a duplicated title, as produced by entities that appear at several levels
+    entities.append(
+        Entity(id="entity-dup", short_id="dup", title=titles[3], rank=rng.randint(0, 4))
+    )
+    relationships = []
+    for i in range(num_relationships):
+        source, target = rng.choice(titles), rng.choice(titles)
+        relationships.append(
+            Relationship(
+                id=f"rel-{i}",
+                short_id=str(i),
+                source=source,
+                target=target,
+                weight=rng.random(),
+                # rank ties exercise the stable ordering
+                attributes={"rank": rng.randint(0, 3)},
+            )
+        )
+    # a relationship to an entity that is missing from the entity list
+    relationships.append(
+        Relationship(
+            id="rel-orphan",
+            short_id="orphan",
+            source=titles[0],
+            target="MISSING",
+            weight=1.0,
+            attributes={"rank": 0},
+        )
+    )
+    return entities, relationships
+
+
+def selections(entities: list[Entity], seed: int) -> list[list[Entity]]:
+    rng = random.Random(seed)
+    return [
+        [],
+        [entities[0]],
+        rng.sample(entities, 3),
+        rng.sample(entities, 10),
+    ]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_relationship_retrieval_matches_scan(seed: int):
+    entities, relationships = make_graph(seed)
+    index = GraphIndex(entities, relationships)
+
+    for selected in selections(entities, seed):
+        assert get_candidate_relationships(
+            selected, relationships, graph_index=index
+        ) == get_candidate_relationships(selected, relationships)
+        for ranking_attribute in ["rank", "weight"]:
+            assert get_in_network_relationships(
+                selected, relationships, ranking_attribute, graph_index=index
+            ) == get_in_network_relationships(
+                selected, relationships, ranking_attribute
+            )
+            assert get_out_network_relationships(
+                selected, relationships, ranking_attribute, graph_index=index
+            ) == get_out_network_relationships(
+                selected, relationships, ranking_attribute
+            )
+
+        candidates = get_candidate_relationships(selected, relationships)
+        assert get_entities_from_relationships(
+            candidates, entities, graph_index=index
+        ) == get_entities_from_relationships(candidates, entities)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_context_builders_match_scan(seed: int):
+    entities, relationships = make_graph(seed)
+    index = GraphIndex(entities, relationships)
+
+    for selected in selections(entities, seed):
+        for ranking_attribute in ["rank", "weight"]:
+            text, table = build_relationship_context(
+                selected,
+                relationships,
+                top_k_relationships=2,
+                relationship_ranking_attribute=ranking_attribute,
+                token_encoder=TOKEN_ENCODER,
+                graph_index=index,
+            )
+            expected_text, expected_table = build_relationship_context(
+                selected,
+                relationships,
+                top_k_relationships=2,
+                relationship_ranking_attribute=ranking_attribute,
+                token_encoder=TOKEN_ENCODER,
+            )
+            assert text == expected_text
+            assert table.equals(expected_table)
+
+        context = get_candidate_context(
+            selected, entities, relationships, {}, graph_index=index
+        )
+        expected = get_candidate_context(selected, entities, relationships, {})
+        assert context.keys() == expected.keys()
+        for key, table in context.items():
+            assert table.equals(expected[key])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_nearest_neighbors_by_entity_rank_matches_scan(seed: int):
+    entities, relationships = make_graph(seed)
+    index = GraphIndex(entities, relationships)
+
+    for entity in [
+        *entities,
+        Entity(id="x", short_id="x", title="MISSING"),
+        Entity(id="y", short_id="y", title=""),
+    ]:
+        for exclude in [None, [entity.title], ["ENTITY_1", "ENTITY_2"]]:
+            for k in [None, 3, 10]:
+                assert find_nearest_neighbors_by_entity_rank(
+                    entity.title,
+                    entities,
+                    relationships,
+                    exclude_entity_names=exclude,
+                    k=k,
+                    graph_index=index,
+                ) == find_nearest_neighbors_by_entity_rank(
+                    entity.title,
+                    entities,
+                    relationships,
+                    exclude_entity_names=exclude,
+                    k=k,
+                )
+
+
+def test_get_entity_by_key_matches_scan():
+    entities = [
+        Entity(id="2da37c7a50a844d4aa2cfd401e19976c", short_id="sid1", title="t1"),
+        Entity(id="c4f93564-4507-4ee4-b102-98add401a965", short_id="sid2", title="t2"),
+        Entity(id="id3", short_id="sid3", title="7c6f2bc947c9445393a3d2e174a02cd9"),
+        Entity(id="id4", short_id="sid4", title="7c6f2bc9-47c9-4453-93a3-d2e174a02cd9"),
+        Entity(id="id5", short_id="sid5", title="t2"),
+    ]
+    index = GraphIndex(entities, [])
+
+    values = [
+        "2da37c7a-50a8-44d4-aa2c-fd401e19976c",
+        "2da37c7a50a844d4aa2cfd401e19976c",
+        "c4f93564-4507-4ee4-b102-98add401a965",
+        "c4f935644507-4ee4-b102-98add401a965",
+        "7c6f2bc9-47c9-4453-93a3-d2e174a02cd9",
+        "t2",
+        "sid3",
+        "missing",
+        3,
+    ]
+    for key in ["id", "title", "short_id"]:
+        for value in values:
+            assert index.get_entity_by_key(key, value) == get_entity_by_key(
+                entities, key, value
+            ), (key, value)
+
+
+def test_lookups():
+    entities, relationships = make_graph(0)
+    index = GraphIndex(entities, relationships)
+
+    assert index.get_entity_by_id("entity-5") is entities[5]
+    assert index.get_entity_by_id("missing") is None
+    assert index.get_entity_by_title("ENTITY_3") is entities[3]
+    assert index.get_entities_by_titles(["ENTITY_3"]) == [entities[3], entities[-1]]
+    assert index.get_relationships(["MISSING"]) == [relationships[-1]]
+    assert index.get_relationships([]) == []
+
+    # neighbour lists are sorted by rank, highest first
+    for entity in entities:
+        ranks = [neighbor.rank or 0 for neighbor in index.get_neighbors(entity.title)]
+        assert ranks == sorted(ranks, reverse=True)
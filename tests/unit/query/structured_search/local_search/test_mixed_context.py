@@ -0,0 +1,120 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from typing import Any, cast
+
+import numpy as np
+
+from graphrag.model import Entity, Relationship
+from graphrag.query.llm.base import BaseTextEmbedding
+from graphrag.query.structured_search.local_search.mixed_context import (
+    LocalSearchMixedContext,
+)
+from graphrag.vector_stores import VectorStoreDocument
+from graphrag.vector_stores.in_memory import InMemoryVectorStore
+
+
+class WordEncoder:
+    """Token encoder stand-in, so the tests do not need to download a tiktoken vocabulary."""
+
+    def encode(self, text: str) -> list[str]:
+        return text.split()
+
+
+class LetterEmbedding(BaseTextEmbedding):
+    """Embeds a text as its letter counts, counting the embedding requests."""
+
+    def __init__(self):
+        self.requests = 0
+
+    def _letters(self, text: str) -> list[float]:
+        vector = np.zeros(26)
+        for char in text.lower():
+            if "a" <= char <= "z":
+                vector[ord(char) - ord("a")] += 1
+        return vector.tolist()
+
+    def embed(self, text: str, **kwargs: Any) -> list[float]:
+        self.requests += 1
+        return self._letters(text)
+
+    async def aembed(self, text: str, **kwargs: Any) -> list[float]:
+        return self.embed(text)
+
+    def embed_batch(self, texts: list[str], **kwargs: Any) -> list[list[float]]:
+        self.requests += 1
+        return [self._letters(text) for text in texts]
+
+
+def create_context() -> tuple[LocalSearchMixedContext, LetterEmbedding]:
+    titles = ["apple", "banana", "cherry", "durian", "elderberry", "fig", "grape"]
+    entities = [
+        Entity(
+            id=f"entity-{i}",
+            short_id=str(i),
+            title=title,
+            description=f"{title} is a fruit",
+            rank=i,
+        )
+        for i, title in enumerate(titles)
+    ]
+    relationships = [
+        Relationship(
+            id=f"rel-{i}",
+            short_id=str(i),
+            source=titles[i],
+            target=titles[i + 1],
+            weight=1.0,
+            attributes={"rank": i},
+        )
+        for i in range(len(titles) - 1)
+    ]
+    embedder = LetterEmbedding()
+    store = InMemoryVectorStore(collection_name="entities")
+    store.connect()
+    store.load_documents([
+        VectorStoreDocument(
+            id=entity.id,
+            text=entity.title,
+            vector=embedder._letters(entity.title),  # noqa: SLF001
+        )
+        for entity in entities
+    ])
+    context = LocalSearchMixedContext(
+        entities=entities,
+        entity_text_embeddings=store,
+        text_embedder=embedder,
+        relationships=relationships,
+        token_encoder=cast(Any, WordEncoder()),
+    )
+    return context, embedder
+
+
+def test_prefetched_queries_are_embedded_and_searched_once():
+    queries = ["grapes", "bananas", "a cherry"]
+    expected_context, expected_embedder = create_context()
+    expected = [
+        expected_context.build_context(query, top_k_mapped_entities=2)
+        for query in queries
+    ]
+    assert expected_embedder.requests == len(queries)
+
+    context, embedder = create_context()
+    context.prefetch_query_entities(
+        [*queries, queries[0], ""], top_k_mapped_entities=2, max_tokens=100
+    )
+    assert embedder.requests == 1
+    for query, (expected_text, expected_data) in zip(queries, expected, strict=True):
+        text, data = context.build_context(query, top_k_mapped_entities=2)
+        assert text == expected_text
+        assert data.keys() == expected_data.keys()
+        for key, table in data.items():
+            assert table.equals(expected_data[key])
+    assert embedder.requests == 1
+
+    # prefetched results are used once, and only for the same number of entities
+    context.build_context(queries[0], top_k_mapped_entities=2)
+    assert embedder.requests == 2
+    context.prefetch_query_entities(queries, top_k_mapped_entities=2)
+    context.build_context(queries[0], top_k_mapped_entities=3)
+    assert embedder.requests == 4
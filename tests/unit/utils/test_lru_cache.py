@@ -0,0 +1,57 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+from unittest import mock
+
+from graphrag.utils.lru_cache import LRUCache
+
+
+def test_evicts_least_recently_used_entry():
+    cache = LRUCache(max_size=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1
+    cache["c"] = 3
+
+    assert "b" not in cache
+    assert cache["a"] == 1
+    assert cache["c"] == 3
+    assert cache.evictions == 1
+
+
+def test_evicts_until_under_byte_budget():
+    cache = LRUCache(max_size=100, max_bytes=10, size_of=len)
+    cache["a"] = "xxxx"
+    cache["b"] = "yyyy"
+    cache["c"] = "zzzz"
+
+    assert list(cache.keys()) == ["b", "c"]
+    assert cache.total_bytes == 8
+
+    cache["b"] = "y"
+    assert cache.total_bytes == 5
+
+
+def test_keeps_newest_entry_even_when_over_byte_budget():
+    cache = LRUCache(max_size=100, max_bytes=2, size_of=len)
+    cache["a"] = "x"
+    cache["big"] = "xxxxxxxx"
+
+    assert list(cache.keys()) == ["big"]
+
+
+def test_expired_entries_are_misses():
+    cache = LRUCache(ttl=60)
+    with mock.patch("graphrag.utils.lru_cache.time", return_value=1000.0):
+        cache["a"] = 1
+        assert cache["a"] == 1
+    with mock.patch("graphrag.utils.lru_cache.time", return_value=1061.0):
+        assert cache["a"] is None
+        assert "a" not in cache
+
+    assert cache.stats == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "entries": 0,
+        "bytes": 0,
+    }
@@ -0,0 +1,95 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import threading
+from typing import Any
+
+from graphrag.model.types import TextEmbedder
+from graphrag.vector_stores import (
+    BaseVectorStore,
+    VectorStoreDocument,
+    VectorStoreSearchResult,
+)
+
+
+class ScoringVectorStore(BaseVectorStore):
+    """Returns the query's first component as the result id, recording the calling threads."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(collection_name="test", **kwargs)
+        self.threads: set[int] = set()
+        self.barrier = threading.Barrier(2, timeout=5)
+
+    def connect(self, **kwargs: Any) -> None:
+        pass
+
+    def load_documents(
+        self, documents: list[VectorStoreDocument], overwrite: bool = True
+    ) -> None:
+        pass
+
+    def similarity_search_by_vector(
+        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        self.threads.add(threading.get_ident())
+        if kwargs.get("wait"):
+            self.barrier.wait()
+        return [
+            VectorStoreSearchResult(
+                document=VectorStoreDocument(
+                    id=str(query_embedding[0]), text=None, vector=None
+                ),
+                score=1 - i / k,
+            )
+            for i in range(k)
+        ]
+
+    def similarity_search_by_text(
+        self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        return self.similarity_search_by_vector(text_embedder(text), k, **kwargs)
+
+    def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
+        return None
+
+
+def test_default_batch_search_searches_each_vector():
+    store = ScoringVectorStore()
+    results = store.similarity_search_by_vectors([[1.0], [2.0], [3.0]], k=2)
+    assert [
+        [result.document.id for result in result_list] for result_list in results
+    ] == [
+        ["1.0", "1.0"],
+        ["2.0", "2.0"],
+        ["3.0", "3.0"],
+    ]
+
+
+def test_batch_text_search_embeds_once():
+    store = ScoringVectorStore()
+    calls = []
+
+    def embed(texts: list[str]) -> list[list[float]]:
+        calls.append(texts)
+        return [[float(len(text))] if text != "skip" else [] for text in texts]
+
+    results = store.similarity_search_by_texts(["a", "skip", "abc"], embed, k=1)
+    assert calls == [["a", "skip", "abc"]]
+    assert [
+        [result.document.id for result in result_list] for result_list in results
+    ] == [
+        ["1.0"],
+        [],
+        ["3.0"],
+    ]
+    assert store.similarity_search_by_texts([], embed) == []
+    assert len(calls) == 1
+
+
+def test_concurrent_search_keeps_query_order():
+    store = ScoringVectorStore(max_concurrent_searches=2)
+    queries = [[float(i)] for i in range(2)]
+    # both searches wait for each other, so they must run on two threads
+    results = store._search_concurrently(queries, k=1, wait=True)  # noqa: SLF001
+    assert [result_list[0].document.id for result_list in results] == ["0.0", "1.0"]
+    assert len(store.threads) == 2
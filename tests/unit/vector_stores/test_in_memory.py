@@ -0,0 +1,205 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import numpy as np
+import pytest
+
+from graphrag.vector_stores import (
+    VectorStoreDocument,
+    VectorStoreFactory,
+    VectorStoreType,
+)
+from graphrag.vector_stores.in_memory import InMemoryVectorStore
+
+
+def make_documents(vectors: np.ndarray, offset: int = 0) -> list[VectorStoreDocument]:
+    return [
+        VectorStoreDocument(
+            id=f"doc-{offset + i}",
+            text=f"text {offset + i}",
+            vector=vector.tolist(),
+            attributes={"title": f"title {offset + i}"},
+        )
+        for i, vector in enumerate(vectors)
+    ]
+
+
+def create_store(**kwargs) -> InMemoryVectorStore:
+    store = VectorStoreFactory.get_vector_store(
+        VectorStoreType.InMemory, kwargs={"collection_name": "entities", **kwargs}
+    )
+    assert isinstance(store, InMemoryVectorStore)
+    store.connect(**kwargs)
+    return store
+
+
+def brute_force(vectors: np.ndarray, query: np.ndarray, k: int) -> list[str]:
+    normalised = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = normalised @ (query / np.linalg.norm(query))
+    return [f"doc-{i}" for i in np.argsort(-scores, kind="stable")[:k]]
+
+
+def test_exact_search_matches_brute_force():
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(500, 16))
+    store = create_store()
+    store.load_documents(make_documents(vectors))
+
+    assert store.matrix.dtype == np.float32
+    assert store.matrix.shape == (500, 16)
+    np.testing.assert_allclose(np.linalg.norm(store.matrix, axis=1), 1, rtol=1e-5)
+
+    for query in rng.normal(size=(10, 16)):
+        results = store.similarity_search_by_vector(query.tolist(), k=7)
+        assert [result.document.id for result in results] == brute_force(
+            vectors, query, 7
+        )
+        scores = [result.score for result in results]
+        assert scores == sorted(scores, reverse=True)
+        assert all(-1 <= score <= 1 for score in scores)
+        assert results[0].document.vector is None
+
+    result = store.similarity_search_by_text(
+        "query", lambda _: vectors[3].tolist(), k=1, include_vectors=True
+    )[0]
+    assert result.document.id == "doc-3"
+    assert result.document.text == "text 3"
+    assert result.document.attributes == {"title": "title 3"}
+    assert result.score == pytest.approx(1)
+    np.testing.assert_allclose(result.document.vector, vectors[3], rtol=1e-5)
+    assert store.similarity_search_by_text("query", lambda _: [], k=1) == []
+
+
+@pytest.mark.parametrize("count", [3, 300])
+def test_filter_by_id(count: int):
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(400, 8))
+    store = create_store()
+    store.load_documents(make_documents(vectors))
+    included = [f"doc-{i}" for i in rng.choice(400, count, replace=False)]
+    store.filter_by_id([*included, "missing"])
+
+    query = rng.normal(size=8)
+    results = store.similarity_search_by_vector(query.tolist(), k=5)
+    indices = [int(id.split("-")[1]) for id in included]
+    expected = [
+        f"doc-{indices[int(i.split('-')[1])]}"
+        for i in brute_force(vectors[indices], query, 5)
+    ]
+    assert [result.document.id for result in results] == expected
+
+    store.filter_by_id([])
+    assert store.query_filter is None
+    assert len(store.similarity_search_by_vector(query.tolist(), k=1000)) == 400
+
+
+def test_skips_documents_without_vectors_and_checks_dimensions():
+    store = create_store()
+    assert store.similarity_search_by_vector([1.0, 0.0], k=3) == []
+    store.load_documents([
+        VectorStoreDocument(id="a", text="a", vector=[1.0, 0.0]),
+        VectorStoreDocument(id="b", text="b", vector=None),
+        VectorStoreDocument(id="c", text="c", vector=[0.0, 0.0]),
+    ])
+    results = store.similarity_search_by_vector([1.0, 0.0], k=3)
+    assert [(result.document.id, result.score) for result in results] == [
+        ("a", 1.0),
+        ("c", 0.0),
+    ]
+    with pytest.raises(ValueError, match="Expected vectors with 2 dimensions"):
+        store.load_documents(
+            [VectorStoreDocument(id="d", text="d", vector=[1.0, 0.0, 0.0])],
+            overwrite=False,
+        )
+
+
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_persisted_collection(tmp_path, memory_map: bool):
+    rng = np.random.default_rng(2)
+    vectors = rng.normal(size=(60, 8))
+    store = create_store(db_uri=str(tmp_path), memory_map=memory_map)
+    # loaded in batches, as the embedding workflow does
+    store.load_documents(make_documents(vectors[:25]))
+    store.load_documents(make_documents(vectors[25:], offset=25), overwrite=False)
+
+    reopened = create_store(db_uri=str(tmp_path), memory_map=memory_map)
+    assert isinstance(reopened.matrix, np.memmap) == memory_map
+    assert not reopened.matrix.flags.writeable
+    np.testing.assert_array_equal(reopened.matrix, store.matrix)
+    query = rng.normal(size=8)
+    assert [
+        result.document.id
+        for result in reopened.similarity_search_by_vector(query.tolist(), k=4)
+    ] == brute_force(vectors, query, 4)
+    assert (
+        reopened.similarity_search_by_vector(query.tolist(), k=1)[0]
+        .document.attributes["title"]
+        .startswith("title")
+    )
+
+    store.load_documents(make_documents(vectors[:5]))
+    assert len(create_store(db_uri=str(tmp_path)).matrix) == 5
+
+
+def test_ivf_index_finds_nearest_neighbours():
+    rng = np.random.default_rng(3)
+    centers = rng.normal(size=(20, 32))
+    vectors = centers[rng.integers(0, 20, 4_000)] + 0.1 * rng.normal(size=(4_000, 32))
+    exact = create_store()
+    exact.load_documents(make_documents(vectors))
+    store = create_store(index_type="ivf", ivf_min_size=1_000, ivf_probes=4)
+    store.load_documents(make_documents(vectors))
+
+    recall = []
+    for query in vectors[rng.choice(4_000, 20, replace=False)]:
+        expected = {
+            result.document.id
+            for result in exact.similarity_search_by_vector(query.tolist(), k=10)
+        }
+        actual = store.similarity_search_by_vector(query.tolist(), k=10)
+        recall.append(len(expected & {result.document.id for result in actual}) / 10)
+    assert store._index is not None  # noqa: SLF001
+    assert np.mean(recall) >= 0.9
+
+    store.filter_by_id(["doc-0", "doc-1"])
+    assert {
+        result.document.id
+        for result in store.similarity_search_by_vector(vectors[0].tolist(), k=10)
+    } == {"doc-0", "doc-1"}
+
+
+def test_unknown_index_type():
+    with pytest.raises(ValueError, match="Unknown index type"):
+        create_store(index_type="hnsw")
+
+
+def test_batched_search_matches_single_searches():
+    rng = np.random.default_rng(4)
+    vectors = rng.normal(size=(300, 16))
+    store = create_store()
+    store.load_documents(make_documents(vectors))
+    store.filter_by_id([f"doc-{i}" for i in range(0, 300, 2)])
+    queries = rng.normal(size=(6, 16)).tolist()
+
+    batch = store.similarity_search_by_vectors(queries, k=5)
+    assert len(batch) == len(queries)
+    for results, query in zip(batch, queries, strict=True):
+        expected = store.similarity_search_by_vector(query, k=5)
+        assert [result.document for result in results] == [
+            result.document for result in expected
+        ]
+        # a matrix product may round differently than a matrix-vector product
+        assert [result.score for result in results] == pytest.approx([
+            result.score for result in expected
+        ])
+    assert store.similarity_search_by_vectors([], k=5) == []
+
+    texts = ["a", "", "b"]
+    results = store.similarity_search_by_texts(
+        texts, lambda texts: [queries[0] if text else [] for text in texts], k=3
+    )
+    assert [len(result) for result in results] == [3, 0, 3]
+    assert [result.document.id for result in results[0]] == [
+        result.document.id
+        for result in store.similarity_search_by_vector(queries[0], k=3)
+    ]
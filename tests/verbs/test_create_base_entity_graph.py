@@ -1,8 +1,8 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-import networkx as nx
 import pytest
+from pandas.testing import assert_frame_equal
 
 from graphrag.config.enums import LLMType
 from graphrag.index.run.utils import create_run_context
@@ -14,8 +14,8 @@ from graphrag.index.workflows.v1.create_base_entity_graph import (
 from .util import (
     get_config_for_workflow,
     get_workflow_output,
-    load_expected,
     load_input_tables,
+    load_test_table,
 )
 
 MOCK_LLM_ENTITY_RESPONSES = [
@@ -53,7 +53,8 @@ async def test_create_base_entity_graph():
     input_tables = load_input_tables([
         "workflow:create_base_text_units",
     ])
-    expected = load_expected(workflow_name)
+    expected_nodes = load_test_table("base_entity_nodes")
+    expected_edges = load_test_table("base_relationship_edges")
 
     context = create_run_context(None, None, None)
     await context.runtime_storage.set(
@@ -74,22 +75,27 @@ async def test_create_base_entity_graph():
         context=context,
     )
 
-    assert len(actual.columns) == len(
-        expected.columns
-    ), "Graph dataframe columns differ"
-    # let's parse a sample of the raw graphml
-    actual_graphml_0 = actual["clustered_graph"][:1][0]
-    actual_graph_0 = nx.parse_graphml(actual_graphml_0)
+    # the graph is handed over in runtime storage, not emitted
+    assert actual.empty
 
-    assert actual_graph_0.number_of_nodes() == 3
-    assert actual_graph_0.number_of_edges() == 2
+    nodes = await context.runtime_storage.get("base_entity_nodes")
+    edges = await context.runtime_storage.get("base_relationship_edges")
+
+    assert set(nodes.columns) == set(expected_nodes.columns)
+    assert set(edges.columns) == set(expected_edges.columns)
+
+    # let's check a single level of the graph
+    nodes_0 = nodes[nodes["level"] == 0]
+    edges_0 = edges[edges["level"] == 0]
+
+    assert len(nodes_0) == 3
+    assert len(edges_0) == 2
 
     # TODO: with the combined verb we can't force summarization
     # this is because the mock responses always result in a single description, which is returned verbatim rather than summarized
     # we need to update the mocking to provide somewhat unique graphs so a true merge happens
     # the assertion should grab a node and ensure the description matches the mock description, not the original as we are doing below
-    nodes = list(actual_graph_0.nodes(data=True))
-    assert nodes[0][1]["description"] == "Company_A is a test company"
+    assert nodes_0["description"].iloc[0] == "Company_A is a test company"
 
     assert len(context.storage.keys()) == 0, "Storage should be empty"
 
@@ -98,8 +104,6 @@ async def test_create_base_entity_graph_with_embeddings():
     input_tables = load_input_tables([
         "workflow:create_base_text_units",
     ])
-    expected = load_expected(workflow_name)
-
     context = create_run_context(None, None, None)
     await context.runtime_storage.set(
         "base_text_units", input_tables["workflow:create_base_text_units"]
@@ -113,7 +117,7 @@ async def test_create_base_entity_graph_with_embeddings():
 
     steps = build_steps(config)
 
-    actual = await get_workflow_output(
+    await get_workflow_output(
         input_tables,
         {
             "steps": steps,
@@ -121,10 +125,8 @@ async def test_create_base_entity_graph_with_embeddings():
         context=context,
     )
 
-    assert (
-        len(actual.columns) == len(expected.columns) + 1
-    ), "Graph dataframe missing embedding column"
-    assert "embeddings" in actual.columns, "Graph dataframe missing embedding column"
+    nodes = await context.runtime_storage.get("base_entity_nodes")
+    assert nodes["graph_embedding"].notna().any(), "Graph nodes missing embeddings"
 
 
 async def test_create_base_entity_graph_with_snapshots():
@@ -164,6 +166,40 @@ async def test_create_base_entity_graph_with_snapshots():
     ], "Graph snapshot keys differ"
 
 
+async def test_create_base_entity_graph_in_batches():
+    input_tables = load_input_tables([
+        "workflow:create_base_text_units",
+    ])
+
+    async def run(batch_size: int | None):
+        context = create_run_context(None, None, None)
+        await context.runtime_storage.set(
+            "base_text_units", input_tables["workflow:create_base_text_units"]
+        )
+        config = get_config_for_workflow(workflow_name)
+        config["entity_extract"]["strategy"]["llm"] = MOCK_LLM_ENTITY_CONFIG
+        config["summarize_descriptions"]["strategy"]["llm"] = (
+            MOCK_LLM_SUMMARIZATION_CONFIG
+        )
+        config["streaming_batch_size"] = batch_size
+        await get_workflow_output(
+            input_tables, {"steps": build_steps(config)}, context=context
+        )
+        return context
+
+    expected = await run(None)
+    actual = await run(3)
+
+    for table in ["base_entity_nodes", "base_relationship_edges"]:
+        expected_table = await expected.runtime_storage.get(table)
+        actual_table = await actual.runtime_storage.get(table)
+        columns = [c for c in expected_table.columns if c != "id"]
+        assert_frame_equal(actual_table[columns], expected_table[columns])
+
+    # the spilled partitions are deleted once merged
+    assert len(actual.storage.keys()) == 0
+
+
 async def test_create_base_entity_graph_missing_llm_throws():
     input_tables = load_input_tables([
         "workflow:create_base_text_units",
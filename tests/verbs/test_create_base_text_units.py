@@ -38,3 +38,28 @@ async def test_create_base_text_units():
 
     actual = await context.runtime_storage.get("base_text_units")
     compare_outputs(actual, expected)
+
+
+async def test_create_base_text_units_in_batches():
+    input_tables = load_input_tables(inputs=[])
+    expected = load_expected(workflow_name)
+
+    context = create_run_context(None, None, None)
+
+    config = get_config_for_workflow(workflow_name)
+    config["text_chunk"]["strategy"]["encoding_name"] = "o200k_base"
+    config["streaming_batch_size"] = 2
+
+    steps = build_steps(config)
+
+    await get_workflow_output(
+        input_tables,
+        {
+            "steps": steps,
+        },
+        context,
+    )
+
+    # documents are chunked on their own, so batching them gives the same text units
+    actual = await context.runtime_storage.get("base_text_units")
+    compare_outputs(actual, expected)
@@ -1,6 +1,7 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
+from graphrag.index.run.utils import create_run_context
 from graphrag.index.workflows.v1.create_final_communities import (
     build_steps,
     workflow_name,
@@ -11,6 +12,7 @@ from .util import (
     get_workflow_output,
     load_expected,
     load_input_tables,
+    load_test_table,
 )
 
 
@@ -20,6 +22,14 @@ async def test_create_final_communities():
     ])
     expected = load_expected(workflow_name)
 
+    context = create_run_context(None, None, None)
+    await context.runtime_storage.set(
+        "base_entity_nodes", load_test_table("base_entity_nodes")
+    )
+    await context.runtime_storage.set(
+        "base_relationship_edges", load_test_table("base_relationship_edges")
+    )
+
     steps = build_steps({})
 
     actual = await get_workflow_output(
@@ -27,6 +37,7 @@ async def test_create_final_communities():
         {
             "steps": steps,
         },
+        context=context,
     )
 
     # we removed the raw_community column, so expect one less in the output
@@ -4,9 +4,15 @@
 import json
 
 import pytest
+from datashaper import NoopVerbCallbacks
 from datashaper.errors import VerbParallelizationError
 
 from graphrag.config.enums import LLMType
+from graphrag.index.cache import InMemoryCache
+from graphrag.index.flows.create_final_community_reports import (
+    create_final_community_reports as create_final_community_reports_flow,
+)
+from graphrag.index.run.utils import create_run_context
 from graphrag.index.workflows.v1.create_final_community_reports import (
     build_steps,
     workflow_name,
@@ -131,3 +137,94 @@ async def test_create_final_community_reports_missing_llm_throws():
                 "steps": steps,
             },
         )
+
+
+async def test_create_final_community_reports_incremental():
+    input_tables = load_input_tables([
+        "workflow:create_final_nodes",
+        "workflow:create_final_covariates",
+        "workflow:create_final_relationships",
+    ])
+    context = create_run_context(None, None, None)
+
+    config = get_config_for_workflow(workflow_name)
+    config["create_community_reports"]["strategy"]["llm"] = MOCK_LLM_CONFIG
+    config["create_community_reports"]["incremental"] = True
+    config["skip_title_embedding"] = False
+    config["community_report_title_embed"]["strategy"]["type"] = "mock"
+
+    first = await get_workflow_output(
+        input_tables, {"steps": build_steps(config)}, context
+    )
+    await context.storage.set(f"{workflow_name}.parquet", first.to_parquet())
+
+    # change one entity and answer with another report
+    nodes = input_tables["workflow:create_final_nodes"].copy()
+    changed = "UNITED STATES"
+    nodes.loc[nodes["title"] == changed, "description"] = "A changed description"
+    input_tables["workflow:create_final_nodes"] = nodes
+    config["create_community_reports"]["strategy"]["llm"] = {
+        "type": LLMType.StaticResponse,
+        "responses": [MOCK_RESPONSES[0].replace("<report_title>", "<new_title>")],
+    }
+
+    second = await get_workflow_output(
+        input_tables, {"steps": build_steps(config)}, context
+    )
+
+    assert list(second.columns) == list(first.columns)
+    assert "fingerprint" in second.columns
+    changed_communities = set(nodes.loc[nodes["title"] == changed, "community"])
+    regenerated = second[second["title"] == "<new_title>"]
+    assert set(regenerated["community"]) <= changed_communities
+    assert len(regenerated) > 0
+    # the other reports are reused with their id and embedding
+    reused = second[second["title"] != "<new_title>"].merge(
+        first, on="community", suffixes=("", "_first")
+    )
+    assert len(reused) == len(first) - len(regenerated)
+    assert (reused["id"] == reused["id_first"]).all()
+    assert (reused["fingerprint"] == reused["fingerprint_first"]).all()
+    assert all(
+        list(a) == list(b)
+        for a, b in zip(
+            reused["title_embedding"], reused["title_embedding_first"], strict=True
+        )
+    )
+
+
+async def test_create_final_community_reports_with_changed_communities():
+    input_tables = load_input_tables([
+        "workflow:create_final_nodes",
+        "workflow:create_final_covariates",
+        "workflow:create_final_relationships",
+    ])
+    config = get_config_for_workflow(workflow_name)
+    config["create_community_reports"]["strategy"]["llm"] = MOCK_LLM_CONFIG
+    args = build_steps(config)[0]["args"]
+    first = await get_workflow_output(input_tables, {"steps": build_steps(config)})
+
+    # an update run knows the changed communities, with or without fingerprints
+    changed = str(first["community"].iloc[0])
+    args["summarization_strategy"]["llm"] = {
+        "type": LLMType.StaticResponse,
+        "responses": [MOCK_RESPONSES[0].replace("<report_title>", "<new_title>")],
+    }
+    second = await create_final_community_reports_flow(
+        input_tables["workflow:create_final_nodes"],
+        input_tables["workflow:create_final_relationships"],
+        input_tables["workflow:create_final_covariates"],
+        NoopVerbCallbacks(),
+        InMemoryCache(),
+        args["summarization_strategy"],
+        previous_reports=first,
+        changed_communities=[changed],
+    )
+
+    regenerated = second[second["title"] == "<new_title>"]
+    assert list(regenerated["community"].astype(str)) == [changed]
+    reused = second[second["title"] != "<new_title>"].merge(
+        first, on="community", suffixes=("", "_first")
+    )
+    assert len(reused) == len(first) - 1
+    assert (reused["id"] == reused["id_first"]).all()
@@ -85,6 +85,39 @@ async def test_create_final_covariates():
     )
 
 
+async def test_create_final_covariates_in_batches():
+    input_tables = load_input_tables(["workflow:create_base_text_units"])
+
+    context = create_run_context(None, None, None)
+    await context.runtime_storage.set(
+        "base_text_units", input_tables["workflow:create_base_text_units"]
+    )
+
+    config = get_config_for_workflow(workflow_name)
+
+    config["claim_extract"]["strategy"]["llm"] = MOCK_LLM_CONFIG
+    config["streaming_batch_size"] = 3
+
+    steps = build_steps(config)
+
+    actual = await get_workflow_output(
+        input_tables,
+        {
+            "steps": steps,
+        },
+        context,
+    )
+
+    input = input_tables["workflow:create_base_text_units"]
+    assert len(actual) == len(input)
+    assert_series_equal(actual["text_unit_id"], input["id"], check_names=False)
+    # the human ids run across the batches
+    assert list(actual["human_readable_id"]) == [str(i + 1) for i in range(len(input))]
+    assert actual["id"].is_unique
+    # the spilled partitions are deleted once merged
+    assert len(context.storage.keys()) == 0
+
+
 async def test_create_final_covariates_missing_llm_throws():
     input_tables = load_input_tables(["workflow:create_base_text_units"])
 
@@ -1,6 +1,7 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
+from graphrag.index.run.utils import create_run_context
 from graphrag.index.workflows.v1.create_final_entities import (
     build_steps,
     workflow_name,
@@ -12,6 +13,7 @@ from .util import (
     get_workflow_output,
     load_expected,
     load_input_tables,
+    load_test_table,
 )
 
 
@@ -21,6 +23,11 @@ async def test_create_final_entities():
     ])
     expected = load_expected(workflow_name)
 
+    context = create_run_context(None, None, None)
+    await context.runtime_storage.set(
+        "base_entity_nodes", load_test_table("base_entity_nodes")
+    )
+
     config = get_config_for_workflow(workflow_name)
 
     config["skip_name_embedding"] = True
@@ -33,6 +40,7 @@ async def test_create_final_entities():
         {
             "steps": steps,
         },
+        context=context,
     )
 
     # ignore the description_embedding column, which is included in the expected output due to default config
@@ -58,6 +66,11 @@ async def test_create_final_entities_with_name_embeddings():
     ])
     expected = load_expected(workflow_name)
 
+    context = create_run_context(None, None, None)
+    await context.runtime_storage.set(
+        "base_entity_nodes", load_test_table("base_entity_nodes")
+    )
+
     config = get_config_for_workflow(workflow_name)
 
     config["skip_name_embedding"] = False
@@ -71,6 +84,7 @@ async def test_create_final_entities_with_name_embeddings():
         {
             "steps": steps,
         },
+        context=context,
     )
 
     assert "name_embedding" in actual.columns
@@ -85,6 +99,11 @@ async def test_create_final_entities_with_description_embeddings():
     ])
     expected = load_expected(workflow_name)
 
+    context = create_run_context(None, None, None)
+    await context.runtime_storage.set(
+        "base_entity_nodes", load_test_table("base_entity_nodes")
+    )
+
     config = get_config_for_workflow(workflow_name)
 
     config["skip_name_embedding"] = True
@@ -98,6 +117,7 @@ async def test_create_final_entities_with_description_embeddings():
         {
             "steps": steps,
         },
+        context=context,
     )
 
     assert "description_embedding" in actual.columns
@@ -111,6 +131,11 @@ async def test_create_final_entities_with_name_and_description_embeddings():
     ])
     expected = load_expected(workflow_name)
 
+    context = create_run_context(None, None, None)
+    await context.runtime_storage.set(
+        "base_entity_nodes", load_test_table("base_entity_nodes")
+    )
+
     config = get_config_for_workflow(workflow_name)
 
     config["skip_name_embedding"] = False
@@ -125,6 +150,7 @@ async def test_create_final_entities_with_name_and_description_embeddings():
         {
             "steps": steps,
         },
+        context=context,
     )
 
     assert "description_embedding" in actual.columns
@@ -13,6 +13,7 @@ from .util import (
     get_workflow_output,
     load_expected,
     load_input_tables,
+    load_test_table,
 )
 
 
@@ -23,6 +24,9 @@ async def test_create_final_nodes():
     expected = load_expected(workflow_name)
 
     context = create_run_context(None, None, None)
+    await context.runtime_storage.set(
+        "base_entity_nodes", load_test_table("base_entity_nodes")
+    )
 
     config = get_config_for_workflow(workflow_name)
 
@@ -52,6 +56,9 @@ async def test_create_final_nodes_with_snapshot():
     expected = load_expected(workflow_name)
 
     context = create_run_context(None, None, None)
+    await context.runtime_storage.set(
+        "base_entity_nodes", load_test_table("base_entity_nodes")
+    )
 
     config = get_config_for_workflow(workflow_name)
 
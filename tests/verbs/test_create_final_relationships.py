@@ -1,6 +1,7 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
+from graphrag.index.run.utils import create_run_context
 from graphrag.index.workflows.v1.create_final_relationships import (
     build_steps,
     workflow_name,
@@ -12,6 +13,7 @@ from .util import (
     get_workflow_output,
     load_expected,
     load_input_tables,
+    load_test_table,
 )
 
 
@@ -22,6 +24,11 @@ async def test_create_final_relationships():
     ])
     expected = load_expected(workflow_name)
 
+    context = create_run_context(None, None, None)
+    await context.runtime_storage.set(
+        "base_relationship_edges", load_test_table("base_relationship_edges")
+    )
+
     config = get_config_for_workflow(workflow_name)
 
     config["skip_description_embedding"] = True
@@ -33,6 +40,7 @@ async def test_create_final_relationships():
         {
             "steps": steps,
         },
+        context=context,
     )
 
     compare_outputs(actual, expected)
@@ -45,6 +53,11 @@ async def test_create_final_relationships_with_embeddings():
     ])
     expected = load_expected(workflow_name)
 
+    context = create_run_context(None, None, None)
+    await context.runtime_storage.set(
+        "base_relationship_edges", load_test_table("base_relationship_edges")
+    )
+
     config = get_config_for_workflow(workflow_name)
 
     config["skip_description_embedding"] = False
@@ -59,6 +72,7 @@ async def test_create_final_relationships_with_embeddings():
         {
             "steps": steps,
         },
+        context=context,
     )
 
     assert "description_embedding" in actual.columns
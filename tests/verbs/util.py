@@ -1,6 +1,7 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
+from pathlib import Path
 from typing import cast
 
 import pandas as pd
@@ -33,11 +34,19 @@ def load_input_tables(inputs: list[str]) -> dict[str, pd.DataFrame]:
     for input in inputs:
         # remove the workflow: prefix if it exists, because that is not part of the actual table filename
         name = input.replace("workflow:", "")
-        input_tables[input] = pd.read_parquet(f"tests/verbs/data/{name}.parquet")
+        path = Path(f"tests/verbs/data/{name}.parquet")
+        # workflows that only hand their output over in runtime storage have no table,
+        # the pipeline injects an empty one for them to keep the execution order
+        input_tables[input] = pd.read_parquet(path) if path.exists() else pd.DataFrame()
 
     return input_tables
 
 
+def load_test_table(name: str) -> pd.DataFrame:
+    """Load a runtime-only table that a workflow hands over in runtime storage."""
+    return pd.read_parquet(f"tests/verbs/data/{name}.parquet")
+
+
 def load_expected(output: str) -> pd.DataFrame:
     """Pass in the workflow output (generally the workflow name)"""
     return pd.read_parquet(f"tests/verbs/data/{output}.parquet")